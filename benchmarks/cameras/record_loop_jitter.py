@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the loop period jitter of `record_loop`, with camera capture in-process and in capture processes.
+
+The robot is simulated, apart from its cameras: reading its state holds the GIL for `--servo-load-ms`, like
+the Python side of servo bus I/O, and the timestamps of the actions it receives give the loop periods.
+
+Example, with two webcams:
+```bash
+python benchmarks/cameras/record_loop_jitter.py --cameras 0 2 --fps 30 --width 640 --height 480
+```
+"""
+
+import argparse
+import time
+from functools import cached_property
+
+import numpy as np
+
+from lerobot.cameras import make_cameras_from_configs
+from lerobot.cameras.opencv import OpenCVCameraConfig
+from lerobot.record import record_loop
+from lerobot.teleoperators.teleoperator import Teleoperator
+
+MOTORS = ["shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll", "gripper"]
+
+
+class SimulatedRobot:
+    """Robot with real cameras and simulated motors, which records when it receives actions."""
+
+    name = "simulated_robot"
+    robot_type = "simulated_robot"
+
+    def __init__(self, cameras: dict, servo_load_ms: float):
+        self.cameras = cameras
+        self.servo_load_s = servo_load_ms / 1000
+        self.action_times = []
+
+    @cached_property
+    def action_features(self) -> dict:
+        return {f"{motor}.pos": float for motor in MOTORS}
+
+    def get_observation(self) -> dict:
+        # Pure Python work, holding the GIL like packet parsing on a servo bus
+        end = time.perf_counter() + self.servo_load_s
+        while time.perf_counter() < end:
+            sum(range(100))
+
+        observation = dict.fromkeys(self.action_features, 0.0)
+        for key, camera in self.cameras.items():
+            observation[key] = camera.async_read()
+        return observation
+
+    def send_action(self, action: dict) -> dict:
+        self.action_times.append(time.perf_counter())
+        return action
+
+
+class ConstantTeleop(Teleoperator):
+    """Teleoperator always sending the same action."""
+
+    name = "constant"
+
+    def __init__(self):
+        # No config nor calibration needed
+        self.id = self.name
+
+    @property
+    def action_features(self) -> dict:
+        return {f"{motor}.pos": float for motor in MOTORS}
+
+    @property
+    def feedback_features(self) -> dict:
+        return {}
+
+    @property
+    def is_connected(self) -> bool:
+        return True
+
+    def connect(self, calibrate: bool = True) -> None:
+        pass
+
+    @property
+    def is_calibrated(self) -> bool:
+        return True
+
+    def calibrate(self) -> None:
+        pass
+
+    def configure(self) -> None:
+        pass
+
+    def get_action(self) -> dict:
+        return dict.fromkeys(self.action_features, 0.0)
+
+    def send_feedback(self, feedback: dict) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+
+def run_record_loop(args: argparse.Namespace, capture_process: bool) -> np.ndarray:
+    """Run `record_loop` for `args.duration` seconds and return its loop periods, in seconds."""
+    camera_configs = {
+        f"camera_{i}": OpenCVCameraConfig(
+            index_or_path=int(camera) if camera.isdigit() else camera,
+            fps=args.camera_fps,
+            width=args.width,
+            height=args.height,
+            capture_process=capture_process,
+        )
+        for i, camera in enumerate(args.cameras)
+    }
+    cameras = make_cameras_from_configs(camera_configs)
+    for camera in cameras.values():
+        camera.connect()
+
+    robot = SimulatedRobot(cameras, args.servo_load_ms)
+    try:
+        record_loop(
+            robot=robot,
+            events={"exit_early": False},
+            fps=args.fps,
+            teleop=ConstantTeleop(),
+            control_time_s=args.duration,
+        )
+    finally:
+        for camera in cameras.values():
+            camera.disconnect()
+
+    # Skip the first periods, while the read threads start
+    return np.diff(robot.action_times)[args.fps :]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--cameras",
+        type=str,
+        nargs="+",
+        default=["0"],
+        help="Indices or paths of the OpenCV cameras to capture from.",
+    )
+    parser.add_argument("--fps", type=int, default=30, help="Frequency of the record loop.")
+    parser.add_argument(
+        "--camera-fps", type=int, default=None, help="Frequency of the cameras, their default if not set."
+    )
+    parser.add_argument("--width", type=int, default=None, help="Width of the captured frames.")
+    parser.add_argument("--height", type=int, default=None, help="Height of the captured frames.")
+    parser.add_argument("--duration", type=float, default=20, help="Duration of each run, in seconds.")
+    parser.add_argument(
+        "--servo-load-ms",
+        type=float,
+        default=5,
+        help="Time the simulated robot holds the GIL when reading its state, in milliseconds.",
+    )
+    args = parser.parse_args()
+
+    target_ms = 1000 / args.fps
+    print(f"Target period: {target_ms:.2f}ms")
+    print(f"{'capture':<10} | {'mean (ms)':>9} | {'std (ms)':>8} | {'p99 (ms)':>8} | {'max (ms)':>8} | late")
+    for capture_process in [False, True]:
+        periods_ms = 1000 * run_record_loop(args, capture_process)
+        late = np.mean(periods_ms > 1.1 * target_ms)
+        print(
+            f"{'process' if capture_process else 'thread':<10} | "
+            f"{periods_ms.mean():>9.2f} | "
+            f"{periods_ms.std():>8.2f} | "
+            f"{np.percentile(periods_ms, 99):>8.2f} | "
+            f"{periods_ms.max():>8.2f} | "
+            f"{late:.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
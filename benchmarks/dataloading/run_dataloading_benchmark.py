@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the end-to-end throughput of loading training batches from a `LeRobotDataset` with a `DataLoader`.
+
+Synthetic datasets are generated locally (once per number of cameras, in `--root`), with camera-like videos
+encoded like recorded datasets. Each combination of the following settings is then benchmarked:
+- `--num-cameras`: number of cameras of the dataset.
+- `--video-backends`: video decoding backend of the dataset (`pyav`, `torchcodec`).
+- `--num-workers`: number of workers of the `DataLoader`.
+- `--delta-timestamps`: frames loaded around each sample, `none`, or the horizons of the `act` (chunk of 100
+  actions) or `diffusion` (2 observations, 16 actions) policies.
+- `--image-transforms`: without (`off`) or with the default random image augmentations, applied to each
+  frame in the workers (`on`) or to each batch on `--device` in the main process (`batched`).
+
+For each combination, the report gives the throughput in samples/s, the time per sample of each stage of
+`__getitem__` (parquet query, video decoding, image transforms) and of the collation, the time the main process
+waited for batches, and the peak resident memory of the workers. The stages are timed in the workers, so with
+several workers their sum exceeds the wall time per sample, except the batched image transforms, which are
+timed in the main process. With `--output`, the results are written as JSON
+for regression tracking.
+
+Example:
+```bash
+python benchmarks/dataloading/run_dataloading_benchmark.py \
+    --num-cameras 1 3 \
+    --video-backends pyav torchcodec \
+    --num-workers 0 4 \
+    --delta-timestamps none act \
+    --image-transforms off on batched \
+    --device cuda \
+    --output outputs/dataloading_benchmark.json
+```
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import psutil
+import torch
+from torch.utils.data import default_collate, get_worker_info
+
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.datasets.transforms import BatchImageTransforms, ImageTransforms, ImageTransformsConfig
+
+PROFILE_PREFIX = "_profile."
+STAGES = ["parquet_query", "video_decode", "transforms", "collate"]
+
+
+def camera_key(camera: int) -> str:
+    return f"observation.images.cam_{camera}"
+
+
+def create_synthetic_dataset(
+    root: Path, num_cameras: int, num_episodes: int, episode_length: int, height: int, width: int, fps: int
+) -> Path:
+    """Create a dataset with moving shapes filmed by `num_cameras` cameras, unless it already exists."""
+    dataset_root = root / f"cameras_{num_cameras}_episodes_{num_episodes}x{episode_length}_{width}x{height}"
+    if (dataset_root / "meta" / "info.json").is_file():
+        return dataset_root
+
+    features = {
+        "observation.state": {"dtype": "float32", "shape": (6,), "names": None},
+        "action": {"dtype": "float32", "shape": (6,), "names": None},
+        **{
+            camera_key(camera): {
+                "dtype": "video",
+                "shape": (height, width, 3),
+                "names": ["height", "width", "channels"],
+            }
+            for camera in range(num_cameras)
+        },
+    }
+    dataset = LeRobotDataset.create(
+        repo_id=f"benchmark/{dataset_root.name}", fps=fps, root=dataset_root, features=features
+    )
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:height, 0:width]
+    background = np.stack([x * 255 // width, y * 255 // height, (x + y) * 255 // (width + height)], axis=-1)
+    for _ in range(num_episodes):
+        for i in range(episode_length):
+            frame = {
+                "observation.state": rng.standard_normal(6, dtype=np.float32),
+                "action": rng.standard_normal(6, dtype=np.float32),
+            }
+            for camera in range(num_cameras):
+                image = background.copy()
+                top, left = (i * 3 + camera * 7) % (height // 2), (i * 5 + camera * 11) % (width // 2)
+                image[top : top + height // 4, left : left + width // 4] = (200, 40, 40)
+                frame[camera_key(camera)] = image.astype(np.uint8)
+            dataset.add_frame(frame, task="Move the red square.")
+        dataset.save_episode()
+    return dataset_root
+
+
+class TimedTransform:
+    """Image transform recording its duration."""
+
+    def __init__(self, transform):
+        self.transform = transform
+        self.elapsed_s = 0.0
+
+    def __call__(self, image: torch.Tensor) -> torch.Tensor:
+        start = time.perf_counter()
+        image = self.transform(image)
+        self.elapsed_s += time.perf_counter() - start
+        return image
+
+
+class ProfiledLeRobotDataset(LeRobotDataset):
+    """`LeRobotDataset` adding the durations of the stages of `__getitem__` to the items it returns.
+
+    The parquet query time is the remaining time of `__getitem__`, which is mostly spent querying the parquet
+    files of the dataset.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.image_transforms is not None:
+            self.image_transforms = TimedTransform(self.image_transforms)
+        self.video_decode_s = 0.0
+
+    def _query_videos(self, query_timestamps: dict[str, list[float]], ep_idx: int) -> dict[str, torch.Tensor]:
+        start = time.perf_counter()
+        item = super()._query_videos(query_timestamps, ep_idx)
+        self.video_decode_s += time.perf_counter() - start
+        return item
+
+    def __getitem__(self, idx) -> dict:
+        self.video_decode_s = 0.0
+        if self.image_transforms is not None:
+            self.image_transforms.elapsed_s = 0.0
+
+        start = time.perf_counter()
+        item = super().__getitem__(idx)
+        total_s = time.perf_counter() - start
+
+        transforms_s = self.image_transforms.elapsed_s if self.image_transforms is not None else 0.0
+        worker_info = get_worker_info()
+        profile = {
+            "parquet_query": total_s - self.video_decode_s - transforms_s,
+            "video_decode": self.video_decode_s,
+            "transforms": transforms_s,
+            "worker_id": worker_info.id if worker_info is not None else -1,
+            "worker_rss_mb": psutil.Process().memory_info().rss / 2**20,
+        }
+        item.update({PROFILE_PREFIX + key: torch.tensor(value) for key, value in profile.items()})
+        return item
+
+
+def profiled_collate(samples: list[dict]) -> dict:
+    start = time.perf_counter()
+    batch = default_collate(samples)
+    batch[PROFILE_PREFIX + "collate"] = torch.tensor(time.perf_counter() - start)
+    return batch
+
+
+def get_delta_timestamps(name: str, fps: int, camera_keys: list[str]) -> dict[str, list[float]] | None:
+    if name == "none":
+        return None
+    if name == "act":
+        return {"action": [i / fps for i in range(100)]}
+    if name == "diffusion":
+        observations = [-1 / fps, 0.0]
+        return {
+            "observation.state": observations,
+            **dict.fromkeys(camera_keys, observations),
+            "action": [i / fps for i in range(-1, 15)],
+        }
+    raise ValueError(name)
+
+
+def run_benchmark(dataset_root: Path, settings: dict, args: argparse.Namespace) -> dict:
+    camera_keys = [camera_key(camera) for camera in range(settings["num_cameras"])]
+    image_transforms = None
+    if settings["image_transforms"] == "on":
+        image_transforms = ImageTransforms(ImageTransformsConfig(enable=True))
+    batch_image_transforms = None
+    if settings["image_transforms"] == "batched":
+        batch_image_transforms = BatchImageTransforms(ImageTransformsConfig(enable=True))
+    device = torch.device(args.device)
+    dataset = ProfiledLeRobotDataset(
+        f"benchmark/{dataset_root.name}",
+        root=dataset_root,
+        delta_timestamps=get_delta_timestamps(settings["delta_timestamps"], args.fps, camera_keys),
+        image_transforms=image_transforms,
+        video_backend=settings["video_backend"],
+    )
+    dataloader = torch.utils.data.DataLoader(
+        dataset,
+        batch_size=args.batch_size,
+        num_workers=settings["num_workers"],
+        shuffle=True,
+        collate_fn=profiled_collate,
+        generator=torch.Generator().manual_seed(0),
+    )
+
+    stage_s = dict.fromkeys(STAGES, 0.0)
+    worker_rss_mb = {}
+    wait_s = 0.0
+    num_samples = 0
+    batches = itertools.chain.from_iterable(itertools.repeat(dataloader))
+    start = time.perf_counter()
+    for i in range(args.warmup_batches + args.num_batches):
+        if i == args.warmup_batches:
+            start = time.perf_counter()
+            stage_s = dict.fromkeys(STAGES, 0.0)
+            wait_s = 0.0
+            num_samples = 0
+        wait_start = time.perf_counter()
+        batch = next(batches)
+        wait_s += time.perf_counter() - wait_start
+
+        num_samples += len(batch["index"])
+        for stage in STAGES:
+            stage_s[stage] += batch[PROFILE_PREFIX + stage].sum().item()
+        if batch_image_transforms is not None:
+            transforms_start = time.perf_counter()
+            for key in camera_keys:
+                batch[key] = batch_image_transforms(batch[key].to(device, non_blocking=True))
+            if device.type == "cuda":
+                torch.cuda.synchronize()
+            stage_s["transforms"] += time.perf_counter() - transforms_start
+        worker_ids = batch[PROFILE_PREFIX + "worker_id"].tolist()
+        for worker_id, rss_mb in zip(
+            worker_ids, batch[PROFILE_PREFIX + "worker_rss_mb"].tolist(), strict=True
+        ):
+            worker_rss_mb[worker_id] = max(worker_rss_mb.get(worker_id, 0.0), rss_mb)
+    elapsed_s = time.perf_counter() - start
+
+    return {
+        **settings,
+        "samples_per_s": num_samples / elapsed_s,
+        # Collation is timed per batch, the other stages per sample
+        "stage_ms_per_sample": {stage: 1000 * value / num_samples for stage, value in stage_s.items()},
+        "wait_ms_per_batch": 1000 * wait_s / args.num_batches,
+        "max_worker_rss_mb": max(worker_rss_mb.values()),
+        "main_rss_mb": psutil.Process().memory_info().rss / 2**20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--root", type=Path, default=None, help="Directory of the synthetic datasets.")
+    parser.add_argument("--num-cameras", type=int, nargs="+", default=[1])
+    parser.add_argument("--video-backends", type=str, nargs="+", default=["pyav"])
+    parser.add_argument("--num-workers", type=int, nargs="+", default=[0, 2])
+    parser.add_argument(
+        "--delta-timestamps", type=str, nargs="+", choices=["none", "act", "diffusion"], default=["none"]
+    )
+    parser.add_argument(
+        "--image-transforms", type=str, nargs="+", choices=["off", "on", "batched"], default=["off"]
+    )
+    parser.add_argument(
+        "--device",
+        type=str,
+        default="cuda" if torch.cuda.is_available() else "cpu",
+        help="Device of the batched image transforms.",
+    )
+    parser.add_argument("--num-episodes", type=int, default=10)
+    parser.add_argument("--episode-length", type=int, default=100, help="Number of frames per episode.")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--num-batches", type=int, default=20, help="Number of measured batches.")
+    parser.add_argument("--warmup-batches", type=int, default=2, help="Number of batches before measuring.")
+    parser.add_argument("--output", type=Path, default=None, help="Path of the JSON report.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = args.root if args.root is not None else Path(tmp_dir)
+        results = []
+        print(
+            f"{'cams':>4} | {'backend':>10} | {'workers':>7} | {'deltas':>9} | {'aug':>7} | "
+            f"{'samples/s':>9} | {'parquet':>7} | {'decode':>7} | {'transf':>7} | {'collate':>7} | "
+            f"{'wait':>7} | {'worker MB':>9}"
+        )
+        for num_cameras in args.num_cameras:
+            dataset_root = create_synthetic_dataset(
+                root, num_cameras, args.num_episodes, args.episode_length, args.height, args.width, args.fps
+            )
+            for backend, num_workers, deltas, transforms in itertools.product(
+                args.video_backends, args.num_workers, args.delta_timestamps, args.image_transforms
+            ):
+                settings = {
+                    "num_cameras": num_cameras,
+                    "video_backend": backend,
+                    "num_workers": num_workers,
+                    "delta_timestamps": deltas,
+                    "image_transforms": transforms,
+                }
+                try:
+                    result = run_benchmark(dataset_root, settings, args)
+                except Exception as e:
+                    results.append({**settings, "error": repr(e)})
+                    # Keep the row short, the full error is in the report
+                    error = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+                    print(
+                        f"{num_cameras:>4} | {backend:>10} | {num_workers:>7} | {deltas:>9} | {transforms:>7} | "
+                        f"failed: {error}"
+                    )
+                    continue
+                results.append(result)
+                stage_ms = result["stage_ms_per_sample"]
+                print(
+                    f"{num_cameras:>4} | {backend:>10} | {num_workers:>7} | {deltas:>9} | {transforms:>7} | "
+                    f"{result['samples_per_s']:>9.1f} | {stage_ms['parquet_query']:>7.2f} | "
+                    f"{stage_ms['video_decode']:>7.2f} | {stage_ms['transforms']:>7.2f} | "
+                    f"{stage_ms['collate']:>7.2f} | {result['wait_ms_per_batch']:>7.1f} | "
+                    f"{result['max_worker_rss_mb']:>9.0f}"
+                )
+        print("Stage times in ms per sample, wait in ms per batch.")
+
+    if args.output is not None:
+        report = {
+            "config": {
+                key: str(value) if isinstance(value, Path) else value for key, value in vars(args).items()
+            },
+            "platform": {
+                "python": platform.python_version(),
+                "torch": torch.__version__,
+                "cpu_count": psutil.cpu_count(),
+            },
+            "results": results,
+        }
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the throughput of saving recorded frames as png images and appending them to frame spools.
+
+For each path, frames are written from a single thread, as `add_frame` does, then encoded into a video with
+`encode_video_frames`. Frames are decoded from `--video` if given, otherwise synthesized with camera-like
+content (smooth gradients, moving objects and sensor noise).
+
+Example:
+```bash
+python benchmarks/datasets/frame_spooling.py --num-frames 300 --width 640 --height 480
+```
+"""
+
+import argparse
+import importlib.util
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import av
+import numpy as np
+
+from lerobot.datasets.frame_spool import SPOOL_FILENAME, FrameSpoolWriter
+from lerobot.datasets.image_writer import write_image
+from lerobot.datasets.video_utils import encode_video_frames
+
+
+def synthesize_frames(num_frames: int, height: int, width: int) -> list[np.ndarray]:
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:height, 0:width]
+    background = np.stack([x * 255 // width, y * 255 // height, (x + y) * 255 // (width + height)], axis=-1)
+    frames = []
+    for i in range(num_frames):
+        frame = background.copy()
+        top, left = (i * 3) % (height // 2), (i * 5) % (width // 2)
+        frame[top : top + height // 4, left : left + width // 4] = (200, 40, 40)
+        frame += rng.normal(0, 3, size=frame.shape).astype(np.int64)
+        frames.append(np.clip(frame, 0, 255).astype(np.uint8))
+    return frames
+
+
+def decode_frames(video_path: str, num_frames: int) -> list[np.ndarray]:
+    frames = []
+    with av.open(video_path) as container:
+        for frame in container.decode(video=0):
+            frames.append(frame.to_ndarray(format="rgb24"))
+            if len(frames) == num_frames:
+                break
+    return frames
+
+
+def write_frames(path: str, frames: list[np.ndarray], imgs_dir: Path) -> float:
+    """Write the frames with the given path, and return the time spent, in seconds."""
+    imgs_dir.mkdir(parents=True)
+    start = time.perf_counter()
+    if path == "png":
+        for i, frame in enumerate(frames):
+            write_image(frame, imgs_dir / f"frame_{i:06d}.png")
+    else:
+        writer = FrameSpoolWriter(imgs_dir / SPOOL_FILENAME, compression=path)
+        for frame in frames:
+            writer.append(frame)
+        writer.close()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--video", type=str, default=None, help="Video to take the frames from.")
+    parser.add_argument("--num-frames", type=int, default=300, help="Number of frames to write.")
+    parser.add_argument("--width", type=int, default=640, help="Width of the synthesized frames.")
+    parser.add_argument("--height", type=int, default=480, help="Height of the synthesized frames.")
+    parser.add_argument("--fps", type=int, default=30, help="Frame rate of the encoded videos.")
+    parser.add_argument("--vcodec", type=str, default="libsvtav1", help="Codec of the encoded videos.")
+    args = parser.parse_args()
+
+    if args.video is not None:
+        frames = decode_frames(args.video, args.num_frames)
+    else:
+        frames = synthesize_frames(args.num_frames, args.height, args.width)
+    height, width, _ = frames[0].shape
+
+    paths = ["png", "raw"]
+    if importlib.util.find_spec("lz4") is not None:
+        paths.append("lz4")
+
+    print(f"{len(frames)} frames of {width}x{height}")
+    print(f"{'path':<5} | {'write (ms/frame)':>16} | {'frames/s':>8} | {'disk (MB)':>9} | {'encode (s)':>10}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for path in paths:
+            imgs_dir = Path(tmp_dir) / path
+            write_s = write_frames(path, frames, imgs_dir)
+            disk_mb = sum(f.stat().st_size for f in imgs_dir.iterdir()) / 1e6
+
+            start = time.perf_counter()
+            encode_video_frames(
+                imgs_dir, Path(tmp_dir) / f"{path}.mp4", args.fps, vcodec=args.vcodec, overwrite=True
+            )
+            encode_s = time.perf_counter() - start
+            shutil.rmtree(imgs_dir)
+
+            print(
+                f"{path:<5} | "
+                f"{1000 * write_s / len(frames):>16.2f} | "
+                f"{len(frames) / write_s:>8.0f} | "
+                f"{disk_mb:>9.1f} | "
+                f"{encode_s:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the per-dataset throughput of loading a weighted mix of datasets with a `MultiLeRobotDataset`.
+
+Synthetic video datasets are generated locally (once, in `--root`), one per value of `--num-cameras`, so that
+the datasets have different loading costs. Batches are then loaded by a `DataLoader` sampling the datasets with
+`--weights` (by default, uniformly over the frames) with a `WeightedDatasetSampler`, with the datasets opened
+as a whole on first access (`lazy`) or an episode at a time (`streaming`).
+
+For each dataset, the report gives the fraction of the samples drawn from it, its throughput in samples/s
+(its share of the overall throughput), and the time per sample spent in `__getitem__`, including opening the
+dataset or episode. The times are measured in the workers, so with several workers their sum exceeds the wall
+time per sample. The time until the first batch includes reading the metadata and opening the datasets.
+
+Example:
+```bash
+python benchmarks/datasets/multi_dataset.py --num-cameras 1 2 3 --weights 1 1 2 --modes lazy streaming
+```
+"""
+
+import argparse
+import itertools
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+
+from lerobot.datasets.lerobot_dataset import LeRobotDataset, MultiLeRobotDataset
+from lerobot.datasets.sampler import WeightedDatasetSampler
+
+LOAD_S_KEY = "_profile.load_s"
+
+
+def create_synthetic_dataset(
+    root: Path, repo_id: str, num_cameras: int, num_episodes: int, episode_length: int, args
+) -> None:
+    """Create a dataset with moving squares filmed by `num_cameras` cameras, unless it already exists."""
+    if (root / repo_id / "meta" / "info.json").is_file():
+        return
+
+    height, width = args.height, args.width
+    features = {
+        "observation.state": {"dtype": "float32", "shape": (6,), "names": None},
+        "action": {"dtype": "float32", "shape": (6,), "names": None},
+        **{
+            f"observation.images.cam_{camera}": {
+                "dtype": "video",
+                "shape": (height, width, 3),
+                "names": ["height", "width", "channels"],
+            }
+            for camera in range(num_cameras)
+        },
+    }
+    dataset = LeRobotDataset.create(repo_id=repo_id, fps=args.fps, root=root / repo_id, features=features)
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:height, 0:width]
+    background = np.stack([x * 255 // width, y * 255 // height, (x + y) * 255 // (width + height)], axis=-1)
+    for _ in range(num_episodes):
+        for i in range(episode_length):
+            frame = {
+                "observation.state": rng.standard_normal(6, dtype=np.float32),
+                "action": rng.standard_normal(6, dtype=np.float32),
+            }
+            for camera in range(num_cameras):
+                image = background.copy()
+                top, left = (i * 3 + camera * 7) % (height // 2), (i * 5 + camera * 11) % (width // 2)
+                image[top : top + height // 4, left : left + width // 4] = (200, 40, 40)
+                frame[f"observation.images.cam_{camera}"] = image.astype(np.uint8)
+            dataset.add_frame(frame, task="Move the red square.")
+        dataset.save_episode()
+
+
+class ProfiledMultiLeRobotDataset(MultiLeRobotDataset):
+    """`MultiLeRobotDataset` adding the duration of `__getitem__` to the items it returns."""
+
+    def __getitem__(self, idx: int) -> dict:
+        start = time.perf_counter()
+        item = super().__getitem__(idx)
+        item[LOAD_S_KEY] = torch.tensor(time.perf_counter() - start)
+        return item
+
+
+def run_benchmark(root: Path, repo_ids: list[str], streaming: bool, args: argparse.Namespace) -> dict:
+    start = time.perf_counter()
+    dataset = ProfiledMultiLeRobotDataset(
+        repo_ids,
+        root=root,
+        weights=dict(zip(repo_ids, args.weights, strict=True)) if args.weights else None,
+        streaming=streaming,
+        video_backend=args.video_backend,
+    )
+    sampler = WeightedDatasetSampler(
+        dataset.dataset_sizes, dataset.weights, num_samples=args.batch_size * args.num_batches, seed=0
+    )
+    dataloader = torch.utils.data.DataLoader(
+        dataset, batch_size=args.batch_size, num_workers=args.num_workers, sampler=sampler
+    )
+
+    num_samples = torch.zeros(len(repo_ids), dtype=torch.long)
+    load_s = torch.zeros(len(repo_ids), dtype=torch.float64)
+    first_batch_s = None
+    for batch in dataloader:
+        if first_batch_s is None:
+            first_batch_s = time.perf_counter() - start
+        num_samples += torch.bincount(batch["dataset_index"], minlength=len(repo_ids))
+        load_s.index_add_(0, batch["dataset_index"], batch[LOAD_S_KEY].double())
+    elapsed_s = time.perf_counter() - start
+
+    total = num_samples.sum().item()
+    return {
+        "first_batch_s": first_batch_s,
+        "samples_per_s": total / elapsed_s,
+        "datasets": {
+            repo_id: {
+                "fraction": num_samples[i].item() / total,
+                "samples_per_s": num_samples[i].item() / elapsed_s,
+                "ms_per_sample": 1000 * load_s[i].item() / max(num_samples[i].item(), 1),
+            }
+            for i, repo_id in enumerate(repo_ids)
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--root", type=Path, default=None, help="Directory of the synthetic datasets.")
+    parser.add_argument("--num-cameras", type=int, nargs="+", default=[1, 3], help="Cameras of each dataset.")
+    parser.add_argument("--weights", type=float, nargs="+", default=None, help="Weight of each dataset.")
+    parser.add_argument("--modes", type=str, nargs="+", choices=["lazy", "streaming"], default=["lazy"])
+    parser.add_argument("--num-workers", type=int, nargs="+", default=[0, 2])
+    parser.add_argument("--video-backend", type=str, default="pyav")
+    parser.add_argument("--num-episodes", type=int, default=10)
+    parser.add_argument("--episode-length", type=int, default=50, help="Number of frames per episode.")
+    parser.add_argument("--width", type=int, default=320)
+    parser.add_argument("--height", type=int, default=240)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--num-batches", type=int, default=20)
+    args = parser.parse_args()
+    if args.weights is not None and len(args.weights) != len(args.num_cameras):
+        parser.error("--weights needs a weight per dataset of --num-cameras")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = args.root if args.root is not None else Path(tmp_dir)
+        repo_ids = []
+        for i, num_cameras in enumerate(args.num_cameras):
+            repo_id = f"benchmark/dataset_{i}_cameras_{num_cameras}_{args.width}x{args.height}"
+            create_synthetic_dataset(root, repo_id, num_cameras, args.num_episodes, args.episode_length, args)
+            repo_ids.append(repo_id)
+
+        print(
+            f"{'mode':>9} | {'workers':>7} | {'dataset':>40} | {'fraction':>8} | {'samples/s':>9} | "
+            f"{'ms/sample':>9}"
+        )
+        for mode, num_workers in itertools.product(args.modes, args.num_workers):
+            run_args = argparse.Namespace(**{**vars(args), "num_workers": num_workers})
+            result = run_benchmark(root, repo_ids, mode == "streaming", run_args)
+            for repo_id, stats in result["datasets"].items():
+                print(
+                    f"{mode:>9} | {num_workers:>7} | {repo_id:>40} | {stats['fraction']:>8.2f} | "
+                    f"{stats['samples_per_s']:>9.1f} | {stats['ms_per_sample']:>9.2f}"
+                )
+            print(
+                f"{mode:>9} | {num_workers:>7} | {'all':>40} | {1:>8.2f} | {result['samples_per_s']:>9.1f} | "
+                f"first batch after {result['first_batch_s']:.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
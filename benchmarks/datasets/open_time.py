@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the time to open a `LeRobotDataset` with many episodes, as a whole or a few of its episodes.
+
+A synthetic dataset is generated locally (once per number of episodes, in `--root`) with the metadata of
+`--num-episodes` episodes, but the data files of the episodes opened by the benchmark only, so that large
+datasets are quick to generate. Its metadata is opened:
+- `eager`: by parsing all the episodes and their stats and aggregating the stats, as done before the metadata
+  was loaded lazily;
+- `lazy (cold)`: by indexing the offsets of the records of the jsonl files, as done the first time a dataset
+  is opened;
+- `lazy (warm)`: by loading the saved index, as done afterwards.
+
+Then subsets of `--subset-sizes` episodes are opened with `LeRobotDataset(..., episodes=...)`, with the
+metadata loaded eagerly or lazily (warm).
+
+Example:
+```bash
+python benchmarks/datasets/open_time.py --num-episodes 1000 10000 100000 --subset-sizes 1 10 100
+```
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pyarrow.parquet as pq
+import torch
+
+from lerobot.datasets.compute_stats import aggregate_stats
+from lerobot.datasets.lerobot_dataset import LeRobotDataset, LeRobotDatasetMetadata
+from lerobot.datasets.utils import (
+    EPISODES_PATH,
+    EPISODES_STATS_PATH,
+    JSONL_INDEX_SUFFIX,
+    load_episodes,
+    load_episodes_stats,
+    load_info,
+    write_info,
+)
+
+STATE_SHAPE = (14,)
+
+
+def create_synthetic_dataset(root: Path, repo_id: str, num_episodes: int, args) -> None:
+    """Create the metadata of `num_episodes` episodes by replicating a recorded episode, unless they exist."""
+    if (root / repo_id / "meta" / "info.json").is_file():
+        return
+
+    features = {
+        "observation.state": {"dtype": "float32", "shape": STATE_SHAPE, "names": None},
+        "action": {"dtype": "float32", "shape": STATE_SHAPE, "names": None},
+    }
+    dataset = LeRobotDataset.create(repo_id=repo_id, fps=args.fps, root=root / repo_id, features=features)
+    rng = np.random.default_rng(0)
+    for _ in range(args.episode_length):
+        dataset.add_frame(
+            {
+                "observation.state": rng.standard_normal(STATE_SHAPE, dtype=np.float32),
+                "action": rng.standard_normal(STATE_SHAPE, dtype=np.float32),
+            },
+            task="Dummy task",
+        )
+    dataset.save_episode()
+
+    meta_dir = root / repo_id
+    episode = json.loads((meta_dir / EPISODES_PATH).read_text())
+    episode_stats = json.loads((meta_dir / EPISODES_STATS_PATH).read_text())
+    with open(meta_dir / EPISODES_PATH, "w") as episodes_file:
+        with open(meta_dir / EPISODES_STATS_PATH, "w") as stats_file:
+            for ep_idx in range(num_episodes):
+                episodes_file.write(json.dumps({**episode, "episode_index": ep_idx}) + "\n")
+                stats_file.write(json.dumps({**episode_stats, "episode_index": ep_idx}) + "\n")
+
+    info = load_info(meta_dir)
+    info["total_episodes"] = num_episodes
+    info["total_frames"] = num_episodes * args.episode_length
+    info["total_chunks"] = (num_episodes - 1) // info["chunks_size"] + 1
+    info["splits"] = {"train": f"0:{num_episodes}"}
+    write_info(info, meta_dir)
+
+
+def write_episode_data(meta: LeRobotDatasetMetadata, episodes: list[int], episode_length: int) -> None:
+    """Write the data files of `episodes` as copies of the recorded episode."""
+    table = pq.read_table(meta.root / meta.get_data_file_path(0))
+    for ep_idx in episodes:
+        fpath = meta.root / meta.get_data_file_path(ep_idx)
+        if fpath.is_file():
+            continue
+        fpath.parent.mkdir(parents=True, exist_ok=True)
+        columns = {
+            "episode_index": np.full(episode_length, ep_idx, dtype=np.int64),
+            "index": np.arange(episode_length, dtype=np.int64) + ep_idx * episode_length,
+        }
+        episode_table = table
+        for name, values in columns.items():
+            position = episode_table.schema.get_field_index(name)
+            episode_table = episode_table.set_column(position, name, [values])
+        pq.write_table(episode_table, fpath)
+
+
+def remove_indexes(dataset_dir: Path) -> None:
+    for fpath in (dataset_dir / "meta").glob(f"*{JSONL_INDEX_SUFFIX}"):
+        fpath.unlink()
+
+
+def load_metadata_eagerly(meta_dir: Path) -> None:
+    episodes_stats = load_episodes_stats(meta_dir)
+    load_episodes(meta_dir)
+    aggregate_stats(list(episodes_stats.values()))
+
+
+def eager_metadata():
+    """Load the metadata eagerly in `LeRobotDatasetMetadata`, as done before it was loaded lazily."""
+    return patch.multiple(
+        "lerobot.datasets.lerobot_dataset",
+        lazy_load_episodes=load_episodes,
+        lazy_load_episodes_stats=load_episodes_stats,
+    )
+
+
+def median_time_ms(fn, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(1000 * (time.perf_counter() - start))
+    return statistics.median(times)
+
+
+def run_benchmark(root: Path, num_episodes: int, args: argparse.Namespace) -> list[tuple[str, str, float]]:
+    """Return the median open times in ms, as (number of opened episodes, mode, time)."""
+    repo_id = f"benchmark/episodes_{num_episodes}x{args.episode_length}"
+    dataset_dir = root / repo_id
+    create_synthetic_dataset(root, repo_id, num_episodes, args)
+    meta = LeRobotDatasetMetadata(repo_id, root=dataset_dir)
+    subsets = {
+        size: sorted(set(np.linspace(0, num_episodes - 1, size).astype(int).tolist()))
+        for size in args.subset_sizes
+        if size <= num_episodes
+    }
+    write_episode_data(meta, sorted(set().union(*subsets.values())), args.episode_length)
+
+    def open_metadata(cold: bool):
+        if cold:
+            remove_indexes(dataset_dir)
+        LeRobotDatasetMetadata(repo_id, root=dataset_dir)
+
+    def open_subset(episodes: list[int], eager: bool):
+        with eager_metadata() if eager else nullcontext():
+            dataset = LeRobotDataset(repo_id, root=dataset_dir, episodes=episodes)
+            if eager:
+                # Aggregated when the metadata was loaded eagerly
+                dataset.meta.stats  # noqa: B018
+
+    results = [
+        ("all", "eager", median_time_ms(lambda: load_metadata_eagerly(dataset_dir), args.repeats)),
+        ("all", "lazy (cold)", median_time_ms(lambda: open_metadata(cold=True), args.repeats)),
+        ("all", "lazy (warm)", median_time_ms(lambda: open_metadata(cold=False), args.repeats)),
+    ]
+    for episodes in subsets.values():
+        for mode in ["eager", "lazy (warm)"]:
+            ms = median_time_ms(lambda: open_subset(episodes, eager=mode == "eager"), args.repeats)  # noqa: B023
+            results.append((str(len(episodes)), mode, ms))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--root", type=Path, default=None, help="Directory of the synthetic datasets.")
+    parser.add_argument("--num-episodes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--subset-sizes", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--episode-length", type=int, default=20, help="Number of frames per episode.")
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Number of timings of which the median is kept."
+    )
+    args = parser.parse_args()
+    torch.set_num_threads(1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = args.root if args.root is not None else Path(tmp_dir)
+        print(f"{'episodes':>9} | {'opened':>8} | {'mode':>12} | {'open time (ms)':>14}")
+        for num_episodes in args.num_episodes:
+            for opened, mode, ms in run_benchmark(root, num_episodes, args):
+                print(f"{num_episodes:>9} | {opened:>8} | {mode:>12} | {ms:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
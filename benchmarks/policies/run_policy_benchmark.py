@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the inference and training latencies of policies.
+
+Each policy is built with its default config for one camera and a state, with synthetic normalization stats,
+and fed synthetic batches with the observation and action horizons that its deltas request. For each policy
+and batch size, the report gives:
+- `cold start`: the time to build the policy and return its first action.
+- `select_action`: the latency of a call that runs the model, i.e. right after `reset`, so that the action
+  queue of chunking policies is refilled.
+- `predict_action_chunk`: the latency of predicting a chunk of actions, for the policies that support it.
+  The policies that keep a queue of observations (Diffusion, TDMPC, VQ-BeT) predict it from the observations
+  queued by `select_action`.
+- `train step`: the time of a training step with the optimizer preset of the policy, by `update_policy` as in
+  `train.py`. For SAC, the step optimizes the critic, actor and temperature losses as `learner.py` does.
+- the median (p50) and 99th percentile (p99) latencies, the throughputs in samples/s, and the peak memory of
+  the process (resident memory on CPU, allocated memory on CUDA).
+
+Each measurement runs in a new process, so that the cold start includes the imports of the policy and the
+peak memory is its own. The policies that cannot be built here, e.g. because their optional dependencies are
+not installed, are reported as failed. With `--output`, the results are written as JSON for comparing runs.
+
+Example:
+```bash
+python benchmarks/policies/run_policy_benchmark.py \
+    --policies act diffusion tdmpc vqbet sac pi0 pi0fast smolvla \
+    --batch-sizes 1 8 32 \
+    --output outputs/policy_benchmark.json
+```
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import torch
+
+POLICIES = ["act", "diffusion", "tdmpc", "vqbet", "sac", "pi0", "pi0fast", "smolvla"]
+# Policies whose `predict_action_chunk` takes the observations stacked in their queues by `select_action`
+QUEUE_POLICIES = ["diffusion", "tdmpc", "vqbet"]
+
+IMAGE_KEY = "observation.image"
+STATE_KEY = "observation.state"
+ACTION_KEY = "action"
+REWARD_KEY = "next.reward"
+TASK = "Pick up the cube."
+
+
+def make_policy(policy_type: str, args: argparse.Namespace):
+    from lerobot.configs.types import FeatureType, PolicyFeature
+    from lerobot.policies.factory import get_policy_class, make_policy_config
+
+    features = {
+        IMAGE_KEY: PolicyFeature(FeatureType.VISUAL, (3, args.image_size, args.image_size)),
+        STATE_KEY: PolicyFeature(FeatureType.STATE, (args.state_dim,)),
+        ACTION_KEY: PolicyFeature(FeatureType.ACTION, (args.state_dim,)),
+    }
+    stats = {
+        key: {
+            "mean": torch.zeros(ft.shape[:1] + (1,) * (len(ft.shape) - 1)),
+            "std": torch.ones(ft.shape[:1] + (1,) * (len(ft.shape) - 1)),
+            "min": -torch.ones(ft.shape[:1] + (1,) * (len(ft.shape) - 1)),
+            "max": torch.ones(ft.shape[:1] + (1,) * (len(ft.shape) - 1)),
+        }
+        for key, ft in features.items()
+    }
+    kwargs = {}
+    if policy_type == "act":
+        kwargs["pretrained_backbone_weights"] = None
+    elif policy_type == "sac":
+        # SAC normalizes its inputs with the stats of its config
+        kwargs["dataset_stats"] = {
+            key: {name: value.tolist() for name, value in key_stats.items()}
+            for key, key_stats in stats.items()
+        }
+    config = make_policy_config(
+        policy_type,
+        input_features={key: ft for key, ft in features.items() if key != ACTION_KEY},
+        output_features={ACTION_KEY: features[ACTION_KEY]},
+        device=args.device,
+        **kwargs,
+    )
+    policy = get_policy_class(policy_type)(config, dataset_stats=stats)
+    return policy.to(args.device), config
+
+
+def make_observation(batch_size: int, args: argparse.Namespace, steps: int | None = None) -> dict:
+    """Observation of `batch_size` samples, with a time dimension of size `steps` if it is not None."""
+    shape = (batch_size,) if steps is None else (batch_size, steps)
+    observation = {
+        IMAGE_KEY: torch.rand(*shape, 3, args.image_size, args.image_size, device=args.device),
+        STATE_KEY: torch.randn(*shape, args.state_dim, device=args.device),
+    }
+    if steps is not None:
+        for key in list(observation):
+            observation[f"{key}_is_pad"] = torch.zeros(*shape, dtype=torch.bool, device=args.device)
+    return observation
+
+
+def make_training_batch(policy_type: str, config, batch_size: int, args: argparse.Namespace) -> dict:
+    """Batch with the observation, action and reward horizons that the policy's deltas request."""
+    if policy_type == "sac":
+        return {
+            "state": make_observation(batch_size, args),
+            "next_state": make_observation(batch_size, args),
+            "action": torch.rand(batch_size, args.state_dim, device=args.device) * 2 - 1,
+            "reward": torch.randn(batch_size, device=args.device),
+            "done": torch.zeros(batch_size, device=args.device),
+        }
+
+    obs_steps = len(config.observation_delta_indices) if config.observation_delta_indices else None
+    n_actions = len(config.action_delta_indices) if config.action_delta_indices else 1
+    batch = {
+        **make_observation(batch_size, args, obs_steps),
+        ACTION_KEY: torch.randn(batch_size, n_actions, args.state_dim, device=args.device),
+        "action_is_pad": torch.zeros(batch_size, n_actions, dtype=torch.bool, device=args.device),
+        "index": torch.arange(batch_size, device=args.device),
+        "task": [TASK] * batch_size,
+    }
+    if config.reward_delta_indices:
+        n_rewards = len(config.reward_delta_indices)
+        batch[REWARD_KEY] = torch.randn(batch_size, n_rewards, device=args.device)
+        batch[f"{REWARD_KEY}_is_pad"] = torch.zeros(
+            batch_size, n_rewards, dtype=torch.bool, device=args.device
+        )
+    return batch
+
+
+def make_train_step(policy_type: str, policy, config):
+    from torch.amp import GradScaler
+
+    from lerobot.scripts.train import update_policy
+
+    optimizer_config = config.get_optimizer_preset()
+    if policy_type == "sac":
+        params = policy.get_optim_params()
+        params["temperature"] = [params["temperature"]]
+        optimizers = optimizer_config.build(params)
+
+        def sac_train_step(batch):
+            # As the updates of `learner.py`, one optimizer per loss
+            for name in ["critic", "actor", "temperature"]:
+                loss = policy(batch, model=name)[f"loss_{name}"]
+                optimizers[name].zero_grad()
+                loss.backward()
+                optimizers[name].step()
+            policy.update_target_networks()
+            policy.update_temperature()
+
+        return sac_train_step
+
+    optimizer = optimizer_config.build(policy.parameters())
+    grad_scaler = GradScaler(config.device, enabled=False)
+    metrics = SimpleNamespace()
+    return lambda batch: update_policy(
+        metrics, policy, dict(batch), optimizer, optimizer_config.grad_clip_norm, grad_scaler
+    )
+
+
+def synchronize(device: str) -> None:
+    if device == "cuda":
+        torch.cuda.synchronize()
+
+
+def time_calls(fn, args: argparse.Namespace) -> list[float]:
+    for _ in range(args.warmup_calls):
+        fn()
+    synchronize(args.device)
+    durations = []
+    for _ in range(args.num_calls):
+        start = time.perf_counter()
+        fn()
+        synchronize(args.device)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def summarize(durations: list[float], batch_size: int) -> dict:
+    return {
+        "p50_ms": 1000 * float(np.percentile(durations, 50)),
+        "p99_ms": 1000 * float(np.percentile(durations, 99)),
+        "samples_per_s": batch_size * len(durations) / sum(durations),
+    }
+
+
+def benchmark_policy(policy_type: str, batch_size: int, args: argparse.Namespace) -> dict:
+    """Measure a policy at a batch size, in a new process."""
+    torch.manual_seed(0)
+    if args.num_threads is not None:
+        torch.set_num_threads(args.num_threads)
+
+    start = time.perf_counter()
+    policy, config = make_policy(policy_type, args)
+    policy.eval()
+    observation = {**make_observation(batch_size, args), "task": [TASK] * batch_size}
+    with torch.inference_mode():
+        policy.select_action(dict(observation))
+    synchronize(args.device)
+    result = {
+        "cold_start_s": time.perf_counter() - start,
+        "num_parameters": sum(p.numel() for p in policy.parameters()),
+    }
+
+    def select_action():
+        policy.reset()
+        policy.select_action(dict(observation))
+
+    with torch.inference_mode():
+        result["select_action"] = summarize(time_calls(select_action, args), batch_size)
+        chunk_input = dict(observation)
+        if policy_type in QUEUE_POLICIES:
+            policy.reset()
+            policy.select_action(dict(observation))
+            # Only the keys are used, to select the queues
+            chunk_input = {key: None for key in policy._queues if key != ACTION_KEY}
+        try:
+            policy.predict_action_chunk(dict(chunk_input))
+        except NotImplementedError:
+            result["predict_action_chunk"] = None
+        else:
+            durations = time_calls(lambda: policy.predict_action_chunk(dict(chunk_input)), args)
+            result["predict_action_chunk"] = summarize(durations, batch_size)
+
+    policy.train()
+    batch = make_training_batch(policy_type, config, batch_size, args)
+    train_step = make_train_step(policy_type, policy, config)
+    result["train_step"] = summarize(time_calls(lambda: train_step(batch), args), batch_size)
+
+    if args.device == "cuda":
+        result["peak_memory_mb"] = torch.cuda.max_memory_allocated() / 2**20
+    else:
+        # Kilobytes on Linux
+        result["peak_memory_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+    return result
+
+
+def format_latency(result: dict | None) -> str:
+    if result is None:
+        return f"{'n/a':>17}"
+    return f"{result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--policies", type=str, nargs="+", choices=POLICIES, default=POLICIES)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--device", type=str, default="cpu")
+    parser.add_argument("--num-threads", type=int, default=None, help="Number of threads of torch on CPU.")
+    parser.add_argument("--image-size", type=int, default=96, help="Height and width of the camera images.")
+    parser.add_argument("--state-dim", type=int, default=6, help="Dimension of the state and action.")
+    parser.add_argument("--num-calls", type=int, default=20, help="Number of measured calls.")
+    parser.add_argument("--warmup-calls", type=int, default=3, help="Number of calls before measuring.")
+    parser.add_argument("--output", type=Path, default=None, help="Path of the JSON report.")
+    args = parser.parse_args()
+
+    results = []
+    print(f"on {args.device}, latencies in ms (p50 p99)")
+    print(
+        f"{'policy':>9} | {'batch':>5} | {'cold (s)':>8} | {'select_action':>17} | "
+        f"{'predict_chunk':>17} | {'train step':>17} | {'train smp/s':>11} | {'peak MB':>7}"
+    )
+    # A new process for each measurement, spawned to not inherit the state of this one
+    context = multiprocessing.get_context("spawn")
+    for policy_type in args.policies:
+        for batch_size in args.batch_sizes:
+            settings = {"policy": policy_type, "batch_size": batch_size}
+            try:
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    result = executor.submit(benchmark_policy, policy_type, batch_size, args).result()
+            except Exception as e:
+                results.append({**settings, "error": repr(e)})
+                error = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+                print(f"{policy_type:>9} | {batch_size:>5} | failed: {error}")
+                continue
+            results.append({**settings, **result})
+            print(
+                f"{policy_type:>9} | {batch_size:>5} | {result['cold_start_s']:>8.2f} | "
+                f"{format_latency(result['select_action'])} | "
+                f"{format_latency(result['predict_action_chunk'])} | "
+                f"{format_latency(result['train_step'])} | "
+                f"{result['train_step']['samples_per_s']:>11.1f} | {result['peak_memory_mb']:>7.0f}"
+            )
+
+    if args.output is not None:
+        report = {
+            "config": {
+                key: str(value) if isinstance(value, Path) else value for key, value in vars(args).items()
+            },
+            "platform": {
+                "python": platform.python_version(),
+                "torch": torch.__version__,
+                "num_threads": args.num_threads or torch.get_num_threads(),
+            },
+            "results": results,
+        }
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the training throughput of distributed data-parallel training for increasing numbers of processes.
+
+For each world size, the processes are spawned on this machine and run `update_policy` on a policy wrapped
+with `wrap_policy`, as `train.py` does under `torchrun`, on synthetic batches of `--batch-size` samples per
+process. The policy is an MLP of `--hidden-dim` units, so that the ratio of compute to gradient communication
+can be varied. The scaling efficiency is the throughput over `world_size` times the single-process throughput.
+
+On CPU, use at most as many processes as cores. With `--device cuda`, each process uses its own GPU.
+
+Example:
+```bash
+python benchmarks/training/distributed_scaling.py --world-sizes 1 2 4 --device cuda --hidden-dim 4096
+```
+"""
+
+import argparse
+import os
+import socket
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import torch
+import torch.multiprocessing as mp
+from torch import nn
+from torch.amp import GradScaler
+
+from lerobot.scripts.train import update_policy
+from lerobot.utils.distributed import cleanup_distributed, init_distributed, unwrap_policy, wrap_policy
+
+
+class MLPPolicy(nn.Module):
+    def __init__(self, input_dim: int, hidden_dim: int, num_layers: int):
+        super().__init__()
+        layers = [nn.Linear(input_dim, hidden_dim), nn.ReLU()]
+        for _ in range(num_layers - 1):
+            layers += [nn.Linear(hidden_dim, hidden_dim), nn.ReLU()]
+        layers.append(nn.Linear(hidden_dim, input_dim))
+        self.net = nn.Sequential(*layers)
+
+    def forward(self, batch):
+        return nn.functional.mse_loss(self.net(batch["observation.state"]), batch["action"]), {}
+
+
+def run_process(rank: int, world_size: int, port: int, args: argparse.Namespace, output_dir: str) -> None:
+    os.environ.update(
+        {
+            "MASTER_ADDR": "127.0.0.1",
+            "MASTER_PORT": str(port),
+            "RANK": str(rank),
+            "LOCAL_RANK": str(rank),
+            "WORLD_SIZE": str(world_size),
+        }
+    )
+    device = torch.device("cuda", rank) if args.device == "cuda" else torch.device("cpu")
+    if device.type == "cuda":
+        torch.cuda.set_device(device)
+    state = init_distributed(device.type)
+    try:
+        policy = MLPPolicy(args.input_dim, args.hidden_dim, args.num_layers).to(device)
+        model = wrap_policy(policy, state, device)
+        optimizer = torch.optim.AdamW(unwrap_policy(model).parameters(), lr=1e-4)
+        grad_scaler = GradScaler(device.type, enabled=False)
+        batch = {
+            "observation.state": torch.randn(args.batch_size, args.input_dim, device=device),
+            "action": torch.randn(args.batch_size, args.input_dim, device=device),
+        }
+
+        for step in range(args.warmup_steps + args.steps):
+            if step == args.warmup_steps:
+                if device.type == "cuda":
+                    torch.cuda.synchronize()
+                start = time.perf_counter()
+            update_policy(SimpleNamespace(), model, batch, optimizer, 1.0, grad_scaler)
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+        elapsed_s = time.perf_counter() - start
+
+        if state.is_main_process:
+            Path(output_dir, f"{world_size}.txt").write_text(str(elapsed_s))
+    finally:
+        cleanup_distributed()
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--world-sizes", type=int, nargs="+", default=[1, 2], help="Numbers of processes.")
+    parser.add_argument("--device", type=str, default="cpu", choices=["cpu", "cuda"])
+    parser.add_argument("--batch-size", type=int, default=64, help="Batch size of each process.")
+    parser.add_argument("--input-dim", type=int, default=32, help="Dimension of the state and action.")
+    parser.add_argument("--hidden-dim", type=int, default=512, help="Width of the MLP.")
+    parser.add_argument("--num-layers", type=int, default=4, help="Number of hidden layers of the MLP.")
+    parser.add_argument("--steps", type=int, default=50, help="Number of measured steps.")
+    parser.add_argument("--warmup-steps", type=int, default=5, help="Number of steps before measuring.")
+    args = parser.parse_args()
+
+    num_params = sum(
+        p.numel() for p in MLPPolicy(args.input_dim, args.hidden_dim, args.num_layers).parameters()
+    )
+    print(f"{num_params / 1e6:.1f}M parameters, batch size {args.batch_size} per process on {args.device}")
+    print(f"{'processes':>9} | {'step (ms)':>9} | {'samples/s':>9} | {'efficiency':>10}")
+    base_throughput = None
+    with tempfile.TemporaryDirectory() as output_dir:
+        for world_size in args.world_sizes:
+            mp.spawn(
+                run_process,
+                args=(world_size, get_free_port(), args, output_dir),
+                nprocs=world_size,
+                join=True,
+            )
+            elapsed_s = float(Path(output_dir, f"{world_size}.txt").read_text())
+            throughput = args.steps * args.batch_size * world_size / elapsed_s
+            if base_throughput is None:
+                base_throughput = throughput / world_size
+            efficiency = throughput / (base_throughput * world_size)
+            print(
+                f"{world_size:>9} | "
+                f"{1000 * elapsed_s / args.steps:>9.2f} | "
+                f"{throughput:>9.0f} | "
+                f"{100 * efficiency:>9.0f}%"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the time of a training step of policies, eager or compiled, with or without a fused optimizer.
+
+Each policy is built with its default config for one camera and a state, and trained with its optimizer preset
+by `update_policy` on a synthetic batch, as `train.py` does. The variants match the training options:
+- `eager`: the default.
+- `fused`: `--fused_optimizer=true`.
+- `compile`: `--use_torch_compile=true`.
+- `compile+fused`: both.
+- `cuda-graphs`: `--use_torch_compile=true --torch_compile_mode=reduce-overhead --fused_optimizer=true`, on
+  CUDA only.
+
+The first `--warmup-steps` steps, which include the compilation, are not measured. The speedup is relative
+to the first variant.
+
+Example:
+```bash
+python benchmarks/training/step_time.py --policies act diffusion --device cuda --batch-size 64
+```
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import torch
+from torch.amp import GradScaler
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.policies.factory import get_policy_class, make_policy_config
+from lerobot.scripts.train import update_policy
+
+VARIANTS = {
+    "eager": {"compile": False, "fused": False, "mode": None},
+    "fused": {"compile": False, "fused": True, "mode": None},
+    "compile": {"compile": True, "fused": False, "mode": None},
+    "compile+fused": {"compile": True, "fused": True, "mode": None},
+    "cuda-graphs": {"compile": True, "fused": True, "mode": "reduce-overhead"},
+}
+
+IMAGE_KEY = "observation.images.top"
+STATE_KEY = "observation.state"
+ACTION_KEY = "action"
+
+
+def make_policy(policy_type: str, args: argparse.Namespace):
+    features = {
+        IMAGE_KEY: PolicyFeature(FeatureType.VISUAL, (3, args.image_size, args.image_size)),
+        STATE_KEY: PolicyFeature(FeatureType.STATE, (args.state_dim,)),
+        ACTION_KEY: PolicyFeature(FeatureType.ACTION, (args.state_dim,)),
+    }
+    kwargs = {"pretrained_backbone_weights": None} if policy_type == "act" else {}
+    config = make_policy_config(
+        policy_type,
+        input_features={key: ft for key, ft in features.items() if key != ACTION_KEY},
+        output_features={ACTION_KEY: features[ACTION_KEY]},
+        device=args.device,
+        **kwargs,
+    )
+    stats = {
+        key: {
+            "mean": np.zeros(ft.shape[:1] + (1,) * (len(ft.shape) - 1), dtype=np.float32),
+            "std": np.ones(ft.shape[:1] + (1,) * (len(ft.shape) - 1), dtype=np.float32),
+            "min": -np.ones(ft.shape[:1] + (1,) * (len(ft.shape) - 1), dtype=np.float32),
+            "max": np.ones(ft.shape[:1] + (1,) * (len(ft.shape) - 1), dtype=np.float32),
+        }
+        for key, ft in features.items()
+    }
+    policy = get_policy_class(policy_type)(config, dataset_stats=stats)
+    return policy.to(args.device), config
+
+
+def make_batch(config, args: argparse.Namespace) -> dict[str, torch.Tensor]:
+    """Batch with the observation and action horizons that the policy's deltas request."""
+    n_obs_steps = len(config.observation_delta_indices) if config.observation_delta_indices else 1
+    n_actions = len(config.action_delta_indices)
+    obs_shape = (args.batch_size, n_obs_steps) if n_obs_steps > 1 else (args.batch_size,)
+    batch = {
+        IMAGE_KEY: torch.rand(*obs_shape, 3, args.image_size, args.image_size),
+        STATE_KEY: torch.randn(*obs_shape, args.state_dim),
+        ACTION_KEY: torch.randn(args.batch_size, n_actions, args.state_dim),
+        "action_is_pad": torch.zeros(args.batch_size, n_actions, dtype=torch.bool),
+    }
+    return {key: value.to(args.device) for key, value in batch.items()}
+
+
+def measure_step_time(policy_type: str, variant: dict, args: argparse.Namespace) -> float:
+    torch.manual_seed(0)
+    policy, config = make_policy(policy_type, args)
+    optimizer_config = config.get_optimizer_preset()
+    optimizer_config.fused = variant["fused"]
+    optimizer = optimizer_config.build(policy.parameters())
+    if variant["compile"]:
+        policy.compile(mode=variant["mode"])
+    grad_scaler = GradScaler(args.device, enabled=False)
+    batch = make_batch(config, args)
+    metrics = SimpleNamespace()
+
+    for step in range(args.warmup_steps + args.steps):
+        if step == args.warmup_steps:
+            if args.device == "cuda":
+                torch.cuda.synchronize()
+            start = time.perf_counter()
+        update_policy(metrics, policy, dict(batch), optimizer, optimizer_config.grad_clip_norm, grad_scaler)
+    if args.device == "cuda":
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) / args.steps
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--policies", type=str, nargs="+", default=["act", "diffusion"])
+    parser.add_argument("--variants", type=str, nargs="+", choices=list(VARIANTS), default=list(VARIANTS))
+    parser.add_argument("--device", type=str, default="cuda" if torch.cuda.is_available() else "cpu")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--image-size", type=int, default=96, help="Height and width of the camera images.")
+    parser.add_argument("--state-dim", type=int, default=6, help="Dimension of the state and action.")
+    parser.add_argument("--steps", type=int, default=20, help="Number of measured steps.")
+    parser.add_argument("--warmup-steps", type=int, default=3, help="Number of steps before measuring.")
+    args = parser.parse_args()
+
+    variants = [v for v in args.variants if args.device == "cuda" or VARIANTS[v]["mode"] is None]
+    print(f"batch size {args.batch_size} on {args.device}")
+    print(f"{'policy':>10} | {'variant':>13} | {'step (ms)':>9} | {'speedup':>7}")
+    for policy_type in args.policies:
+        reference_s = None
+        for name in variants:
+            step_s = measure_step_time(policy_type, VARIANTS[name], args)
+            if reference_s is None:
+                reference_s = step_s
+            print(f"{policy_type:>10} | {name:>13} | {1000 * step_s:>9.2f} | {reference_s / step_s:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
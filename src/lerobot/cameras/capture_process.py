@@ -0,0 +1,337 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides the ProcessCamera class, which captures frames from any camera in a dedicated worker process and
+shares them with the control process through a ring buffer in shared memory.
+"""
+
+import logging
+import multiprocessing as mp
+import time
+from dataclasses import replace
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+
+from lerobot.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
+
+from .camera import Camera
+from .configs import CameraConfig, ColorMode
+from .ring_buffer import FrameRingBuffer, TimestampedFrame
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RING_BUFFER_SIZE = 4
+CONNECT_TIMEOUT_S = 30.0
+STOP_TIMEOUT_S = 2.0
+
+
+def _capture_worker(config: CameraConfig, warmup: bool, num_slots: int, conn, condition, stop_event) -> None:
+    """
+    Entry point of the capture process.
+
+    Connects the camera, sends its (height, width, fps) to the control process, which answers with the name of
+    the shared memory holding the ring buffer, then captures frames into the ring until `stop_event` is set.
+    The worker closes its end of the pipe once the camera is released.
+    """
+    from .opencv import OpenCVCamera
+    from .utils import make_cameras_from_configs
+
+    camera = make_cameras_from_configs({"camera": replace(config, capture_process=False)})["camera"]
+    try:
+        camera.connect(warmup=warmup)
+    except Exception as e:
+        conn.send(e)
+        conn.close()
+        return
+
+    shared_memory = None
+    try:
+        conn.send((camera.height, camera.width, camera.fps))
+        shared_memory = SharedMemory(name=conn.recv())
+        ring = FrameRingBuffer(
+            num_slots,
+            (camera.height, camera.width, 3),
+            buffer=shared_memory.buf,
+            condition=condition,
+            initialize=False,
+        )
+
+        # OpenCV cameras decode and post-process straight into the shared slots
+        read_into_buffer = isinstance(camera, OpenCVCamera)
+        if read_into_buffer:
+            camera.frame_buffer = ring
+
+        while not stop_event.is_set():
+            try:
+                if read_into_buffer:
+                    camera._read_into_buffer()
+                else:
+                    frame = camera.read()
+                    ring.write(frame, time.perf_counter())
+
+            except DeviceNotConnectedError:
+                break
+            except Exception as e:
+                logger.warning(f"Error reading frame in capture process for {camera}: {e}")
+    finally:
+        # Release the views on the shared memory before closing it
+        ring = None
+        if isinstance(camera, OpenCVCamera):
+            camera.frame_buffer = None
+        if camera.is_connected:
+            camera.disconnect()
+        if shared_memory is not None:
+            shared_memory.close()
+        conn.close()
+
+
+class ProcessCamera(Camera):
+    """
+    Runs any camera in a dedicated capture process, and reads its frames from shared memory.
+
+    In the control process, the read threads of in-process cameras contend for the GIL with servo I/O and policy
+    inference: decoding, color conversion and rotation all happen in Python threads. A `ProcessCamera` moves
+    them to a worker process, one per camera. The worker writes each frame into a `FrameRingBuffer` living in a
+    `multiprocessing.shared_memory` segment, and publishes it through a `multiprocessing.Condition`, so only
+    the frame index crosses the process boundary.
+
+    The ring exposes the same reads as `OpenCVCamera`: `async_read`, `read_latest`, `read_since` and
+    `read_nearest`. By default, frames are copied out of shared memory, so they stay valid however long the
+    caller holds them (e.g. while queued to the dataset's image writer). With `zero_copy=True`, reads return
+    read-only views of the shared slots, which are overwritten once the worker wraps around the ring: only use
+    it when frames are consumed before `ring_buffer_size` new frames are captured.
+
+    Set `capture_process=True` in a camera config to have `make_cameras_from_configs` wrap it in a
+    `ProcessCamera`.
+
+    Example:
+        ```python
+        from lerobot.cameras.opencv import OpenCVCameraConfig
+        from lerobot.cameras.capture_process import ProcessCamera
+
+        camera = ProcessCamera(OpenCVCameraConfig(index_or_path=0, fps=30, width=640, height=480))
+        camera.connect()
+        frame = camera.async_read()
+        camera.disconnect()
+        ```
+    """
+
+    def __init__(self, config: CameraConfig, zero_copy: bool = False):
+        """
+        Args:
+            config: Configuration of the wrapped camera.
+            zero_copy: Whether reads return read-only views of the shared memory instead of copies.
+        """
+        super().__init__(config)
+
+        self.config = config
+        self.zero_copy = zero_copy
+        self.ring_buffer_size = getattr(config, "ring_buffer_size", DEFAULT_RING_BUFFER_SIZE)
+
+        self.process: mp.Process | None = None
+        self.conn = None
+        self.stop_event = None
+        self.shared_memory: SharedMemory | None = None
+        self.frame_buffer: FrameRingBuffer | None = None
+        self.last_async_seq: int = -1
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.config.type})"
+
+    @property
+    def is_connected(self) -> bool:
+        """Checks if the capture process is running and sharing frames."""
+        return self.frame_buffer is not None and self.process is not None and self.process.is_alive()
+
+    @staticmethod
+    def find_cameras() -> list[dict[str, Any]]:
+        """Cameras are detected by the camera classes wrapped by `ProcessCamera`."""
+        return []
+
+    def connect(self, warmup: bool = True) -> None:
+        """
+        Starts the capture process, which connects to the camera, and sets up the shared ring buffer.
+
+        Raises:
+            DeviceAlreadyConnectedError: If the camera is already connected.
+            ConnectionError: If the capture process fails to connect to the camera.
+        """
+        if self.is_connected:
+            raise DeviceAlreadyConnectedError(f"{self} is already connected.")
+
+        # Spawn rather than fork, so the worker does not inherit the control process' threads and locks
+        ctx = mp.get_context("spawn")
+        self.conn, child_conn = ctx.Pipe()
+        condition = ctx.Condition()
+        self.stop_event = ctx.Event()
+        self.process = ctx.Process(
+            target=_capture_worker,
+            args=(self.config, warmup, self.ring_buffer_size, child_conn, condition, self.stop_event),
+            name=f"{self}_capture",
+            daemon=True,
+        )
+        self.process.start()
+        # Only the worker holds its end of the pipe, so its exit is seen as EOF
+        child_conn.close()
+
+        try:
+            message = self.conn.recv() if self.conn.poll(CONNECT_TIMEOUT_S) else None
+        except EOFError:
+            message = None
+        if not isinstance(message, tuple):
+            self._stop_process()
+            raise ConnectionError(f"Capture process of {self} failed to connect the camera.") from message
+
+        self.height, self.width, self.fps = message
+        shape = (self.height, self.width, 3)
+        self.shared_memory = SharedMemory(
+            create=True, size=FrameRingBuffer.nbytes(self.ring_buffer_size, shape)
+        )
+        self.frame_buffer = FrameRingBuffer(
+            self.ring_buffer_size, shape, buffer=self.shared_memory.buf, condition=condition
+        )
+        self.conn.send(self.shared_memory.name)
+
+        logger.info(f"{self} connected.")
+
+    def read(self, color_mode: ColorMode | None = None) -> np.ndarray:
+        """
+        Waits for the next frame captured by the worker process and returns it.
+
+        Raises:
+            ValueError: If a `color_mode` is requested, the worker always outputs the configured color mode.
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no frame is captured within a second.
+        """
+        if color_mode is not None:
+            raise ValueError(f"{self} outputs frames in the color mode of its config, got {color_mode}.")
+
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        return self._wait_for_frame(self.frame_buffer.last_seq, 1000).frame
+
+    def async_read(self, timeout_ms: float = 200) -> np.ndarray:
+        """
+        Reads the latest frame captured by the worker process, waiting up to `timeout_ms` for a frame more
+        recent than the one returned by the previous call.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no frame becomes available within the specified timeout.
+        """
+        frame = self._wait_for_frame(self.last_async_seq, timeout_ms)
+        self.last_async_seq = frame.seq
+        return frame.frame
+
+    def _wait_for_frame(self, after_seq: int, timeout_ms: float) -> TimestampedFrame:
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        frame = self.frame_buffer.wait_for_frame(
+            after_seq, timeout=timeout_ms / 1000.0, copy=not self.zero_copy
+        )
+        if frame is None:
+            raise TimeoutError(
+                f"Timed out waiting for frame from camera {self} after {timeout_ms} ms. "
+                f"Capture process alive: {self.process.is_alive()}."
+            )
+
+        return frame
+
+    def read_latest(self, timeout_ms: float = 200) -> TimestampedFrame:
+        """
+        Returns the most recent frame, with its capture timestamp and sequence number. Only waits (up to
+        `timeout_ms`) if no frame was captured yet.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no frame becomes available within the specified timeout.
+        """
+        return self._wait_for_frame(-1, timeout_ms)
+
+    def read_since(self, seq: int) -> list[TimestampedFrame]:
+        """
+        Returns the frames captured after the frame with sequence number `seq` that are still in the ring
+        buffer, oldest first.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        return self.frame_buffer.read_since(seq, copy=not self.zero_copy)
+
+    def read_nearest(self, timestamp: float, timeout_ms: float = 200) -> TimestampedFrame:
+        """
+        Returns the buffered frame whose capture time is closest to `timestamp`, on the `time.perf_counter()`
+        clock, which is shared by all processes.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no frame becomes available within the specified timeout.
+        """
+        self._wait_for_frame(-1, timeout_ms)
+        return self.frame_buffer.read_nearest(timestamp, copy=not self.zero_copy)
+
+    def _stop_process(self) -> None:
+        """Signals the capture process to stop and waits for it to exit."""
+        if self.stop_event is not None:
+            self.stop_event.set()
+
+        if self.process is not None:
+            # Wait for the worker to release the camera, which closes its end of the pipe. The teardown of the
+            # interpreter that follows can be slow (the worker imports the main module), so it is cut short.
+            if not self.conn.poll(STOP_TIMEOUT_S):
+                logger.warning(f"Capture process of {self} did not stop, terminating it.")
+            self.process.join(timeout=0.1)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+            self.conn.close()
+
+        self.process = None
+        self.conn = None
+        self.stop_event = None
+
+    def disconnect(self) -> None:
+        """
+        Stops the capture process, which disconnects the camera, and releases the shared memory.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is already disconnected.
+        """
+        if self.process is None and self.shared_memory is None:
+            raise DeviceNotConnectedError(f"{self} not connected.")
+
+        self._stop_process()
+
+        self.frame_buffer = None
+        self.last_async_seq = -1
+        if self.shared_memory is not None:
+            try:
+                self.shared_memory.close()
+            except BufferError:
+                # Zero-copy frames still held by the caller keep the mapping alive until they are released
+                logger.warning(
+                    f"{self} frames are still in use, the shared memory is unmapped once released."
+                )
+            self.shared_memory.unlink()
+            self.shared_memory = None
+
+        logger.info(f"{self} disconnected.")
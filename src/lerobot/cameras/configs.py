@@ -38,6 +38,8 @@ class CameraConfig(draccus.ChoiceRegistry, abc.ABC):
     fps: int | None = None
     width: int | None = None
     height: int | None = None
+    # Capture frames in a dedicated process, see `ProcessCamera`
+    capture_process: bool = False
 
     @property
     def type(self) -> str:
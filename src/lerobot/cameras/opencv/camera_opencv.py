@@ -22,7 +22,7 @@ import os
 import platform
 import time
 from pathlib import Path
-from threading import Event, Lock, Thread
+from threading import Event, Thread
 from typing import Any
 
 # Fix MSMF hardware transform compatibility for Windows before importing cv2
@@ -34,6 +34,7 @@ import numpy as np
 from lerobot.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
 from ..camera import Camera
+from ..ring_buffer import FrameRingBuffer, TimestampedFrame
 from ..utils import get_cv2_backend, get_cv2_rotation
 from .configuration_opencv import ColorMode, OpenCVCameraConfig
 
@@ -83,6 +84,11 @@ class OpenCVCamera(Camera):
         # Read 1 frame asynchronously
         async_image = camera.async_read()
 
+        # Read timestamped frames from the ring buffer filled by the background thread
+        latest = camera.read_latest()
+        new_frames = camera.read_since(latest.seq)
+        aligned = camera.read_nearest(time.perf_counter())
+
         # When done, properly disconnect the camera using
         camera.disconnect()
 
@@ -120,9 +126,11 @@ class OpenCVCamera(Camera):
 
         self.thread: Thread | None = None
         self.stop_event: Event | None = None
-        self.frame_lock: Lock = Lock()
-        self.latest_frame: np.ndarray | None = None
-        self.new_frame_event: Event = Event()
+        self.frame_buffer: FrameRingBuffer | None = None
+        self.ring_buffer_size = config.ring_buffer_size
+        # Sequence number of the last frame returned by `async_read`
+        self.last_async_seq: int = -1
+        self._raw_frame: np.ndarray | None = None
 
         self.rotation: int | None = get_cv2_rotation(config.rotation)
         self.backend: int = get_cv2_backend()
@@ -329,7 +337,9 @@ class OpenCVCamera(Camera):
 
         return processed_frame
 
-    def _postprocess_image(self, image: np.ndarray, color_mode: ColorMode | None = None) -> np.ndarray:
+    def _postprocess_image(
+        self, image: np.ndarray, color_mode: ColorMode | None = None, out: np.ndarray | None = None
+    ) -> np.ndarray:
         """
         Applies color conversion, dimension validation, and rotation to a raw frame.
 
@@ -337,6 +347,9 @@ class OpenCVCamera(Camera):
             image (np.ndarray): The raw image frame (expected BGR format from OpenCV).
             color_mode (Optional[ColorMode]): The target color mode (RGB or BGR). If None,
                                              uses the instance's default `self.color_mode`.
+            out (Optional[np.ndarray]): If provided, the processed frame is written into this
+                                        preallocated array instead of a new one. `image` may
+                                        then be modified in place.
 
         Returns:
             np.ndarray: The processed image frame.
@@ -363,33 +376,67 @@ class OpenCVCamera(Camera):
         if c != 3:
             raise RuntimeError(f"{self} frame channels={c} do not match expected 3 channels (RGB/BGR).")
 
+        rotate = self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE, cv2.ROTATE_180]
+
+        if out is not None:
+            if requested_color_mode == ColorMode.RGB:
+                cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image if rotate else out)
+            if rotate:
+                cv2.rotate(image, self.rotation, dst=out)
+            elif requested_color_mode != ColorMode.RGB:
+                np.copyto(out, image)
+            return out
+
         processed_image = image
         if requested_color_mode == ColorMode.RGB:
             processed_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
-        if self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE, cv2.ROTATE_180]:
+        if rotate:
             processed_image = cv2.rotate(processed_image, self.rotation)
 
         return processed_image
 
+    def _read_into_buffer(self) -> None:
+        """
+        Captures a frame straight into the next slot of the ring buffer, without allocating memory.
+
+        The capture timestamp is taken as soon as the frame is grabbed, before it is decoded and
+        post-processed, so that it is as close as possible to the exposure time.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            RuntimeError: If grabbing or decoding the frame fails.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        if not self.videocapture.grab():
+            raise RuntimeError(f"{self} grab failed.")
+        timestamp = time.perf_counter()
+
+        ret, frame = self.videocapture.retrieve(self._raw_frame)
+        if not ret or frame is None:
+            raise RuntimeError(f"{self} read failed (status={ret}).")
+        # Reuse the decoded frame buffer, unless the backend returned a frame of a different layout
+        self._raw_frame = frame
+
+        self._postprocess_image(frame, out=self.frame_buffer.begin_write())
+        self.frame_buffer.commit_write(timestamp)
+
     def _read_loop(self):
         """
         Internal loop run by the background thread for asynchronous reading.
 
         On each iteration:
-        1. Reads a color frame
-        2. Stores result in latest_frame (thread-safe)
-        3. Sets new_frame_event to notify listeners
+        1. Grabs a color frame and timestamps it
+        2. Decodes and post-processes it into the next slot of the ring buffer
+        3. Publishes the frame, notifying waiting readers
 
         Stops on DeviceNotConnectedError, logs other errors and continues.
         """
         while not self.stop_event.is_set():
             try:
-                color_image = self.read()
-
-                with self.frame_lock:
-                    self.latest_frame = color_image
-                self.new_frame_event.set()
+                self._read_into_buffer()
 
             except DeviceNotConnectedError:
                 break
@@ -403,6 +450,9 @@ class OpenCVCamera(Camera):
         if self.stop_event is not None:
             self.stop_event.set()
 
+        if self.frame_buffer is None:
+            self.frame_buffer = FrameRingBuffer(self.ring_buffer_size, (self.height, self.width, 3))
+
         self.stop_event = Event()
         self.thread = Thread(target=self._read_loop, args=(), name=f"{self}_read_loop")
         self.thread.daemon = True
@@ -440,27 +490,74 @@ class OpenCVCamera(Camera):
             TimeoutError: If no frame becomes available within the specified timeout.
             RuntimeError: If an unexpected error occurs.
         """
+        frame = self._wait_for_frame(self.last_async_seq, timeout_ms)
+        self.last_async_seq = frame.seq
+        return frame.frame
+
+    def _wait_for_frame(self, after_seq: int, timeout_ms: float) -> TimestampedFrame:
+        """Starts the background thread if needed, and waits for a frame more recent than `after_seq`."""
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
         if self.thread is None or not self.thread.is_alive():
             self._start_read_thread()
 
-        if not self.new_frame_event.wait(timeout=timeout_ms / 1000.0):
+        frame = self.frame_buffer.wait_for_frame(after_seq, timeout=timeout_ms / 1000.0)
+        if frame is None:
             thread_alive = self.thread is not None and self.thread.is_alive()
             raise TimeoutError(
                 f"Timed out waiting for frame from camera {self} after {timeout_ms} ms. "
                 f"Read thread alive: {thread_alive}."
             )
 
-        with self.frame_lock:
-            frame = self.latest_frame
-            self.new_frame_event.clear()
+        return frame
 
-        if frame is None:
-            raise RuntimeError(f"Internal error: Event set but no frame available for {self}.")
+    def read_latest(self, timeout_ms: float = 200) -> TimestampedFrame:
+        """
+        Returns the most recent frame captured by the background read thread, with its
+        capture timestamp and sequence number.
 
-        return frame
+        Unlike `async_read`, this does not wait for a frame newer than the previous call,
+        and does not affect what other readers get. It only waits (up to `timeout_ms`) if
+        no frame was captured yet.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no frame becomes available within the specified timeout.
+        """
+        return self._wait_for_frame(-1, timeout_ms)
+
+    def read_since(self, seq: int) -> list[TimestampedFrame]:
+        """
+        Returns the frames captured after the frame with sequence number `seq` that are
+        still in the ring buffer, oldest first. Use `seq=-1` to get every buffered frame.
+
+        Each consumer keeps track of the last sequence number it processed, so several
+        consumers can read all the frames independently. Frames overwritten before being
+        read show up as gaps in the sequence numbers.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        if self.thread is None or not self.thread.is_alive():
+            self._start_read_thread()
+
+        return self.frame_buffer.read_since(seq)
+
+    def read_nearest(self, timestamp: float, timeout_ms: float = 200) -> TimestampedFrame:
+        """
+        Returns the buffered frame whose capture time is closest to `timestamp`, on the
+        `time.perf_counter()` clock, e.g. to align frames with a robot state read.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no frame becomes available within the specified timeout.
+        """
+        self._wait_for_frame(-1, timeout_ms)
+        return self.frame_buffer.read_nearest(timestamp)
 
     def disconnect(self):
         """
@@ -482,4 +579,8 @@ class OpenCVCamera(Camera):
             self.videocapture.release()
             self.videocapture = None
 
+        self.frame_buffer = None
+        self.last_async_seq = -1
+        self._raw_frame = None
+
         logger.info(f"{self} disconnected.")
@@ -46,6 +46,8 @@ class OpenCVCameraConfig(CameraConfig):
         color_mode: Color mode for image output (RGB or BGR). Defaults to RGB.
         rotation: Image rotation setting (0°, 90°, 180°, or 270°). Defaults to no rotation.
         warmup_s: Time reading frames before returning from connect (in seconds)
+        ring_buffer_size: Number of most recent frames kept by the background read thread,
+                          along with their capture timestamps. At least 2.
 
     Note:
         - Only 3-channel color output (RGB/BGR) is currently supported.
@@ -55,6 +57,7 @@ class OpenCVCameraConfig(CameraConfig):
     color_mode: ColorMode = ColorMode.RGB
     rotation: Cv2Rotation = Cv2Rotation.NO_ROTATION
     warmup_s: int = 1
+    ring_buffer_size: int = 4
 
     def __post_init__(self):
         if self.color_mode not in (ColorMode.RGB, ColorMode.BGR):
@@ -71,3 +74,8 @@ class OpenCVCameraConfig(CameraConfig):
             raise ValueError(
                 f"`rotation` is expected to be in {(Cv2Rotation.NO_ROTATION, Cv2Rotation.ROTATE_90, Cv2Rotation.ROTATE_180, Cv2Rotation.ROTATE_270)}, but {self.rotation} is provided."
             )
+
+        if self.ring_buffer_size < 2:
+            raise ValueError(
+                f"`ring_buffer_size` must be at least 2, but {self.ring_buffer_size} is provided."
+            )
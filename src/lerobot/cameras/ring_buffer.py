@@ -0,0 +1,197 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides the FrameRingBuffer class, a fixed-size ring of timestamped frames shared between a camera's capture
+thread and its readers.
+"""
+
+from dataclasses import dataclass
+from threading import Condition
+from typing import Any
+
+import numpy as np
+
+
+@dataclass
+class TimestampedFrame:
+    """A captured frame, with its capture time and sequence number.
+
+    Attributes:
+        frame: The frame, as a (height, width, channels) array owned by the caller.
+        timestamp: Capture time, on the `time.perf_counter()` clock.
+        seq: Sequence number of the frame, incremented by one for every frame captured by the camera.
+    """
+
+    frame: np.ndarray
+    timestamp: float
+    seq: int
+
+
+class FrameRingBuffer:
+    """
+    Fixed-size ring of preallocated frame buffers, written by a single capture thread and read by any number
+    of consumers.
+
+    Frames are written in place into the slot of the oldest frame, so capturing does not allocate memory.
+    Each slot holds the capture timestamp and sequence number of its frame, which lets consumers read the
+    latest frame, every frame since the one they last saw, or the frame closest to a given time (e.g. the time
+    the robot state was read). By default, frames are copied out under the ring's lock, so a returned frame is
+    never overwritten by the writer. With `copy=False`, readers get read-only views of the slots instead,
+    which stay valid until the writer wraps around the ring.
+
+    The ring can live in memory provided by the caller, e.g. a `multiprocessing.shared_memory.SharedMemory`
+    buffer, together with a `multiprocessing.Condition`, to be shared between a capture process and its
+    readers. Use `FrameRingBuffer.nbytes` to size the buffer.
+
+    Example:
+        ```python
+        ring = FrameRingBuffer(num_slots=4, shape=(480, 640, 3))
+
+        # Capture thread
+        slot = ring.begin_write()
+        cv2.cvtColor(raw_frame, cv2.COLOR_BGR2RGB, dst=slot)
+        ring.commit_write(timestamp=time.perf_counter())
+
+        # Consumers
+        latest = ring.read_latest()
+        new_frames = ring.read_since(latest.seq)
+        aligned = ring.read_nearest(state_timestamp)
+        ```
+    """
+
+    def __init__(
+        self,
+        num_slots: int,
+        shape: tuple[int, ...],
+        dtype: np.dtype = np.uint8,
+        buffer: Any | None = None,
+        condition: Any | None = None,
+        initialize: bool = True,
+    ):
+        """
+        Args:
+            num_slots: Number of frames kept in the ring, at least 2.
+            shape: Shape of a frame.
+            dtype: Data type of a frame.
+            buffer: Optional writable buffer of at least `FrameRingBuffer.nbytes(...)` bytes holding the ring.
+                If None, the ring allocates its own memory.
+            condition: Optional condition (threading or multiprocessing) guarding the ring. Every user of a
+                ring shared between processes must pass the same condition.
+            initialize: Whether to mark every slot as empty. Set to False when attaching to a ring that is
+                already in use.
+        """
+        # With a single slot, the slot being written would be the one holding the latest frame
+        if num_slots < 2:
+            raise ValueError(f"A frame ring buffer needs at least 2 slots, got {num_slots}.")
+
+        if buffer is None:
+            buffer = np.empty(self.nbytes(num_slots, shape, dtype), dtype=np.uint8)
+            initialize = True
+
+        # Layout: last sequence number, then the sequence numbers, timestamps and frames of the slots
+        self.num_slots = num_slots
+        self._last_seq = np.ndarray((1,), dtype=np.int64, buffer=buffer)
+        self.seqs = np.ndarray((num_slots,), dtype=np.int64, buffer=buffer, offset=8)
+        self.timestamps = np.ndarray((num_slots,), dtype=np.float64, buffer=buffer, offset=8 + 8 * num_slots)
+        self.frames = np.ndarray((num_slots, *shape), dtype=dtype, buffer=buffer, offset=8 + 16 * num_slots)
+
+        if initialize:
+            self._last_seq[0] = -1
+            # -1 marks an empty slot, or a slot being written
+            self.seqs[:] = -1
+            self.timestamps[:] = -np.inf
+            self.frames[:] = 0
+
+        self._condition = condition if condition is not None else Condition()
+
+    @staticmethod
+    def nbytes(num_slots: int, shape: tuple[int, ...], dtype: np.dtype = np.uint8) -> int:
+        """Size in bytes of the memory holding a ring."""
+        return 8 + 16 * num_slots + num_slots * int(np.prod(shape)) * np.dtype(dtype).itemsize
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recent frame, -1 if no frame was written yet."""
+        return int(self._last_seq[0])
+
+    def begin_write(self) -> np.ndarray:
+        """Invalidate the slot of the oldest frame and return it, to be filled in place by the writer before
+        calling `commit_write`."""
+        slot = (self.last_seq + 1) % self.num_slots
+        with self._condition:
+            self.seqs[slot] = -1
+        return self.frames[slot]
+
+    def commit_write(self, timestamp: float) -> int:
+        """Publish the frame written in the slot returned by `begin_write`. Returns its sequence number."""
+        seq = self.last_seq + 1
+        slot = seq % self.num_slots
+        with self._condition:
+            self.timestamps[slot] = timestamp
+            self.seqs[slot] = seq
+            self._last_seq[0] = seq
+            self._condition.notify_all()
+        return seq
+
+    def write(self, frame: np.ndarray, timestamp: float) -> int:
+        """Copy a frame into the ring. Returns its sequence number."""
+        np.copyto(self.begin_write(), frame)
+        return self.commit_write(timestamp)
+
+    def _read_slot(self, slot: int, copy: bool = True) -> TimestampedFrame:
+        if copy:
+            frame = self.frames[slot].copy()
+        else:
+            frame = self.frames[slot].view()
+            frame.flags.writeable = False
+        return TimestampedFrame(frame=frame, timestamp=float(self.timestamps[slot]), seq=int(self.seqs[slot]))
+
+    def read_latest(self, copy: bool = True) -> TimestampedFrame | None:
+        """Return the most recent frame, or None if no frame was captured yet."""
+        with self._condition:
+            if self.last_seq < 0:
+                return None
+            return self._read_slot(self.last_seq % self.num_slots, copy)
+
+    def wait_for_frame(
+        self, after_seq: int = -1, timeout: float | None = None, copy: bool = True
+    ) -> TimestampedFrame | None:
+        """Wait for a frame more recent than `after_seq` and return the most recent frame, or None if none was
+        captured within `timeout` seconds."""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self.last_seq > after_seq, timeout=timeout):
+                return None
+            return self._read_slot(self.last_seq % self.num_slots, copy)
+
+    def read_since(self, seq: int, copy: bool = True) -> list[TimestampedFrame]:
+        """Return the frames captured after the frame `seq` that are still in the ring, oldest first.
+
+        Frames that were overwritten before being read are skipped, which consumers can detect from the gaps
+        in sequence numbers.
+        """
+        with self._condition:
+            first_seq = max(seq + 1, self.last_seq - self.num_slots + 1, 0)
+            slots = [s % self.num_slots for s in range(first_seq, self.last_seq + 1)]
+            return [self._read_slot(slot, copy) for slot in slots if self.seqs[slot] >= 0]
+
+    def read_nearest(self, timestamp: float, copy: bool = True) -> TimestampedFrame | None:
+        """Return the frame whose capture time is closest to `timestamp`, or None if no frame was captured
+        yet."""
+        with self._condition:
+            valid = self.seqs >= 0
+            if not valid.any():
+                return None
+            distances = np.where(valid, np.abs(self.timestamps - timestamp), np.inf)
+            return self._read_slot(int(np.argmin(distances)), copy)
@@ -28,7 +28,12 @@ def make_cameras_from_configs(camera_configs: dict[str, CameraConfig]) -> dict[s
     cameras = {}
 
     for key, cfg in camera_configs.items():
-        if cfg.type == "opencv":
+        if cfg.capture_process:
+            from .capture_process import ProcessCamera
+
+            cameras[key] = ProcessCamera(cfg)
+
+        elif cfg.type == "opencv":
             from .opencv import OpenCVCamera
 
             cameras[key] = OpenCVCamera(cfg)
@@ -51,13 +51,43 @@ class TrainPipelineConfig(HubMixin):
     seed: int | None = 1000
     # Number of workers for the dataloader.
     num_workers: int = 4
+    # Number of batches loaded and copied to the device by a background thread ahead of the training step, or
+    # 0 to load each batch when the training step needs it.
+    prefetch_batches: int = 2
+    # Batch size of each process. In distributed training, the effective batch size of an optimizer step is
+    # `batch_size * gradient_accumulation_steps * world_size`.
     batch_size: int = 8
+    # Number of batches whose gradients are accumulated before each optimizer step.
+    gradient_accumulation_steps: int = 1
+    # In distributed training, let `DistributedDataParallel` find the parameters that don't receive gradients,
+    # for policies that don't use all their parameters in `forward`.
+    ddp_find_unused_parameters: bool = False
+    # Compile the training forward pass of the policy, and with it the backward pass, with `torch.compile`.
+    use_torch_compile: bool = False
+    # Mode of `torch.compile`. "reduce-overhead" also captures the compiled graphs as CUDA graphs, which suits
+    # the policies whose batches have static shapes, such as ACT and diffusion.
+    torch_compile_mode: str | None = None
+    # Use the fused implementation of the optimizer, which updates all the parameters in a few kernels.
+    fused_optimizer: bool = False
+    # Compute the features of the camera frames with the frozen vision encoder of the policy once, cache them
+    # in memory-mapped files next to the dataset, and train on them instead of decoding and encoding the frames.
+    # Requires a policy supporting it with a frozen vision encoder, e.g. ACT with
+    # `--policy.freeze_vision_encoder=true`, and no image transforms.
+    cache_image_features: bool = False
     steps: int = 100_000
     eval_freq: int = 20_000
     log_freq: int = 200
     save_checkpoint: bool = True
     # Checkpoint is saved every `save_freq` training iterations and after the last training step.
     save_freq: int = 20_000
+    # Write the checkpoints in a background thread, from a copy of the training state in CPU memory, so that
+    # training continues while they are written.
+    async_checkpoint: bool = True
+    # Number of latest checkpoints to keep, all of them when None.
+    keep_last_checkpoints: int | None = None
+    # Number of checkpoints with the best evaluation success rate to keep on top of the latest ones. Only the
+    # checkpoints saved at an evaluation step are ranked.
+    keep_best_checkpoints: int = 0
     use_policy_training_preset: bool = True
     optimizer: OptimizerConfig | None = None
     scheduler: LRSchedulerConfig | None = None
@@ -110,12 +140,28 @@ class TrainPipelineConfig(HubMixin):
         if isinstance(self.dataset.repo_id, list):
             raise NotImplementedError("LeRobotMultiDataset is not currently implemented.")
 
+        if self.gradient_accumulation_steps < 1:
+            raise ValueError(
+                f"gradient_accumulation_steps must be at least 1, got {self.gradient_accumulation_steps}."
+            )
+
         if not self.use_policy_training_preset and (self.optimizer is None or self.scheduler is None):
             raise ValueError("Optimizer and Scheduler must be set when the policy presets are not used.")
         elif self.use_policy_training_preset and not self.resume:
             self.optimizer = self.policy.get_optimizer_preset()
             self.scheduler = self.policy.get_scheduler_preset()
 
+        if self.fused_optimizer:
+            if not hasattr(self.optimizer, "fused"):
+                raise ValueError(f"The '{self.optimizer.type}' optimizer has no fused implementation.")
+            self.optimizer.fused = True
+
+        if self.cache_image_features:
+            if not getattr(self.policy, "freeze_vision_encoder", False):
+                raise ValueError("The image features can only be cached with a frozen vision encoder.")
+            if self.dataset.image_transforms.enable:
+                raise ValueError("The image transforms cannot be applied to cached image features.")
+
         if self.policy.push_to_hub and not self.policy.repo_id:
             raise ValueError(
                 "'policy.repo_id' argument missing. Please specify it to push the model to the hub."
@@ -21,6 +21,9 @@ OBS_ENV_STATE = "observation.environment_state"
 OBS_STATE = "observation.state"
 OBS_IMAGE = "observation.image"
 OBS_IMAGES = "observation.images"
+# Image features computed by a frozen encoder, per camera as "<camera key>.features" or for all cameras
+IMAGE_FEATURES_SUFFIX = ".features"
+OBS_IMAGE_FEATURES = "observation.image_features"
 ACTION = "action"
 REWARD = "next.reward"
 
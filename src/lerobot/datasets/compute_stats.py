@@ -13,6 +13,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections.abc import Sequence
+
 import numpy as np
 
 from lerobot.datasets.utils import load_image_as_numpy
@@ -54,14 +56,19 @@ def auto_downsample_height_width(img: np.ndarray, target_size: int = 150, max_si
     return img[:, ::downsample_factor, ::downsample_factor]
 
 
-def sample_images(image_paths: list[str]) -> np.ndarray:
+def sample_images(image_paths: list[str] | Sequence[np.ndarray]) -> np.ndarray:
+    """Sample images from their paths, or from a sequence of (h, w, c) uint8 frames such as a
+    `FrameSpoolReader`."""
     sampled_indices = sample_indices(len(image_paths))
 
     images = None
     for i, idx in enumerate(sampled_indices):
         path = image_paths[idx]
-        # we load as uint8 to reduce memory usage
-        img = load_image_as_numpy(path, dtype=np.uint8, channel_first=True)
+        if isinstance(path, np.ndarray):
+            img = np.transpose(path, (2, 0, 1))
+        else:
+            # we load as uint8 to reduce memory usage
+            img = load_image_as_numpy(path, dtype=np.uint8, channel_first=True)
         img = auto_downsample_height_width(img)
 
         if images is None:
@@ -88,7 +95,7 @@ def compute_episode_stats(episode_data: dict[str, list[str] | np.ndarray], featu
         if features[key]["dtype"] == "string":
             continue  # HACK: we should receive np.arrays of strings
         elif features[key]["dtype"] in ["image", "video"]:
-            ep_ft_array = sample_images(data)  # data is a list of image paths
+            ep_ft_array = sample_images(data)  # data is a list of image paths, or a frame spool
             axes_to_reduce = (0, 2, 3)  # keep channel dim
             keepdims = True
         else:
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Columnar storage of the numeric features of an episode while it is being recorded, and its conversion into
+an Arrow table when the episode is saved.
+"""
+
+from typing import Any
+
+import datasets
+import numpy as np
+import pyarrow as pa
+
+from lerobot.datasets.utils import is_valid_numpy_dtype_string
+
+DEFAULT_COLUMN_CAPACITY = 1024
+
+
+class FeatureColumn:
+    """
+    Values of a numeric feature over an episode, stored as the rows of a preallocated array.
+
+    The array doubles its capacity when it is full, so appending a frame is a copy into the next row instead
+    of the allocation of a new array, and the values of the episode are read back as a single array without
+    stacking them.
+
+    Example:
+        ```python
+        column = FeatureColumn("float32", shape=(6,))
+        column.append(np.zeros(6, dtype=np.float32))
+        column.data  # array of shape (1, 6)
+        ```
+    """
+
+    def __init__(
+        self, dtype: str | np.dtype, shape: tuple[int, ...] = (), capacity: int = DEFAULT_COLUMN_CAPACITY
+    ):
+        self.dtype = np.dtype(dtype)
+        self.shape = tuple(shape)
+        self.size = 0
+        self._data = np.empty((max(capacity, 1), *self.shape), dtype=self.dtype)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, idx):
+        return self.data[idx]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return self.data if dtype is None else self.data.astype(dtype)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    @property
+    def data(self) -> np.ndarray:
+        """View of the values appended so far, of shape (size, *shape)."""
+        return self._data[: self.size]
+
+    def accepts(self, value: Any) -> bool:
+        """Whether `value` is an array of the column's dtype and shape, which `append` copies as is."""
+        return isinstance(value, np.ndarray) and value.dtype == self.dtype and value.shape == self.shape
+
+    def append(self, value: Any) -> None:
+        if self.size == self.capacity:
+            grown = np.empty((2 * self.capacity, *self.shape), dtype=self.dtype)
+            grown[: self.size] = self._data
+            self._data = grown
+        self._data[self.size] = value
+        self.size += 1
+
+
+def is_columnar_feature(feature: dict) -> bool:
+    return is_valid_numpy_dtype_string(feature["dtype"])
+
+
+def _to_arrow_array(values: np.ndarray, hf_feature: Any) -> pa.Array | None:
+    if isinstance(hf_feature, datasets.Value):
+        values = np.asarray(values)
+        if not is_valid_numpy_dtype_string(hf_feature.dtype) or values.size != len(values):
+            return None
+        return pa.array(values.reshape(-1).astype(hf_feature.dtype, copy=False))
+
+    if isinstance(hf_feature, datasets.Sequence) and isinstance(hf_feature.feature, datasets.Value):
+        values = np.asarray(values)
+        length = hf_feature.length
+        if not is_valid_numpy_dtype_string(hf_feature.feature.dtype) or values.shape[1:] != (length,):
+            return None
+        flat_values = pa.array(values.reshape(-1).astype(hf_feature.feature.dtype, copy=False))
+        return pa.FixedSizeListArray.from_arrays(flat_values, length)
+
+    return None
+
+
+def episode_to_arrow_table(
+    episode_dict: dict[str, np.ndarray], hf_features: datasets.Features
+) -> pa.Table | None:
+    """
+    Build the Arrow table of an episode directly from the arrays of its features.
+
+    Only scalar and 1D numeric features are converted. Returns None if any other feature (images, strings or
+    multidimensional arrays) is present, which are left to `datasets.Dataset.from_dict` to encode.
+    """
+    arrays = []
+    for key, hf_feature in hf_features.items():
+        array = _to_arrow_array(episode_dict[key], hf_feature)
+        if array is None:
+            return None
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, schema=hf_features.arrow_schema)
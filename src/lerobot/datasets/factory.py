@@ -78,8 +78,11 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
     Returns:
         LeRobotDataset | MultiLeRobotDataset
     """
+    # Transforms applied on the device are applied to the batches by the training loop instead
     image_transforms = (
-        ImageTransforms(cfg.dataset.image_transforms) if cfg.dataset.image_transforms.enable else None
+        ImageTransforms(cfg.dataset.image_transforms)
+        if cfg.dataset.image_transforms.enable and not cfg.dataset.image_transforms.on_device
+        else None
     )
 
     if isinstance(cfg.dataset.repo_id, str):
@@ -0,0 +1,191 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import torch
+import tqdm
+
+from lerobot.constants import IMAGE_FEATURES_SUFFIX
+
+IMAGE_FEATURE_CACHE_DIR = "image_features"
+CACHE_INFO = "info.json"
+CACHED_FRAMES = "cached.npy"
+
+
+def image_features_key(camera_key: str) -> str:
+    """Key of the features of the images of `camera_key`, e.g. "observation.images.top.features"."""
+    return camera_key + IMAGE_FEATURES_SUFFIX
+
+
+def hash_state_dict(state_dict: dict[str, torch.Tensor]) -> str:
+    """Hash of the names and values of the tensors of a state dict, which identifies the weights of an
+    encoder."""
+    sha = hashlib.sha256()
+    for name in sorted(state_dict):
+        tensor = state_dict[name].detach().cpu().contiguous()
+        sha.update(f"{name}:{tensor.dtype}:{tuple(tensor.shape)}".encode())
+        sha.update(tensor.view(-1).view(torch.uint8).numpy().tobytes())
+    return sha.hexdigest()[:16]
+
+
+class ImageFeatureCache:
+    """
+    Features computed by a frozen image encoder for the frames of a dataset, stored in memory-mapped arrays so
+    that a frame is read without loading the others.
+
+    The cache of an encoder is the directory `root/image_features/<encoder_hash>`, where `encoder_hash`
+    identifies the weights of the encoder (see `hash_state_dict`). It has one array per camera, the row of a
+    frame being its index in the dataset, which is unique across episodes. The frames that have been computed
+    are recorded with the array `cached.npy`, so that a cache computed for some episodes can be completed with
+    the others.
+
+    Features are stored in float16 and served in float32.
+    """
+
+    def __init__(self, root: str | Path, encoder_hash: str):
+        self.dir = Path(root) / IMAGE_FEATURE_CACHE_DIR / encoder_hash
+        self.encoder_hash = encoder_hash
+        self.info = (
+            json.loads((self.dir / CACHE_INFO).read_text()) if (self.dir / CACHE_INFO).is_file() else None
+        )
+        self._arrays: dict[str, np.ndarray] = {}
+
+    @property
+    def camera_keys(self) -> list[str]:
+        return self.info["camera_keys"] if self.info is not None else []
+
+    def cached_frames(self) -> np.ndarray:
+        """Boolean mask of the frames whose features are cached."""
+        if self.info is None:
+            return np.zeros(0, dtype=bool)
+        return np.load(self.dir / CACHED_FRAMES)
+
+    def get(self, camera_key: str, indices: list[int]) -> torch.Tensor:
+        """Features of the frames of indices `indices` in the dataset, of shape (len(indices), *feature_shape)."""
+        if camera_key not in self._arrays:
+            # Opened on first access, so that each dataloader worker maps the file itself
+            self._arrays[camera_key] = np.load(self.dir / f"{camera_key}.npy", mmap_mode="r")
+        return torch.from_numpy(self._arrays[camera_key][indices].astype(np.float32))
+
+    def __getstate__(self) -> dict:
+        # Memory maps would be pickled as the full arrays
+        return {**self.__dict__, "_arrays": {}}
+
+
+def _grow_array(path: Path, num_rows: int) -> np.ndarray:
+    """Extend the array saved at `path` to `num_rows` rows, e.g. after episodes were added to the dataset, and
+    return it memory-mapped. The new rows are zeros."""
+    array = np.load(path, mmap_mode="r")
+    tmp_path = path.with_name(f"{path.stem}.tmp.npy")
+    grown = np.lib.format.open_memmap(
+        tmp_path, mode="w+", dtype=array.dtype, shape=(num_rows, *array.shape[1:])
+    )
+    grown[: len(array)] = array
+    grown.flush()
+    del array, grown
+    # Replaced at once, so that an interrupted copy leaves the cache as it was
+    os.replace(tmp_path, path)
+    return np.lib.format.open_memmap(path, mode="r+")
+
+
+@torch.no_grad()
+def compute_image_features(
+    dataset,
+    encode_images: Callable[[dict[str, torch.Tensor]], dict[str, torch.Tensor]],
+    encoder_hash: str,
+    device: torch.device,
+    batch_size: int = 32,
+    num_workers: int = 0,
+) -> ImageFeatureCache:
+    """Compute the image features of the frames of `dataset` that are not cached yet, and return the cache.
+
+    Args:
+        dataset: The `LeRobotDataset` whose camera frames are encoded. Its delta timestamps and image
+            transforms are not applied.
+        encode_images: Function returning the features of the images of a batch, with the keys given by
+            `image_features_key`, typically `policy.encode_images`.
+        encoder_hash: Identifier of the weights of the encoder, e.g. by `hash_state_dict`.
+        device: Device the encoder runs on.
+        batch_size: Number of frames encoded at once.
+        num_workers: Number of dataloader workers decoding the frames.
+    """
+    # Imported here to avoid a circular import
+    from lerobot.datasets.lerobot_dataset import LeRobotDataset
+
+    cache = ImageFeatureCache(dataset.root, encoder_hash)
+    camera_keys = dataset.meta.camera_keys
+    if cache.info is not None and cache.camera_keys != camera_keys:
+        raise ValueError(f"The cache at {cache.dir} has cameras {cache.camera_keys}, expected {camera_keys}.")
+
+    frames = dataset.hf_dataset.with_format(None)["index"]
+    cached = cache.cached_frames()
+    missing = [i for i, frame in enumerate(frames) if frame >= len(cached) or not cached[frame]]
+    if len(missing) == 0:
+        return cache
+
+    logging.info(f"Computing the image features of {len(missing)} frames in {cache.dir}")
+    frames_dataset = LeRobotDataset(
+        dataset.repo_id,
+        root=dataset.root,
+        episodes=dataset.episodes,
+        revision=dataset.revision,
+        video_backend=dataset.video_backend,
+    )
+    dataloader = torch.utils.data.DataLoader(
+        torch.utils.data.Subset(frames_dataset, missing),
+        batch_size=batch_size,
+        num_workers=num_workers,
+        pin_memory=device.type == "cuda",
+    )
+
+    num_frames = dataset.meta.total_frames
+    cache.dir.mkdir(parents=True, exist_ok=True)
+    arrays = {}
+    if len(cached) < num_frames:
+        cached = np.concatenate([cached, np.zeros(num_frames - len(cached), dtype=bool)])
+    for batch in tqdm.tqdm(dataloader, desc="Computing image features"):
+        images = {key: batch[key].to(device, non_blocking=True) for key in camera_keys}
+        features = encode_images(images)
+        indices = batch["index"].numpy()
+        for key in camera_keys:
+            feature = features[image_features_key(key)].cpu().numpy()
+            if key not in arrays:
+                path = cache.dir / f"{key}.npy"
+                if cache.info is None:
+                    shape = (num_frames, *feature.shape[1:])
+                    arrays[key] = np.lib.format.open_memmap(path, mode="w+", dtype=np.float16, shape=shape)
+                else:
+                    # The shape is ignored when opening an existing array, which has fewer rows than the
+                    # frames of a dataset that grew since the cache was computed
+                    arrays[key] = np.lib.format.open_memmap(path, mode="r+")
+                    if len(arrays[key]) < num_frames:
+                        del arrays[key]
+                        arrays[key] = _grow_array(path, num_frames)
+            arrays[key][indices] = feature
+        cached[indices] = True
+
+    for array in arrays.values():
+        array.flush()
+    # Written last, so that the frames of an interrupted computation are computed again
+    np.save(cache.dir / CACHED_FRAMES, cached)
+    if cache.info is None:
+        info = {"camera_keys": camera_keys, "shapes": {key: list(arrays[key].shape[1:]) for key in arrays}}
+        (cache.dir / CACHE_INFO).write_text(json.dumps(info, indent=4))
+    return ImageFeatureCache(dataset.root, encoder_hash)
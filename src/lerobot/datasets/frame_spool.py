@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Frame spools: the frames of one camera over one episode, appended to a single file until they are encoded
+into a video, as a cheaper alternative to writing one PNG file per frame while recording.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import PIL.Image
+
+from lerobot.datasets.image_writer import image_array_to_pil_image
+
+SPOOL_COMPRESSIONS = ["raw", "lz4"]
+SPOOL_FILENAME = "frames.spool"
+
+
+def get_spool_index_path(spool_path: Path | str) -> Path:
+    return Path(spool_path).with_suffix(".index.npz")
+
+
+def _import_lz4_frame():
+    try:
+        import lz4.frame
+    except ImportError as e:
+        raise ImportError(
+            "lz4 is required for 'lz4' frame spooling. "
+            "Please install the optional dependencies of `frame-spooling` in the package."
+        ) from e
+    return lz4.frame
+
+
+def _to_hwc_uint8(image: np.ndarray | PIL.Image.Image) -> np.ndarray:
+    if isinstance(image, np.ndarray) and image.dtype == np.uint8 and image.ndim == 3 and image.shape[-1] == 3:
+        return np.ascontiguousarray(image)
+    # Channel-first or float images go through the same conversion as the PNG path
+    if isinstance(image, np.ndarray):
+        image = image_array_to_pil_image(image)
+    return np.asarray(image.convert("RGB"))
+
+
+class FrameSpoolWriter:
+    """
+    Appends the frames of a camera to a single spool file, as raw pixels or lz4-compressed.
+
+    Compared to saving each frame as a PNG, appending to a spool skips the PNG compression (the most expensive
+    part of recording on CPU) and the creation of a file per frame. Frames are written in order, at offsets
+    recorded in an index written next to the spool by `close`, which `FrameSpoolReader` uses to memory-map
+    them back.
+
+    - `raw`: frames are copied as is. Cheapest to write, but takes height * width * 3 bytes per frame.
+    - `lz4`: frames are compressed with the fastest lz4 level, for a fraction of the cost of PNG. It shrinks
+      frames with flat areas, but barely compresses the sensor noise of real cameras. Requires the `lz4`
+      package.
+
+    Example:
+        ```python
+        writer = FrameSpoolWriter(episode_dir / SPOOL_FILENAME, compression="lz4")
+        for frame in frames:
+            writer.append(frame)
+        writer.close()
+        ```
+    """
+
+    def __init__(self, path: Path | str, compression: str = "raw"):
+        if compression not in SPOOL_COMPRESSIONS:
+            raise ValueError(f"Unknown spool compression '{compression}'. Available: {SPOOL_COMPRESSIONS}")
+
+        self.path = Path(path)
+        self.compression = compression
+        self._lz4 = _import_lz4_frame() if compression == "lz4" else None
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, "wb")  # noqa: SIM115
+        self.shape: tuple[int, ...] | None = None
+        self.offsets: list[int] = []
+        self.sizes: list[int] = []
+        self._offset = 0
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def closed(self) -> bool:
+        return self.file.closed
+
+    def append(self, image: np.ndarray | PIL.Image.Image) -> int:
+        """Append a frame to the spool. Returns its index in the spool."""
+        if self.closed:
+            raise ValueError(f"The spool {self.path} is closed.")
+
+        frame = _to_hwc_uint8(image)
+        if self.shape is None:
+            self.shape = frame.shape
+        elif frame.shape != self.shape:
+            raise ValueError(
+                f"All the frames of a spool must have the shape {self.shape}, got {frame.shape}."
+            )
+
+        payload = frame if self._lz4 is None else self._lz4.compress(frame, compression_level=0)
+        size = frame.nbytes if self._lz4 is None else len(payload)
+        self.file.write(payload)
+
+        self.offsets.append(self._offset)
+        self.sizes.append(size)
+        self._offset += size
+        return len(self.offsets) - 1
+
+    def close(self) -> None:
+        """Close the spool file and write its index."""
+        if self.closed:
+            return
+
+        self.file.close()
+        np.savez(
+            get_spool_index_path(self.path),
+            offsets=np.array(self.offsets, dtype=np.int64),
+            sizes=np.array(self.sizes, dtype=np.int64),
+            shape=np.array(self.shape if self.shape is not None else (0, 0, 3), dtype=np.int64),
+            compression=np.array(self.compression),
+        )
+
+
+class FrameSpoolReader:
+    """
+    Reads the frames of a spool written by `FrameSpoolWriter`, as (height, width, 3) uint8 arrays.
+
+    The spool is memory-mapped: raw frames are returned as read-only views of the mapping without any copy,
+    lz4 frames are decompressed from it.
+
+    Example:
+        ```python
+        frames = FrameSpoolReader(episode_dir / SPOOL_FILENAME)
+        for frame in frames:
+            ...
+        ```
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        with np.load(get_spool_index_path(self.path)) as index:
+            self.offsets = index["offsets"]
+            self.sizes = index["sizes"]
+            self.shape = tuple(index["shape"].tolist())
+            self.compression = str(index["compression"])
+
+        self._lz4 = _import_lz4_frame() if self.compression == "lz4" else None
+        # An empty file can't be mapped
+        self._data = np.memmap(self.path, dtype=np.uint8, mode="r") if len(self.offsets) > 0 else None
+
+    @property
+    def height(self) -> int:
+        return self.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, idx: int) -> np.ndarray:
+        if not -len(self) <= idx < len(self):
+            raise IndexError(f"Frame {idx} out of range for a spool of {len(self)} frames.")
+
+        offset, size = int(self.offsets[idx]), int(self.sizes[idx])
+        payload = self._data[offset : offset + size]
+        if self._lz4 is not None:
+            payload = np.frombuffer(self._lz4.decompress(payload), dtype=np.uint8)
+        return payload.reshape(self.shape)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for idx in range(len(self)):
+            yield self[idx]
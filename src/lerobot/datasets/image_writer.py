@@ -13,15 +13,30 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import bisect
+import logging
 import multiprocessing
 import queue
+import shutil
 import threading
+import time
+from collections import defaultdict
 from pathlib import Path
 
 import numpy as np
 import PIL.Image
 import torch
 
+from lerobot.utils.control_loop import LatencyHistogram
+
+OVERFLOW_POLICIES = ["block", "drop"]
+
+# Autoscaling starts a worker when more images than this are pending per worker, at most once per interval
+AUTOSCALE_BACKLOG_PER_WORKER = 4
+AUTOSCALE_INTERVAL_S = 1.0
+
+RESULTS_TIMEOUT_S = 5.0
+
 
 def safe_stop_image_writer(func):
     def wrapper(*args, **kwargs):
@@ -68,34 +83,51 @@ def image_array_to_pil_image(image_array: np.ndarray, range_check: bool = True)
     return PIL.Image.fromarray(image_array)
 
 
+def _save_image(image: np.ndarray | PIL.Image.Image, fpath: Path):
+    if isinstance(image, np.ndarray):
+        img = image_array_to_pil_image(image)
+    elif isinstance(image, PIL.Image.Image):
+        img = image
+    else:
+        raise TypeError(f"Unsupported image type: {type(image)}")
+    img.save(fpath)
+
+
 def write_image(image: np.ndarray | PIL.Image.Image, fpath: Path):
     try:
-        if isinstance(image, np.ndarray):
-            img = image_array_to_pil_image(image)
-        elif isinstance(image, PIL.Image.Image):
-            img = image
-        else:
-            raise TypeError(f"Unsupported image type: {type(image)}")
-        img.save(fpath)
+        _save_image(image, fpath)
     except Exception as e:
         print(f"Error writing image {fpath}: {e}")
 
 
-def worker_thread_loop(queue: queue.Queue):
+def get_camera_key(fpath: Path) -> str:
+    """Camera of an image saved at `DEFAULT_IMAGE_PATH`, i.e. `images/{image_key}/episode_*/frame_*.png`."""
+    return Path(fpath).parent.parent.name
+
+
+def worker_thread_loop(queue: queue.Queue, results_queue: queue.Queue | None = None):
     while True:
         item = queue.get()
         if item is None:
             queue.task_done()
             break
-        image_array, fpath = item
-        write_image(image_array, fpath)
+        image_array, fpath, enqueue_time = item
+        error = None
+        try:
+            _save_image(image_array, fpath)
+        except Exception as e:
+            error = f"Error writing image {fpath}: {e}"
+            print(error)
+        # Reported before `task_done`, so that it is available once `wait_until_done` returns
+        if results_queue is not None:
+            results_queue.put((get_camera_key(fpath), time.perf_counter() - enqueue_time, error))
         queue.task_done()
 
 
-def worker_process(queue: queue.Queue, num_threads: int):
+def worker_process(queue: queue.Queue, num_threads: int, results_queue: queue.Queue | None = None):
     threads = []
     for _ in range(num_threads):
-        t = threading.Thread(target=worker_thread_loop, args=(queue,))
+        t = threading.Thread(target=worker_thread_loop, args=(queue, results_queue))
         t.daemon = True
         t.start()
         threads.append(t)
@@ -103,6 +135,51 @@ def worker_process(queue: queue.Queue, num_threads: int):
         t.join()
 
 
+class CameraWriteMetrics:
+    """Counters and latency of the images written for a camera."""
+
+    def __init__(self):
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+    def reset(self) -> None:
+        """Reset the counters and latencies, but not the depth of the queue."""
+        self.max_queue_depth = self.queue_depth
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+    def summary(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "written": self.written,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "latency": self.latency.summary(),
+        }
+
+
+def format_write_metrics(metrics: dict[str, dict]) -> str:
+    """Format the `AsyncImageWriter.metrics` of each camera, one line per camera."""
+    lines = []
+    for camera_key, camera_metrics in metrics.items():
+        line = (
+            f"{camera_key}: written {camera_metrics['written']} | dropped {camera_metrics['dropped']} | "
+            f"errors {camera_metrics['errors']} | max queue depth {camera_metrics['max_queue_depth']}"
+        )
+        latency = camera_metrics["latency"]
+        if latency["count"] > 0:
+            line += f" | latency p50 {latency['p50_ms']:.1f}ms | p99 {latency['p99_ms']:.1f}ms"
+        lines.append(line)
+    return "\n".join(lines)
+
+
 class AsyncImageWriter:
     """
     This class abstract away the initialisation of processes or/and threads to
@@ -116,44 +193,184 @@ class AsyncImageWriter:
     The optimal number of processes and threads depends on your computer capabilities.
     We advise to use 4 threads per camera with 0 processes. If the fps is not stable, try to increase or lower
     the number of threads. If it is still not stable, try to use 1 subprocess, or more.
+
+    With `max_queue_size > 0`, at most `max_queue_size` images wait to be written, so memory stays bounded
+    when the disk or the png compression falls behind. The `overflow_policy` decides what happens to an
+    image saved while the queue is full:
+    - `block`: `save_image` waits for room in the queue, which slows down the caller.
+    - `drop`: the image is not written, and `wait_until_done` fills its file with a copy of the previous
+      frame of the same camera, so the episode keeps one image per frame.
+
+    With `max_workers`, the writer starts more workers (threads, or processes when `num_processes>0`), up to
+    `max_workers`, while its backlog grows faster than its workers write.
+
+    `metrics` returns the queue depth, the number of written, dropped and failed images and the write latency
+    of each camera, the camera of an image being inferred from its path (`images/{camera}/episode_*/*.png`).
     """
 
-    def __init__(self, num_processes: int = 0, num_threads: int = 1):
+    def __init__(
+        self,
+        num_processes: int = 0,
+        num_threads: int = 1,
+        max_queue_size: int = 0,
+        overflow_policy: str = "block",
+        max_workers: int | None = None,
+    ):
         self.num_processes = num_processes
         self.num_threads = num_threads
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.max_workers = max_workers
         self.queue = None
+        self.results_queue = None
         self.threads = []
         self.processes = []
         self._stopped = False
 
+        self.camera_metrics: dict[str, CameraWriteMetrics] = defaultdict(CameraWriteMetrics)
+        self.num_pending = 0
+        self.dropped_fpaths: list[Path] = []
+        self._last_scale_time = time.perf_counter()
+
         if num_threads <= 0 and num_processes <= 0:
             raise ValueError("Number of threads and processes must be greater than zero.")
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow_policy}'. Available: {OVERFLOW_POLICIES}")
 
         if self.num_processes == 0:
             # Use threading
-            self.queue = queue.Queue()
+            self.queue = queue.Queue(maxsize=max_queue_size)
+            self.results_queue = queue.Queue()
             for _ in range(self.num_threads):
-                t = threading.Thread(target=worker_thread_loop, args=(self.queue,))
-                t.daemon = True
-                t.start()
-                self.threads.append(t)
+                self._start_thread()
         else:
             # Use multiprocessing
-            self.queue = multiprocessing.JoinableQueue()
+            self.queue = multiprocessing.JoinableQueue(maxsize=max_queue_size)
+            self.results_queue = multiprocessing.Queue()
             for _ in range(self.num_processes):
-                p = multiprocessing.Process(target=worker_process, args=(self.queue, self.num_threads))
-                p.daemon = True
-                p.start()
-                self.processes.append(p)
+                self._start_process()
+
+    @property
+    def num_workers(self) -> int:
+        """Number of threads, or of processes when `num_processes>0`."""
+        return self.num_threads if self.num_processes == 0 else self.num_processes
+
+    def _start_thread(self) -> None:
+        t = threading.Thread(target=worker_thread_loop, args=(self.queue, self.results_queue))
+        t.daemon = True
+        t.start()
+        self.threads.append(t)
+
+    def _start_process(self) -> None:
+        p = multiprocessing.Process(
+            target=worker_process, args=(self.queue, self.num_threads, self.results_queue)
+        )
+        p.daemon = True
+        p.start()
+        self.processes.append(p)
+
+    def _maybe_scale_up(self) -> None:
+        """Start a worker if the backlog exceeds what the current workers keep up with."""
+        if self.max_workers is None or self.num_workers >= self.max_workers:
+            return
+
+        scale_up_backlog = AUTOSCALE_BACKLOG_PER_WORKER * self.num_workers
+        if self.max_queue_size > 0:
+            # A bounded queue never grows past its size, the writer must scale up before it is full
+            scale_up_backlog = min(scale_up_backlog, self.max_queue_size // 2)
+
+        now = time.perf_counter()
+        if self.num_pending < scale_up_backlog or now - self._last_scale_time < AUTOSCALE_INTERVAL_S:
+            return
+
+        if self.num_processes == 0:
+            self.num_threads += 1
+            self._start_thread()
+        else:
+            self.num_processes += 1
+            self._start_process()
+        self._last_scale_time = now
+        logging.info(
+            f"Image writer backlog of {self.num_pending} images, scaled up to {self.num_workers} "
+            f"{'threads' if self.num_processes == 0 else 'processes'}."
+        )
+
+    def _collect_results(self, num_results: int = 0) -> None:
+        """Account for the images written by the workers, waiting for at least `num_results` of them."""
+        while True:
+            try:
+                if num_results > 0:
+                    camera_key, latency_s, error = self.results_queue.get(timeout=RESULTS_TIMEOUT_S)
+                    num_results -= 1
+                else:
+                    camera_key, latency_s, error = self.results_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            metrics = self.camera_metrics[camera_key]
+            metrics.queue_depth -= 1
+            self.num_pending -= 1
+            metrics.latency.record(latency_s)
+            if error is None:
+                metrics.written += 1
+            else:
+                metrics.errors += 1
 
     def save_image(self, image: torch.Tensor | np.ndarray | PIL.Image.Image, fpath: Path):
         if isinstance(image, torch.Tensor):
             # Convert tensor to numpy array to minimize main process time
             image = image.cpu().numpy()
-        self.queue.put((image, fpath))
+
+        self._collect_results()
+        self._maybe_scale_up()
+
+        metrics = self.camera_metrics[get_camera_key(fpath)]
+        item = (image, fpath, time.perf_counter())
+        if self.overflow_policy == "block":
+            self.queue.put(item)
+        else:
+            try:
+                self.queue.put(item, block=False)
+            except queue.Full:
+                metrics.dropped += 1
+                self.dropped_fpaths.append(Path(fpath))
+                return
+
+        metrics.queue_depth += 1
+        metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+        self.num_pending += 1
+
+    def metrics(self, reset: bool = False) -> dict[str, dict]:
+        """Write metrics of each camera. With `reset`, the counters and latencies are reset afterwards, while
+        the queue depths keep counting the images still queued."""
+        self._collect_results()
+        summary = {camera_key: metrics.summary() for camera_key, metrics in self.camera_metrics.items()}
+        if reset:
+            for metrics in self.camera_metrics.values():
+                metrics.reset()
+        return summary
+
+    def _fill_dropped_images(self) -> None:
+        """Replace each dropped image with a copy of the previous frame of the same camera, or of the next one
+        for the first frames."""
+        frame_names: dict[Path, list[str]] = {}
+        for fpath in sorted(self.dropped_fpaths):
+            if fpath.parent not in frame_names:
+                frame_names[fpath.parent] = sorted(f.name for f in fpath.parent.glob("frame_*"))
+            names = frame_names[fpath.parent]
+            if not names:
+                continue
+
+            i = bisect.bisect_left(names, fpath.name)
+            shutil.copyfile(fpath.parent / names[max(i - 1, 0)], fpath)
+            names.insert(i, fpath.name)
+        self.dropped_fpaths = []
 
     def wait_until_done(self):
         self.queue.join()
+        # With processes, results may still be in transit once the queue is joined
+        self._collect_results(num_results=self.num_pending)
+        self._fill_dropped_images()
 
     def stop(self):
         if self._stopped:
@@ -169,10 +386,13 @@ class AsyncImageWriter:
             for _ in range(num_nones):
                 self.queue.put(None)
             for p in self.processes:
-                p.join()
-                if p.is_alive():
-                    p.terminate()
+                # Keep reading the results, the workers can't exit while they are pending in the pipe
+                while p.is_alive():
+                    self._collect_results()
+                    p.join(timeout=0.1)
             self.queue.close()
             self.queue.join_thread()
+            self.results_queue.close()
+            self.results_queue.join_thread()
 
         self._stopped = True
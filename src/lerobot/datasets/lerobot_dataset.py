@@ -13,10 +13,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import bisect
 import contextlib
 import logging
 import shutil
+from collections import OrderedDict
 from collections.abc import Callable
+from functools import cached_property
+from itertools import accumulate
 from pathlib import Path
 
 import datasets
@@ -26,17 +30,27 @@ import PIL.Image
 import torch
 import torch.utils
 from datasets import concatenate_datasets, load_dataset
+from datasets.table import InMemoryTable
 from huggingface_hub import HfApi, snapshot_download
 from huggingface_hub.constants import REPOCARD_NAME
 from huggingface_hub.errors import RevisionNotFoundError
 
 from lerobot.constants import HF_LEROBOT_HOME
 from lerobot.datasets.compute_stats import aggregate_stats, compute_episode_stats
+from lerobot.datasets.episode_buffer import FeatureColumn, episode_to_arrow_table, is_columnar_feature
+from lerobot.datasets.feature_cache import ImageFeatureCache, image_features_key
+from lerobot.datasets.frame_spool import (
+    SPOOL_COMPRESSIONS,
+    SPOOL_FILENAME,
+    FrameSpoolReader,
+    FrameSpoolWriter,
+)
 from lerobot.datasets.image_writer import AsyncImageWriter, write_image
 from lerobot.datasets.utils import (
     DEFAULT_FEATURES,
     DEFAULT_IMAGE_PATH,
     INFO_PATH,
+    JSONL_INDEX_SUFFIX,
     TASKS_PATH,
     _validate_feature_names,
     append_jsonlines,
@@ -53,12 +67,13 @@ from lerobot.datasets.utils import (
     get_safe_version,
     hf_transform_to_torch,
     is_valid_version,
-    load_episodes,
-    load_episodes_stats,
+    lazy_load_episodes,
+    lazy_load_episodes_stats,
     load_info,
     load_stats,
     load_tasks,
     validate_episode_buffer,
+    validate_feature_dtype_and_shape,
     validate_frame,
     write_episode,
     write_episode_stats,
@@ -104,13 +119,26 @@ class LeRobotDatasetMetadata:
         self.info = load_info(self.root)
         check_version_compatibility(self.repo_id, self._version, CODEBASE_VERSION)
         self.tasks, self.task_to_task_index = load_tasks(self.root)
-        self.episodes = load_episodes(self.root)
+        # The episodes and their stats are parsed on access, so that opening a few episodes of a large dataset
+        # doesn't parse the metadata of all the others
+        self.episodes = lazy_load_episodes(self.root)
         if self._version < packaging.version.parse("v2.1"):
             self.stats = load_stats(self.root)
             self.episodes_stats = backward_compatible_episodes_stats(self.stats, self.episodes)
         else:
-            self.episodes_stats = load_episodes_stats(self.root)
-            self.stats = aggregate_stats(list(self.episodes_stats.values()))
+            self.episodes_stats = lazy_load_episodes_stats(self.root)
+            self._stats = None
+
+    @property
+    def stats(self) -> dict[str, dict[str, np.ndarray]]:
+        """Stats of the whole dataset, aggregated from the stats of the episodes on first access."""
+        if self._stats is None and self.episodes_stats:
+            self._stats = aggregate_stats(list(self.episodes_stats.values()))
+        return self._stats
+
+    @stats.setter
+    def stats(self, stats: dict[str, dict[str, np.ndarray]]) -> None:
+        self._stats = stats
 
     def pull_from_repo(
         self,
@@ -271,8 +299,10 @@ class LeRobotDatasetMetadata:
         self.episodes[episode_index] = episode_dict
         write_episode(episode_dict, self.root)
 
+        # Read before adding the episode, which the lazily aggregated stats would otherwise include twice
+        stats = self.stats
         self.episodes_stats[episode_index] = episode_stats
-        self.stats = aggregate_stats([self.stats, episode_stats]) if self.stats else episode_stats
+        self.stats = aggregate_stats([stats, episode_stats]) if stats else episode_stats
         write_episode_stats(episode_index, episode_stats, self.root)
 
     def update_video_info(self) -> None:
@@ -341,6 +371,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         download_videos: bool = True,
         video_backend: str | None = None,
         batch_encoding_size: int = 1,
+        image_feature_cache: ImageFeatureCache | None = None,
     ):
         """
         2 modes are available for instantiating this class, depending on 2 different use cases:
@@ -444,6 +475,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 You can also use the 'pyav' decoder used by Torchvision, which used to be the default option, or 'video_reader' which is another decoder of Torchvision.
             batch_encoding_size (int, optional): Number of episodes to accumulate before batch encoding videos.
                 Set to 1 for immediate encoding (default), or higher for batched encoding. Defaults to 1.
+            image_feature_cache (ImageFeatureCache | None, optional): Cache of the features of the camera
+                frames computed by a frozen image encoder. When provided, the features of the cached cameras
+                are returned under the keys given by `image_features_key` instead of their frames, which are
+                not decoded. Defaults to None.
         """
         super().__init__()
         self.repo_id = repo_id
@@ -456,10 +491,13 @@ class LeRobotDataset(torch.utils.data.Dataset):
         self.video_backend = video_backend if video_backend else get_safe_default_codec()
         self.delta_indices = None
         self.batch_encoding_size = batch_encoding_size
+        self.image_feature_cache = image_feature_cache
         self.episodes_since_last_encoding = 0
 
         # Unused attributes
         self.image_writer = None
+        self.frame_spooling = None
+        self.spool_writers = {}
         self.episode_buffer = None
 
         self.root.mkdir(exist_ok=True, parents=True)
@@ -484,6 +522,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
             self.hf_dataset = self.load_hf_dataset()
 
         self.episode_data_index = get_episode_data_index(self.meta.episodes, self.episodes)
+        # Position of each selected episode in `episode_data_index`
+        self._episode_positions = (
+            {ep_idx: i for i, ep_idx in enumerate(self.episodes)} if self.episodes is not None else None
+        )
 
         # Check timestamps
         timestamps = torch.stack(self.hf_dataset["timestamp"]).numpy()
@@ -508,7 +550,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         upload_large_folder: bool = False,
         **card_kwargs,
     ) -> None:
-        ignore_patterns = ["images/"]
+        ignore_patterns = ["images/", f"meta/*{JSONL_INDEX_SUFFIX}"]
         if not push_videos:
             ignore_patterns.append("videos/")
 
@@ -644,8 +686,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
             return get_hf_features_from_features(self.features)
 
     def _get_query_indices(self, idx: int, ep_idx: int) -> tuple[dict[str, list[int | bool]]]:
-        ep_start = self.episode_data_index["from"][ep_idx]
-        ep_end = self.episode_data_index["to"][ep_idx]
+        ep_position = self._episode_positions[ep_idx] if self._episode_positions is not None else ep_idx
+        ep_start = self.episode_data_index["from"][ep_position]
+        ep_end = self.episode_data_index["to"][ep_position]
         query_indices = {
             key: [max(ep_start.item(), min(ep_end.item() - 1, idx + delta)) for delta in delta_idx]
             for key, delta_idx in self.delta_indices.items()
@@ -665,6 +708,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
     ) -> dict[str, list[float]]:
         query_timestamps = {}
         for key in self.meta.video_keys:
+            if self.image_feature_cache is not None and key in self.image_feature_cache.camera_keys:
+                continue
             if query_indices is not None and key in query_indices:
                 timestamps = self.hf_dataset.select(query_indices[key])["timestamp"]
                 query_timestamps[key] = torch.stack(timestamps).tolist()
@@ -678,6 +723,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
             key: torch.stack(self.hf_dataset.select(q_idx)[key])
             for key, q_idx in query_indices.items()
             if key not in self.meta.video_keys
+            and (self.image_feature_cache is None or key not in self.image_feature_cache.camera_keys)
         }
 
     def _query_videos(self, query_timestamps: dict[str, list[float]], ep_idx: int) -> dict[str, torch.Tensor]:
@@ -694,6 +740,18 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
         return item
 
+    def _query_image_features(self, idx: int, item: dict, query_indices: dict[str, list[int]] | None) -> dict:
+        # The features are stored by index in the full dataset, which is contiguous within an episode
+        offset = item["index"].item() - idx
+        features = {}
+        for key in self.image_feature_cache.camera_keys:
+            if query_indices is not None and key in query_indices:
+                indices = [offset + i for i in query_indices[key]]
+            else:
+                indices = [offset + idx]
+            features[image_features_key(key)] = self.image_feature_cache.get(key, indices).squeeze(0)
+        return features
+
     def _add_padding_keys(self, item: dict, padding: dict[str, list[bool]]) -> dict:
         for key, val in padding.items():
             item[key] = torch.BoolTensor(val)
@@ -714,6 +772,13 @@ class LeRobotDataset(torch.utils.data.Dataset):
             for key, val in query_result.items():
                 item[key] = val
 
+        cached_keys = []
+        if self.image_feature_cache is not None:
+            cached_keys = self.image_feature_cache.camera_keys
+            for key in cached_keys:
+                item.pop(key, None)
+            item = {**self._query_image_features(idx, item, query_indices), **item}
+
         if len(self.meta.video_keys) > 0:
             current_ts = item["timestamp"].item()
             query_timestamps = self._get_query_timestamps(current_ts, query_indices)
@@ -721,7 +786,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
             item = {**video_frames, **item}
 
         if self.image_transforms is not None:
-            image_keys = self.meta.camera_keys
+            image_keys = [key for key in self.meta.camera_keys if key not in cached_keys]
             for cam in image_keys:
                 item[cam] = self.image_transforms(item[cam])
 
@@ -743,21 +808,72 @@ class LeRobotDataset(torch.utils.data.Dataset):
         )
 
     def create_episode_buffer(self, episode_index: int | None = None) -> dict:
+        """
+        Create an empty episode buffer. Numeric features are stored in a `FeatureColumn` each, the dtype and
+        shape of which the frames of `add_frame` are checked against. The other features (images, videos and
+        strings) are stored in lists.
+        """
         current_ep_idx = self.meta.total_episodes if episode_index is None else episode_index
         ep_buffer = {}
         # size and task are special cases that are not in self.features
         ep_buffer["size"] = 0
         ep_buffer["task"] = []
-        for key in self.features:
-            ep_buffer[key] = current_ep_idx if key == "episode_index" else []
+        for key, ft in self.features.items():
+            if key == "episode_index":
+                ep_buffer[key] = current_ep_idx
+            elif key in ["index", "task_index"] or not is_columnar_feature(ft):
+                ep_buffer[key] = []
+            elif key in ["frame_index", "timestamp"]:
+                # Scalars filled by `add_frame`. Timestamps are kept in float64 for `check_timestamps_sync`
+                ep_buffer[key] = FeatureColumn("int64" if key == "frame_index" else "float64")
+            else:
+                ep_buffer[key] = FeatureColumn(ft["dtype"], ft["shape"])
         return ep_buffer
 
+    @cached_property
+    def _frame_keys(self) -> frozenset[str]:
+        return frozenset(self.features) - frozenset(DEFAULT_FEATURES)
+
+    def _frame_matches_episode_buffer(self, frame: dict) -> bool:
+        """Check the frame against the columns of the episode buffer, without building error messages."""
+        if frame.keys() != self._frame_keys:
+            return False
+        for key, value in frame.items():
+            column = self.episode_buffer[key]
+            if isinstance(column, FeatureColumn):
+                if not column.accepts(value):
+                    return False
+            elif validate_feature_dtype_and_shape(key, self.features[key], value):
+                return False
+        return True
+
     def _get_image_file_path(self, episode_index: int, image_key: str, frame_index: int) -> Path:
         fpath = DEFAULT_IMAGE_PATH.format(
             image_key=image_key, episode_index=episode_index, frame_index=frame_index
         )
         return self.root / fpath
 
+    def _get_spool_path(self, episode_index: int, video_key: str) -> Path:
+        img_dir = self._get_image_file_path(episode_index=episode_index, image_key=video_key, frame_index=0)
+        return img_dir.parent / SPOOL_FILENAME
+
+    def _spool_frame(self, episode_index: int, video_key: str, image: np.ndarray | PIL.Image.Image) -> Path:
+        writer = self.spool_writers.get(video_key)
+        if writer is None:
+            writer = FrameSpoolWriter(self._get_spool_path(episode_index, video_key), self.frame_spooling)
+            self.spool_writers[video_key] = writer
+        writer.append(image)
+        return writer.path
+
+    def _close_spool_writers(self) -> dict[str, Path]:
+        """Close the frame spools of the current episode, and return their paths."""
+        spool_paths = {}
+        for key, writer in self.spool_writers.items():
+            writer.close()
+            spool_paths[key] = writer.path
+        self.spool_writers = {}
+        return spool_paths
+
     def _save_image(self, image: torch.Tensor | np.ndarray | PIL.Image.Image, fpath: Path) -> None:
         if self.image_writer is None:
             if isinstance(image, torch.Tensor):
@@ -771,17 +887,22 @@ class LeRobotDataset(torch.utils.data.Dataset):
         This function only adds the frame to the episode_buffer. Apart from images — which are written in a
         temporary directory — nothing is written to disk. To save those frames, the 'save_episode()' method
         then needs to be called.
+
+        With `frame_spooling`, the frames of video features are appended to a spool file per camera instead
+        of being written as png images. The append happens in the calling thread.
         """
         # Convert torch to numpy if needed
         for name in frame:
             if isinstance(frame[name], torch.Tensor):
                 frame[name] = frame[name].numpy()
 
-        validate_frame(frame, self.features)
-
         if self.episode_buffer is None:
             self.episode_buffer = self.create_episode_buffer()
 
+        if not self._frame_matches_episode_buffer(frame):
+            # Raises with the details of the mismatch
+            validate_frame(frame, self.features)
+
         # Automatically add frame_index and timestamp to episode buffer
         frame_index = self.episode_buffer["size"]
         if timestamp is None:
@@ -792,12 +913,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
         # Add frame features to episode_buffer
         for key in frame:
-            if key not in self.features:
-                raise ValueError(
-                    f"An element of the frame is not in the features. '{key}' not in '{self.features.keys()}'."
-                )
-
-            if self.features[key]["dtype"] in ["image", "video"]:
+            if self.features[key]["dtype"] == "video" and self.frame_spooling is not None:
+                spool_path = self._spool_frame(self.episode_buffer["episode_index"], key, frame[key])
+                self.episode_buffer[key].append(str(spool_path))
+            elif self.features[key]["dtype"] in ["image", "video"]:
                 img_path = self._get_image_file_path(
                     episode_index=self.episode_buffer["episode_index"], image_key=key, frame_index=frame_index
                 )
@@ -853,9 +972,14 @@ class LeRobotDataset(torch.utils.data.Dataset):
             # are processed separately by storing image path and frame info as meta data
             if key in ["index", "episode_index", "task_index"] or ft["dtype"] in ["image", "video"]:
                 continue
-            episode_buffer[key] = np.stack(episode_buffer[key])
+            if isinstance(episode_buffer[key], FeatureColumn):
+                episode_buffer[key] = episode_buffer[key].data
+            else:
+                episode_buffer[key] = np.stack(episode_buffer[key])
 
         self._wait_image_writer()
+        for key, spool_path in self._close_spool_writers().items():
+            episode_buffer[key] = FrameSpoolReader(spool_path)
         self._save_episode_table(episode_buffer, episode_index)
         ep_stats = compute_episode_stats(episode_buffer, self.features)
 
@@ -904,8 +1028,15 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
     def _save_episode_table(self, episode_buffer: dict, episode_index: int) -> None:
         episode_dict = {key: episode_buffer[key] for key in self.hf_features}
-        ep_dataset = datasets.Dataset.from_dict(episode_dict, features=self.hf_features, split="train")
-        ep_dataset = embed_images(ep_dataset)
+        table = episode_to_arrow_table(episode_dict, self.hf_features)
+        if table is not None:
+            # Numeric features only: the arrays are converted to Arrow as is, and there are no images to embed
+            ep_dataset = datasets.Dataset(
+                InMemoryTable(table), info=datasets.DatasetInfo(features=self.hf_features), split="train"
+            )
+        else:
+            ep_dataset = datasets.Dataset.from_dict(episode_dict, features=self.hf_features, split="train")
+            ep_dataset = embed_images(ep_dataset)
         self.hf_dataset = concatenate_datasets([self.hf_dataset, ep_dataset])
         self.hf_dataset.set_transform(hf_transform_to_torch)
         ep_data_path = self.root / self.meta.get_data_file_path(ep_index=episode_index)
@@ -915,8 +1046,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
     def clear_episode_buffer(self) -> None:
         episode_index = self.episode_buffer["episode_index"]
 
-        # Clean up image files for the current episode buffer
-        if self.image_writer is not None:
+        # Clean up image files for the current episode buffer, once they are no longer being written
+        self._wait_image_writer()
+        spool_paths = self._close_spool_writers()
+        if self.image_writer is not None or spool_paths:
             for cam_key in self.meta.camera_keys:
                 img_dir = self._get_image_file_path(
                     episode_index=episode_index, image_key=cam_key, frame_index=0
@@ -927,7 +1060,16 @@ class LeRobotDataset(torch.utils.data.Dataset):
         # Reset the buffer
         self.episode_buffer = self.create_episode_buffer()
 
-    def start_image_writer(self, num_processes: int = 0, num_threads: int = 4) -> None:
+    def start_image_writer(
+        self,
+        num_processes: int = 0,
+        num_threads: int = 4,
+        max_queue_size: int = 0,
+        overflow_policy: str = "block",
+        max_workers: int | None = None,
+    ) -> None:
+        """Start an `AsyncImageWriter` to save the images of `add_frame`, see its documentation for the
+        arguments."""
         if isinstance(self.image_writer, AsyncImageWriter):
             logging.warning(
                 "You are starting a new AsyncImageWriter that is replacing an already existing one in the dataset."
@@ -936,6 +1078,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         self.image_writer = AsyncImageWriter(
             num_processes=num_processes,
             num_threads=num_threads,
+            max_queue_size=max_queue_size,
+            overflow_policy=overflow_policy,
+            max_workers=max_workers,
         )
 
     def stop_image_writer(self) -> None:
@@ -954,7 +1099,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
     def encode_episode_videos(self, episode_index: int) -> None:
         """
-        Use ffmpeg to convert frames stored as png into mp4 videos.
+        Use ffmpeg to convert frames stored as png, or in a frame spool, into mp4 videos.
         Note: `encode_video_frames` is a blocking call. Making it asynchronous shouldn't speedup encoding,
         since video encoding with ffmpeg is already using multithreading.
 
@@ -1016,8 +1161,16 @@ class LeRobotDataset(torch.utils.data.Dataset):
         image_writer_threads: int = 0,
         video_backend: str | None = None,
         batch_encoding_size: int = 1,
+        frame_spooling: str | None = None,
     ) -> "LeRobotDataset":
-        """Create a LeRobot Dataset from scratch in order to record data."""
+        """Create a LeRobot Dataset from scratch in order to record data.
+
+        Set `frame_spooling` to "raw" or "lz4" to append the frames of video features to a spool file per
+        camera and per episode, instead of writing them as png images, see `FrameSpoolWriter`.
+        """
+        if frame_spooling is not None and frame_spooling not in SPOOL_COMPRESSIONS:
+            raise ValueError(f"Unknown frame spooling '{frame_spooling}'. Available: {SPOOL_COMPRESSIONS}")
+
         obj = cls.__new__(cls)
         obj.meta = LeRobotDatasetMetadata.create(
             repo_id=repo_id,
@@ -1032,6 +1185,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj.revision = None
         obj.tolerance_s = tolerance_s
         obj.image_writer = None
+        obj.frame_spooling = frame_spooling
+        obj.spool_writers = {}
         obj.batch_encoding_size = batch_encoding_size
         obj.episodes_since_last_encoding = 0
 
@@ -1046,7 +1201,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj.image_transforms = None
         obj.delta_timestamps = None
         obj.delta_indices = None
+        obj.image_feature_cache = None
         obj.episode_data_index = None
+        obj._episode_positions = None
         obj.video_backend = video_backend if video_backend is not None else get_safe_default_codec()
         return obj
 
@@ -1055,7 +1212,22 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
     """A dataset consisting of multiple underlying `LeRobotDataset`s.
 
     The underlying `LeRobotDataset`s are effectively concatenated, and this class adopts much of the API
-    structure of `LeRobotDataset`.
+    structure of `LeRobotDataset`. An index is mapped to its dataset by a binary search in the cumulative
+    numbers of frames of the datasets.
+
+    Only the metadata of the datasets is loaded at initialization. Each dataset is opened on its first access,
+    by each dataloader worker itself, so that the workers only open the datasets they read from, and the
+    opened datasets are never pickled to them. In streaming mode, the datasets are not opened as a whole:
+    an episode is opened, and downloaded if it is not on disk yet, when one of its frames is accessed, and the
+    last `max_open_episodes` opened episodes are kept open.
+
+    The datasets can be sampled with per-dataset weights by a `WeightedDatasetSampler`, e.g. to balance a small
+    dataset against a large one:
+        ```python
+        dataset = MultiLeRobotDataset(["lerobot/pusht", "lerobot/aloha"], weights={...})
+        sampler = WeightedDatasetSampler(dataset.dataset_sizes, dataset.weights)
+        dataloader = torch.utils.data.DataLoader(dataset, sampler=sampler, batch_size=32)
+        ```
     """
 
     def __init__(
@@ -1068,53 +1240,81 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
         tolerances_s: dict | None = None,
         download_videos: bool = True,
         video_backend: str | None = None,
+        weights: dict[str, float] | None = None,
+        streaming: bool = False,
+        max_open_episodes: int = 8,
     ):
+        """
+        Args:
+            weights (dict[str, float] | None, optional): Sampling weight of each repo_id, normalized to sum to
+                1. Defaults to the fraction of the frames in each dataset, i.e. uniform over the frames.
+            streaming (bool, optional): Open the episodes one at a time on demand, downloading their files
+                if needed, instead of the whole datasets. Defaults to False.
+            max_open_episodes (int, optional): Number of episodes kept open in streaming mode, per process.
+                Defaults to 8.
+        """
         super().__init__()
         self.repo_ids = repo_ids
         self.root = Path(root) if root else HF_LEROBOT_HOME
         self.tolerances_s = tolerances_s if tolerances_s else dict.fromkeys(repo_ids, 0.0001)
-        # Construct the underlying datasets passing everything but `transform` and `delta_timestamps` which
-        # are handled by this class.
-        self._datasets = [
-            LeRobotDataset(
-                repo_id,
-                root=self.root / repo_id,
-                episodes=episodes[repo_id] if episodes else None,
-                image_transforms=image_transforms,
-                delta_timestamps=delta_timestamps,
-                tolerance_s=self.tolerances_s[repo_id],
-                download_videos=download_videos,
-                video_backend=video_backend,
-            )
-            for repo_id in repo_ids
+        self.episodes = {repo_id: episodes.get(repo_id) if episodes else None for repo_id in repo_ids}
+        self.image_transforms = image_transforms
+        self.delta_timestamps = delta_timestamps
+        self.download_videos = download_videos
+        self.video_backend = video_backend
+        self.streaming = streaming
+        self.max_open_episodes = max_open_episodes
+
+        self.metas = [LeRobotDatasetMetadata(repo_id, root=self.root / repo_id) for repo_id in repo_ids]
+        self.episode_data_indices = [
+            get_episode_data_index(meta.episodes, self.episodes[repo_id])
+            for repo_id, meta in zip(repo_ids, self.metas, strict=True)
         ]
+        # Number of frames of each dataset
+        self.dataset_sizes = [index["to"][-1].item() for index in self.episode_data_indices]
+        self.cumulative_sizes = list(accumulate(self.dataset_sizes))
+        # End index of each episode of each dataset, to find the episode of a frame in streaming mode
+        self._episode_ends = [index["to"].tolist() for index in self.episode_data_indices]
+
+        if weights is not None:
+            if set(weights) != set(repo_ids):
+                raise ValueError(f"Expected a weight for each of {repo_ids}, got {list(weights)}.")
+            if any(weight < 0 for weight in weights.values()) or sum(weights.values()) <= 0:
+                raise ValueError(f"Weights must be non-negative with a positive sum, got {weights}.")
+            total = sum(weights.values())
+            self.weights = [weights[repo_id] / total for repo_id in repo_ids]
+        else:
+            self.weights = [size / self.num_frames for size in self.dataset_sizes]
+
+        # Opened on first access, see `_get_dataset` and `_get_episode_dataset`
+        self._datasets: list[LeRobotDataset | None] = [None] * len(repo_ids)
+        self._open_episodes: OrderedDict[tuple[int, int], LeRobotDataset] = OrderedDict()
 
         # Disable any data keys that are not common across all of the datasets. Note: we may relax this
         # restriction in future iterations of this class. For now, this is necessary at least for being able
         # to use PyTorch's default DataLoader collate function.
         self.disabled_features = set()
-        intersection_features = set(self._datasets[0].features)
-        for ds in self._datasets:
-            intersection_features.intersection_update(ds.features)
+        intersection_features = set(self.metas[0].features)
+        for meta in self.metas:
+            intersection_features.intersection_update(meta.features)
         if len(intersection_features) == 0:
             raise RuntimeError(
                 "Multiple datasets were provided but they had no keys common to all of them. "
                 "The multi-dataset functionality currently only keeps common keys."
             )
-        for repo_id, ds in zip(self.repo_ids, self._datasets, strict=True):
-            extra_keys = set(ds.features).difference(intersection_features)
-            logging.warning(
-                f"keys {extra_keys} of {repo_id} were disabled as they are not contained in all the "
-                "other datasets."
-            )
+        for repo_id, meta in zip(self.repo_ids, self.metas, strict=True):
+            extra_keys = set(meta.features).difference(intersection_features)
+            if extra_keys:
+                logging.warning(
+                    f"keys {extra_keys} of {repo_id} were disabled as they are not contained in all the "
+                    "other datasets."
+                )
             self.disabled_features.update(extra_keys)
 
-        self.image_transforms = image_transforms
-        self.delta_timestamps = delta_timestamps
         # TODO(rcadene, aliberts): We should not perform this aggregation for datasets
         # with multiple robots of different ranges. Instead we should have one normalization
         # per robot.
-        self.stats = aggregate_stats([dataset.meta.stats for dataset in self._datasets])
+        self.stats = aggregate_stats([meta.stats for meta in self.metas])
 
     @property
     def repo_id_to_index(self):
@@ -1135,7 +1335,7 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
 
         NOTE: Fow now, this relies on a check in __init__ to make sure all sub-datasets have the same info.
         """
-        return self._datasets[0].meta.info["fps"]
+        return self.metas[0].info["fps"]
 
     @property
     def video(self) -> bool:
@@ -1145,13 +1345,14 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
 
         NOTE: Fow now, this relies on a check in __init__ to make sure all sub-datasets have the same info.
         """
-        return self._datasets[0].meta.info.get("video", False)
+        return self.metas[0].info.get("video", False)
 
     @property
     def features(self) -> datasets.Features:
         features = {}
-        for dataset in self._datasets:
-            features.update({k: v for k, v in dataset.hf_features.items() if k not in self.disabled_features})
+        for meta in self.metas:
+            hf_features = get_hf_features_from_features(meta.features)
+            features.update({k: v for k, v in hf_features.items() if k not in self.disabled_features})
         return features
 
     @property
@@ -1180,12 +1381,12 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
     @property
     def num_frames(self) -> int:
         """Number of samples/frames."""
-        return sum(d.num_frames for d in self._datasets)
+        return self.cumulative_sizes[-1]
 
     @property
     def num_episodes(self) -> int:
         """Number of episodes."""
-        return sum(d.num_episodes for d in self._datasets)
+        return sum(len(index["to"]) for index in self.episode_data_indices)
 
     @property
     def tolerance_s(self) -> float:
@@ -1199,21 +1400,53 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
     def __len__(self):
         return self.num_frames
 
+    def _make_dataset(self, dataset_idx: int, episodes: list[int] | None) -> LeRobotDataset:
+        repo_id = self.repo_ids[dataset_idx]
+        return LeRobotDataset(
+            repo_id,
+            root=self.root / repo_id,
+            episodes=episodes,
+            image_transforms=self.image_transforms,
+            delta_timestamps=self.delta_timestamps,
+            tolerance_s=self.tolerances_s[repo_id],
+            download_videos=self.download_videos,
+            video_backend=self.video_backend,
+        )
+
+    def _get_dataset(self, dataset_idx: int) -> LeRobotDataset:
+        if self._datasets[dataset_idx] is None:
+            self._datasets[dataset_idx] = self._make_dataset(
+                dataset_idx, self.episodes[self.repo_ids[dataset_idx]]
+            )
+        return self._datasets[dataset_idx]
+
+    def _get_episode_dataset(self, dataset_idx: int, idx: int) -> tuple[LeRobotDataset, int]:
+        """Opened episode containing the frame `idx` of the dataset, and the index of the frame in it."""
+        episode_data_index = self.episode_data_indices[dataset_idx]
+        position = bisect.bisect_right(self._episode_ends[dataset_idx], idx)
+        episodes = self.episodes[self.repo_ids[dataset_idx]]
+        ep_idx = episodes[position] if episodes is not None else position
+
+        key = (dataset_idx, ep_idx)
+        if key in self._open_episodes:
+            self._open_episodes.move_to_end(key)
+        else:
+            self._open_episodes[key] = self._make_dataset(dataset_idx, [ep_idx])
+            if len(self._open_episodes) > self.max_open_episodes:
+                self._open_episodes.popitem(last=False)
+        return self._open_episodes[key], idx - episode_data_index["from"][position].item()
+
     def __getitem__(self, idx: int) -> dict[str, torch.Tensor]:
         if idx >= len(self):
             raise IndexError(f"Index {idx} out of bounds.")
         # Determine which dataset to get an item from based on the index.
-        start_idx = 0
-        dataset_idx = 0
-        for dataset in self._datasets:
-            if idx >= start_idx + dataset.num_frames:
-                start_idx += dataset.num_frames
-                dataset_idx += 1
-                continue
-            break
+        dataset_idx = bisect.bisect_right(self.cumulative_sizes, idx)
+        start_idx = self.cumulative_sizes[dataset_idx - 1] if dataset_idx > 0 else 0
+        if self.streaming:
+            dataset, frame_idx = self._get_episode_dataset(dataset_idx, idx - start_idx)
+            item = dataset[frame_idx]
         else:
-            raise AssertionError("We expect the loop to break out as long as the index is within bounds.")
-        item = self._datasets[dataset_idx][idx - start_idx]
+            item = self._get_dataset(dataset_idx)[idx - start_idx]
         item["dataset_index"] = torch.tensor(dataset_idx)
         for data_key in self.disabled_features:
             if data_key in item:
@@ -1221,10 +1454,16 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
 
         return item
 
+    def __getstate__(self) -> dict:
+        # Each dataloader worker opens the datasets itself
+        return {**self.__dict__, "_datasets": [None] * len(self.repo_ids), "_open_episodes": OrderedDict()}
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(\n"
             f"  Repository IDs: '{self.repo_ids}',\n"
+            f"  Sampling Weights: {[round(weight, 3) for weight in self.weights]},\n"
+            f"  Streaming: {self.streaming},\n"
             f"  Number of Samples: {self.num_frames},\n"
             f"  Number of Episodes: {self.num_episodes},\n"
             f"  Type: {'video (.mp4)' if self.video else 'image (.png)'},\n"
@@ -0,0 +1,167 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+import torch
+
+# Put in the queue by the producer thread when the underlying iterator is exhausted
+_END = object()
+
+
+class DevicePrefetcher:
+    """
+    Iterates over the batches of a dataloader moved to the training device, with `num_prefetch` batches loaded
+    and copied ahead of the training step.
+
+    A background thread takes the batches from the dataloader and copies their tensors to the device. On CUDA,
+    the copies are issued on a side stream, so they overlap with the training step running on the default
+    stream, which only waits for them when it takes the batch. The uint8 images in `image_keys` are converted to
+    float32 in [0, 1] on the device, so that 4 times fewer bytes are copied, and then transformed by
+    `image_transform` if given, e.g. augmented a whole batch at a time, also ahead of the training step.
+
+    With `num_prefetch=0`, each batch is loaded and copied by the call to `next`, as without prefetching.
+
+    `wait_s` is the time the last call to `next` waited for the batch, i.e. the data loading time that is not
+    hidden behind the training step.
+
+    Example:
+        ```python
+        batches = DevicePrefetcher(cycle_epochs(dataloader), device, image_keys=dataset.meta.camera_keys)
+        for step in range(steps):
+            batch = next(batches)
+            logging.info(f"waited {batches.wait_s:.3f}s for data")
+        batches.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        iterable: Iterable[dict[str, Any]],
+        device: torch.device,
+        num_prefetch: int = 2,
+        image_keys: Iterable[str] | None = None,
+        image_transform: Callable[[torch.Tensor], torch.Tensor] | None = None,
+    ):
+        """
+        Args:
+            iterable: Batches to load, typically a dataloader.
+            device: Device the tensors are copied to.
+            num_prefetch: Number of batches loaded ahead of the training step.
+            image_keys: Keys of the images, which are converted to float32 in [0, 1] if they are uint8.
+            image_transform: Transform applied on the device to the batch of images of each key in
+                `image_keys`, e.g. `BatchImageTransforms`.
+        """
+        if num_prefetch < 0:
+            raise ValueError(f"num_prefetch must be non-negative, got {num_prefetch}")
+
+        self.iterator = iter(iterable)
+        self.device = device
+        self.num_prefetch = num_prefetch
+        self.image_keys = set(image_keys) if image_keys is not None else set()
+        self.image_transform = image_transform
+        self.wait_s = 0.0
+
+        self.stream = torch.cuda.Stream(device) if device.type == "cuda" and num_prefetch > 0 else None
+        self.queue: queue.Queue = queue.Queue(maxsize=max(num_prefetch, 1))
+        self.shutdown_event = threading.Event()
+        self.thread = None
+        if num_prefetch > 0:
+            self.thread = threading.Thread(target=self._produce, name="device_prefetcher", daemon=True)
+            self.thread.start()
+
+    def to_device(self, batch: dict[str, Any]) -> dict[str, Any]:
+        """Copy the tensors of `batch` to the device, convert its uint8 images to float32 and transform them."""
+        non_blocking = self.device.type == "cuda"
+        for key, value in batch.items():
+            if not isinstance(value, torch.Tensor):
+                continue
+            value = value.to(self.device, non_blocking=non_blocking)
+            if key in self.image_keys and value.dtype == torch.uint8:
+                value = value.to(torch.float32).div_(255)
+            if key in self.image_keys and self.image_transform is not None:
+                value = self.image_transform(value)
+            batch[key] = value
+        return batch
+
+    def _produce(self) -> None:
+        while not self.shutdown_event.is_set():
+            try:
+                batch = next(self.iterator)
+                event = None
+                if self.stream is not None:
+                    with torch.cuda.stream(self.stream):
+                        batch = self.to_device(batch)
+                        event = torch.cuda.Event()
+                        event.record(self.stream)
+                else:
+                    batch = self.to_device(batch)
+                item = (batch, event)
+            except StopIteration:
+                item = _END
+            except Exception as e:
+                item = e
+
+            while not self.shutdown_event.is_set():
+                try:
+                    # The timeout lets the thread exit when the queue stays full after `close`
+                    self.queue.put(item, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+            if item is _END or isinstance(item, Exception):
+                return
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self
+
+    def __next__(self) -> dict[str, Any]:
+        start = time.perf_counter()
+        if self.thread is None:
+            batch = self.to_device(next(self.iterator))
+            self.wait_s = time.perf_counter() - start
+            return batch
+
+        item = self.queue.get()
+        if item is _END or isinstance(item, Exception):
+            # Put it back for the following calls, the producer thread has stopped
+            self.queue.put(item)
+            if item is _END:
+                raise StopIteration
+            raise RuntimeError("Loading the batch failed") from item
+
+        batch, event = item
+        if event is not None:
+            current_stream = torch.cuda.current_stream(self.device)
+            current_stream.wait_event(event)
+            # The memory of the tensors allocated on the side stream must not be reused before the current
+            # stream is done with them
+            for value in batch.values():
+                if isinstance(value, torch.Tensor):
+                    value.record_stream(current_stream)
+        self.wait_s = time.perf_counter() - start
+        return batch
+
+    def close(self) -> None:
+        """Stop the background thread."""
+        self.shutdown_event.set()
+        if self.thread is not None:
+            # Unblock the thread if it is waiting on a full queue
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.thread.join(timeout=1.0)
+            self.thread = None
@@ -13,6 +13,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import math
 from collections.abc import Iterator
 
 import torch
@@ -26,6 +27,9 @@ class EpisodeAwareSampler:
         drop_n_first_frames: int = 0,
         drop_n_last_frames: int = 0,
         shuffle: bool = False,
+        num_replicas: int = 1,
+        rank: int = 0,
+        seed: int | None = None,
     ):
         """Sampler that optionally incorporates episode boundary information.
 
@@ -36,7 +40,19 @@ class EpisodeAwareSampler:
             drop_n_first_frames: Number of frames to drop from the start of each episode.
             drop_n_last_frames: Number of frames to drop from the end of each episode.
             shuffle: Whether to shuffle the indices.
+            num_replicas: Number of processes of distributed training, each iterating over its own shard of
+                the indices. As with `torch.utils.data.DistributedSampler`, the indices are padded by repeating
+                the first ones, so that every shard has the same length.
+            rank: Rank of the current process among `num_replicas`.
+            seed: Seed of the shuffling, combined with the epoch set by `set_epoch`. Required to shuffle
+                with several replicas, so that they all draw the same permutation. If None, the global torch
+                random generator is used.
         """
+        if not 0 <= rank < num_replicas:
+            raise ValueError(f"rank must be in [0, {num_replicas - 1}], got {rank}")
+        if shuffle and num_replicas > 1 and seed is None:
+            raise ValueError("A seed is required to shuffle the same way on all the replicas.")
+
         indices = []
         for episode_idx, (start_index, end_index) in enumerate(
             zip(episode_data_index["from"], episode_data_index["to"], strict=True)
@@ -48,14 +64,92 @@ class EpisodeAwareSampler:
 
         self.indices = indices
         self.shuffle = shuffle
+        self.num_replicas = num_replicas
+        self.rank = rank
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        """Set the epoch, for the seeded shuffling to draw a different permutation at each epoch."""
+        self.epoch = epoch
 
     def __iter__(self) -> Iterator[int]:
-        if self.shuffle:
-            for i in torch.randperm(len(self.indices)):
-                yield self.indices[i]
+        if self.shuffle and self.seed is not None:
+            generator = torch.Generator()
+            generator.manual_seed(self.seed + self.epoch)
+            order = torch.randperm(len(self.indices), generator=generator).tolist()
+        elif self.shuffle:
+            order = torch.randperm(len(self.indices)).tolist()
         else:
-            for i in self.indices:
-                yield i
+            order = range(len(self.indices))
+
+        if self.num_replicas > 1:
+            total_size = len(self) * self.num_replicas
+            order = (list(order) * math.ceil(total_size / max(len(self.indices), 1)))[:total_size]
+            order = order[self.rank : total_size : self.num_replicas]
+
+        for i in order:
+            yield self.indices[i]
+
+    def __len__(self) -> int:
+        return math.ceil(len(self.indices) / self.num_replicas)
+
+
+class WeightedDatasetSampler:
+    def __init__(
+        self,
+        dataset_sizes: list[int],
+        weights: list[float],
+        num_samples: int | None = None,
+        seed: int | None = None,
+    ):
+        """Sampler of the frames of concatenated datasets, e.g. a `MultiLeRobotDataset`, with per-dataset
+        weights.
+
+        For each sample, a dataset is drawn with the probabilities `weights`, and then a frame of this dataset
+        uniformly, both with replacement. With weights proportional to `dataset_sizes`, frames are sampled
+        uniformly as with `torch.utils.data.RandomSampler(replacement=True)`.
+
+        Args:
+            dataset_sizes: Number of frames of each dataset, whose frames are concatenated in this order.
+            weights: Sampling weight of each dataset. If the sum of the weights is not 1, they will be
+                normalized.
+            num_samples: Number of frames sampled per epoch. Defaults to the total number of frames.
+            seed: Seed of the sampling, combined with the epoch set by `set_epoch`. If None, the global torch
+                random generator is used.
+        """
+        if len(weights) != len(dataset_sizes):
+            raise ValueError(
+                f"Length of weights doesn't match the number of datasets: {len(weights)} != {len(dataset_sizes)}"
+            )
+        if any(w < 0 for w in weights) or sum(weights) <= 0:
+            raise ValueError(f"weights should be non-negative with a positive sum, got {weights}")
+        if any(w > 0 and size == 0 for w, size in zip(weights, dataset_sizes, strict=True)):
+            raise ValueError("Empty datasets can't be sampled, their weight should be 0")
+
+        self.dataset_sizes = torch.tensor(dataset_sizes)
+        self.dataset_starts = torch.cumsum(self.dataset_sizes, dim=0) - self.dataset_sizes
+        self.weights = torch.tensor(weights, dtype=torch.float64)
+        self.num_samples = num_samples if num_samples is not None else sum(dataset_sizes)
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        """Set the epoch, for the seeded sampling to draw different frames at each epoch."""
+        self.epoch = epoch
+
+    def __iter__(self) -> Iterator[int]:
+        generator = None
+        if self.seed is not None:
+            generator = torch.Generator()
+            generator.manual_seed(self.seed + self.epoch)
+
+        dataset_indices = torch.multinomial(
+            self.weights, self.num_samples, replacement=True, generator=generator
+        )
+        offsets = torch.rand(self.num_samples, generator=generator, dtype=torch.float64)
+        frames = (offsets * self.dataset_sizes[dataset_indices]).long()
+        yield from (self.dataset_starts[dataset_indices] + frames).tolist()
 
     def __len__(self) -> int:
-        return len(self.indices)
+        return self.num_samples
@@ -19,6 +19,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import torch
+from torch import nn
 from torchvision.transforms import v2
 from torchvision.transforms.v2 import (
     Transform,
@@ -179,6 +180,10 @@ class ImageTransformsConfig:
     # By default, transforms are applied in Torchvision's suggested order (shown below).
     # Set this to True to apply them in a random order.
     random_order: bool = False
+    # Set this to True to apply the transforms to whole batches on the training device with
+    # `BatchImageTransforms`, instead of to each frame in the dataloader workers. Each frame still draws its own
+    # transforms and parameters, from the same distributions.
+    on_device: bool = False
     tfs: dict[str, ImageTransformConfig] = field(
         default_factory=lambda: {
             "brightness": ImageTransformConfig(
@@ -250,3 +255,273 @@ class ImageTransforms(Transform):
 
     def forward(self, *inputs: Any) -> Any:
         return self.tf(*inputs)
+
+
+def _batch_factor(factor: torch.Tensor, image: torch.Tensor) -> torch.Tensor:
+    """View of the per-image `factor` of shape (B,) broadcasting over the images (B, ..., C, H, W)."""
+    return factor.view(-1, *[1] * (image.ndim - 1))
+
+
+def _blend(image1: torch.Tensor, image2: torch.Tensor, ratio: torch.Tensor) -> torch.Tensor:
+    # image1 + (1 - ratio) * (image2 - image1), computed in place in a single new tensor
+    ratio = _batch_factor(ratio, image1)
+    return (image2 - image1).mul_(1.0 - ratio).add_(image1).clamp_(0.0, 1.0)
+
+
+def _rgb_to_grayscale(image: torch.Tensor) -> torch.Tensor:
+    if image.shape[-3] == 1:
+        return image
+    r, g, b = image.unbind(dim=-3)
+    return (0.2989 * r + 0.587 * g + 0.114 * b).unsqueeze(dim=-3)
+
+
+def _rgb_to_hsv(image: torch.Tensor) -> torch.Tensor:
+    r, g, b = image.unbind(dim=-3)
+    minc, maxc = torch.aminmax(image, dim=-3)
+    # Hue and saturation are 0 for grays, where the divisions below are replaced by divisions by 1
+    eqc = maxc == minc
+    channels_range = maxc - minc
+    ones = torch.ones_like(maxc)
+    s = channels_range / torch.where(eqc, ones, maxc)
+    channels_range = torch.where(eqc, ones, channels_range)
+    rc, gc, bc = (maxc - r) / channels_range, (maxc - g) / channels_range, (maxc - b) / channels_range
+    h = torch.where(maxc == r, bc - gc, torch.where(maxc == g, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = (h / 6.0 + 1.0).fmod(1.0)
+    return torch.stack((h, s, maxc), dim=-3)
+
+
+def _hsv_to_rgb(image: torch.Tensor) -> torch.Tensor:
+    h, s, v = image.unbind(dim=-3)
+    h6 = h * 6.0
+    i = torch.floor(h6)
+    f = h6 - i
+    i = i.to(torch.int64).remainder_(6)
+    p = (v * (1.0 - s)).clamp_(0.0, 1.0)
+    q = (v * (1.0 - s * f)).clamp_(0.0, 1.0)
+    t = (v * (1.0 - s * (1.0 - f))).clamp_(0.0, 1.0)
+    vpqt = torch.stack((v, p, q, t), dim=-3)
+    # Index in (v, p, q, t) of the red, green and blue channels, for each of the 6 sectors of the hue
+    select = torch.tensor([[0, 2, 1, 1, 3, 0], [3, 0, 0, 2, 1, 1], [1, 1, 3, 0, 0, 2]], device=image.device)
+    channels = select[:, i].movedim(0, -3)
+    return vpqt.gather(-3, channels)
+
+
+def adjust_brightness(image: torch.Tensor, factor: torch.Tensor) -> torch.Tensor:
+    """Batched `F.adjust_brightness`, with one brightness factor per image."""
+    return image.mul(_batch_factor(factor, image)).clamp_(0.0, 1.0)
+
+
+def adjust_contrast(image: torch.Tensor, factor: torch.Tensor) -> torch.Tensor:
+    """Batched `F.adjust_contrast`, with one contrast factor per image."""
+    mean = _rgb_to_grayscale(image).mean(dim=(-3, -2, -1), keepdim=True)
+    return _blend(image, mean, factor)
+
+
+def adjust_saturation(image: torch.Tensor, factor: torch.Tensor) -> torch.Tensor:
+    """Batched `F.adjust_saturation`, with one saturation factor per image."""
+    if image.shape[-3] == 1:
+        return image
+    return _blend(image, _rgb_to_grayscale(image), factor)
+
+
+def adjust_hue(image: torch.Tensor, factor: torch.Tensor) -> torch.Tensor:
+    """Batched `F.adjust_hue`, with one hue factor per image."""
+    if image.shape[-3] == 1:
+        return image
+    h, s, v = _rgb_to_hsv(image).unbind(dim=-3)
+    h = (h + _batch_factor(factor, h)).remainder_(1.0)
+    return _hsv_to_rgb(torch.stack((h, s, v), dim=-3))
+
+
+def adjust_sharpness(image: torch.Tensor, factor: torch.Tensor) -> torch.Tensor:
+    """Batched `F.adjust_sharpness`, with one sharpness factor per image."""
+    num_channels, height, width = image.shape[-3:]
+    if height <= 2 or width <= 2:
+        return image
+    # Normalized 3x3 kernel with 1s in the edges and a 5 in the middle, blurring all but the border pixels
+    kernel = torch.ones(3, 3, dtype=image.dtype, device=image.device)
+    kernel[1, 1] = 5.0
+    kernel = (kernel / 13.0).expand(num_channels, 1, 3, 3)
+    blurred = nn.functional.conv2d(
+        image.reshape(-1, num_channels, height, width), kernel, groups=num_channels
+    )
+    blurred = blurred.view(*image.shape[:-2], height - 2, width - 2)
+    output = image.clone()
+    view = output[..., 1:-1, 1:-1]
+    view.add_(blurred.sub_(view).mul_(1.0 - _batch_factor(factor, blurred)))
+    return output.clamp_(0.0, 1.0)
+
+
+class BatchColorJitter(nn.Module):
+    """Batched `v2.ColorJitter`, drawing the order of the adjustments and their factors for each image.
+
+    Args:
+        brightness, contrast, saturation, hue: Ranges of the factors, as for `v2.ColorJitter`.
+    """
+
+    def __init__(
+        self,
+        brightness: float | Sequence[float] | None = None,
+        contrast: float | Sequence[float] | None = None,
+        saturation: float | Sequence[float] | None = None,
+        hue: float | Sequence[float] | None = None,
+    ) -> None:
+        super().__init__()
+        # Validated and converted to ranges by `v2.ColorJitter`
+        jitter = v2.ColorJitter(brightness=brightness, contrast=contrast, saturation=saturation, hue=hue)
+        adjustments = [
+            (jitter.brightness, adjust_brightness),
+            (jitter.contrast, adjust_contrast),
+            (jitter.saturation, adjust_saturation),
+            (jitter.hue, adjust_hue),
+        ]
+        self.adjustments = [(bounds, fn) for bounds, fn in adjustments if bounds is not None]
+
+    def forward(self, images: torch.Tensor) -> torch.Tensor:
+        num_images = images.shape[0]
+        factors = [
+            torch.empty(num_images).uniform_(*bounds).to(images.device, non_blocking=True)
+            for bounds, _ in self.adjustments
+        ]
+        if len(self.adjustments) == 1:
+            return self.adjustments[0][1](images, factors[0])
+
+        # A random permutation of the adjustments for each image
+        order = torch.rand(num_images, len(self.adjustments)).argsort(dim=1)
+        for position in range(len(self.adjustments)):
+            for i, (_, fn) in enumerate(self.adjustments):
+                rows = (order[:, position] == i).nonzero().squeeze(1)
+                images = _apply_to_rows(fn, images, rows, factors[i])
+        return images
+
+
+class BatchSharpnessJitter(nn.Module):
+    """Batched `SharpnessJitter`, drawing the sharpness factor of each image.
+
+    Args:
+        sharpness: Range of the sharpness factor, as for `SharpnessJitter`.
+    """
+
+    def __init__(self, sharpness: float | Sequence[float]) -> None:
+        super().__init__()
+        self.sharpness = SharpnessJitter(sharpness).sharpness
+
+    def forward(self, images: torch.Tensor) -> torch.Tensor:
+        factor = torch.empty(images.shape[0]).uniform_(*self.sharpness)
+        return adjust_sharpness(images, factor.to(images.device, non_blocking=True))
+
+
+def _apply_to_rows(
+    fn: Callable, images: torch.Tensor, rows: torch.Tensor, *params: torch.Tensor
+) -> torch.Tensor:
+    """Apply `fn(images, *params)` to the images of the batch at the indices `rows`, and leave the others as is.
+
+    The indices are on the CPU, so that selecting the images does not synchronize with the device. `params` are
+    tensors with a value per image of the batch.
+    """
+    if len(rows) == 0:
+        return images
+    if len(rows) == len(images):
+        return fn(images, *params)
+    device_rows = rows.to(images.device, non_blocking=True)
+    selected = fn(images.index_select(0, device_rows), *[p.index_select(0, device_rows) for p in params])
+    return images.index_copy(0, device_rows, selected)
+
+
+class BatchRandomSubsetApply(nn.Module):
+    """Batched `RandomSubsetApply`, drawing the subset of transformations of each image.
+
+    Args:
+        transforms: list of batched transformations, drawing their own parameters for each image.
+        p: multinomial probabilities (with no replacement) used for sampling the transforms, as for
+            `RandomSubsetApply`.
+        n_subset: number of transformations to apply to each image. If ``None``, all transforms are applied.
+        random_order: apply the transformations of each image in a random order.
+    """
+
+    def __init__(
+        self,
+        transforms: Sequence[Callable],
+        p: list[float] | None = None,
+        n_subset: int | None = None,
+        random_order: bool = False,
+    ) -> None:
+        super().__init__()
+        # Validated and normalized like the per-image version
+        subset = RandomSubsetApply(transforms, p=p, n_subset=n_subset, random_order=random_order)
+        self.transforms = list(transforms)
+        self.p = subset.p
+        self.n_subset = subset.n_subset
+        self.random_order = random_order
+
+    def forward(self, images: torch.Tensor) -> torch.Tensor:
+        num_images = images.shape[0]
+        selected = torch.multinomial(torch.tensor(self.p).expand(num_images, -1), self.n_subset)
+        if not self.random_order:
+            # Each image goes through its transforms in the order of the list
+            for i, transform in enumerate(self.transforms):
+                rows = (selected == i).any(dim=1).nonzero().squeeze(1)
+                images = _apply_to_rows(transform, images, rows)
+            return images
+
+        for position in range(self.n_subset):
+            for i, transform in enumerate(self.transforms):
+                rows = (selected[:, position] == i).nonzero().squeeze(1)
+                images = _apply_to_rows(transform, images, rows)
+        return images
+
+    def extra_repr(self) -> str:
+        return f"p={self.p}, n_subset={self.n_subset}, random_order={self.random_order}"
+
+
+def make_batch_transform_from_config(cfg: ImageTransformConfig) -> Callable:
+    if cfg.type == "Identity":
+        return nn.Identity()
+    elif cfg.type == "ColorJitter":
+        return BatchColorJitter(**cfg.kwargs)
+    elif cfg.type == "SharpnessJitter":
+        return BatchSharpnessJitter(**cfg.kwargs)
+    else:
+        raise ValueError(f"Transform '{cfg.type}' is not valid.")
+
+
+class BatchImageTransforms(nn.Module):
+    """Batched `ImageTransforms`, applying the transforms of a configuration to a batch of images on its device.
+
+    Each image of the batch draws its subset of transforms and their parameters independently, from the same
+    distributions as with `ImageTransforms`. The images of shape (B, ..., C, H, W) are float in [0, 1], and the
+    frames of the leading dimensions of an image, e.g. its observation steps, get the same parameters, as when
+    `ImageTransforms` is applied to them at once.
+
+    The parameters are drawn with the default CPU generator, so that drawing them does not synchronize with the
+    device.
+    """
+
+    def __init__(self, cfg: ImageTransformsConfig) -> None:
+        super().__init__()
+        self._cfg = cfg
+
+        self.weights = []
+        self.transforms = {}
+        for tf_name, tf_cfg in cfg.tfs.items():
+            if tf_cfg.weight <= 0.0:
+                continue
+
+            self.transforms[tf_name] = make_batch_transform_from_config(tf_cfg)
+            self.weights.append(tf_cfg.weight)
+
+        n_subset = min(len(self.transforms), cfg.max_num_transforms)
+        if n_subset == 0 or not cfg.enable:
+            self.tf = nn.Identity()
+        else:
+            self.tf = BatchRandomSubsetApply(
+                transforms=list(self.transforms.values()),
+                p=self.weights,
+                n_subset=n_subset,
+                random_order=cfg.random_order,
+            )
+
+    def forward(self, images: torch.Tensor) -> torch.Tensor:
+        if not images.is_floating_point():
+            raise TypeError(f"Expected float images in [0, 1], got {images.dtype}.")
+        return self.tf(images)
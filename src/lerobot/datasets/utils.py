@@ -17,7 +17,9 @@ import contextlib
 import importlib.resources
 import json
 import logging
-from collections.abc import Iterator
+import os
+import re
+from collections.abc import Callable, Iterator, MutableMapping
 from itertools import accumulate
 from pathlib import Path
 from pprint import pformat
@@ -50,6 +52,8 @@ EPISODES_PATH = "meta/episodes.jsonl"
 STATS_PATH = "meta/stats.json"
 EPISODES_STATS_PATH = "meta/episodes_stats.jsonl"
 TASKS_PATH = "meta/tasks.jsonl"
+# Suffix of the index of the offsets of the records of a jsonl file, e.g. "meta/episodes.jsonl.index.npz"
+JSONL_INDEX_SUFFIX = ".index.npz"
 
 DEFAULT_VIDEO_PATH = "videos/chunk-{episode_chunk:03d}/{video_key}/episode_{episode_index:06d}.mp4"
 DEFAULT_PARQUET_PATH = "data/chunk-{episode_chunk:03d}/episode_{episode_index:06d}.parquet"
@@ -236,6 +240,149 @@ def load_episodes_stats(local_dir: Path) -> dict:
     }
 
 
+def _parse_episode_stats(item: dict) -> dict[str, dict[str, np.ndarray]]:
+    return cast_stats_to_numpy(item["stats"])
+
+
+def lazy_load_episodes(local_dir: Path) -> "LazyJsonlDict":
+    """Lazy equivalent of `load_episodes`, parsing an episode when it is accessed."""
+    return LazyJsonlDict(local_dir / EPISODES_PATH, key="episode_index")
+
+
+def lazy_load_episodes_stats(local_dir: Path) -> "LazyJsonlDict":
+    """Lazy equivalent of `load_episodes_stats`, parsing the stats of an episode when they are accessed."""
+    return LazyJsonlDict(local_dir / EPISODES_STATS_PATH, key="episode_index", parse=_parse_episode_stats)
+
+
+class LazyJsonlDict(MutableMapping):
+    """
+    Records of a jsonl file keyed by one of their integer fields, e.g. "episode_index", which are parsed on
+    first access instead of all at once.
+
+    The offset of each record in the file is indexed once and saved next to it (with the suffix
+    `JSONL_INDEX_SUFFIX`), so that opening the file afterwards only loads the index. Since the metadata files
+    are only appended to, the index of a file which grew is completed by indexing the new lines only. If the
+    index can't be saved, e.g. in a read-only directory, it is kept in memory.
+
+    Records set with `__setitem__` are kept in memory only, the file being written separately (see
+    `write_episode`). As with `load_episodes`, the keys are iterated in increasing order and the last record
+    of a duplicated key is kept.
+    """
+
+    def __init__(self, fpath: Path, key: str, parse: Callable[[dict], Any] | None = None):
+        self.fpath = Path(fpath)
+        self.key = key
+        self.parse = parse
+        self._key_pattern = re.compile(rb'^\{\s*"' + re.escape(key.encode()) + rb'"\s*:\s*(-?\d+)')
+        self._keys, self._offsets = self._load_index()
+        self._records: dict[int, Any] = {}
+        self._new_keys: set[int] = set()
+        self._file = None
+
+    @property
+    def index_path(self) -> Path:
+        return self.fpath.with_name(self.fpath.name + JSONL_INDEX_SUFFIX)
+
+    def _load_index(self) -> tuple[np.ndarray, np.ndarray]:
+        stat = os.stat(self.fpath)  # Raises FileNotFoundError for a missing file, as `load_jsonlines` does
+        keys, offsets, indexed_size = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), 0
+        if self.index_path.is_file():
+            try:
+                with np.load(self.index_path) as index:
+                    indexed_size, mtime_ns = index["source"].tolist()
+                    keys, offsets = index["keys"], index["offsets"]
+            except (OSError, ValueError, KeyError):
+                indexed_size, mtime_ns = 0, None
+            if indexed_size == stat.st_size and mtime_ns == stat.st_mtime_ns:
+                return keys, offsets
+            if not (0 < indexed_size < stat.st_size and self._ends_with_newline(indexed_size)):
+                keys, offsets, indexed_size = keys[:0], offsets[:0], 0
+
+        new_keys, new_offsets = self._index_lines(indexed_size)
+        keys, offsets = np.concatenate([keys, new_keys]), np.concatenate([offsets, new_offsets])
+        order = np.argsort(keys, kind="stable")
+        keys, offsets = keys[order], offsets[order]
+        if len(keys) > 1:
+            # Keep the last record of each key
+            last = np.append(keys[1:] != keys[:-1], True)
+            keys, offsets = keys[last], offsets[last]
+        self._save_index(keys, offsets, stat)
+        return keys, offsets
+
+    def _ends_with_newline(self, size: int) -> bool:
+        with open(self.fpath, "rb") as f:
+            f.seek(size - 1)
+            return f.read(1) == b"\n"
+
+    def _index_lines(self, start: int) -> tuple[np.ndarray, np.ndarray]:
+        keys, offsets = [], []
+        with open(self.fpath, "rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if line.strip():
+                    # The key is written first (see `write_episode_stats`), which avoids parsing the line
+                    match = self._key_pattern.match(line)
+                    keys.append(int(match.group(1)) if match else json.loads(line)[self.key])
+                    offsets.append(offset)
+                offset += len(line)
+        return np.array(keys, dtype=np.int64), np.array(offsets, dtype=np.int64)
+
+    def _save_index(self, keys: np.ndarray, offsets: np.ndarray, stat: os.stat_result) -> None:
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp.npz")
+        try:
+            np.savez(tmp_path, source=np.array([stat.st_size, stat.st_mtime_ns]), keys=keys, offsets=offsets)
+            # Atomic, for concurrent readers of the same dataset
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logging.debug(f"Couldn't save the index of {self.fpath}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _position(self, key: int) -> int | None:
+        position = int(np.searchsorted(self._keys, key))
+        return position if position < len(self._keys) and self._keys[position] == key else None
+
+    def __getitem__(self, key: int) -> Any:
+        if key in self._records:
+            return self._records[key]
+        position = self._position(key)
+        if position is None:
+            raise KeyError(key)
+        if self._file is None:
+            self._file = open(self.fpath, "rb")  # noqa: SIM115
+        self._file.seek(self._offsets[position])
+        record = json.loads(self._file.readline())
+        record = self.parse(record) if self.parse is not None else record
+        self._records[key] = record
+        return record
+
+    def __setitem__(self, key: int, value: Any) -> None:
+        if self._position(key) is None:
+            self._new_keys.add(key)
+        self._records[key] = value
+
+    def __delitem__(self, key: int) -> None:
+        raise TypeError(f"Records of {self.fpath} can't be deleted.")
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._new_keys or (isinstance(key, int) and self._position(key) is not None)
+
+    def __iter__(self) -> Iterator[int]:
+        if not self._new_keys:
+            return iter(self._keys.tolist())
+        return iter(sorted(self._keys.tolist() + list(self._new_keys)))
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._new_keys)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.fpath)!r}, {len(self)} records)"
+
+    def __getstate__(self) -> dict:
+        # The file is opened again by each process
+        return {**self.__dict__, "_file": None}
+
+
 def backward_compatible_episodes_stats(
     stats: dict[str, dict[str, np.ndarray]], episodes: list[int]
 ) -> dict[str, dict[str, np.ndarray]]:
@@ -497,9 +644,10 @@ def create_empty_dataset_info(
 def get_episode_data_index(
     episode_dicts: dict[dict], episodes: list[int] | None = None
 ) -> dict[str, torch.Tensor]:
-    episode_lengths = {ep_idx: ep_dict["length"] for ep_idx, ep_dict in episode_dicts.items()}
-    if episodes is not None:
-        episode_lengths = {ep_idx: episode_lengths[ep_idx] for ep_idx in episodes}
+    if episodes is None:
+        episodes = list(episode_dicts)
+    # Only the selected episodes are accessed, which are then the only ones parsed from a `LazyJsonlDict`
+    episode_lengths = {ep_idx: episode_dicts[ep_idx]["length"] for ep_idx in episodes}
 
     cumulative_lengths = list(accumulate(episode_lengths.values()))
     return {
@@ -632,6 +780,20 @@ def cycle(iterable):
             iterator = iter(iterable)
 
 
+def cycle_epochs(dataloader: torch.utils.data.DataLoader):
+    """Like `cycle`, but sets the epoch of the dataloader's sampler before each pass over the dataloader.
+
+    Samplers shuffling with a fixed seed, such as `DistributedSampler`, would otherwise repeat the same
+    permutation at every epoch.
+    """
+    epoch = 0
+    while True:
+        if hasattr(dataloader.sampler, "set_epoch"):
+            dataloader.sampler.set_epoch(epoch)
+        yield from dataloader
+        epoch += 1
+
+
 def create_branch(repo_id, *, branch: str, repo_type: str | None = None) -> None:
     """Create a branch on a existing Hugging Face repo. Delete the branch if it already
     exists before creating it.
@@ -29,6 +29,8 @@ import torchvision
 from datasets.features.features import register_feature
 from PIL import Image
 
+from lerobot.datasets.frame_spool import SPOOL_FILENAME, FrameSpoolReader
+
 
 def get_safe_default_codec():
     if importlib.util.find_spec("torchcodec"):
@@ -255,7 +257,11 @@ def encode_video_frames(
     log_level: int | None = av.logging.ERROR,
     overwrite: bool = False,
 ) -> None:
-    """More info on ffmpeg arguments tuning on `benchmark/video/README.md`"""
+    """Encode the frames of `imgs_dir` into a video: the frame spool written while recording (see
+    `FrameSpoolWriter`) if it has one, otherwise its `frame_XXXXXX.png` images.
+
+    More info on ffmpeg arguments tuning on `benchmark/video/README.md`
+    """
     # Check encoder availability
     if vcodec not in ["h264", "hevc", "libsvtav1"]:
         raise ValueError(f"Unsupported video codec: {vcodec}. Supported codecs are: h264, hevc, libsvtav1.")
@@ -272,17 +278,28 @@ def encode_video_frames(
         )
         pix_fmt = "yuv420p"
 
-    # Get input frames
-    template = "frame_" + ("[0-9]" * 6) + ".png"
-    input_list = sorted(
-        glob.glob(str(imgs_dir / template)), key=lambda x: int(x.split("_")[-1].split(".")[0])
-    )
+    # Get input frames, from the spool written while recording if any, otherwise from png images
+    spool_path = imgs_dir / SPOOL_FILENAME
+    if spool_path.is_file():
+        spool = FrameSpoolReader(spool_path)
+        if len(spool) == 0:
+            raise FileNotFoundError(f"No frames found in {spool_path}.")
+        width, height = spool.width, spool.height
+        input_frames = (av.VideoFrame.from_ndarray(frame, format="rgb24") for frame in spool)
+    else:
+        template = "frame_" + ("[0-9]" * 6) + ".png"
+        input_list = sorted(
+            glob.glob(str(imgs_dir / template)), key=lambda x: int(x.split("_")[-1].split(".")[0])
+        )
 
-    # Define video output frame size (assuming all input frames are the same size)
-    if len(input_list) == 0:
-        raise FileNotFoundError(f"No images found in {imgs_dir}.")
-    dummy_image = Image.open(input_list[0])
-    width, height = dummy_image.size
+        # Define video output frame size (assuming all input frames are the same size)
+        if len(input_list) == 0:
+            raise FileNotFoundError(f"No images found in {imgs_dir}.")
+        dummy_image = Image.open(input_list[0])
+        width, height = dummy_image.size
+        input_frames = (
+            av.VideoFrame.from_image(Image.open(input_data).convert("RGB")) for input_data in input_list
+        )
 
     # Define video codec options
     video_options = {}
@@ -311,9 +328,7 @@ def encode_video_frames(
         output_stream.height = height
 
         # Loop through input frames and encode them
-        for input_data in input_list:
-            input_image = Image.open(input_data).convert("RGB")
-            input_frame = av.VideoFrame.from_image(input_image)
+        for input_frame in input_frames:
             packet = output_stream.encode(input_frame)
             if packet:
                 output.mux(packet)
@@ -491,6 +506,7 @@ class VideoEncodingManager:
 
         # Clean up episode images if recording was interrupted
         if exc_type is not None:
+            self.dataset._close_spool_writers()
             interrupted_episode_index = self.dataset.num_episodes
             for key in self.dataset.meta.video_keys:
                 img_dir = self.dataset._get_image_file_path(
@@ -504,14 +520,16 @@ class VideoEncodingManager:
 
         # Clean up any remaining images directory if it's empty
         img_dir = self.dataset.root / "images"
-        # Check for any remaining PNG files
-        png_files = list(img_dir.rglob("*.png"))
+        # Check for any remaining PNG files or frame spools
+        png_files = list(img_dir.rglob("*.png")) + list(img_dir.rglob(SPOOL_FILENAME))
         if len(png_files) == 0:
-            # Only remove the images directory if no PNG files remain
+            # Only remove the images directory if no PNG files or frame spools remain
             if img_dir.exists():
                 shutil.rmtree(img_dir)
                 logging.debug("Cleaned up empty images directory")
         else:
-            logging.debug(f"Images directory is not empty, containing {len(png_files)} PNG files")
+            logging.debug(
+                f"Images directory is not empty, containing {len(png_files)} PNG files or frame spools"
+            )
 
         return False  # Don't suppress the original exception
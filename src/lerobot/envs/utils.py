@@ -81,6 +81,26 @@ def preprocess_observation(observations: dict[str, np.ndarray]) -> dict[str, Ten
     return return_observations
 
 
+def rename_env_observation(observations: dict[str, Any]) -> dict[str, np.ndarray]:
+    """Rename the keys of a Gym environment observation to the LeRobot format, keeping the numpy arrays as is.
+
+    Used with `ObservationPreprocessor`, which converts the arrays on the policy's device.
+    """
+    lerobot_observations = {}
+    if "pixels" in observations:
+        if isinstance(observations["pixels"], dict):
+            for key, img in observations["pixels"].items():
+                lerobot_observations[f"observation.images.{key}"] = img
+        else:
+            lerobot_observations["observation.image"] = observations["pixels"]
+
+    if "environment_state" in observations:
+        lerobot_observations["observation.environment_state"] = observations["environment_state"]
+
+    lerobot_observations["observation.state"] = observations["agent_pos"]
+    return lerobot_observations
+
+
 def env_to_policy_features(env_cfg: EnvConfig) -> dict[str, PolicyFeature]:
     # TODO(aliberts, rcadene): remove this hardcoding of keys and just use the nested keys as is
     # (need to also refactor preprocess_observation and externalize normalization from policies)
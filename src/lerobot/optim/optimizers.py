@@ -66,6 +66,8 @@ class AdamConfig(OptimizerConfig):
     eps: float = 1e-8
     weight_decay: float = 0.0
     grad_clip_norm: float = 10.0
+    # Update all the parameters in a single fused kernel instead of one kernel per parameter.
+    fused: bool = False
 
     def build(self, params: dict) -> torch.optim.Optimizer:
         kwargs = asdict(self)
@@ -81,6 +83,8 @@ class AdamWConfig(OptimizerConfig):
     eps: float = 1e-8
     weight_decay: float = 1e-2
     grad_clip_norm: float = 10.0
+    # Update all the parameters in a single fused kernel instead of one kernel per parameter.
+    fused: bool = False
 
     def build(self, params: dict) -> torch.optim.Optimizer:
         kwargs = asdict(self)
@@ -97,6 +101,8 @@ class SGDConfig(OptimizerConfig):
     nesterov: bool = False
     weight_decay: float = 0.0
     grad_clip_norm: float = 10.0
+    # Update all the parameters in a single fused kernel instead of one kernel per parameter.
+    fused: bool = False
 
     def build(self, params: dict) -> torch.optim.Optimizer:
         kwargs = asdict(self)
@@ -68,6 +68,8 @@ class ACTConfig(PreTrainedConfig):
             `None` means no pretrained weights.
         replace_final_stride_with_dilation: Whether to replace the ResNet's final 2x2 stride with a dilated
             convolution.
+        freeze_vision_encoder: Whether to freeze the vision backbone. Its image features can then be computed
+            once and served by the dataset (see `TrainPipelineConfig.cache_image_features`).
         pre_norm: Whether to use "pre-norm" in the transformer blocks.
         dim_model: The transformer blocks' main hidden dimension.
         n_heads: The number of heads to use in the transformer blocks' multi-head attention.
@@ -108,6 +110,7 @@ class ACTConfig(PreTrainedConfig):
     vision_backbone: str = "resnet18"
     pretrained_backbone_weights: str | None = "ResNet18_Weights.IMAGENET1K_V1"
     replace_final_stride_with_dilation: int = False
+    freeze_vision_encoder: bool = False
     # Transformer layers.
     pre_norm: bool = False
     dim_model: int = 512
@@ -33,7 +33,7 @@ from torch import Tensor, nn
 from torchvision.models._utils import IntermediateLayerGetter
 from torchvision.ops.misc import FrozenBatchNorm2d
 
-from lerobot.constants import ACTION, OBS_IMAGES
+from lerobot.constants import ACTION, IMAGE_FEATURES_SUFFIX, OBS_IMAGE_FEATURES, OBS_IMAGES
 from lerobot.policies.act.configuration_act import ACTConfig
 from lerobot.policies.normalize import Normalize, Unnormalize
 from lerobot.policies.pretrained import PreTrainedPolicy
@@ -100,6 +100,39 @@ class ACTPolicy(PreTrainedPolicy):
             },
         ]
 
+    def image_encoder_state_dict(self) -> dict[str, Tensor]:
+        """State of the modules computing the image features, which identifies them in a feature cache."""
+        state_dict = {f"backbone.{name}": value for name, value in self.model.backbone.state_dict().items()}
+        image_buffers = tuple("buffer_" + key.replace(".", "_") + "." for key in self.config.image_features)
+        for name, value in self.normalize_inputs.state_dict().items():
+            if name.startswith(image_buffers):
+                state_dict[f"normalize_inputs.{name}"] = value
+        return state_dict
+
+    @torch.no_grad()
+    def encode_images(self, batch: dict[str, Tensor]) -> dict[str, Tensor]:
+        """Compute the feature maps of the images of `batch` with the frozen backbone.
+
+        They are returned under the keys "<camera key>.features", the keys under which the dataset serves
+        them from an `ImageFeatureCache`, and are then used by the policy instead of the images.
+        """
+        if not self.config.freeze_vision_encoder:
+            raise ValueError("The image features can only be precomputed with `freeze_vision_encoder=True`.")
+        batch = self.normalize_inputs(batch)
+        return {
+            key + IMAGE_FEATURES_SUFFIX: self.model.backbone(batch[key])["feature_map"]
+            for key in self.config.image_features
+        }
+
+    def _prepare_images(self, batch: dict[str, Tensor]) -> dict[str, Tensor]:
+        batch = dict(batch)  # shallow copy so that adding a key doesn't modify the original
+        feature_keys = [key + IMAGE_FEATURES_SUFFIX for key in self.config.image_features]
+        if all(key in batch for key in feature_keys):
+            batch[OBS_IMAGE_FEATURES] = [batch[key] for key in feature_keys]
+        else:
+            batch[OBS_IMAGES] = [batch[key] for key in self.config.image_features]
+        return batch
+
     def reset(self):
         """This should be called whenever the environment is reset."""
         if self.config.temporal_ensemble_coeff is not None:
@@ -139,8 +172,7 @@ class ACTPolicy(PreTrainedPolicy):
 
         batch = self.normalize_inputs(batch)
         if self.config.image_features:
-            batch = dict(batch)  # shallow copy so that adding a key doesn't modify the original
-            batch[OBS_IMAGES] = [batch[key] for key in self.config.image_features]
+            batch = self._prepare_images(batch)
 
         actions = self.model(batch)[0]
         actions = self.unnormalize_outputs({ACTION: actions})[ACTION]
@@ -150,8 +182,7 @@ class ACTPolicy(PreTrainedPolicy):
         """Run the batch through the model and compute the loss for training or validation."""
         batch = self.normalize_inputs(batch)
         if self.config.image_features:
-            batch = dict(batch)  # shallow copy so that adding a key doesn't modify the original
-            batch[OBS_IMAGES] = [batch[key] for key in self.config.image_features]
+            batch = self._prepare_images(batch)
 
         batch = self.normalize_targets(batch)
         actions_hat, (mu_hat, log_sigma_x2_hat) = self.model(batch)
@@ -345,6 +376,8 @@ class ACT(nn.Module):
             # feature map).
             # Note: The forward method of this returns a dict: {"feature_map": output}.
             self.backbone = IntermediateLayerGetter(backbone_model, return_layers={"layer4": "feature_map"})
+            if config.freeze_vision_encoder:
+                self.backbone.requires_grad_(False)
 
         # Transformer (acts as VAE decoder when training with the variational objective).
         self.encoder = ACTEncoder(config)
@@ -398,6 +431,8 @@ class ACT(nn.Module):
             [robot_state_feature] (optional): (B, state_dim) batch of robot states.
 
             [image_features]: (B, n_cameras, C, H, W) batch of images.
+                OR
+            ["observation.image_features"]: list of n_cameras (B, C', H', W') backbone feature maps.
                 AND/OR
             [env_state_feature]: (B, env_dim) batch of environment states.
 
@@ -414,7 +449,9 @@ class ACT(nn.Module):
                 "actions must be provided when using the variational objective in training mode."
             )
 
-        if "observation.images" in batch:
+        if OBS_IMAGE_FEATURES in batch:
+            batch_size = batch[OBS_IMAGE_FEATURES][0].shape[0]
+        elif "observation.images" in batch:
             batch_size = batch["observation.images"][0].shape[0]
         else:
             batch_size = batch["observation.environment_state"].shape[0]
@@ -489,8 +526,11 @@ class ACT(nn.Module):
             # For a list of images, the H and W may vary but H*W is constant.
             # NOTE: If modifying this section, verify on MPS devices that
             # gradients remain stable (no explosions or NaNs).
-            for img in batch["observation.images"]:
-                cam_features = self.backbone(img)["feature_map"]
+            if OBS_IMAGE_FEATURES in batch:
+                feature_maps = batch[OBS_IMAGE_FEATURES]
+            else:
+                feature_maps = [self.backbone(img)["feature_map"] for img in batch["observation.images"]]
+            for cam_features in feature_maps:
                 cam_pos_embed = self.encoder_cam_feat_pos_embed(cam_features).to(dtype=cam_features.dtype)
                 cam_features = self.encoder_img_feat_input_proj(cam_features)
 
@@ -53,6 +53,44 @@ class ActorLearnerConfig:
     learner_port: int = 50051
     policy_parameters_push_frequency: int = 4
     queue_get_timeout: float = 2
+    # Every `parameters_keyframe_interval` pushes, the learner sends a full snapshot of the actor parameters.
+    # Other pushes leave out frozen parameters, which actors only need to receive once.
+    parameters_keyframe_interval: int = 10
+    # Dtype floating point parameters are sent in ("float32", "float16" or "bfloat16")
+    parameters_dtype: str = "float32"
+    # Optional compression of the transitions sent by the actors ("zlib", "lz4" or "zstd")
+    transitions_compression: str | None = None
+    # Send float images in [0, 1] as uint8, rounding them to multiples of 1/255. This is lossy for images that
+    # were resized or otherwise processed after capture (e.g. by the crop and resize of the environment), so
+    # the replay buffer then stores quantized images.
+    transitions_images_to_uint8: bool = False
+    # Number of actors the learner serves at once. Each actor gets its own gRPC streams, and its transitions
+    # go to one of `num_actors` ingest queues that the learner drains in turn.
+    num_actors: int = 1
+    # Maximum number of pending transition messages per ingest queue (0 for unbounded). When the learner falls
+    # behind, it stops reading from the actors of a full queue, which slows them down instead of piling up.
+    transition_queue_size: int = 0
+    # Identifier of this actor on the learner, defaults to "<hostname>-<pid>"
+    actor_id: str | None = None
+
+    def __post_init__(self):
+        if self.parameters_keyframe_interval < 1:
+            raise ValueError(
+                f"parameters_keyframe_interval must be at least 1, got {self.parameters_keyframe_interval}"
+            )
+        if self.parameters_dtype not in ("float32", "float16", "bfloat16"):
+            raise ValueError(
+                f"parameters_dtype must be one of 'float32', 'float16' or 'bfloat16', got {self.parameters_dtype}"
+            )
+        if self.transitions_compression not in (None, "zlib", "lz4", "zstd"):
+            raise ValueError(
+                "transitions_compression must be None, 'zlib', 'lz4' or 'zstd', "
+                f"got {self.transitions_compression}"
+            )
+        if self.num_actors < 1:
+            raise ValueError(f"num_actors must be at least 1, got {self.num_actors}")
+        if self.transition_queue_size < 0:
+            raise ValueError(f"transition_queue_size must be non-negative, got {self.transition_queue_size}")
 
 
 @dataclass
@@ -58,7 +58,7 @@ lerobot-record \
 """
 
 import logging
-import time
+from collections.abc import Callable
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from pprint import pformat
@@ -70,9 +70,10 @@ from lerobot.cameras.opencv.configuration_opencv import OpenCVCameraConfig  # no
 from lerobot.cameras.realsense.configuration_realsense import RealSenseCameraConfig  # noqa: F401
 from lerobot.configs import parser
 from lerobot.configs.policies import PreTrainedConfig
-from lerobot.datasets.image_writer import safe_stop_image_writer
+from lerobot.datasets.frame_spool import SPOOL_COMPRESSIONS
+from lerobot.datasets.image_writer import OVERFLOW_POLICIES, format_write_metrics, safe_stop_image_writer
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
-from lerobot.datasets.utils import build_dataset_frame, hw_to_dataset_features
+from lerobot.datasets.utils import append_jsonlines, build_dataset_frame, hw_to_dataset_features
 from lerobot.datasets.video_utils import VideoEncodingManager
 from lerobot.policies.factory import make_policy
 from lerobot.policies.pretrained import PreTrainedPolicy
@@ -86,6 +87,7 @@ from lerobot.robots import (  # noqa: F401
     so100_follower,
     so101_follower,
 )
+from lerobot.scripts.server.configs import AGGREGATE_FUNCTIONS
 from lerobot.teleoperators import (  # noqa: F401
     Teleoperator,
     TeleoperatorConfig,
@@ -97,6 +99,12 @@ from lerobot.teleoperators import (  # noqa: F401
     so101_leader,
 )
 from lerobot.teleoperators.keyboard.teleop_keyboard import KeyboardTeleop
+from lerobot.utils.control_loop import (
+    OVERRUN_POLICIES,
+    ControlLoopStats,
+    DeadlineScheduler,
+    PipelinedStage,
+)
 from lerobot.utils.control_utils import (
     init_keyboard_listener,
     is_headless,
@@ -104,13 +112,14 @@ from lerobot.utils.control_utils import (
     sanity_check_dataset_name,
     sanity_check_dataset_robot_compatibility,
 )
-from lerobot.utils.robot_utils import busy_wait
+from lerobot.utils.local_async_inference import LocalAsyncInference
+from lerobot.utils.observation_preprocessing import ObservationPreprocessor
 from lerobot.utils.utils import (
     get_safe_torch_device,
     init_logging,
     log_say,
 )
-from lerobot.utils.visualization_utils import _init_rerun, log_rerun_data
+from lerobot.utils.visualization_utils import RerunSink, _init_rerun
 
 
 @dataclass
@@ -146,13 +155,34 @@ class DatasetRecordConfig:
     # Too many threads might cause unstable teleoperation fps due to main thread being blocked.
     # Not enough threads might cause low camera fps.
     num_image_writer_threads_per_camera: int = 4
+    # Maximum number of images waiting to be written, per camera, which bounds the memory used when writing
+    # falls behind. Set to 0 for an unbounded queue.
+    image_writer_queue_size_per_camera: int = 90
+    # What to do with an image when the queue is full: "block" the recording until there is room, or "drop" it
+    # (its frame then repeats the previous image of the camera).
+    image_writer_overflow_policy: str = "block"
+    # Let the image writer start more threads (or processes, if `num_image_writer_processes` > 0), up to this
+    # number, when its backlog grows. Disabled if None.
+    max_image_writer_workers: int | None = None
     # Number of episodes to record before batch encoding videos
     # Set to 1 for immediate encoding (default behavior), or higher for batched encoding
     video_encoding_batch_size: int = 1
+    # Append the frames of each camera to a single spool file per episode, as "raw" pixels or "lz4"-compressed,
+    # instead of writing them as png images. Frames are then encoded into videos from the spool.
+    frame_spooling: str | None = None
 
     def __post_init__(self):
         if self.single_task is None:
             raise ValueError("You need to provide a task as argument in `single_task`.")
+        if self.image_writer_overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown image writer overflow policy '{self.image_writer_overflow_policy}'. "
+                f"Available: {OVERFLOW_POLICIES}"
+            )
+        if self.frame_spooling is not None and self.frame_spooling not in SPOOL_COMPRESSIONS:
+            raise ValueError(
+                f"Unknown frame spooling '{self.frame_spooling}'. Available: {SPOOL_COMPRESSIONS}"
+            )
 
 
 @dataclass
@@ -165,10 +195,28 @@ class RecordConfig:
     policy: PreTrainedConfig | None = None
     # Display all cameras on screen
     display_data: bool = False
+    # Rate at which camera images are displayed, at every step if None. Other values are displayed at every step.
+    display_image_fps: float | None = 5.0
+    # Factor by which camera images are downscaled before being displayed.
+    display_image_scale: float = 1.0
     # Use vocal synthesis to read events.
     play_sounds: bool = True
     # Resume recording on an existing dataset.
     resume: bool = False
+    # What to do with the ticks of the control loop whose deadline was missed entirely: "skip" them, or
+    # "catch_up" by running them back to back.
+    overrun_policy: str = "skip"
+    # Save frames to the dataset in a background thread, pipelined with the control loop.
+    pipeline_recording: bool = True
+    # Predict the action chunks of the policy in a background thread, ahead of their execution, as the
+    # `RobotClient` does with a remote `PolicyServer`. Only for policies predicting action chunks.
+    async_inference: bool = False
+    # Fraction of an action chunk left in the queue under which the next chunk is requested.
+    chunk_size_threshold: float = 0.5
+    # How overlapping actions of consecutive chunks are blended, see `AGGREGATE_FUNCTIONS`.
+    aggregate_fn_name: str = "weighted_average"
+    # Optional JSON lines file where the latency statistics of the control loop are appended after each episode.
+    control_stats_path: Path | None = None
 
     def __post_init__(self):
         # HACK: We parse again the cli args here to get the pretrained path if there was one.
@@ -181,12 +229,36 @@ class RecordConfig:
         if self.teleop is None and self.policy is None:
             raise ValueError("Choose a policy, a teleoperator or both to control the robot")
 
+        if self.overrun_policy not in OVERRUN_POLICIES:
+            raise ValueError(f"Unknown overrun policy '{self.overrun_policy}'. Available: {OVERRUN_POLICIES}")
+
+        if self.aggregate_fn_name not in AGGREGATE_FUNCTIONS:
+            raise ValueError(
+                f"Unknown aggregate function '{self.aggregate_fn_name}'. Available: {list(AGGREGATE_FUNCTIONS)}"
+            )
+
     @classmethod
     def __get_path_fields__(cls) -> list[str]:
         """This enables the parser to load config from the policy using `--policy.path=local/dir`"""
         return ["policy"]
 
 
+def _close_all(closers: list[Callable[[], None]], error: BaseException | None = None) -> None:
+    """Call every closer, even if some of them raise. The first error is raised once they were all called,
+    unless `error` is already being raised, and the other errors are logged."""
+    first_error = None
+    for close in closers:
+        try:
+            close()
+        except Exception as e:
+            if error is None and first_error is None:
+                first_error = e
+            else:
+                logging.exception(f"Error while closing, after a previous error: {e}")
+    if first_error is not None:
+        raise first_error
+
+
 @safe_stop_image_writer
 def record_loop(
     robot: Robot,
@@ -198,7 +270,14 @@ def record_loop(
     control_time_s: int | None = None,
     single_task: str | None = None,
     display_data: bool = False,
-):
+    rerun_sink: RerunSink | None = None,
+    preprocessor: ObservationPreprocessor | None = None,
+    overrun_policy: str = "skip",
+    pipeline_recording: bool = True,
+    async_inference: bool = False,
+    chunk_size_threshold: float = 0.5,
+    aggregate_fn_name: str = "weighted_average",
+) -> ControlLoopStats:
     if dataset is not None and dataset.fps != fps:
         raise ValueError(f"The dataset fps should be equal to requested fps ({dataset.fps} != {fps}).")
 
@@ -222,74 +301,146 @@ def record_loop(
     # if policy is given it needs cleaning up
     if policy is not None:
         policy.reset()
+        if preprocessor is None:
+            preprocessor = ObservationPreprocessor.from_dataset_features(
+                dataset.features, get_safe_torch_device(policy.config.device), policy.config.input_features
+            )
 
-    timestamp = 0
-    start_episode_t = time.perf_counter()
-    while timestamp < control_time_s:
-        start_loop_t = time.perf_counter()
-
-        if events["exit_early"]:
-            events["exit_early"] = False
-            break
-
-        observation = robot.get_observation()
+    stats = ControlLoopStats()
+    scheduler = DeadlineScheduler(fps, overrun_policy, stats)
+
+    # Action chunks are predicted in a background thread, ahead of their execution
+    local_async_inference = None
+    if policy is not None and async_inference:
+        local_async_inference = LocalAsyncInference(
+            policy,
+            preprocessor,
+            chunk_size_threshold=chunk_size_threshold,
+            aggregate_fn_name=aggregate_fn_name,
+            task=single_task,
+            robot_type=robot.robot_type,
+            stats=stats,
+        )
 
-        if policy is not None or dataset is not None:
+    def record_frame(observation, observation_frame, sent_action):
+        if observation_frame is None:
             observation_frame = build_dataset_frame(dataset.features, observation, prefix="observation")
+        action_frame = build_dataset_frame(dataset.features, sent_action, prefix="action")
+        frame = {**observation_frame, **action_frame}
+        dataset.add_frame(frame, task=single_task)
+
+    # Saving frames runs in a background thread, pipelined with the control of the next tick
+    recording_stage = None
+    if pipeline_recording and dataset is not None:
+        recording_stage = PipelinedStage(record_frame, maxsize=fps, name="record", stats=stats)
+
+    # Displaying data runs in its own background thread, which skips the ticks it can't keep up with
+    owns_rerun_sink = display_data and rerun_sink is None
+    if owns_rerun_sink:
+        rerun_sink = RerunSink()
+
+    loop_error = None
+    scheduler.start()
+    try:
+        while scheduler.elapsed_s() < control_time_s:
+            if events["exit_early"]:
+                events["exit_early"] = False
+                break
+
+            with stats.measure("observation"):
+                observation = robot.get_observation()
+
+            observation_frame = None
+            if policy is not None:
+                observation_frame = build_dataset_frame(dataset.features, observation, prefix="observation")
+
+            if local_async_inference is not None:
+                with stats.measure("policy"):
+                    if local_async_inference.ready_for_observation():
+                        local_async_inference.submit_observation(observation_frame)
+                    action_values = local_async_inference.pop_action()
+                action = {key: action_values[i].item() for i, key in enumerate(robot.action_features)}
+            elif policy is not None:
+                with stats.measure("policy"):
+                    action_values = predict_action(
+                        observation_frame,
+                        policy,
+                        preprocessor.device,
+                        policy.config.use_amp,
+                        task=single_task,
+                        robot_type=robot.robot_type,
+                        preprocessor=preprocessor,
+                    )
+                action = {key: action_values[i].item() for i, key in enumerate(robot.action_features)}
+            elif policy is None and isinstance(teleop, Teleoperator):
+                with stats.measure("teleop"):
+                    action = teleop.get_action()
+            elif policy is None and isinstance(teleop, list):
+                # TODO(pepijn, steven): clean the record loop for use of multiple robots (possibly with pipeline)
+                with stats.measure("teleop"):
+                    arm_action = teleop_arm.get_action()
+                    arm_action = {f"arm_{k}": v for k, v in arm_action.items()}
+
+                    keyboard_action = teleop_keyboard.get_action()
+                    base_action = robot._from_keyboard_to_base_action(keyboard_action)
+
+                action = {**arm_action, **base_action} if len(base_action) > 0 else arm_action
+            else:
+                logging.info(
+                    "No policy or teleoperator provided, skipping action generation."
+                    "This is likely to happen when resetting the environment without a teleop device."
+                    "The robot won't be at its rest position at the start of the next episode."
+                )
+                scheduler.wait_for_next_tick()
+                continue
 
-        if policy is not None:
-            action_values = predict_action(
-                observation_frame,
-                policy,
-                get_safe_torch_device(policy.config.device),
-                policy.config.use_amp,
-                task=single_task,
-                robot_type=robot.robot_type,
+            # Action can eventually be clipped using `max_relative_target`,
+            # so action actually sent is saved in the dataset.
+            with stats.measure("send_action"):
+                sent_action = robot.send_action(action)
+
+            if recording_stage is not None:
+                recording_stage.submit(observation, observation_frame, sent_action)
+            elif dataset is not None:
+                with stats.measure("record"):
+                    record_frame(observation, observation_frame, sent_action)
+
+            if display_data:
+                rerun_sink.log(observation, action)
+
+            scheduler.wait_for_next_tick()
+    except BaseException as e:
+        loop_error = e
+        raise
+    finally:
+        # Every background thread is stopped, and the first error (of the loop or of a thread) is reported.
+        # All the frames of the episode are in the dataset once the recording stage is closed.
+        closers = [
+            resource.close
+            for resource in (
+                local_async_inference,
+                recording_stage,
+                rerun_sink if owns_rerun_sink else None,
             )
-            action = {key: action_values[i].item() for i, key in enumerate(robot.action_features)}
-        elif policy is None and isinstance(teleop, Teleoperator):
-            action = teleop.get_action()
-        elif policy is None and isinstance(teleop, list):
-            # TODO(pepijn, steven): clean the record loop for use of multiple robots (possibly with pipeline)
-            arm_action = teleop_arm.get_action()
-            arm_action = {f"arm_{k}": v for k, v in arm_action.items()}
-
-            keyboard_action = teleop_keyboard.get_action()
-            base_action = robot._from_keyboard_to_base_action(keyboard_action)
-
-            action = {**arm_action, **base_action} if len(base_action) > 0 else arm_action
-        else:
-            logging.info(
-                "No policy or teleoperator provided, skipping action generation."
-                "This is likely to happen when resetting the environment without a teleop device."
-                "The robot won't be at its rest position at the start of the next episode."
-            )
-            continue
-
-        # Action can eventually be clipped using `max_relative_target`,
-        # so action actually sent is saved in the dataset.
-        sent_action = robot.send_action(action)
+            if resource is not None
+        ]
+        _close_all(closers, loop_error)
 
-        if dataset is not None:
-            action_frame = build_dataset_frame(dataset.features, sent_action, prefix="action")
-            frame = {**observation_frame, **action_frame}
-            dataset.add_frame(frame, task=single_task)
-
-        if display_data:
-            log_rerun_data(observation, action)
-
-        dt_s = time.perf_counter() - start_loop_t
-        busy_wait(1 / fps - dt_s)
-
-        timestamp = time.perf_counter() - start_episode_t
+    logging.info(f"Control loop statistics:\n{stats.format()}")
+    if dataset is not None and dataset.image_writer is not None:
+        stats.metrics["image_writer"] = dataset.image_writer.metrics(reset=True)
+        logging.info(f"Image writer statistics:\n{format_write_metrics(stats.metrics['image_writer'])}")
+    return stats
 
 
 @parser.wrap()
 def record(cfg: RecordConfig) -> LeRobotDataset:
     init_logging()
     logging.info(pformat(asdict(cfg)))
+    rerun_sink = None
     if cfg.display_data:
         _init_rerun(session_name="recording")
+        rerun_sink = RerunSink(image_fps=cfg.display_image_fps, image_scale=cfg.display_image_scale)
 
     robot = make_robot_from_config(cfg.robot)
     teleop = make_teleoperator_from_config(cfg.teleop) if cfg.teleop is not None else None
@@ -304,12 +455,7 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
             root=cfg.dataset.root,
             batch_encoding_size=cfg.dataset.video_encoding_batch_size,
         )
-
-        if hasattr(robot, "cameras") and len(robot.cameras) > 0:
-            dataset.start_image_writer(
-                num_processes=cfg.dataset.num_image_writer_processes,
-                num_threads=cfg.dataset.num_image_writer_threads_per_camera * len(robot.cameras),
-            )
+        dataset.frame_spooling = cfg.dataset.frame_spooling
         sanity_check_dataset_robot_compatibility(dataset, robot, cfg.dataset.fps, dataset_features)
     else:
         # Create empty dataset or load existing saved episodes
@@ -321,13 +467,26 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
             robot_type=robot.name,
             features=dataset_features,
             use_videos=cfg.dataset.video,
-            image_writer_processes=cfg.dataset.num_image_writer_processes,
-            image_writer_threads=cfg.dataset.num_image_writer_threads_per_camera * len(robot.cameras),
             batch_encoding_size=cfg.dataset.video_encoding_batch_size,
+            frame_spooling=cfg.dataset.frame_spooling,
+        )
+
+    if hasattr(robot, "cameras") and len(robot.cameras) > 0:
+        dataset.start_image_writer(
+            num_processes=cfg.dataset.num_image_writer_processes,
+            num_threads=cfg.dataset.num_image_writer_threads_per_camera * len(robot.cameras),
+            max_queue_size=cfg.dataset.image_writer_queue_size_per_camera * len(robot.cameras),
+            overflow_policy=cfg.dataset.image_writer_overflow_policy,
+            max_workers=cfg.dataset.max_image_writer_workers,
         )
 
     # Load pretrained policy
     policy = None if cfg.policy is None else make_policy(cfg.policy, ds_meta=dataset.meta)
+    preprocessor = None
+    if policy is not None:
+        preprocessor = ObservationPreprocessor.from_dataset_features(
+            dataset.features, get_safe_torch_device(policy.config.device), policy.config.input_features
+        )
 
     robot.connect()
     if teleop is not None:
@@ -339,7 +498,7 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
         recorded_episodes = 0
         while recorded_episodes < cfg.dataset.num_episodes and not events["stop_recording"]:
             log_say(f"Recording episode {dataset.num_episodes}", cfg.play_sounds)
-            record_loop(
+            stats = record_loop(
                 robot=robot,
                 events=events,
                 fps=cfg.dataset.fps,
@@ -349,7 +508,18 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 control_time_s=cfg.dataset.episode_time_s,
                 single_task=cfg.dataset.single_task,
                 display_data=cfg.display_data,
+                rerun_sink=rerun_sink,
+                preprocessor=preprocessor,
+                overrun_policy=cfg.overrun_policy,
+                pipeline_recording=cfg.pipeline_recording,
+                async_inference=cfg.async_inference,
+                chunk_size_threshold=cfg.chunk_size_threshold,
+                aggregate_fn_name=cfg.aggregate_fn_name,
             )
+            if cfg.control_stats_path is not None:
+                append_jsonlines(
+                    {"episode_index": dataset.num_episodes, **stats.summary()}, cfg.control_stats_path
+                )
 
             # Execute a few seconds without recording to give time to manually reset the environment
             # Skip reset for the last episode to be recorded
@@ -365,6 +535,9 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                     control_time_s=cfg.dataset.reset_time_s,
                     single_task=cfg.dataset.single_task,
                     display_data=cfg.display_data,
+                    rerun_sink=rerun_sink,
+                    overrun_policy=cfg.overrun_policy,
+                    pipeline_recording=cfg.pipeline_recording,
                 )
 
             if events["rerecord_episode"]:
@@ -389,6 +562,10 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
     if cfg.dataset.push_to_hub:
         dataset.push_to_hub(tags=cfg.dataset.tags, private=cfg.dataset.private)
 
+    # Last, as it raises the errors of the display
+    if rerun_sink is not None:
+        rerun_sink.close()
+
     log_say("Exiting", cfg.play_sounds)
     return dataset
 
@@ -180,13 +180,22 @@ class BrewieBase(Robot):
         start = time.perf_counter()
         obs_dict = self.bus.sync_read("Present_Position")
         obs_dict = {f"{motor}.pos": val for motor, val in obs_dict.items()}
-        dt_ms = (time.perf_counter() - start) * 1e3
+        end = time.perf_counter()
+        dt_ms = (end - start) * 1e3
         logger.debug(f"{self} read state: {dt_ms:.1f}ms")
 
-        # Capture images from cameras
+        # Capture images from cameras, taking the frames closest to the middle of the state read when
+        # the camera keeps timestamped frames
+        state_timestamp = (start + end) / 2
         for cam_key, cam in self.cameras.items():
             start = time.perf_counter()
-            obs_dict[cam_key] = cam.async_read()
+            if self.config.align_cameras_to_state and hasattr(cam, "read_nearest"):
+                frame = cam.read_nearest(state_timestamp)
+                obs_dict[cam_key] = frame.frame
+                offset_ms = (frame.timestamp - state_timestamp) * 1e3
+                logger.debug(f"{self} {cam_key} frame offset to state: {offset_ms:.1f}ms")
+            else:
+                obs_dict[cam_key] = cam.async_read()
             dt_ms = (time.perf_counter() - start) * 1e3
             logger.debug(f"{self} read {cam_key}: {dt_ms:.1f}ms")
 
@@ -38,5 +38,8 @@ class BrewieConfig(RobotConfig):
     # cameras
     cameras: dict[str, CameraConfig] = field(default_factory=dict)
 
+    # Use the camera frames captured closest to the joint state read, for cameras that timestamp their frames
+    align_cameras_to_state: bool = True
+
     # Set to True for backward compatibility with previous datasets/policies
     use_degrees: bool = False
\ No newline at end of file
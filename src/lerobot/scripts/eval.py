@@ -68,11 +68,17 @@ from tqdm import trange
 from lerobot.configs import parser
 from lerobot.configs.eval import EvalPipelineConfig
 from lerobot.envs.factory import make_env
-from lerobot.envs.utils import add_envs_task, check_env_attributes_and_types, preprocess_observation
+from lerobot.envs.utils import (
+    add_envs_task,
+    check_env_attributes_and_types,
+    preprocess_observation,
+    rename_env_observation,
+)
 from lerobot.policies.factory import make_policy
 from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.policies.utils import get_device_from_parameters
 from lerobot.utils.io_utils import write_video
+from lerobot.utils.observation_preprocessing import ObservationPreprocessor
 from lerobot.utils.random_utils import set_seed
 from lerobot.utils.utils import (
     get_safe_torch_device,
@@ -121,6 +127,10 @@ def rollout(
     """
     assert isinstance(policy, nn.Module), "Policy must be a PyTorch nn module."
     device = get_device_from_parameters(policy)
+    image_features = policy.config.image_features
+    preprocessor = ObservationPreprocessor(
+        device, image_features, {key: tuple(ft.shape[-2:]) for key, ft in image_features.items()}
+    )
 
     # Reset the policy and environments.
     policy.reset()
@@ -146,14 +156,11 @@ def rollout(
     )
     check_env_attributes_and_types(env)
     while not np.all(done):
-        # Numpy array to tensor and changing dictionary keys to LeRobot policy format.
-        observation = preprocess_observation(observation)
         if return_observations:
-            all_observations.append(deepcopy(observation))
+            all_observations.append(preprocess_observation(observation))
 
-        observation = {
-            key: observation[key].to(device, non_blocking=device.type == "cuda") for key in observation
-        }
+        # Changing dictionary keys to LeRobot policy format, and numpy arrays to tensors on the device.
+        observation = preprocessor(rename_env_observation(observation))
 
         # Infer "task" from attributes of environments.
         # TODO: works with SyncVectorEnv but not AsyncVectorEnv
@@ -48,6 +48,7 @@ https://github.com/michel-aractingi/lerobot-hilserl-guide
 
 import logging
 import os
+import socket
 import time
 from functools import lru_cache
 from queue import Empty
@@ -63,16 +64,18 @@ from lerobot.configs.train import TrainRLServerPipelineConfig
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
 from lerobot.robots import so100_follower  # noqa: F401
+from lerobot.scripts.rl import learner_service
 from lerobot.scripts.rl.gym_manipulator import make_robot_env
 from lerobot.teleoperators import gamepad, so101_leader  # noqa: F401
 from lerobot.transport import services_pb2, services_pb2_grpc
 from lerobot.transport.utils import (
-    bytes_to_state_dict,
     grpc_channel_options,
+    load_parameters_from_bytes,
     python_object_to_bytes,
+    read_parameters_header,
     receive_bytes_in_chunks,
     send_bytes_in_chunks,
-    transitions_to_bytes,
+    transitions_to_batch_bytes,
 )
 from lerobot.utils.process import ProcessSignalHandler
 from lerobot.utils.queue import get_last_item_from_queue
@@ -80,12 +83,10 @@ from lerobot.utils.random_utils import set_seed
 from lerobot.utils.robot_utils import busy_wait
 from lerobot.utils.transition import (
     Transition,
-    move_state_dict_to_device,
     move_transition_to_device,
 )
 from lerobot.utils.utils import (
     TimerManager,
-    get_safe_torch_device,
     init_logging,
 )
 
@@ -119,6 +120,11 @@ def actor_cli(cfg: TrainRLServerPipelineConfig):
     is_threaded = use_threads(cfg)
     shutdown_event = ProcessSignalHandler(is_threaded, display_pid=display_pid).shutdown_event
 
+    # Resolve the actor id once, so that every stream of this actor reports the same one to the learner
+    if cfg.policy.actor_learner_config.actor_id is None:
+        cfg.policy.actor_learner_config.actor_id = f"{socket.gethostname()}-{os.getpid()}"
+    logging.info(f"[ACTOR] Actor id: {cfg.policy.actor_learner_config.actor_id}")
+
     learner_client, grpc_channel = learner_service_client(
         host=cfg.policy.actor_learner_config.learner_host,
         port=cfg.policy.actor_learner_config.learner_port,
@@ -239,7 +245,6 @@ def act_with_policy(
     online_env = make_robot_env(cfg=cfg.env)
 
     set_seed(cfg.seed)
-    device = get_safe_torch_device(cfg.policy.device, log=True)
 
     torch.backends.cudnn.benchmark = True
     torch.backends.cuda.matmul.allow_tf32 = True
@@ -267,6 +272,9 @@ def act_with_policy(
     episode_total_steps = 0
 
     policy_timer = TimerManager("Policy inference", log=False)
+    # Version of the parameters received from the learner, None until a full snapshot has been loaded
+    policy_version = None
+    policy_update_time = 0.0
 
     for interaction_step in range(cfg.policy.online_steps):
         start_time = time.perf_counter()
@@ -317,12 +325,22 @@ def act_with_policy(
         if done or truncated:
             logging.info(f"[ACTOR] Global step {interaction_step}: Episode reward: {sum_reward_episode}")
 
-            update_policy_parameters(policy=policy, parameters_queue=parameters_queue, device=device)
+            update_start = time.perf_counter()
+            policy_version = update_policy_parameters(
+                policy=policy, parameters_queue=parameters_queue, policy_version=policy_version
+            )
+            policy_update_time = time.perf_counter() - update_start
 
-            if len(list_transition_to_send_to_learner) > 0:
-                push_transitions_to_transport_queue(
+            transitions_bytes = 0
+            n_transitions = len(list_transition_to_send_to_learner)
+            if n_transitions > 0:
+                transitions_bytes = push_transitions_to_transport_queue(
                     transitions=list_transition_to_send_to_learner,
                     transitions_queue=transitions_queue,
+                    compression=cfg.policy.actor_learner_config.transitions_compression,
+                    images_to_uint8=cfg.policy.actor_learner_config.transitions_images_to_uint8,
+                    actor_id=cfg.policy.actor_learner_config.actor_id,
+                    policy_version=policy_version,
                 )
                 list_transition_to_send_to_learner = []
 
@@ -342,6 +360,9 @@ def act_with_policy(
                         "Interaction step": interaction_step,
                         "Episode intervention": int(episode_intervention),
                         "Intervention rate": intervention_rate,
+                        "Policy version": policy_version if policy_version is not None else -1,
+                        "Policy update time (s)": policy_update_time,
+                        "Transitions bytes per transition": transitions_bytes / max(n_transitions, 1),
                         **stats,
                     }
                 )
@@ -394,6 +415,14 @@ def establish_learner_connection(
     return False
 
 
+def actor_metadata(cfg: TrainRLServerPipelineConfig) -> tuple[tuple[str, str], ...] | None:
+    """gRPC metadata identifying this actor on the learner, which serves several actors at once."""
+    actor_id = cfg.policy.actor_learner_config.actor_id
+    if actor_id is None:
+        return None
+    return ((learner_service.ACTOR_ID_METADATA_KEY, actor_id),)
+
+
 @lru_cache(maxsize=1)
 def learner_service_client(
     host: str = "127.0.0.1",
@@ -451,7 +480,7 @@ def receive_policy(
         )
 
     try:
-        iterator = learner_client.StreamParameters(services_pb2.Empty())
+        iterator = learner_client.StreamParameters(services_pb2.Empty(), metadata=actor_metadata(cfg))
         receive_bytes_in_chunks(
             iterator,
             parameters_queue,
@@ -505,7 +534,8 @@ def send_transitions(
         learner_client.SendTransitions(
             transitions_stream(
                 shutdown_event, transitions_queue, cfg.policy.actor_learner_config.queue_get_timeout
-            )
+            ),
+            metadata=actor_metadata(cfg),
         )
     except grpc.RpcError as e:
         logging.error(f"[ACTOR] gRPC error: {e}")
@@ -558,7 +588,8 @@ def send_interactions(
         learner_client.SendInteractions(
             interactions_stream(
                 shutdown_event, interactions_queue, cfg.policy.actor_learner_config.queue_get_timeout
-            )
+            ),
+            metadata=actor_metadata(cfg),
         )
     except grpc.RpcError as e:
         logging.error(f"[ACTOR] gRPC error: {e}")
@@ -611,33 +642,53 @@ def interactions_stream(
 #################################################
 
 
-def update_policy_parameters(policy: SACPolicy, parameters_queue: Queue, device):
-    bytes_state_dict = get_last_item_from_queue(parameters_queue, block=False)
-    if bytes_state_dict is not None:
-        logging.info("[ACTOR] Load new parameters from Learner.")
-        state_dicts = bytes_to_state_dict(bytes_state_dict)
-
-        # TODO: check encoder parameter synchronization possible issues:
-        # 1. When shared_encoder=True, we're loading stale encoder params from actor's state_dict
-        #    instead of the updated encoder params from critic (which is optimized separately)
-        # 2. When freeze_vision_encoder=True, we waste bandwidth sending/loading frozen params
-        # 3. Need to handle encoder params correctly for both actor and discrete_critic
-        # Potential fixes:
-        # - Send critic's encoder state when shared_encoder=True
-        # - Skip encoder params entirely when freeze_vision_encoder=True
-        # - Ensure discrete_critic gets correct encoder state (currently uses encoder_critic)
-
-        # Load actor state dict
-        actor_state_dict = move_state_dict_to_device(state_dicts["policy"], device=device)
-        policy.actor.load_state_dict(actor_state_dict)
-
-        # Load discrete critic if present
-        if hasattr(policy, "discrete_critic") and "discrete_critic" in state_dicts:
-            discrete_critic_state_dict = move_state_dict_to_device(
-                state_dicts["discrete_critic"], device=device
-            )
-            policy.discrete_critic.load_state_dict(discrete_critic_state_dict)
-            logging.info("[ACTOR] Loaded discrete critic parameters from Learner.")
+def update_policy_parameters(
+    policy: SACPolicy, parameters_queue: Queue, policy_version: int | None = None
+) -> int | None:
+    """Load the latest parameters pushed by the learner, if any, into the policy.
+
+    Parameters are copied in place from the received buffer. Messages that are not keyframes leave out the
+    frozen weights, so they are only loaded once a keyframe (full snapshot) has been received.
+
+    Args:
+        policy: The policy whose actor (and discrete critic) parameters are updated.
+        parameters_queue: Queue receiving the parameters messages from the learner.
+        policy_version: Version of the parameters currently loaded in the policy, None if no keyframe was
+            loaded yet.
+
+    Returns:
+        The version of the parameters loaded in the policy after the update.
+    """
+    bytes_parameters = get_last_item_from_queue(parameters_queue, block=False)
+    if bytes_parameters is None:
+        return policy_version
+
+    header, _ = read_parameters_header(bytes_parameters)
+    if policy_version is None and not header["is_keyframe"]:
+        logging.info(
+            f"[ACTOR] Skipping parameters version {header['version']} from Learner, waiting for a keyframe."
+        )
+        return policy_version
+
+    logging.info(f"[ACTOR] Load new parameters (version {header['version']}) from Learner.")
+
+    # TODO: check encoder parameter synchronization possible issues:
+    # 1. When shared_encoder=True, we're loading stale encoder params from actor's state_dict
+    #    instead of the updated encoder params from critic (which is optimized separately)
+    # 2. Need to handle encoder params correctly for both actor and discrete_critic
+    # Potential fixes:
+    # - Send critic's encoder state when shared_encoder=True
+    # - Ensure discrete_critic gets correct encoder state (currently uses encoder_critic)
+    modules = {"policy": policy.actor}
+    if hasattr(policy, "discrete_critic") and policy.discrete_critic is not None:
+        modules["discrete_critic"] = policy.discrete_critic
+
+    load_parameters_from_bytes(modules, bytes_parameters)
+
+    if "discrete_critic" in modules and any(t["module"] == "discrete_critic" for t in header["tensors"]):
+        logging.info("[ACTOR] Loaded discrete critic parameters from Learner.")
+
+    return header["version"]
 
 
 #################################################
@@ -645,13 +696,26 @@ def update_policy_parameters(policy: SACPolicy, parameters_queue: Queue, device)
 #################################################
 
 
-def push_transitions_to_transport_queue(transitions: list, transitions_queue):
-    """Send transitions to learner in smaller chunks to avoid network issues.
+def push_transitions_to_transport_queue(
+    transitions: list,
+    transitions_queue,
+    compression: str | None = None,
+    images_to_uint8: bool = False,
+    actor_id: str | None = None,
+    policy_version: int | None = None,
+) -> int:
+    """Send transitions to the learner as a single columnar batch.
 
     Args:
         transitions: List of transitions to send
-        message_queue: Queue to send messages to learner
-        chunk_size: Size of each chunk to send
+        transitions_queue: Queue to send messages to learner
+        compression: Optional compression of the message ("zlib", "lz4" or "zstd")
+        images_to_uint8: Whether float images in [0, 1] are quantized to uint8 (lossy)
+        actor_id: Identifier of this actor on the learner
+        policy_version: Version of the parameters the transitions were collected with
+
+    Returns:
+        The size of the pushed message in bytes.
     """
     transition_to_send_to_learner = []
     for transition in transitions:
@@ -662,7 +726,21 @@ def push_transitions_to_transport_queue(transitions: list, transitions_queue):
 
         transition_to_send_to_learner.append(tr)
 
-    transitions_queue.put(transitions_to_bytes(transition_to_send_to_learner))
+    message = transitions_to_batch_bytes(
+        transition_to_send_to_learner,
+        compression=compression,
+        images_to_uint8=images_to_uint8,
+        actor_id=actor_id,
+        policy_version=policy_version,
+    )
+    transitions_queue.put(message)
+
+    if transition_to_send_to_learner:
+        logging.debug(
+            f"[ACTOR] Pushed {len(transition_to_send_to_learner)} transitions, "
+            f"{len(message) / len(transition_to_send_to_learner) / 1024:.1f} KB per transition"
+        )
+    return len(message)
 
 
 def get_frequency_stats(timer: TimerManager) -> dict[str, float]:
@@ -78,20 +78,20 @@ from lerobot.teleoperators import gamepad, so101_leader  # noqa: F401
 from lerobot.transport import services_pb2_grpc
 from lerobot.transport.utils import (
     MAX_MESSAGE_SIZE,
+    PARAMETERS_DTYPES,
     bytes_to_python_object,
-    bytes_to_transitions,
-    state_to_bytes,
+    bytes_to_transition_batch,
+    parameters_to_bytes,
+    read_transitions_header,
 )
+from lerobot.utils.async_checkpoint import AsyncCheckpointer
 from lerobot.utils.buffer import ReplayBuffer, concatenate_batch_transitions
 from lerobot.utils.process import ProcessSignalHandler
 from lerobot.utils.random_utils import set_seed
 from lerobot.utils.train_utils import (
     get_step_checkpoint_dir,
     load_training_state as utils_load_training_state,
-    save_checkpoint,
-    update_last_checkpoint,
 )
-from lerobot.utils.transition import move_state_dict_to_device, move_transition_to_device
 from lerobot.utils.utils import (
     format_big_number,
     get_safe_torch_device,
@@ -194,8 +194,12 @@ def start_learner_threads(
         wandb_logger (WandBLogger | None): Logger for metrics
         shutdown_event: Event to signal shutdown
     """
-    # Create multiprocessing queues
-    transition_queue = Queue()
+    # Create multiprocessing queues, with one transitions ingest queue (shard) per actor
+    actor_learner_config = cfg.policy.actor_learner_config
+    transition_queues = [
+        Queue(maxsize=actor_learner_config.transition_queue_size)
+        for _ in range(actor_learner_config.num_actors)
+    ]
     interaction_message_queue = Queue()
     parameters_queue = Queue()
 
@@ -214,7 +218,7 @@ def start_learner_threads(
         target=start_learner,
         args=(
             parameters_queue,
-            transition_queue,
+            transition_queues,
             interaction_message_queue,
             shutdown_event,
             cfg,
@@ -227,14 +231,15 @@ def start_learner_threads(
         cfg=cfg,
         wandb_logger=wandb_logger,
         shutdown_event=shutdown_event,
-        transition_queue=transition_queue,
+        transition_queue=transition_queues,
         interaction_message_queue=interaction_message_queue,
         parameters_queue=parameters_queue,
     )
     logging.info("[LEARNER] Training process stopped")
 
     logging.info("[LEARNER] Closing queues")
-    transition_queue.close()
+    for transition_queue in transition_queues:
+        transition_queue.close()
     interaction_message_queue.close()
     parameters_queue.close()
 
@@ -242,7 +247,8 @@ def start_learner_threads(
     logging.info("[LEARNER] Communication process joined")
 
     logging.info("[LEARNER] join queues")
-    transition_queue.cancel_join_thread()
+    for transition_queue in transition_queues:
+        transition_queue.cancel_join_thread()
     interaction_message_queue.cancel_join_thread()
     parameters_queue.cancel_join_thread()
 
@@ -258,7 +264,7 @@ def add_actor_information_and_train(
     cfg: TrainRLServerPipelineConfig,
     wandb_logger: WandBLogger | None,
     shutdown_event: any,  # Event,
-    transition_queue: Queue,
+    transition_queue: "Queue | list[Queue]",
     interaction_message_queue: Queue,
     parameters_queue: Queue,
 ):
@@ -282,7 +288,8 @@ def add_actor_information_and_train(
         cfg (TrainRLServerPipelineConfig): Configuration object containing hyperparameters.
         wandb_logger (WandBLogger | None): Logger for tracking training progress.
         shutdown_event (Event): Event to signal shutdown.
-        transition_queue (Queue): Queue for receiving transitions from the actor.
+        transition_queue (Queue | list[Queue]): Queue(s) for receiving transitions from the actors, one per
+            ingest shard.
         interaction_message_queue (Queue): Queue for receiving interaction messages from the actor.
         parameters_queue (Queue): Queue for sending policy parameters to the actor.
     """
@@ -298,6 +305,8 @@ def add_actor_information_and_train(
     save_freq = cfg.save_freq
     policy_update_freq = cfg.policy.policy_update_freq
     policy_parameters_push_frequency = cfg.policy.actor_learner_config.policy_parameters_push_frequency
+    parameters_keyframe_interval = cfg.policy.actor_learner_config.parameters_keyframe_interval
+    parameters_dtype = PARAMETERS_DTYPES[cfg.policy.actor_learner_config.parameters_dtype]
     saving_checkpoint = cfg.save_checkpoint
     online_steps = cfg.policy.online_steps
     async_prefetch = cfg.policy.async_prefetch
@@ -321,7 +330,11 @@ def add_actor_information_and_train(
 
     policy.train()
 
-    push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+    # The first push is always a keyframe, so that actors receive the frozen weights too
+    parameters_version = 0
+    push_actor_policy_to_queue(
+        parameters_queue=parameters_queue, policy=policy, version=parameters_version, dtype=parameters_dtype
+    )
 
     last_time_policy_pushed = time.time()
 
@@ -357,6 +370,15 @@ def add_actor_information_and_train(
     online_iterator = None
     offline_iterator = None
 
+    checkpointer = AsyncCheckpointer(keep_last=cfg.keep_last_checkpoints, background=cfg.async_checkpoint)
+
+    # Replay buffer ingest throughput, reset at every log
+    ingested_transitions = 0
+    ingest_time_s = 0.0
+    # Per-actor transitions count and policy version, reported at every log
+    actor_stats = {}
+    last_log_time = time.perf_counter()
+
     # NOTE: THIS IS THE MAIN LOOP OF THE LEARNER
     while True:
         # Exit the training loop if shutdown is requested
@@ -365,14 +387,18 @@ def add_actor_information_and_train(
             break
 
         # Process all available transitions to the replay buffer, send by the actor server
-        process_transitions(
+        ingest_start = time.perf_counter()
+        n_ingested = process_transitions(
             transition_queue=transition_queue,
             replay_buffer=replay_buffer,
             offline_replay_buffer=offline_replay_buffer,
-            device=device,
             dataset_repo_id=dataset_repo_id,
             shutdown_event=shutdown_event,
+            actor_stats=actor_stats,
         )
+        if n_ingested > 0:
+            ingested_transitions += n_ingested
+            ingest_time_s += time.perf_counter() - ingest_start
 
         # Process all available interaction messages sent by the actor server
         interaction_message = process_interaction_messages(
@@ -556,7 +582,15 @@ def add_actor_information_and_train(
 
         # Push policy to actors if needed
         if time.time() - last_time_policy_pushed > policy_parameters_push_frequency:
-            push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+            parameters_version += 1
+            training_infos["parameters_push_bytes"] = push_actor_policy_to_queue(
+                parameters_queue=parameters_queue,
+                policy=policy,
+                version=parameters_version,
+                is_keyframe=parameters_version % parameters_keyframe_interval == 0,
+                dtype=parameters_dtype,
+            )
+            training_infos["parameters_version"] = parameters_version
             last_time_policy_pushed = time.time()
 
         # Update target networks (main and discrete)
@@ -565,6 +599,14 @@ def add_actor_information_and_train(
         # Log training metrics at specified intervals
         if optimization_step % log_freq == 0:
             training_infos["replay_buffer_size"] = len(replay_buffer)
+            if ingest_time_s > 0:
+                training_infos["transitions_ingest_per_s"] = ingested_transitions / ingest_time_s
+                ingested_transitions = 0
+                ingest_time_s = 0.0
+            training_infos.update(
+                get_actor_metrics(actor_stats, parameters_version, time.perf_counter() - last_log_time)
+            )
+            last_log_time = time.perf_counter()
             if offline_replay_buffer is not None:
                 training_infos["offline_replay_buffer_size"] = len(offline_replay_buffer)
             training_infos["Optimization step"] = optimization_step
@@ -607,12 +649,15 @@ def add_actor_information_and_train(
                 offline_replay_buffer=offline_replay_buffer,
                 dataset_repo_id=dataset_repo_id,
                 fps=fps,
+                checkpointer=checkpointer,
             )
 
+    checkpointer.close()
+
 
 def start_learner(
     parameters_queue: Queue,
-    transition_queue: Queue,
+    transition_queue: "Queue | list[Queue]",
     interaction_message_queue: Queue,
     shutdown_event: any,  # Event,
     cfg: TrainRLServerPipelineConfig,
@@ -624,7 +669,7 @@ def start_learner(
 
     Args:
         parameters_queue: Queue for sending policy parameters to the actor
-        transition_queue: Queue for receiving transitions from the actor
+        transition_queue: Queue(s) for receiving transitions from the actors, one per ingest shard
         interaction_message_queue: Queue for receiving interaction messages from the actor
         shutdown_event: Event to signal shutdown
         cfg: Training configuration
@@ -655,7 +700,9 @@ def start_learner(
     )
 
     server = grpc.server(
-        ThreadPoolExecutor(max_workers=learner_service.MAX_WORKERS),
+        ThreadPoolExecutor(
+            max_workers=learner_service.STREAMS_PER_ACTOR * cfg.policy.actor_learner_config.num_actors
+        ),
         options=[
             ("grpc.max_receive_message_length", MAX_MESSAGE_SIZE),
             ("grpc.max_send_message_length", MAX_MESSAGE_SIZE),
@@ -691,6 +738,7 @@ def save_training_checkpoint(
     offline_replay_buffer: ReplayBuffer | None = None,
     dataset_repo_id: str | None = None,
     fps: int = 30,
+    checkpointer: AsyncCheckpointer | None = None,
 ) -> None:
     """
     Save training checkpoint and associated data.
@@ -700,6 +748,7 @@ def save_training_checkpoint(
     2. Saves the policy model, configuration, and optimizer states
     3. Saves the current interaction step for resuming training
     4. Updates the "last" checkpoint symlink to point to this checkpoint
+    Steps 2 to 4 are done in the background by the checkpointer.
     5. Saves the replay buffer as a dataset for later use
     6. If an offline replay buffer exists, saves it as a separate dataset
 
@@ -714,6 +763,7 @@ def save_training_checkpoint(
         offline_replay_buffer: Optional offline replay buffer to save
         dataset_repo_id: Repository ID for dataset
         fps: Frames per second for dataset
+        checkpointer: Checkpointer writing the checkpoint, which writes it before returning if not given
     """
     logging.info(f"Checkpoint policy after step {optimization_step}")
     _num_digits = max(6, len(str(online_steps)))
@@ -722,25 +772,25 @@ def save_training_checkpoint(
     # Create checkpoint directory
     checkpoint_dir = get_step_checkpoint_dir(cfg.output_dir, online_steps, optimization_step)
 
-    # Save checkpoint
-    save_checkpoint(
+    # Save interaction step manually, in the checkpoint written by the checkpointer
+    training_state = {"step": optimization_step, "interaction_step": interaction_step}
+
+    def save_interaction_step(tmp_checkpoint_dir: Path) -> None:
+        torch.save(training_state, tmp_checkpoint_dir / TRAINING_STATE_DIR / "training_state.pt")
+
+    # Save checkpoint and update the "last" symlink
+    if checkpointer is None:
+        checkpointer = AsyncCheckpointer(background=False)
+    checkpointer.save(
         checkpoint_dir=checkpoint_dir,
         step=optimization_step,
         cfg=cfg,
         policy=policy,
         optimizer=optimizers,
         scheduler=None,
+        write_extra=save_interaction_step,
     )
 
-    # Save interaction step manually
-    training_state_dir = os.path.join(checkpoint_dir, TRAINING_STATE_DIR)
-    os.makedirs(training_state_dir, exist_ok=True)
-    training_state = {"step": optimization_step, "interaction_step": interaction_step}
-    torch.save(training_state, os.path.join(training_state_dir, "training_state.pt"))
-
-    # Update the "last" symlink
-    update_last_checkpoint(checkpoint_dir)
-
     # TODO : temporary save replay buffer here, remove later when on the robot
     # We want to control this with the keyboard inputs
     dataset_dir = os.path.join(cfg.output_dir, "dataset")
@@ -1106,22 +1156,51 @@ def check_nan_in_transition(
     return nan_detected
 
 
-def push_actor_policy_to_queue(parameters_queue: Queue, policy: nn.Module):
-    logging.debug("[LEARNER] Pushing actor policy to the queue")
+def push_actor_policy_to_queue(
+    parameters_queue: Queue,
+    policy: nn.Module,
+    version: int = 0,
+    is_keyframe: bool = True,
+    dtype: torch.dtype | None = None,
+) -> int:
+    """Serialize the actor parameters and push them to the queue streamed to the actors.
+
+    Keyframes carry every tensor. Other pushes leave out frozen parameters (e.g. a frozen vision encoder),
+    which never change after the actors received them with a keyframe.
+
+    Args:
+        parameters_queue: Queue for sending policy parameters to the actor.
+        policy: The policy whose actor (and discrete critic) parameters are pushed.
+        version: Version of the pushed parameters.
+        is_keyframe: Whether to push a full snapshot, including frozen parameters.
+        dtype: If set, floating point parameters are cast to this dtype before being sent.
+
+    Returns:
+        The size of the pushed message in bytes.
+    """
+    logging.debug(f"[LEARNER] Pushing actor policy (version {version}, keyframe: {is_keyframe}) to the queue")
 
-    # Create a dictionary to hold all the state dicts
-    state_dicts = {"policy": move_state_dict_to_device(policy.actor.state_dict(), device="cpu")}
+    modules = {"policy": policy.actor}
 
     # Add discrete critic if it exists
     if hasattr(policy, "discrete_critic") and policy.discrete_critic is not None:
-        state_dicts["discrete_critic"] = move_state_dict_to_device(
-            policy.discrete_critic.state_dict(), device="cpu"
-        )
+        modules["discrete_critic"] = policy.discrete_critic
         logging.debug("[LEARNER] Including discrete critic in state dict push")
 
-    state_bytes = state_to_bytes(state_dicts)
+    state_dicts = {name: module.state_dict() for name, module in modules.items()}
+    frozen = {
+        name: {n for n, p in module.named_parameters() if not p.requires_grad}
+        for name, module in modules.items()
+    }
+
+    state_bytes = parameters_to_bytes(
+        state_dicts, version=version, is_keyframe=is_keyframe, skip=frozen, dtype=dtype
+    )
     parameters_queue.put(state_bytes)
 
+    logging.debug(f"[LEARNER] Pushed {len(state_bytes) / 1024 / 1024:.2f} MB of parameters")
+    return len(state_bytes)
+
 
 def process_interaction_message(
     message, interaction_step_shift: int, wandb_logger: WandBLogger | None = None
@@ -1138,47 +1217,119 @@ def process_interaction_message(
     return message
 
 
+def _select_transitions(batch: dict, mask: torch.Tensor) -> dict:
+    """Select the transitions of a columnar batch where `mask` is True."""
+    return {
+        key: (
+            {k: v[mask] for k, v in value.items()}
+            if isinstance(value, dict)
+            else value[mask]
+            if value is not None
+            else None
+        )
+        for key, value in batch.items()
+    }
+
+
 def process_transitions(
-    transition_queue: Queue,
+    transition_queue: "Queue | list[Queue]",
     replay_buffer: ReplayBuffer,
     offline_replay_buffer: ReplayBuffer,
-    device: str,
     dataset_repo_id: str | None,
     shutdown_event: any,
-):
-    """Process all available transitions from the queue.
+    actor_stats: dict[str, dict] | None = None,
+) -> int:
+    """Process all available transitions from the queue(s).
+
+    Each message holds a columnar batch of transitions, inserted into the replay buffer at once. With several
+    ingest queues (one per shard of actors), one message is taken from each queue in turn so that a fast actor
+    can't starve the others.
 
     Args:
-        transition_queue: Queue for receiving transitions from the actor
+        transition_queue: Queue(s) for receiving transitions from the actors
         replay_buffer: Replay buffer to add transitions to
         offline_replay_buffer: Offline replay buffer to add transitions to
-        device: Device to move transitions to
         dataset_repo_id: Repository ID for dataset
         shutdown_event: Event to signal shutdown
+        actor_stats: If provided, updated in place with the number of transitions received from each actor and
+            the policy version the actor last collected them with. Disconnected actors are removed.
+
+    Returns:
+        The number of transitions added to the replay buffer.
     """
-    while not transition_queue.empty() and not shutdown_event.is_set():
-        transition_list = transition_queue.get()
-        transition_list = bytes_to_transitions(buffer=transition_list)
-
-        for transition in transition_list:
-            transition = move_transition_to_device(transition=transition, device=device)
-
-            # Skip transitions with NaN values
-            if check_nan_in_transition(
-                observations=transition["state"],
-                actions=transition["action"],
-                next_state=transition["next_state"],
-            ):
-                logging.warning("[LEARNER] NaN detected in transition, skipping")
+    pending_queues = transition_queue if isinstance(transition_queue, list) else [transition_queue]
+    n_added = 0
+    while pending_queues and not shutdown_event.is_set():
+        for queue in list(pending_queues):
+            if queue.empty():
+                pending_queues.remove(queue)
                 continue
 
-            replay_buffer.add(**transition)
+            n_added += add_transitions_message(
+                queue.get(), replay_buffer, offline_replay_buffer, dataset_repo_id, actor_stats
+            )
 
-            # Add to offline buffer if it's an intervention
-            if dataset_repo_id is not None and transition.get("complementary_info", {}).get(
-                "is_intervention"
-            ):
-                offline_replay_buffer.add(**transition)
+    return n_added
+
+
+def add_transitions_message(
+    message: bytes,
+    replay_buffer: ReplayBuffer,
+    offline_replay_buffer: ReplayBuffer,
+    dataset_repo_id: str | None,
+    actor_stats: dict[str, dict] | None = None,
+) -> int:
+    """Add the transitions of a single message to the replay buffer(s). Returns the number of transitions added."""
+    header = read_transitions_header(message)
+    if header.get("disconnected"):
+        # The actor closed its last stream, its next connection may use another id
+        if actor_stats is not None:
+            actor_stats.pop(header.get("actor_id"), None)
+        return 0
+
+    batch = bytes_to_transition_batch(message)
+    if batch is None:
+        return 0
+
+    # Skip transitions with NaN values
+    has_nan = batch["action"].reshape(len(batch["action"]), -1).isnan().any(dim=1)
+    for states in (batch["state"], batch["next_state"]):
+        for value in states.values():
+            has_nan |= value.reshape(len(value), -1).isnan().any(dim=1)
+    if has_nan.any():
+        logging.warning(f"[LEARNER] NaN detected in {int(has_nan.sum())} transitions, skipping")
+        batch = _select_transitions(batch, ~has_nan)
+
+    replay_buffer.add_batch(**batch)
+    n_added = len(batch["reward"])
+
+    # Add to offline buffer if it's an intervention
+    complementary_info = batch["complementary_info"] or {}
+    if dataset_repo_id is not None and "is_intervention" in complementary_info:
+        is_intervention = complementary_info["is_intervention"].bool()
+        if is_intervention.any():
+            offline_replay_buffer.add_batch(**_select_transitions(batch, is_intervention))
+
+    if actor_stats is not None:
+        stats = actor_stats.setdefault(header.get("actor_id") or "unknown", {"transitions": 0})
+        stats["transitions"] += n_added
+        stats["policy_version"] = header.get("policy_version")
+
+    return n_added
+
+
+def get_actor_metrics(actor_stats: dict[str, dict], parameters_version: int, elapsed_s: float) -> dict:
+    """Per-actor metrics since the last call: transitions received per second, and staleness of the policy
+    the actor is running, in number of parameters versions behind the learner. Resets the transition counts."""
+    metrics = {}
+    for actor_id, stats in actor_stats.items():
+        if elapsed_s > 0:
+            metrics[f"actor/{actor_id}/transitions_per_s"] = stats["transitions"] / elapsed_s
+        if stats.get("policy_version") is not None:
+            metrics[f"actor/{actor_id}/policy_staleness"] = parameters_version - stats["policy_version"]
+        stats["transitions"] = 0
+
+    return metrics
 
 
 def process_interaction_messages(
@@ -16,22 +16,56 @@
 # limitations under the License.
 
 import logging
+import threading
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from multiprocessing import Event, Queue
 
 from lerobot.transport import services_pb2, services_pb2_grpc
-from lerobot.transport.utils import receive_bytes_in_chunks, send_bytes_in_chunks
+from lerobot.transport.utils import (
+    actor_disconnected_to_bytes,
+    put_until_shutdown,
+    read_parameters_header,
+    receive_bytes_in_chunks,
+    send_bytes_in_chunks,
+)
 from lerobot.utils.queue import get_last_item_from_queue
 
-MAX_WORKERS = 3  # Stream parameters, send transitions and interactions
+STREAMS_PER_ACTOR = 3  # Stream parameters, send transitions and interactions
 SHUTDOWN_TIMEOUT = 10
+ACTOR_ID_METADATA_KEY = "actor-id"
+
+
+def get_actor_id(context) -> str:
+    """Identify the actor behind a gRPC call, from the `actor-id` metadata it sends, or its peer address."""
+    for key, value in context.invocation_metadata() or ():
+        if key == ACTOR_ID_METADATA_KEY:
+            return value
+    return context.peer()
+
+
+def _is_parameters_keyframe(buffer: bytes) -> bool:
+    try:
+        header, _ = read_parameters_header(buffer)
+    except ValueError:
+        return False
+    return bool(header.get("is_keyframe", False))
 
 
 class LearnerService(services_pb2_grpc.LearnerServiceServicer):
     """
     Implementation of the LearnerService gRPC service
-    This service is used to send parameters to the Actor and receive transitions and interactions from the Actor
+    This service is used to send parameters to the Actors and receive transitions and interactions from the Actors
     check transport.proto for the gRPC service definition
+
+    Several actors can be connected at once. Each actor's transitions go to one of the transition queues
+    (shards), the one with the fewest connected actors when the actor opens its first transitions stream, so
+    that the learner can drain the actors fairly. When the actor closes its last transitions stream, its shard
+    is released and the learner is told with a message from `actor_disconnected_to_bytes`, so that an actor
+    reconnecting under a new id (e.g. after a restart) doesn't leave state behind.
+    When the queues are bounded, a full shard stops reading from its actors' streams until the learner catches
+    up, which applies back-pressure to those actors only.
     """
 
     def __init__(
@@ -39,22 +73,114 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
         shutdown_event: Event,  # type: ignore
         parameters_queue: Queue,
         seconds_between_pushes: float,
-        transition_queue: Queue,
+        transition_queue: "Queue | list[Queue]",
         interaction_message_queue: Queue,
         queue_get_timeout: float = 0.001,
     ):
         self.shutdown_event = shutdown_event
         self.parameters_queue = parameters_queue
         self.seconds_between_pushes = seconds_between_pushes
-        self.transition_queue = transition_queue
+        self.transition_queues = (
+            transition_queue if isinstance(transition_queue, list) else [transition_queue]
+        )
         self.interaction_message_queue = interaction_message_queue
         self.queue_get_timeout = queue_get_timeout
 
+        # Shard and number of open transitions streams of each connected actor
+        self._actor_shards: dict[str, int] = {}
+        self._actor_streams: dict[str, int] = {}
+        self._actor_shards_lock = threading.Lock()
+
+        # The parameters queue is drained once for all the actors' streams, the last message is cached here.
+        # A single stream at a time waits on the queue, the others wait on the condition to be woken up.
+        self._parameters_count = 0
+        self._parameters: bytes | None = None
+        self._parameters_keyframe: bytes | None = None
+        self._parameters_condition = threading.Condition()
+        self._parameters_polling = False
+
+    def _cache_parameters(self, buffer: bytes | None) -> None:
+        if buffer is not None:
+            self._parameters_count += 1
+            self._parameters = buffer
+            if _is_parameters_keyframe(buffer):
+                self._parameters_keyframe = buffer
+
+    def _poll_parameters(self, count_sent: int) -> tuple[int, bytes | None, bytes | None]:
+        """Return the parameters cached for all the streams, after waiting up to `queue_get_timeout` for newer
+        ones than the `count_sent` messages a stream already sent.
+
+        The lock is never held while waiting on the queue: one stream polls it, and wakes up the others when
+        it receives a message, so that all the actors get it at once.
+
+        Returns the number of messages received so far, the last one and the last keyframe.
+        """
+        deadline = time.monotonic() + self.queue_get_timeout
+        with self._parameters_condition:
+            while True:
+                # Draining without blocking is quick, and gives a stream that is behind the latest parameters
+                self._cache_parameters(get_last_item_from_queue(self.parameters_queue, block=False))
+                remaining = deadline - time.monotonic()
+                if self._parameters_count > count_sent or remaining <= 0 or self.shutdown_event.is_set():
+                    return self._parameters_count, self._parameters, self._parameters_keyframe
+                if not self._parameters_polling:
+                    self._parameters_polling = True
+                    break
+                self._parameters_condition.wait(remaining)
+
+        buffer = None
+        try:
+            buffer = get_last_item_from_queue(self.parameters_queue, block=True, timeout=remaining)
+        finally:
+            with self._parameters_condition:
+                self._parameters_polling = False
+                self._cache_parameters(buffer)
+                self._parameters_condition.notify_all()
+        with self._parameters_condition:
+            return self._parameters_count, self._parameters, self._parameters_keyframe
+
+    @contextmanager
+    def transitions_stream(self, actor_id: str) -> Iterator[Queue]:
+        """Yield the transition queue of an actor for the duration of one of its transitions streams.
+
+        An actor without open streams is assigned the shard with the fewest connected actors, and released when
+        its last stream closes.
+        """
+        with self._actor_shards_lock:
+            if actor_id not in self._actor_shards:
+                actors_per_shard = [0] * len(self.transition_queues)
+                for shard in self._actor_shards.values():
+                    actors_per_shard[shard] += 1
+                self._actor_shards[actor_id] = actors_per_shard.index(min(actors_per_shard))
+                self._actor_streams[actor_id] = 0
+                logging.info(
+                    f"[LEARNER] Actor {actor_id} connected, "
+                    f"assigned to transitions shard {self._actor_shards[actor_id]}"
+                )
+            self._actor_streams[actor_id] += 1
+            queue = self.transition_queues[self._actor_shards[actor_id]]
+
+        try:
+            yield queue
+        finally:
+            with self._actor_shards_lock:
+                self._actor_streams[actor_id] -= 1
+                disconnected = self._actor_streams[actor_id] == 0
+                if disconnected:
+                    del self._actor_streams[actor_id], self._actor_shards[actor_id]
+            if disconnected:
+                logging.info(f"[LEARNER] Actor {actor_id} disconnected")
+                # Queued after the actor's transitions, so that the learner releases it once they are added
+                put_until_shutdown(queue, actor_disconnected_to_bytes(actor_id), self.shutdown_event)
+
     def StreamParameters(self, request, context):  # noqa: N802
         # TODO: authorize the request
-        logging.info("[LEARNER] Received request to stream parameters from the Actor")
+        logging.info(
+            f"[LEARNER] Received request to stream parameters from the Actor {get_actor_id(context)}"
+        )
 
         last_push_time = 0
+        count_sent = 0
 
         while not self.shutdown_event.is_set():
             time_since_last_push = time.time() - last_push_time
@@ -65,19 +191,25 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
                 continue
 
             logging.info("[LEARNER] Push parameters to the Actor")
-            buffer = get_last_item_from_queue(
-                self.parameters_queue, block=True, timeout=self.queue_get_timeout
-            )
+            count, buffer, keyframe = self._poll_parameters(count_sent)
 
-            if buffer is None:
+            if count == count_sent:
                 continue
 
-            yield from send_bytes_in_chunks(
-                buffer,
-                services_pb2.Parameters,
-                log_prefix="[LEARNER] Sending parameters",
-                silent=True,
-            )
+            # An actor that just connected needs a keyframe first, to receive the frozen parameters too
+            buffers = [buffer]
+            if count_sent == 0 and keyframe is not None and keyframe is not buffer:
+                buffers.insert(0, keyframe)
+
+            for buffer in buffers:
+                yield from send_bytes_in_chunks(
+                    buffer,
+                    services_pb2.Parameters,
+                    log_prefix="[LEARNER] Sending parameters",
+                    silent=True,
+                )
+
+            count_sent = count
 
             last_push_time = time.time()
             logging.info("[LEARNER] Parameters sent")
@@ -87,14 +219,16 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
 
     def SendTransitions(self, request_iterator, _context):  # noqa: N802
         # TODO: authorize the request
-        logging.info("[LEARNER] Received request to receive transitions from the Actor")
-
-        receive_bytes_in_chunks(
-            request_iterator,
-            self.transition_queue,
-            self.shutdown_event,
-            log_prefix="[LEARNER] transitions",
-        )
+        actor_id = get_actor_id(_context)
+        logging.info(f"[LEARNER] Received request to receive transitions from the Actor {actor_id}")
+
+        with self.transitions_stream(actor_id) as transition_queue:
+            receive_bytes_in_chunks(
+                request_iterator,
+                transition_queue,
+                self.shutdown_event,
+                log_prefix="[LEARNER] transitions",
+            )
 
         logging.debug("[LEARNER] Finished receiving transitions")
         return services_pb2.Empty()
@@ -22,6 +22,9 @@ from lerobot.scripts.server.constants import (
     DEFAULT_FPS,
     DEFAULT_INFERENCE_LATENCY,
     DEFAULT_OBS_QUEUE_TIMEOUT,
+    DEFAULT_OBS_STATE_ATOL,
+    DEFAULT_OBS_THUMBNAIL_SIZE,
+    INFERENCE_RUNTIMES,
 )
 
 # Aggregate function registry for CLI usage
@@ -63,6 +66,41 @@ class PolicyServerConfig:
         default=DEFAULT_OBS_QUEUE_TIMEOUT, metadata={"help": "Timeout for observation queue in seconds"}
     )
 
+    # Observation deduplication configuration
+    obs_state_atol: float = field(
+        default=DEFAULT_OBS_STATE_ATOL,
+        metadata={"help": "Joint-space L2 distance under which observations are considered similar"},
+    )
+    obs_image_atol: float | None = field(
+        default=None,
+        metadata={
+            "help": "Mean absolute luma difference (in [0, 1]) under which camera views are considered similar. "
+            "When None, only the joint-space state is compared"
+        },
+    )
+    obs_thumbnail_size: int = field(
+        default=DEFAULT_OBS_THUMBNAIL_SIZE,
+        metadata={"help": "Side of the luma thumbnails used to compare camera views"},
+    )
+
+    # Inference runtime configuration
+    inference_runtime: str = field(
+        default="eager",
+        metadata={"help": f"Runtime the policy is optimized into once loaded. Options: {INFERENCE_RUNTIMES}"},
+    )
+    warmup_steps: int = field(
+        default=3, metadata={"help": "Number of warm-up inference passes run when the policy is loaded"}
+    )
+    runtime_atol: float = field(
+        default=1e-2,
+        metadata={
+            "help": "Max abs difference with eager actions above which the runtime falls back to eager"
+        },
+    )
+    onnx_export_path: str | None = field(
+        default=None, metadata={"help": "If set, the loaded policy is also exported to ONNX at this path"}
+    )
+
     def __post_init__(self):
         """Validate configuration after initialization."""
         if self.port < 1 or self.port > 65535:
@@ -77,6 +115,23 @@ class PolicyServerConfig:
         if self.obs_queue_timeout < 0:
             raise ValueError(f"obs_queue_timeout must be non-negative, got {self.obs_queue_timeout}")
 
+        if self.obs_state_atol < 0:
+            raise ValueError(f"obs_state_atol must be non-negative, got {self.obs_state_atol}")
+
+        if self.obs_image_atol is not None and self.obs_image_atol < 0:
+            raise ValueError(f"obs_image_atol must be non-negative, got {self.obs_image_atol}")
+
+        if self.obs_thumbnail_size <= 0:
+            raise ValueError(f"obs_thumbnail_size must be positive, got {self.obs_thumbnail_size}")
+
+        if self.inference_runtime not in INFERENCE_RUNTIMES:
+            raise ValueError(
+                f"Unknown inference runtime '{self.inference_runtime}'. Available: {INFERENCE_RUNTIMES}"
+            )
+
+        if self.warmup_steps < 0:
+            raise ValueError(f"warmup_steps must be non-negative, got {self.warmup_steps}")
+
     @classmethod
     def from_dict(cls, config_dict: dict) -> "PolicyServerConfig":
         """Create a PolicyServerConfig from a dictionary."""
@@ -95,6 +150,13 @@ class PolicyServerConfig:
             "fps": self.fps,
             "environment_dt": self.environment_dt,
             "inference_latency": self.inference_latency,
+            "obs_state_atol": self.obs_state_atol,
+            "obs_image_atol": self.obs_image_atol,
+            "obs_thumbnail_size": self.obs_thumbnail_size,
+            "inference_runtime": self.inference_runtime,
+            "warmup_steps": self.warmup_steps,
+            "runtime_atol": self.runtime_atol,
+            "onnx_export_path": self.onnx_export_path,
         }
 
 
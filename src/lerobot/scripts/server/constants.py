@@ -22,6 +22,15 @@ DEFAULT_INFERENCE_LATENCY = 1 / DEFAULT_FPS
 """Server side: Timeout for observation queue in seconds"""
 DEFAULT_OBS_QUEUE_TIMEOUT = 2
 
+"""Server side: Joint-space distance under which observations are considered similar"""
+DEFAULT_OBS_STATE_ATOL = 1.0
+
+"""Server side: Side of the luma thumbnails used to compare camera views between observations"""
+DEFAULT_OBS_THUMBNAIL_SIZE = 16
+
+"""Server side: Runtimes the policy can be optimized into after loading"""
+INFERENCE_RUNTIMES = ["eager", "compile", "bf16", "int8"]
+
 # All action chunking policies
 SUPPORTED_POLICIES = ["act", "smolvla", "diffusion", "pi0", "tdmpc", "vqbet"]
 
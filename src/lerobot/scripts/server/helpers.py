@@ -16,9 +16,10 @@ import logging
 import logging.handlers
 import os
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
 import torch
 
 from lerobot.configs.types import PolicyFeature
@@ -229,10 +230,26 @@ class TimedAction(TimedData):
         return self.action
 
 
+@dataclass
+class ObservationSignature:
+    """Compact summary of an observation, used to cheaply compare observations with each other.
+
+    Args:
+        state: Joint-space state vector, shape (1, state_dim).
+        images: Downsampled luma thumbnails in [0, 1], one (size, size) tensor per camera key. None when
+            the camera views were not summarized.
+    """
+
+    state: torch.Tensor
+    images: dict[str, torch.Tensor] | None = None
+
+
 @dataclass
 class TimedObservation(TimedData):
     observation: RawObservation
     must_go: bool = False
+    # Cached on the server side the first time the observation is compared, never set by the client
+    signature: ObservationSignature | None = field(default=None, repr=False, compare=False)
 
     def get_observation(self):
         return self.observation
@@ -280,21 +297,107 @@ def _compare_observation_states(obs1_state: torch.Tensor, obs2_state: torch.Tens
     return bool(torch.linalg.norm(obs1_state - obs2_state) < atol)
 
 
+def _compare_observation_images(
+    obs1_images: dict[str, torch.Tensor], obs2_images: dict[str, torch.Tensor], atol: float
+) -> bool:
+    """Check if the camera views of two observations are similar, i.e. if the mean absolute luma difference
+    of every camera thumbnail is under a tolerance threshold"""
+    if obs1_images.keys() != obs2_images.keys():
+        return False
+
+    return all(float((obs1_images[k] - obs2_images[k]).abs().mean()) < atol for k in obs1_images)
+
+
+def image_to_luma_thumbnail(image: np.ndarray | torch.Tensor, size: int = 16) -> torch.Tensor:
+    """Reduce a (H, W, C) uint8 image to a (size, size) luma thumbnail in [0, 1].
+
+    The image is first strided down to a few times the thumbnail resolution, so that the float conversion
+    and area pooling only touch a small fraction of the original pixels.
+    """
+    image = torch.as_tensor(image)
+    assert image.ndim == 3, f"Image must be (H, W, C)! Received {image.shape}"
+
+    stride = max(1, min(image.shape[0], image.shape[1]) // (4 * size))
+    image = image[::stride, ::stride].to(torch.float32) / 255
+
+    if image.shape[-1] == 3:
+        # ITU-R BT.601 luma
+        luma = image[..., 0] * 0.299 + image[..., 1] * 0.587 + image[..., 2] * 0.114
+    else:
+        luma = image.mean(dim=-1)
+
+    return torch.nn.functional.adaptive_avg_pool2d(luma[None, None], (size, size))[0, 0]
+
+
+def compute_observation_signature(
+    robot_obs: RawObservation,
+    lerobot_features: dict[str, dict],
+    with_images: bool = True,
+    thumbnail_size: int = 16,
+) -> ObservationSignature:
+    """Compute the signature of a raw observation, to be cached and compared with later observations."""
+    lerobot_obs = make_lerobot_observation(robot_obs, lerobot_features)
+
+    images = None
+    if with_images:
+        images = {
+            k: image_to_luma_thumbnail(v, size=thumbnail_size)
+            for k, v in lerobot_obs.items()
+            if is_image_key(k)
+        }
+
+    return ObservationSignature(state=extract_state_from_raw_observation(lerobot_obs), images=images)
+
+
+def get_observation_signature(
+    obs: TimedObservation,
+    lerobot_features: dict[str, dict],
+    with_images: bool = True,
+    thumbnail_size: int = 16,
+) -> ObservationSignature:
+    """Return the signature of an observation, computing and caching it on the observation the first time."""
+    if obs.signature is None or (with_images and obs.signature.images is None):
+        obs.signature = compute_observation_signature(
+            obs.get_observation(), lerobot_features, with_images=with_images, thumbnail_size=thumbnail_size
+        )
+
+    return obs.signature
+
+
+def signatures_similar(
+    sig1: ObservationSignature,
+    sig2: ObservationSignature,
+    atol: float = 1,
+    image_atol: float | None = None,
+) -> bool:
+    """Check if two observation signatures are similar. Joint states are compared in L2 norm under `atol`,
+    and, when `image_atol` is set, camera thumbnails are compared in mean absolute luma difference."""
+    if not _compare_observation_states(sig1.state, sig2.state, atol=atol):
+        return False
+
+    if image_atol is None:
+        return True
+
+    return _compare_observation_images(sig1.images or {}, sig2.images or {}, atol=image_atol)
+
+
 def observations_similar(
-    obs1: TimedObservation, obs2: TimedObservation, lerobot_features: dict[str, dict], atol: float = 1
+    obs1: TimedObservation,
+    obs2: TimedObservation,
+    lerobot_features: dict[str, dict],
+    atol: float = 1,
+    image_atol: float | None = None,
+    thumbnail_size: int = 16,
 ) -> bool:
     """Check if two observations are similar, under a tolerance threshold. Measures distance between
-    observations as the difference in joint-space between the two observations.
+    observations as the difference in joint-space between the two observations and, if `image_atol` is
+    provided, as the perceptual difference between downsampled luma thumbnails of their camera views.
 
-    NOTE(fracapuano): This is a very simple check, and it is enough for the current use case.
-    An immediate next step is to use (fast) perceptual difference metrics comparing some camera views,
-    to surpass this joint-space similarity check.
+    Signatures are cached on the observations, so comparing an observation against several others only
+    processes its frames once.
     """
-    obs1_state = extract_state_from_raw_observation(
-        make_lerobot_observation(obs1.get_observation(), lerobot_features)
-    )
-    obs2_state = extract_state_from_raw_observation(
-        make_lerobot_observation(obs2.get_observation(), lerobot_features)
-    )
+    with_images = image_atol is not None
+    sig1 = get_observation_signature(obs1, lerobot_features, with_images, thumbnail_size)
+    sig2 = get_observation_signature(obs2, lerobot_features, with_images, thumbnail_size)
 
-    return _compare_observation_states(obs1_state, obs2_state, atol=atol)
+    return signatures_similar(sig1, sig2, atol=atol, image_atol=image_atol)
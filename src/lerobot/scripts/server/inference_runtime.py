@@ -0,0 +1,248 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Optimized inference runtimes for the PolicyServer.
+
+A runtime wraps `policy.predict_action_chunk` once, right after the policy is loaded, so that every request
+is served by the optimized callable:
+
+- `eager`: plain PyTorch, the reference behaviour.
+- `compile`: `torch.compile` with static shapes, traced on a dummy observation built from the client's
+  `lerobot_features`.
+- `bf16`: bfloat16 autocast around the forward pass.
+- `int8`: dynamic int8 quantization of the `nn.Linear` layers (CPU only).
+
+Building a runtime runs warm-up passes (which also triggers compilation), measures cold-start and
+steady-state latency, and checks that the optimized outputs match the eager ones.
+"""
+
+import logging
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import torch
+
+from lerobot.configs.types import PolicyFeature
+from lerobot.policies.pretrained import PreTrainedPolicy
+from lerobot.scripts.server.constants import INFERENCE_RUNTIMES
+from lerobot.scripts.server.helpers import Observation, is_image_key, raw_observation_to_observation
+
+PredictFn = Callable[[Observation], torch.Tensor]
+
+
+@dataclass
+class RuntimeReport:
+    """Latency and correctness report of an inference runtime, measured at startup.
+
+    Args:
+        runtime: Name of the runtime.
+        cold_start_s: Time taken by the first call, including compilation if any.
+        eager_latency_ms: Median steady-state latency of the eager policy.
+        latency_ms: Median steady-state latency of the optimized runtime.
+        max_abs_diff: Maximum absolute difference between eager and optimized action chunks.
+        fallback_to_eager: Whether the runtime was rejected, e.g. because its outputs diverged.
+    """
+
+    runtime: str
+    cold_start_s: float
+    eager_latency_ms: float
+    latency_ms: float
+    max_abs_diff: float
+    fallback_to_eager: bool = False
+
+    def __str__(self) -> str:
+        return (
+            f"Runtime: {self.runtime} | "
+            f"Cold start: {self.cold_start_s:.2f}s | "
+            f"Steady state: {self.latency_ms:.2f}ms (eager: {self.eager_latency_ms:.2f}ms) | "
+            f"Max abs diff vs eager: {self.max_abs_diff:.2e} | "
+            f"Fallback to eager: {self.fallback_to_eager}"
+        )
+
+
+def make_dummy_raw_observation(lerobot_features: dict[str, dict], task: str = "") -> dict:
+    """Build a raw robot observation of zeros, with the static shapes described by `lerobot_features`."""
+    raw_observation = {}
+    for key, ft in lerobot_features.items():
+        if is_image_key(key):
+            raw_observation[key.removeprefix("observation.images.")] = np.zeros(ft["shape"], dtype=np.uint8)
+        elif ft["dtype"] == "float32":
+            raw_observation.update(dict.fromkeys(ft["names"], 0.0))
+
+    raw_observation["task"] = task
+    return raw_observation
+
+
+def _autocast_bf16(fn: PredictFn, device_type: str) -> PredictFn:
+    def predict(observation: Observation) -> torch.Tensor:
+        with torch.autocast(device_type=device_type, dtype=torch.bfloat16):
+            return fn(observation).float()
+
+    return predict
+
+
+def build_predict_fn(
+    policy: PreTrainedPolicy, runtime: str, device: str
+) -> tuple[PreTrainedPolicy, PredictFn]:
+    """Wrap the policy's `predict_action_chunk` into the requested runtime.
+
+    Returns the (possibly transformed) policy together with the callable to use for inference.
+    """
+    if runtime not in INFERENCE_RUNTIMES:
+        raise ValueError(f"Unknown inference runtime '{runtime}'. Available: {INFERENCE_RUNTIMES}")
+
+    device_type = torch.device(device).type
+
+    if runtime == "eager":
+        return policy, policy.predict_action_chunk
+
+    if runtime == "compile":
+        # Shapes are fixed by the robot's features, dynamic shapes would only add guards and recompilations
+        return policy, torch.compile(policy.predict_action_chunk, dynamic=False)
+
+    if runtime == "bf16":
+        return policy, _autocast_bf16(policy.predict_action_chunk, device_type)
+
+    # int8
+    if device_type != "cpu":
+        raise ValueError(f"The int8 runtime only supports CPU inference, got device '{device}'")
+
+    quantized = torch.ao.quantization.quantize_dynamic(policy, {torch.nn.Linear}, dtype=torch.qint8)
+    return quantized, quantized.predict_action_chunk
+
+
+def _time_calls(
+    fn: PredictFn, observation: Observation, n_calls: int, seed: int
+) -> tuple[list[float], torch.Tensor]:
+    """Call `fn` `n_calls` times, re-seeding before each call so that stochastic policies (diffusion,
+    flow matching) sample the same noise. Returns per-call latencies in seconds and the last output."""
+    latencies = []
+    output = None
+    for _ in range(n_calls):
+        torch.manual_seed(seed)
+        start = time.perf_counter()
+        output = fn(observation)
+        if isinstance(output, torch.Tensor) and output.is_cuda:
+            torch.cuda.synchronize()
+        latencies.append(time.perf_counter() - start)
+
+    return latencies, output
+
+
+def export_policy_to_onnx(
+    policy: PreTrainedPolicy, observation: Observation, path: str | Path, logger: logging.Logger
+) -> bool:
+    """Export the policy's `predict_action_chunk` to ONNX, taking the observation tensors as positional
+    inputs in a fixed key order. Returns whether the export succeeded.
+
+    The export is a side artifact for deployment on other runtimes, the server keeps serving with PyTorch.
+    """
+    keys = [k for k, v in observation.items() if isinstance(v, torch.Tensor)]
+    extras = {k: v for k, v in observation.items() if k not in keys}
+
+    class _OnnxWrapper(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.policy = policy
+
+        def forward(self, *tensors):
+            return self.policy.predict_action_chunk({**dict(zip(keys, tensors, strict=True)), **extras})
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        torch.onnx.export(
+            _OnnxWrapper(),
+            tuple(observation[k] for k in keys),
+            str(path),
+            input_names=keys,
+            output_names=["action"],
+        )
+    except Exception as e:
+        logger.warning(f"ONNX export to {path} failed: {e}")
+        return False
+
+    logger.info(f"Policy exported to ONNX at {path}")
+    return True
+
+
+def build_inference_runtime(
+    policy: PreTrainedPolicy,
+    runtime: str,
+    lerobot_features: dict[str, dict],
+    policy_image_features: dict[str, PolicyFeature],
+    device: str,
+    warmup_steps: int = 3,
+    atol: float = 1e-2,
+    onnx_export_path: str | Path | None = None,
+    logger: logging.Logger | None = None,
+) -> tuple[PreTrainedPolicy, PredictFn, RuntimeReport]:
+    """Build the inference runtime for a freshly loaded policy.
+
+    Warm-up passes are run on a dummy observation with the static shapes of `lerobot_features`. Cold-start and
+    steady-state latency are measured for both eager and optimized callables, and the optimized runtime is
+    rejected (falling back to eager) if its actions differ from the eager ones by more than `atol`.
+    """
+    logger = logger or logging.getLogger(__name__)
+    policy.eval()
+
+    observation = raw_observation_to_observation(
+        make_dummy_raw_observation(lerobot_features), lerobot_features, policy_image_features, device
+    )
+    n_calls = max(1, warmup_steps) + 1
+    seed = 0
+
+    eager_latencies, eager_actions = _time_calls(policy.predict_action_chunk, observation, n_calls, seed)
+
+    if onnx_export_path is not None:
+        export_policy_to_onnx(policy, observation, onnx_export_path, logger)
+
+    if runtime == "eager":
+        report = RuntimeReport(
+            runtime=runtime,
+            cold_start_s=eager_latencies[0],
+            eager_latency_ms=1000 * statistics.median(eager_latencies[1:]),
+            latency_ms=1000 * statistics.median(eager_latencies[1:]),
+            max_abs_diff=0.0,
+        )
+        policy.reset()
+        return policy, policy.predict_action_chunk, report
+
+    optimized_policy, predict_fn = build_predict_fn(policy, runtime, device)
+    latencies, actions = _time_calls(predict_fn, observation, n_calls, seed)
+
+    max_abs_diff = float((actions.float() - eager_actions.float()).abs().max())
+    report = RuntimeReport(
+        runtime=runtime,
+        cold_start_s=latencies[0],
+        eager_latency_ms=1000 * statistics.median(eager_latencies[1:]),
+        latency_ms=1000 * statistics.median(latencies[1:]),
+        max_abs_diff=max_abs_diff,
+    )
+
+    if max_abs_diff > atol:
+        logger.warning(
+            f"{runtime} runtime diverges from eager outputs (max abs diff {max_abs_diff:.2e} > {atol:.2e}). "
+            "Falling back to eager inference."
+        )
+        report.fallback_to_eager = True
+        policy.reset()
+        return policy, policy.predict_action_chunk, report
+
+    optimized_policy.reset()
+    return optimized_policy, predict_fn, report
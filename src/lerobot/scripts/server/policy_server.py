@@ -20,7 +20,9 @@ python src/lerobot/scripts/server/policy_server.py \
      --port=8080 \
      --fps=30 \
      --inference_latency=0.033 \
-     --obs_queue_timeout=1
+     --obs_queue_timeout=1 \
+     --obs_image_atol=0.02 \
+     --inference_runtime=compile
 ```
 """
 
@@ -50,6 +52,7 @@ from lerobot.scripts.server.helpers import (
     observations_similar,
     raw_observation_to_observation,
 )
+from lerobot.scripts.server.inference_runtime import RuntimeReport, build_inference_runtime
 from lerobot.transport import (
     services_pb2,  # type: ignore
     services_pb2_grpc,  # type: ignore
@@ -81,6 +84,9 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         self.lerobot_features = None
         self.actions_per_chunk = None
         self.policy = None
+        # Callable serving inference requests, built from the policy according to config.inference_runtime
+        self.predict_fn = None
+        self.runtime_report: RuntimeReport | None = None
 
     @property
     def running(self):
@@ -149,6 +155,19 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
         self.logger.info(f"Time taken to put policy on {self.device}: {end - start:.4f} seconds")
 
+        self.policy, self.predict_fn, self.runtime_report = build_inference_runtime(
+            self.policy,
+            self.config.inference_runtime,
+            self.lerobot_features,
+            self.policy_image_features,
+            self.device,
+            warmup_steps=self.config.warmup_steps,
+            atol=self.config.runtime_atol,
+            onnx_export_path=self.config.onnx_export_path,
+            logger=self.logger,
+        )
+        self.logger.info(str(self.runtime_report))
+
         return services_pb2.Empty()
 
     def SendObservations(self, request_iterator, context):  # noqa: N802
@@ -255,7 +274,14 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             self.logger.debug(f"Skipping observation #{obs.get_timestep()} - Timestep predicted already!")
             return False
 
-        elif observations_similar(obs, previous_obs, lerobot_features=self.lerobot_features):
+        elif observations_similar(
+            obs,
+            previous_obs,
+            lerobot_features=self.lerobot_features,
+            atol=self.config.obs_state_atol,
+            image_atol=self.config.obs_image_atol,
+            thumbnail_size=self.config.obs_thumbnail_size,
+        ):
             self.logger.debug(
                 f"Skipping observation #{obs.get_timestep()} - Observation too similar to last obs predicted!"
             )
@@ -319,7 +345,8 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
     def _get_action_chunk(self, observation: dict[str, torch.Tensor]) -> torch.Tensor:
         """Get an action chunk from the policy. The chunk contains only"""
-        chunk = self.policy.predict_action_chunk(observation)
+        predict_fn = self.predict_fn if self.predict_fn is not None else self.policy.predict_action_chunk
+        chunk = predict_fn(observation)
         if chunk.ndim != 3:
             chunk = chunk.unsqueeze(0)  # adding batch dimension, now shape is (B, chunk_size, action_dim)
 
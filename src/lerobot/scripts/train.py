@@ -27,22 +27,32 @@ from torch.optim import Optimizer
 from lerobot.configs import parser
 from lerobot.configs.train import TrainPipelineConfig
 from lerobot.datasets.factory import make_dataset
+from lerobot.datasets.feature_cache import compute_image_features, hash_state_dict
+from lerobot.datasets.prefetch import DevicePrefetcher
 from lerobot.datasets.sampler import EpisodeAwareSampler
-from lerobot.datasets.utils import cycle
+from lerobot.datasets.transforms import BatchImageTransforms
+from lerobot.datasets.utils import cycle_epochs
 from lerobot.envs.factory import make_env
 from lerobot.optim.factory import make_optimizer_and_scheduler
 from lerobot.policies.factory import make_policy
 from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.policies.utils import get_device_from_parameters
 from lerobot.scripts.eval import eval_policy
+from lerobot.utils.async_checkpoint import AsyncCheckpointer
+from lerobot.utils.distributed import (
+    barrier,
+    cleanup_distributed,
+    init_distributed,
+    main_process_first,
+    unwrap_policy,
+    wrap_policy,
+)
 from lerobot.utils.logging_utils import AverageMeter, MetricsTracker
 from lerobot.utils.random_utils import set_seed
 from lerobot.utils.train_utils import (
     get_step_checkpoint_dir,
     get_step_identifier,
     load_training_state,
-    save_checkpoint,
-    update_last_checkpoint,
 )
 from lerobot.utils.utils import (
     format_big_number,
@@ -64,13 +74,27 @@ def update_policy(
     use_amp: bool = False,
     lock=None,
 ) -> tuple[MetricsTracker, dict]:
+    """Run one optimizer step.
+
+    `batch` is either a batch, or a list of micro-batches whose gradients are accumulated before the step. The
+    policy may be wrapped with `DistributedDataParallel`, in which case the gradients are only averaged across
+    processes in the backward pass of the last micro-batch.
+    """
     start_time = time.perf_counter()
     device = get_device_from_parameters(policy)
+    micro_batches = batch if isinstance(batch, list) else [batch]
     policy.train()
-    with torch.autocast(device_type=device.type) if use_amp else nullcontext():
-        loss, output_dict = policy.forward(batch)
-        # TODO(rcadene): policy.unnormalize_outputs(out_dict)
-    grad_scaler.scale(loss).backward()
+    losses = []
+    for i, micro_batch in enumerate(micro_batches):
+        is_last = i == len(micro_batches) - 1
+        with policy.no_sync() if hasattr(policy, "no_sync") and not is_last else nullcontext():
+            with torch.autocast(device_type=device.type) if use_amp else nullcontext():
+                # The policy is called rather than its `forward`, which is what `torch.compile` compiles
+                loss, output_dict = policy(micro_batch)
+                # TODO(rcadene): policy.unnormalize_outputs(out_dict)
+            grad_scaler.scale(loss / len(micro_batches)).backward()
+        # Kept on the device, so that the backward passes of the micro-batches are queued without waiting
+        losses.append(loss.detach())
 
     # Unscale the gradient of the optimizer's assigned params in-place **prior to gradient clipping**.
     grad_scaler.unscale_(optimizer)
@@ -94,11 +118,11 @@ def update_policy(
     if lr_scheduler is not None:
         lr_scheduler.step()
 
-    if has_method(policy, "update"):
+    if has_method(unwrap_policy(policy), "update"):
         # To possibly update an internal buffer (for instance an Exponential Moving Average like in TDMPC).
-        policy.update()
+        unwrap_policy(policy).update()
 
-    train_metrics.loss = loss.item()
+    train_metrics.loss = torch.stack(losses).mean().item()
     train_metrics.grad_norm = grad_norm.item()
     train_metrics.lr = optimizer.param_groups[0]["lr"]
     train_metrics.update_s = time.perf_counter() - start_time
@@ -108,30 +132,42 @@ def update_policy(
 @parser.wrap()
 def train(cfg: TrainPipelineConfig):
     cfg.validate()
+
+    # Check device is available
+    device = get_safe_torch_device(cfg.policy.device, log=True)
+    # In distributed training (launched with torchrun), each process trains on its own device and shard of
+    # the dataset, and only the main process logs, evaluates and saves checkpoints
+    dist_state = init_distributed(device.type)
+    if dist_state.is_distributed and device.type == "cuda":
+        device = torch.device("cuda", dist_state.local_rank)
+        torch.cuda.set_device(device)
+    if not dist_state.is_main_process:
+        logging.getLogger().setLevel(logging.WARNING)
+
     logging.info(pformat(cfg.to_dict()))
 
-    if cfg.wandb.enable and cfg.wandb.project:
+    if cfg.wandb.enable and cfg.wandb.project and dist_state.is_main_process:
         wandb_logger = WandBLogger(cfg)
     else:
         wandb_logger = None
         logging.info(colored("Logs will be saved locally.", "yellow", attrs=["bold"]))
 
     if cfg.seed is not None:
-        set_seed(cfg.seed)
+        # Processes draw different random augmentations, the dataset shards are seeded with `cfg.seed` below
+        set_seed(cfg.seed + dist_state.rank)
 
-    # Check device is available
-    device = get_safe_torch_device(cfg.policy.device, log=True)
     torch.backends.cudnn.benchmark = True
     torch.backends.cuda.matmul.allow_tf32 = True
 
     logging.info("Creating dataset")
-    dataset = make_dataset(cfg)
+    with main_process_first(dist_state):
+        dataset = make_dataset(cfg)
 
     # Create environment used for evaluating checkpoints during training on simulation data.
     # On real-world data, no need to create an environment as evaluations are done outside train.py,
     # using the eval.py instead, with gym_dora environment and dora-rs.
     eval_env = None
-    if cfg.eval_freq > 0 and cfg.env is not None:
+    if cfg.eval_freq > 0 and cfg.env is not None and dist_state.is_main_process:
         logging.info("Creating env")
         eval_env = make_env(cfg.env, n_envs=cfg.eval.batch_size, use_async_envs=cfg.eval.use_async_envs)
 
@@ -150,6 +186,27 @@ def train(cfg: TrainPipelineConfig):
     if cfg.resume:
         step, optimizer, lr_scheduler = load_training_state(cfg.checkpoint_path, optimizer, lr_scheduler)
 
+    if cfg.cache_image_features:
+        if not hasattr(policy, "encode_images"):
+            raise ValueError(f"The '{cfg.policy.type}' policy does not support cached image features.")
+        if not dataset.meta.camera_keys:
+            raise ValueError("The dataset has no cameras whose image features could be cached.")
+        encoder_hash = hash_state_dict(policy.image_encoder_state_dict())
+        # The main process computes the features, the others read them
+        with main_process_first(dist_state):
+            dataset.image_feature_cache = compute_image_features(
+                dataset, policy.encode_images, encoder_hash, device, cfg.batch_size, cfg.num_workers
+            )
+        logging.info(f"Training on the image features cached in {dataset.image_feature_cache.dir}")
+
+    if cfg.use_torch_compile:
+        # Compiled before the DistributedDataParallel wrapping, which then calls the compiled policy
+        policy.compile(mode=cfg.torch_compile_mode)
+
+    # Gradients are averaged across processes by DistributedDataParallel, whose initialization broadcasts the
+    # parameters of the main process to the others
+    model = wrap_policy(policy, dist_state, device, cfg.ddp_find_unused_parameters)
+
     num_learnable_params = sum(p.numel() for p in policy.parameters() if p.requires_grad)
     num_total_params = sum(p.numel() for p in policy.parameters())
 
@@ -161,14 +218,34 @@ def train(cfg: TrainPipelineConfig):
     logging.info(f"{dataset.num_episodes=}")
     logging.info(f"{num_learnable_params=} ({format_big_number(num_learnable_params)})")
     logging.info(f"{num_total_params=} ({format_big_number(num_total_params)})")
+    effective_batch_size = cfg.batch_size * cfg.gradient_accumulation_steps * dist_state.world_size
+    if effective_batch_size != cfg.batch_size:
+        logging.info(
+            f"{effective_batch_size=} ({dist_state.world_size} processes x {cfg.gradient_accumulation_steps} "
+            f"accumulation steps x batch size {cfg.batch_size})"
+        )
 
     # create dataloader for offline training
+    # In distributed training, the processes shuffle with the same seed and each takes its own shard
+    sampler_seed = cfg.seed if cfg.seed is not None else 0
     if hasattr(cfg.policy, "drop_n_last_frames"):
         shuffle = False
         sampler = EpisodeAwareSampler(
             dataset.episode_data_index,
             drop_n_last_frames=cfg.policy.drop_n_last_frames,
             shuffle=True,
+            num_replicas=dist_state.world_size,
+            rank=dist_state.rank,
+            seed=sampler_seed if dist_state.is_distributed else None,
+        )
+    elif dist_state.is_distributed:
+        shuffle = False
+        sampler = torch.utils.data.DistributedSampler(
+            dataset,
+            num_replicas=dist_state.world_size,
+            rank=dist_state.rank,
+            shuffle=True,
+            seed=sampler_seed,
         )
     else:
         shuffle = True
@@ -181,11 +258,31 @@ def train(cfg: TrainPipelineConfig):
         shuffle=shuffle,
         sampler=sampler,
         pin_memory=device.type == "cuda",
-        drop_last=False,
+        # A smaller last batch would make the compiled policy recompile for the new shapes
+        drop_last=cfg.use_torch_compile,
+    )
+    # Each frame draws its own augmentations, applied to the whole batch on the device
+    batch_image_transforms = (
+        BatchImageTransforms(cfg.dataset.image_transforms)
+        if cfg.dataset.image_transforms.enable and cfg.dataset.image_transforms.on_device
+        else None
+    )
+    # The next batches are loaded and copied to the device while the policy trains on the current one
+    dl_iter = DevicePrefetcher(
+        cycle_epochs(dataloader),
+        device,
+        num_prefetch=cfg.prefetch_batches,
+        image_keys=dataset.meta.camera_keys,
+        image_transform=batch_image_transforms,
     )
-    dl_iter = cycle(dataloader)
 
-    policy.train()
+    checkpointer = AsyncCheckpointer(
+        keep_last=cfg.keep_last_checkpoints,
+        keep_best=cfg.keep_best_checkpoints,
+        background=cfg.async_checkpoint,
+    )
+
+    model.train()
 
     train_metrics = {
         "loss": AverageMeter("loss", ":.3f"),
@@ -193,38 +290,41 @@ def train(cfg: TrainPipelineConfig):
         "lr": AverageMeter("lr", ":0.1e"),
         "update_s": AverageMeter("updt_s", ":.3f"),
         "dataloading_s": AverageMeter("data_s", ":.3f"),
+        "dataloading_pct": AverageMeter("data_%", ":.1f"),
     }
 
     train_tracker = MetricsTracker(
-        cfg.batch_size, dataset.num_frames, dataset.num_episodes, train_metrics, initial_step=step
+        effective_batch_size, dataset.num_frames, dataset.num_episodes, train_metrics, initial_step=step
     )
 
     logging.info("Start offline training on a fixed dataset")
     for _ in range(step, cfg.steps):
-        start_time = time.perf_counter()
-        batch = next(dl_iter)
-        train_tracker.dataloading_s = time.perf_counter() - start_time
-
-        for key in batch:
-            if isinstance(batch[key], torch.Tensor):
-                batch[key] = batch[key].to(device, non_blocking=device.type == "cuda")
+        step_start_time = time.perf_counter()
+        batches = []
+        dataloading_s = 0.0
+        for _ in range(cfg.gradient_accumulation_steps):
+            batches.append(next(dl_iter))
+            dataloading_s += dl_iter.wait_s
+        train_tracker.dataloading_s = dataloading_s
 
         train_tracker, output_dict = update_policy(
             train_tracker,
-            policy,
-            batch,
+            model,
+            batches if cfg.gradient_accumulation_steps > 1 else batches[0],
             optimizer,
             cfg.optimizer.grad_clip_norm,
             grad_scaler=grad_scaler,
             lr_scheduler=lr_scheduler,
             use_amp=cfg.policy.use_amp,
         )
+        # Fraction of the step spent waiting for data that was not loaded ahead
+        train_tracker.dataloading_pct = 100 * dataloading_s / (time.perf_counter() - step_start_time)
 
         # Note: eval and checkpoint happens *after* the `step`th training update has completed, so we
         # increment `step` here.
         step += 1
         train_tracker.step()
-        is_log_step = cfg.log_freq > 0 and step % cfg.log_freq == 0
+        is_log_step = cfg.log_freq > 0 and step % cfg.log_freq == 0 and dist_state.is_main_process
         is_saving_step = step % cfg.save_freq == 0 or step == cfg.steps
         is_eval_step = cfg.eval_freq > 0 and step % cfg.eval_freq == 0
 
@@ -238,14 +338,21 @@ def train(cfg: TrainPipelineConfig):
             train_tracker.reset_averages()
 
         if cfg.save_checkpoint and is_saving_step:
-            logging.info(f"Checkpoint policy after step {step}")
-            checkpoint_dir = get_step_checkpoint_dir(cfg.output_dir, cfg.steps, step)
-            save_checkpoint(checkpoint_dir, step, cfg, policy, optimizer, lr_scheduler)
-            update_last_checkpoint(checkpoint_dir)
-            if wandb_logger:
-                wandb_logger.log_policy(checkpoint_dir)
+            if dist_state.is_main_process:
+                logging.info(f"Checkpoint policy after step {step}")
+                checkpoint_dir = get_step_checkpoint_dir(cfg.output_dir, cfg.steps, step)
+                checkpointer.save(
+                    checkpoint_dir,
+                    step,
+                    cfg,
+                    policy,
+                    optimizer,
+                    lr_scheduler,
+                    on_saved=wandb_logger.log_policy if wandb_logger else None,
+                )
+            barrier()
 
-        if cfg.env and is_eval_step:
+        if cfg.env and is_eval_step and dist_state.is_main_process:
             step_id = get_step_identifier(step, cfg.steps)
             logging.info(f"Eval policy at step {step}")
             with (
@@ -273,6 +380,8 @@ def train(cfg: TrainPipelineConfig):
             eval_tracker.avg_sum_reward = eval_info["aggregated"].pop("avg_sum_reward")
             eval_tracker.pc_success = eval_info["aggregated"].pop("pc_success")
             logging.info(eval_tracker)
+            if cfg.save_checkpoint and is_saving_step:
+                checkpointer.set_metric(checkpoint_dir, eval_tracker.pc_success.avg)
             if wandb_logger:
                 wandb_log_dict = {**eval_tracker.to_dict(), **eval_info}
                 wandb_logger.log_dict(wandb_log_dict, step, mode="eval")
@@ -280,11 +389,16 @@ def train(cfg: TrainPipelineConfig):
 
     if eval_env:
         eval_env.close()
+    dl_iter.close()
+    checkpointer.close()
     logging.info("End of training")
 
-    if cfg.policy.push_to_hub:
+    if cfg.policy.push_to_hub and dist_state.is_main_process:
         policy.push_model_to_hub(cfg)
 
+    barrier()
+    cleanup_distributed()
+
 
 def main():
     init_logging()
@@ -49,6 +49,19 @@ lerobot-teleoperate \
   --display_data=true
 ```
 
+Example threaded teleoperation of Brewie, where the leader is read at 200Hz in a background thread and its motion
+is extrapolated over the latency of the follower's bus:
+
+```shell
+lerobot-teleoperate \
+  --robot.type=brewie \
+  --robot.port=/dev/rrc \
+  --teleop.type=so101_leader \
+  --teleop.port=/dev/tty.usbmodem58760431551 \
+  --threaded=true \
+  --leader_fps=200
+```
+
 """
 
 import logging
@@ -65,6 +78,7 @@ from lerobot.robots import (  # noqa: F401
     Robot,
     RobotConfig,
     bi_so100_follower,
+    brewie,
     hope_jr,
     koch_follower,
     make_robot_from_config,
@@ -82,9 +96,11 @@ from lerobot.teleoperators import (  # noqa: F401
     so100_leader,
     so101_leader,
 )
+from lerobot.utils.control_loop import ControlLoopStats, DeadlineScheduler
 from lerobot.utils.robot_utils import busy_wait
+from lerobot.utils.threaded_teleop import ThreadedTeleoperation
 from lerobot.utils.utils import init_logging, move_cursor_up
-from lerobot.utils.visualization_utils import _init_rerun, log_rerun_data
+from lerobot.utils.visualization_utils import RerunSink, _init_rerun
 
 
 @dataclass
@@ -97,19 +113,40 @@ class TeleoperateConfig:
     teleop_time_s: float | None = None
     # Display all cameras on screen
     display_data: bool = False
+    # Rate at which camera images are displayed, at every step if None. Other values are displayed at every step.
+    display_image_fps: float | None = 5.0
+    # Factor by which camera images are downscaled before being displayed.
+    display_image_scale: float = 1.0
+    # Read the leader in a background thread while the control thread writes the follower, for followers with
+    # slow motor buses. See `ThreadedTeleoperation`.
+    threaded: bool = False
+    # Rate at which the leader is read in threaded mode. Defaults to `fps`.
+    leader_fps: int | None = None
+    # In threaded mode, extrapolate the leader's motion over the measured follower latency.
+    predict_leader: bool = True
+    # Maximum extrapolation horizon of the leader's motion, in seconds.
+    max_prediction_s: float = 0.1
 
 
 def teleop_loop(
-    teleop: Teleoperator, robot: Robot, fps: int, display_data: bool = False, duration: float | None = None
+    teleop: Teleoperator,
+    robot: Robot,
+    fps: int,
+    display_data: bool = False,
+    duration: float | None = None,
+    rerun_sink: RerunSink | None = None,
 ):
     display_len = max(len(key) for key in robot.action_features)
+    owns_rerun_sink = display_data and rerun_sink is None
+    if owns_rerun_sink:
+        rerun_sink = RerunSink()
     start = time.perf_counter()
     while True:
         loop_start = time.perf_counter()
         action = teleop.get_action()
         if display_data:
             observation = robot.get_observation()
-            log_rerun_data(observation, action)
+            rerun_sink.log(observation, action)
 
         robot.send_action(action)
         dt_s = time.perf_counter() - loop_start
@@ -124,11 +161,57 @@ def teleop_loop(
         print(f"\ntime: {loop_s * 1e3:.2f}ms ({1 / loop_s:.0f} Hz)")
 
         if duration is not None and time.perf_counter() - start >= duration:
+            if owns_rerun_sink:
+                rerun_sink.close()
             return
 
         move_cursor_up(len(action) + 5)
 
 
+def threaded_teleop_loop(
+    teleop: Teleoperator,
+    robot: Robot,
+    fps: int,
+    leader_fps: int | None = None,
+    predict_leader: bool = True,
+    max_prediction_s: float = 0.1,
+    display_data: bool = False,
+    duration: float | None = None,
+    rerun_sink: RerunSink | None = None,
+) -> ControlLoopStats:
+    """Teleoperate with `ThreadedTeleoperation`, and return the latency statistics."""
+    stats = ControlLoopStats()
+    teleoperation = ThreadedTeleoperation(
+        teleop,
+        robot,
+        leader_fps=leader_fps if leader_fps is not None else fps,
+        predict=predict_leader,
+        max_prediction_s=max_prediction_s,
+        stats=stats,
+    )
+    owns_rerun_sink = display_data and rerun_sink is None
+    if owns_rerun_sink:
+        rerun_sink = RerunSink()
+
+    teleoperation.start()
+    scheduler = DeadlineScheduler(fps, stats=stats)
+    scheduler.start()
+    try:
+        while duration is None or scheduler.elapsed_s() < duration:
+            action = teleoperation.step()
+            if display_data:
+                with stats.measure("observation"):
+                    observation = robot.get_observation()
+                rerun_sink.log(observation, action)
+            scheduler.wait_for_next_tick()
+    finally:
+        teleoperation.close()
+        logging.info(f"Teleoperation stats:\n{stats.format()}")
+        if owns_rerun_sink:
+            rerun_sink.close()
+    return stats
+
+
 @draccus.wrap()
 def teleoperate(cfg: TeleoperateConfig):
     init_logging()
@@ -142,15 +225,42 @@ def teleoperate(cfg: TeleoperateConfig):
     teleop.connect()
     robot.connect()
 
+    rerun_sink = None
+    if cfg.display_data:
+        rerun_sink = RerunSink(image_fps=cfg.display_image_fps, image_scale=cfg.display_image_scale)
+
     try:
-        teleop_loop(teleop, robot, cfg.fps, display_data=cfg.display_data, duration=cfg.teleop_time_s)
+        if cfg.threaded:
+            threaded_teleop_loop(
+                teleop,
+                robot,
+                cfg.fps,
+                leader_fps=cfg.leader_fps,
+                predict_leader=cfg.predict_leader,
+                max_prediction_s=cfg.max_prediction_s,
+                display_data=cfg.display_data,
+                duration=cfg.teleop_time_s,
+                rerun_sink=rerun_sink,
+            )
+        else:
+            teleop_loop(
+                teleop,
+                robot,
+                cfg.fps,
+                display_data=cfg.display_data,
+                duration=cfg.teleop_time_s,
+                rerun_sink=rerun_sink,
+            )
     except KeyboardInterrupt:
         pass
     finally:
-        if cfg.display_data:
-            rr.rerun_shutdown()
         teleop.disconnect()
         robot.disconnect()
+        if cfg.display_data:
+            try:
+                rerun_sink.close()
+            finally:
+                rr.rerun_shutdown()
 
 
 def main():
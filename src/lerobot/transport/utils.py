@@ -19,8 +19,11 @@ import io
 import json
 import logging
 import pickle  # nosec B403: Safe usage for internal serialization only
+import struct
+import warnings
+import zlib
 from multiprocessing import Event
-from queue import Queue
+from queue import Full, Queue
 from typing import Any
 
 import torch
@@ -31,6 +34,18 @@ from lerobot.utils.transition import Transition
 CHUNK_SIZE = 2 * 1024 * 1024  # 2 MB
 MAX_MESSAGE_SIZE = 4 * 1024 * 1024  # 4 MB
 
+# Dtypes parameters can be cast to before being sent from the learner to the actors
+PARAMETERS_DTYPES = {
+    "float32": torch.float32,
+    "float16": torch.float16,
+    "bfloat16": torch.bfloat16,
+}
+# Compressions supported for transitions messages. zlib ships with Python, lz4 and zstd need `lz4`/`zstandard`
+COMPRESSIONS = ["zlib", "lz4", "zstd"]
+
+_TENSORS_HEADER_LEN = struct.Struct("<Q")
+_TENSORS_ALIGNMENT = 8
+
 
 def bytes_buffer_size(buffer: io.BytesIO) -> int:
     buffer.seek(0, io.SEEK_END)
@@ -67,6 +82,21 @@ def send_bytes_in_chunks(buffer: bytes, message_class: Any, log_prefix: str = ""
     logging_method(f"{log_prefix} Published {sent_bytes / 1024 / 1024} MB")
 
 
+def put_until_shutdown(queue: Queue, item: Any, shutdown_event: Event, timeout: float = 0.1) -> bool:
+    """Put an item in a possibly bounded queue. While the queue is full, the receiver stops reading from the
+    stream, which propagates back-pressure to the sender through gRPC flow control.
+
+    Returns False if shutdown was requested before the item could be queued.
+    """
+    while not shutdown_event.is_set():
+        try:
+            queue.put(item, timeout=timeout)
+            return True
+        except Full:
+            continue
+    return False
+
+
 def receive_bytes_in_chunks(iterator, queue: Queue | None, shutdown_event: Event, log_prefix: str = ""):
     bytes_buffer = io.BytesIO()
     step = 0
@@ -93,7 +123,9 @@ def receive_bytes_in_chunks(iterator, queue: Queue | None, shutdown_event: Event
             logging.debug(f"{log_prefix} Received data at step end size {bytes_buffer_size(bytes_buffer)}")
 
             if queue is not None:
-                queue.put(bytes_buffer.getvalue())
+                if not put_until_shutdown(queue, bytes_buffer.getvalue(), shutdown_event):
+                    logging.info(f"{log_prefix} Shutting down receiver")
+                    return
             else:
                 return bytes_buffer.getvalue()
 
@@ -122,6 +154,301 @@ def bytes_to_state_dict(buffer: bytes) -> dict[str, torch.Tensor]:
     return torch.load(buffer, weights_only=True)
 
 
+def _pack_tensors(
+    header: dict, tensors: list[tuple[dict, torch.Tensor]], compression: str | None = None
+) -> bytes:
+    """Pack tensors into a flat message: a little-endian header length, a JSON header describing every tensor
+    (dtype, shape, offset in the payload, plus the caller's fields) and the raw tensor bytes, each aligned on
+    8 bytes so that the receiver can view them in place with `torch.frombuffer`.
+
+    The payload is optionally compressed, the header never is.
+    """
+    specs = []
+    payload = []
+    offset = 0
+    for spec, tensor in tensors:
+        data = tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy().tobytes()
+
+        padding = -offset % _TENSORS_ALIGNMENT
+        payload.append(b"\0" * padding)
+        offset += padding
+
+        specs.append(
+            {
+                **spec,
+                "dtype": str(tensor.dtype).removeprefix("torch."),
+                "shape": list(tensor.shape),
+                "offset": offset,
+                "nbytes": len(data),
+            }
+        )
+        payload.append(data)
+        offset += len(data)
+
+    payload = b"".join(payload)
+    if compression is not None:
+        payload = _compress(payload, compression)
+
+    header = {**header, "compression": compression, "tensors": specs}
+    header_bytes = json.dumps(header).encode("utf-8")
+    header_bytes += b" " * (-(_TENSORS_HEADER_LEN.size + len(header_bytes)) % _TENSORS_ALIGNMENT)
+
+    return _TENSORS_HEADER_LEN.pack(len(header_bytes)) + header_bytes + payload
+
+
+def _read_tensors_header(buffer: bytes) -> tuple[dict, int]:
+    if len(buffer) < _TENSORS_HEADER_LEN.size:
+        raise ValueError(f"Message is too short ({len(buffer)} bytes)")
+
+    (header_len,) = _TENSORS_HEADER_LEN.unpack_from(buffer)
+    payload_offset = _TENSORS_HEADER_LEN.size + header_len
+    header = json.loads(bytes(buffer[_TENSORS_HEADER_LEN.size : payload_offset]))
+    return header, payload_offset
+
+
+def _iter_tensors(buffer: bytes, header: dict, payload_offset: int):
+    """Yield (spec, tensor) pairs of a message built by `_pack_tensors`. Tensors are read-only views of the
+    (decompressed) payload, they must be copied before being written to."""
+    if header.get("compression") is not None:
+        buffer = _decompress(bytes(buffer[payload_offset:]), header["compression"])
+        payload_offset = 0
+
+    with warnings.catch_warnings():
+        # The received buffer is read-only, but tensors viewing it are only ever read from
+        warnings.filterwarnings("ignore", message="The given buffer is not writable")
+        for spec in header["tensors"]:
+            dtype = getattr(torch, spec["dtype"])
+            numel = spec["nbytes"] // dtype.itemsize
+            if numel == 0:
+                yield spec, torch.empty(spec["shape"], dtype=dtype)
+                continue
+
+            tensor = torch.frombuffer(
+                buffer, dtype=dtype, count=numel, offset=payload_offset + spec["offset"]
+            )
+            yield spec, tensor.view(spec["shape"])
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "zlib":
+        return zlib.compress(data, level=1)
+    if compression == "lz4":
+        import lz4.frame
+
+        return lz4.frame.compress(data)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    raise ValueError(f"Unknown compression '{compression}'. Available: {COMPRESSIONS}")
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    if compression == "zlib":
+        return zlib.decompress(data)
+    if compression == "lz4":
+        import lz4.frame
+
+        return lz4.frame.decompress(data)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unknown compression '{compression}'. Available: {COMPRESSIONS}")
+
+
+def parameters_to_bytes(
+    state_dicts: dict[str, dict[str, torch.Tensor]],
+    version: int,
+    is_keyframe: bool = True,
+    skip: dict[str, set[str]] | None = None,
+    dtype: torch.dtype | None = None,
+) -> bytes:
+    """Serialize named state dicts into a flat, versioned parameters message.
+
+    Tensors are laid out raw and aligned in the message, so that the receiver can view them in place with
+    `torch.frombuffer` and copy them straight into its parameters.
+
+    Args:
+        state_dicts: Mapping from module name (e.g. "policy") to its state dict.
+        version: Monotonic version of the parameters, incremented by the sender on every push.
+        is_keyframe: Whether the message carries every tensor. Non-keyframes leave out the tensors in `skip`.
+        skip: Per-module names of tensors that never change (e.g. frozen encoder weights), only sent with
+            keyframes.
+        dtype: If set, floating point tensors are cast to this dtype to reduce the message size.
+    """
+    skip = skip or {}
+    tensors = []
+    for module_name, state_dict in state_dicts.items():
+        skipped = skip.get(module_name, set()) if not is_keyframe else set()
+        for name, tensor in state_dict.items():
+            if name in skipped:
+                continue
+            if dtype is not None and tensor.is_floating_point():
+                tensor = tensor.to(dtype)
+            tensors.append(({"module": module_name, "name": name}, tensor))
+
+    return _pack_tensors({"version": version, "is_keyframe": is_keyframe}, tensors)
+
+
+def read_parameters_header(buffer: bytes) -> tuple[dict, int]:
+    """Read the header of a message built by `parameters_to_bytes`. Returns the header and the offset of the
+    payload in the buffer."""
+    return _read_tensors_header(buffer)
+
+
+def load_parameters_from_bytes(modules: dict[str, torch.nn.Module], buffer: bytes) -> dict:
+    """Copy the tensors of a message built by `parameters_to_bytes` into the existing parameters and buffers
+    of `modules`, without materializing an intermediate state dict.
+
+    Returns the message header (version, keyframe flag and tensor descriptions).
+    """
+    header, payload_offset = read_parameters_header(buffer)
+    targets = {module_name: module.state_dict(keep_vars=True) for module_name, module in modules.items()}
+
+    with torch.no_grad():
+        for spec, source in _iter_tensors(buffer, header, payload_offset):
+            if spec["module"] in targets:
+                targets[spec["module"]][spec["name"]].copy_(source)
+
+    return header
+
+
+def _is_image_key(key: str) -> bool:
+    return key.startswith("observation.image")
+
+
+def transitions_to_batch_bytes(
+    transitions: list[Transition],
+    compression: str | None = None,
+    images_to_uint8: bool = False,
+    actor_id: str | None = None,
+    policy_version: int | None = None,
+) -> bytes:
+    """Serialize a list of transitions into a compact columnar message.
+
+    Every field is stacked into a single (N, ...) tensor. Next states that are equal to the state of the
+    following transition (i.e. all steps within an episode) are not sent again. Float images in [0, 1] are
+    sent as uint8 when `images_to_uint8` is set, which is lossy: images that were resized or otherwise
+    processed after capture don't have values in multiples of 1/255 anymore.
+
+    Args:
+        transitions: Transitions to serialize, with tensors of shape (1, ...) as produced by the actor.
+        compression: Optional compression of the payload, one of `COMPRESSIONS`.
+        images_to_uint8: Whether to quantize float images to uint8, rounding them to multiples of 1/255.
+        actor_id: Identifier of the actor that collected the transitions.
+        policy_version: Version of the parameters the actor's policy was running, None before the first
+            update.
+    """
+    n = len(transitions)
+    header = {"n": n, "actor_id": actor_id, "policy_version": policy_version}
+    tensors = []
+
+    def add(field: str, key: str | None, tensor: torch.Tensor):
+        spec = {"field": field, "key": key}
+        if images_to_uint8 and key is not None and _is_image_key(key) and tensor.is_floating_point():
+            spec["quantized_from"] = str(tensor.dtype).removeprefix("torch.")
+            tensor = (tensor * 255).round_().clamp_(0, 255).to(torch.uint8)
+        tensors.append((spec, tensor))
+
+    if n == 0:
+        return _pack_tensors(header, [], compression)
+
+    state_keys = list(transitions[0]["state"])
+    next_from_state = torch.tensor(
+        [
+            i + 1 < n
+            and all(torch.equal(t["next_state"][k], transitions[i + 1]["state"][k]) for k in state_keys)
+            for i, t in enumerate(transitions)
+        ],
+        dtype=torch.bool,
+    )
+    # The next state of the last transition of a trajectory can't be recovered from the states
+    kept_next_states = [
+        t for t, from_state in zip(transitions, next_from_state.tolist(), strict=True) if not from_state
+    ]
+
+    # Tensors are stored with a leading batch dimension of 1 by the actor, dropped here like in ReplayBuffer.add
+    for key in state_keys:
+        add("state", key, torch.stack([t["state"][key].squeeze(0) for t in transitions]))
+        if kept_next_states:
+            add("next_state", key, torch.stack([t["next_state"][key].squeeze(0) for t in kept_next_states]))
+    add("next_from_state", None, next_from_state)
+
+    add("action", None, torch.stack([torch.as_tensor(t["action"]).squeeze(0) for t in transitions]))
+    add("reward", None, torch.tensor([float(t["reward"]) for t in transitions], dtype=torch.float32))
+    add("done", None, torch.tensor([bool(t["done"]) for t in transitions], dtype=torch.bool))
+    add("truncated", None, torch.tensor([bool(t["truncated"]) for t in transitions], dtype=torch.bool))
+
+    # Only the keys shared by all transitions can be stacked
+    infos = [t.get("complementary_info") or {} for t in transitions]
+    info_keys = [k for k in infos[0] if all(k in info for info in infos[1:])]
+    for key in info_keys:
+        add("complementary_info", key, torch.stack([torch.as_tensor(info[key]).squeeze(0) for info in infos]))
+
+    return _pack_tensors(header, tensors, compression)
+
+
+def actor_disconnected_to_bytes(actor_id: str) -> bytes:
+    """Message without transitions telling the learner that an actor closed its last transitions stream, so
+    that the learner can release what it keeps per actor."""
+    return _pack_tensors({"n": 0, "actor_id": actor_id, "disconnected": True}, [])
+
+
+def read_transitions_header(buffer: bytes) -> dict:
+    """Read the header of a message built by `transitions_to_batch_bytes`, without decoding its payload.
+    The header holds the number of transitions `n`, the sender's `actor_id` and `policy_version`, or
+    `disconnected` for a message built by `actor_disconnected_to_bytes`."""
+    header, _ = _read_tensors_header(buffer)
+    return header
+
+
+def bytes_to_transition_batch(buffer: bytes) -> dict | None:
+    """Deserialize a message built by `transitions_to_batch_bytes` into a batch of stacked tensors, with the
+    same fields as a `BatchTransition` (state, action, reward, next_state, done, truncated,
+    complementary_info). Quantized images are converted back to their original float dtype.
+
+    Returns None if the message holds no transition.
+    """
+    header, payload_offset = _read_tensors_header(buffer)
+    n = header["n"]
+
+    columns = {"state": {}, "next_state": {}, "complementary_info": {}}
+    for spec, tensor in _iter_tensors(buffer, header, payload_offset):
+        if "quantized_from" in spec:
+            tensor = tensor.to(getattr(torch, spec["quantized_from"])) / 255
+        else:
+            tensor = tensor.clone()
+
+        if spec["key"] is None:
+            columns[spec["field"]] = tensor
+        else:
+            columns[spec["field"]][spec["key"]] = tensor
+
+    if n == 0:
+        return None
+
+    # Rebuild the next states, taking them from the following state whenever they were deduplicated
+    next_from_state = columns["next_from_state"]
+    kept = (~next_from_state).nonzero().squeeze(-1)
+    next_idx = torch.arange(1, n + 1).clamp_(max=n - 1)
+    next_state = {}
+    for key, states in columns["state"].items():
+        next_state[key] = states[next_idx]
+        if len(kept) > 0:
+            next_state[key][kept] = columns["next_state"][key]
+
+    return {
+        "state": columns["state"],
+        "action": columns["action"],
+        "reward": columns["reward"],
+        "next_state": next_state,
+        "done": columns["done"],
+        "truncated": columns["truncated"],
+        "complementary_info": columns["complementary_info"] or None,
+    }
+
+
 def python_object_to_bytes(python_object: Any) -> bytes:
     return pickle.dumps(python_object)
 
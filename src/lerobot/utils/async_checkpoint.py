@@ -0,0 +1,324 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Checkpoints written in a background thread, so that saving large policies (e.g. pi0 or SmolVLA) does not stall
+the training loop.
+
+The training thread only copies the state to CPU memory, pinned when CUDA is available so that the copies from
+the device are asynchronous. The files are then written by the background thread into a temporary directory
+next to the checkpoint, which is renamed to the checkpoint directory once complete: a checkpoint directory is
+either complete or absent, even if training is interrupted while writing.
+"""
+
+import copy
+import logging
+import re
+import shutil
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import torch
+from huggingface_hub.constants import SAFETENSORS_SINGLE_FILE
+from safetensors.torch import _remove_duplicate_names, save_file
+from torch import Tensor, nn
+from torch.optim import Optimizer
+from torch.optim.lr_scheduler import LRScheduler
+
+from lerobot.configs.train import TrainPipelineConfig
+from lerobot.constants import (
+    LAST_CHECKPOINT_LINK,
+    OPTIMIZER_PARAM_GROUPS,
+    OPTIMIZER_STATE,
+    PRETRAINED_MODEL_DIR,
+    RNG_STATE,
+    SCHEDULER_STATE,
+    TRAINING_STATE_DIR,
+)
+from lerobot.datasets.utils import flatten_dict, write_json
+from lerobot.policies.pretrained import PreTrainedPolicy
+from lerobot.utils.random_utils import serialize_rng_state
+from lerobot.utils.train_utils import save_training_step, update_last_checkpoint
+
+# Checkpoint directories are named after their zero-padded training step, see `get_step_identifier`
+CHECKPOINT_NAME_PATTERN = re.compile(r"^\d+$")
+
+
+class CheckpointSnapshot:
+    """State of a training run at one step, copied to CPU memory, and the code writing it to disk."""
+
+    def __init__(self, checkpoint_dir: Path, step: int):
+        self.checkpoint_dir = checkpoint_dir
+        self.step = step
+        self.model_state: dict[str, Tensor] = {}
+        self.model_metadata: dict[str, str] | None = None
+        # Flat optimizer states and param groups, by subdirectory of the training state directory
+        self.optimizer_states: dict[str, tuple[dict[str, Any], list[dict]]] = {}
+        self.scheduler_state: dict | None = None
+        self.rng_state: dict[str, Tensor] = {}
+        self.write_extra: Callable[[Path], None] | None = None
+
+    @property
+    def tmp_dir(self) -> Path:
+        return self.checkpoint_dir.parent / f".{self.checkpoint_dir.name}.tmp"
+
+    def write(self) -> None:
+        """Write the files into the temporary directory, then move it to the checkpoint directory."""
+        pretrained_dir = self.tmp_dir / PRETRAINED_MODEL_DIR
+        save_file(self.model_state, pretrained_dir / SAFETENSORS_SINGLE_FILE, metadata=self.model_metadata)
+
+        training_state_dir = self.tmp_dir / TRAINING_STATE_DIR
+        training_state_dir.mkdir(parents=True, exist_ok=True)
+        save_training_step(self.step, training_state_dir)
+        save_file(self.rng_state, training_state_dir / RNG_STATE)
+        for subdir, (flat_state, param_groups) in self.optimizer_states.items():
+            optimizer_dir = training_state_dir / subdir
+            optimizer_dir.mkdir(parents=True, exist_ok=True)
+            save_file(flat_state, optimizer_dir / OPTIMIZER_STATE)
+            write_json(param_groups, optimizer_dir / OPTIMIZER_PARAM_GROUPS)
+        if self.scheduler_state is not None:
+            write_json(self.scheduler_state, training_state_dir / SCHEDULER_STATE)
+        if self.write_extra is not None:
+            self.write_extra(self.tmp_dir)
+
+        if self.checkpoint_dir.exists():
+            shutil.rmtree(self.checkpoint_dir)
+        self.tmp_dir.rename(self.checkpoint_dir)
+
+
+class AsyncCheckpointer:
+    """
+    Saves training checkpoints with the same layout as `save_checkpoint`, written in a background thread.
+
+    `save` returns once the state is copied to CPU memory. At most one checkpoint is written at a time: `save`
+    first waits for the previous checkpoint to be written, and re-raises its error if writing it failed. The
+    CPU buffers are allocated at the first `save` and reused by the following ones.
+
+    Once a checkpoint is written, the "last" symlink is updated and the retention policy is applied to the
+    checkpoints directory: only the `keep_last` latest checkpoints are kept, plus the `keep_best` ones with the
+    best metric among those given to `set_metric`. The checkpoints of previous runs in the same directory are
+    subject to `keep_last` too.
+
+    Example:
+        ```python
+        checkpointer = AsyncCheckpointer(keep_last=3)
+        for step in range(1, steps + 1):
+            update_policy(...)
+            if step % save_freq == 0:
+                checkpointer.save(
+                    get_step_checkpoint_dir(output_dir, steps, step), step, cfg, policy, optimizer
+                )
+        checkpointer.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        keep_last: int | None = None,
+        keep_best: int = 0,
+        higher_is_better: bool = True,
+        background: bool = True,
+        pin_memory: bool | None = None,
+    ):
+        """
+        Args:
+            keep_last: Number of latest checkpoints to keep, or None to keep all of them.
+            keep_best: Number of checkpoints with the best metric to keep on top of the latest ones.
+            higher_is_better: Whether the best checkpoints are those with the highest metric, e.g. a success
+                rate, or the lowest, e.g. a loss.
+            background: Whether to write the checkpoints in a background thread. When False, `save` writes
+                the checkpoint before returning.
+            pin_memory: Whether to snapshot into pinned memory. Defaults to whether CUDA is available.
+        """
+        if keep_last is not None and keep_last < 1:
+            raise ValueError(f"keep_last must be at least 1, got {keep_last}")
+        if keep_best < 0:
+            raise ValueError(f"keep_best must be non-negative, got {keep_best}")
+
+        self.keep_last = keep_last
+        self.keep_best = keep_best
+        self.higher_is_better = higher_is_better
+        self.background = background
+        self.pin_memory = torch.cuda.is_available() if pin_memory is None else pin_memory
+
+        self.buffers: dict[str, Tensor] = {}
+        self.metrics: dict[str, float] = {}
+        self.metrics_lock = threading.Lock()
+        self.thread: threading.Thread | None = None
+        self.error: BaseException | None = None
+
+    def save(
+        self,
+        checkpoint_dir: Path,
+        step: int,
+        cfg: TrainPipelineConfig,
+        policy: PreTrainedPolicy,
+        optimizer: Optimizer | dict[str, Optimizer] | None = None,
+        scheduler: LRScheduler | None = None,
+        write_extra: Callable[[Path], None] | None = None,
+        on_saved: Callable[[Path], None] | None = None,
+    ) -> None:
+        """Snapshot the training state and write it to `checkpoint_dir`.
+
+        Args:
+            checkpoint_dir: Directory of the checkpoint, in the checkpoints directory of the run.
+            step: The training step at that checkpoint.
+            cfg: The training config used for this run.
+            policy: The policy to save.
+            optimizer: The optimizer, or dictionary of optimizers, to save the state from.
+            scheduler: The scheduler to save the state from.
+            write_extra: Called by the writer with the (temporary) checkpoint directory to write additional
+                files. It must not read state that training modifies.
+            on_saved: Called by the writer with the checkpoint directory once it is complete, e.g. to upload
+                it.
+        """
+        self.wait()
+
+        start = time.perf_counter()
+        snapshot = CheckpointSnapshot(checkpoint_dir, step)
+        if snapshot.tmp_dir.exists():
+            shutil.rmtree(snapshot.tmp_dir)
+
+        # The configs are small, they are written right away rather than copied
+        pretrained_dir = snapshot.tmp_dir / PRETRAINED_MODEL_DIR
+        pretrained_dir.mkdir(parents=True)
+        policy.config._save_pretrained(pretrained_dir)
+        cfg.save_pretrained(pretrained_dir)
+
+        self._snapshot_model(snapshot, policy)
+        if isinstance(optimizer, dict):
+            for name, opt in optimizer.items():
+                self._snapshot_optimizer(snapshot, opt, name)
+        elif optimizer is not None:
+            self._snapshot_optimizer(snapshot, optimizer, "")
+        if scheduler is not None:
+            snapshot.scheduler_state = copy.deepcopy(scheduler.state_dict())
+        snapshot.rng_state = flatten_dict(serialize_rng_state())
+        snapshot.write_extra = write_extra
+        if self.pin_memory:
+            # The copies from the device to pinned memory are asynchronous
+            torch.cuda.synchronize()
+        logging.info(f"Checkpoint state copied in {time.perf_counter() - start:.2f}s")
+
+        if self.background:
+            self.thread = threading.Thread(
+                target=self._write, args=(snapshot, on_saved), name="checkpoint_writer", daemon=True
+            )
+            self.thread.start()
+        else:
+            self._write(snapshot, on_saved)
+            self._raise_error()
+
+    def _snapshot_tensor(self, name: str, tensor: Tensor) -> Tensor:
+        buffer = self.buffers.get(name)
+        if buffer is None or buffer.shape != tensor.shape or buffer.dtype != tensor.dtype:
+            buffer = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=self.pin_memory)
+            self.buffers[name] = buffer
+        buffer.copy_(tensor.detach(), non_blocking=self.pin_memory)
+        return buffer
+
+    def _snapshot_model(self, snapshot: CheckpointSnapshot, policy: nn.Module) -> None:
+        state_dict = policy.state_dict()
+        # Tensors sharing memory (e.g. tied embeddings) are saved once, as `safetensors.torch.save_model` does
+        to_removes = _remove_duplicate_names(state_dict)
+        metadata = {}
+        for kept_name, to_remove_group in to_removes.items():
+            for to_remove in to_remove_group:
+                metadata[to_remove] = kept_name
+                del state_dict[to_remove]
+        snapshot.model_metadata = {"format": "pt", **metadata} if metadata else None
+        snapshot.model_state = {
+            name: self._snapshot_tensor(f"model/{name}", tensor) for name, tensor in state_dict.items()
+        }
+
+    def _snapshot_optimizer(self, snapshot: CheckpointSnapshot, optimizer: Optimizer, subdir: str) -> None:
+        state = optimizer.state_dict()
+        param_groups = copy.deepcopy(state.pop("param_groups"))
+        flat_state = {
+            key: self._snapshot_tensor(f"optimizer/{subdir}/{key}", value)
+            if isinstance(value, Tensor)
+            else copy.deepcopy(value)
+            for key, value in flatten_dict(state).items()
+        }
+        snapshot.optimizer_states[subdir] = (flat_state, param_groups)
+
+    def _write(self, snapshot: CheckpointSnapshot, on_saved: Callable[[Path], None] | None) -> None:
+        try:
+            start = time.perf_counter()
+            snapshot.write()
+            update_last_checkpoint(snapshot.checkpoint_dir)
+            self.apply_retention(snapshot.checkpoint_dir.parent)
+            logging.info(
+                f"Checkpoint {snapshot.checkpoint_dir} written in {time.perf_counter() - start:.2f}s"
+            )
+            if on_saved is not None:
+                on_saved(snapshot.checkpoint_dir)
+        except BaseException as e:
+            self.error = e
+
+    def set_metric(self, checkpoint_dir: Path, value: float) -> None:
+        """Record the metric of a checkpoint, e.g. the success rate of its evaluation, to rank the best
+        checkpoints. It can be called before the checkpoint is written."""
+        with self.metrics_lock:
+            self.metrics[Path(checkpoint_dir).name] = value
+
+    def apply_retention(self, checkpoints_dir: Path) -> list[Path]:
+        """Delete the checkpoints that are neither among the latest nor the best ones, and return them."""
+        if self.keep_last is None:
+            return []
+
+        checkpoints = sorted(
+            (path for path in checkpoints_dir.iterdir() if CHECKPOINT_NAME_PATTERN.match(path.name)),
+            key=lambda path: int(path.name),
+        )
+        kept = {path.name for path in checkpoints[-self.keep_last :]}
+        last_link = checkpoints_dir / LAST_CHECKPOINT_LINK
+        if last_link.is_symlink():
+            kept.add(last_link.resolve().name)
+
+        with self.metrics_lock:
+            metrics = dict(self.metrics)
+        ranked = sorted(
+            (path.name for path in checkpoints if path.name in metrics),
+            key=lambda name: metrics[name],
+            reverse=self.higher_is_better,
+        )
+        kept.update(ranked[: self.keep_best])
+
+        removed = [path for path in checkpoints if path.name not in kept]
+        for path in removed:
+            shutil.rmtree(path)
+        return removed
+
+    def _raise_error(self) -> None:
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise RuntimeError("Writing the checkpoint failed") from error
+
+    def wait(self) -> None:
+        """Wait for the checkpoint being written, and re-raise its error if writing it failed."""
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self._raise_error()
+
+    def close(self) -> None:
+        """Wait for the last checkpoint to be written, and release the CPU buffers."""
+        try:
+            self.wait()
+        finally:
+            self.buffers.clear()
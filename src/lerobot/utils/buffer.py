@@ -228,6 +228,60 @@ class ReplayBuffer:
         self.position = (self.position + 1) % self.capacity
         self.size = min(self.size + 1, self.capacity)
 
+    def add_batch(
+        self,
+        state: dict[str, torch.Tensor],
+        action: torch.Tensor,
+        reward: torch.Tensor,
+        next_state: dict[str, torch.Tensor],
+        done: torch.Tensor,
+        truncated: torch.Tensor,
+        complementary_info: dict[str, torch.Tensor] | None = None,
+    ):
+        """Saves a batch of N transitions at once, with every tensor stacked along a leading dimension of
+        size N. Equivalent to calling `add` on each transition, with a single indexed copy per field."""
+        n = len(reward)
+        if n == 0:
+            return
+
+        if not self.initialized:
+            self._initialize_storage(
+                state={key: val[:1] for key, val in state.items()},
+                action=action[:1],
+                complementary_info=(
+                    {key: val[:1] for key, val in complementary_info.items()}
+                    if complementary_info is not None
+                    else None
+                ),
+            )
+
+        # Only the last `capacity` transitions would survive the ring buffer wrap-around
+        start = max(0, n - self.capacity)
+        idx = (torch.arange(start, n, device=self.storage_device) + self.position) % self.capacity
+
+        for key in self.states:
+            self.states[key][idx] = state[key][start:].to(self.storage_device, self.states[key].dtype)
+
+            if not self.optimize_memory:
+                self.next_states[key][idx] = next_state[key][start:].to(
+                    self.storage_device, self.next_states[key].dtype
+                )
+
+        self.actions[idx] = action[start:].to(self.storage_device, self.actions.dtype)
+        self.rewards[idx] = reward[start:].to(self.storage_device, self.rewards.dtype)
+        self.dones[idx] = done[start:].to(self.storage_device, torch.bool)
+        self.truncateds[idx] = truncated[start:].to(self.storage_device, torch.bool)
+
+        if complementary_info is not None and self.has_complementary_info:
+            for key in self.complementary_info_keys:
+                if key in complementary_info:
+                    self.complementary_info[key][idx] = complementary_info[key][start:].to(
+                        self.storage_device, self.complementary_info[key].dtype
+                    )
+
+        self.position = (self.position + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+
     def sample(self, batch_size: int) -> BatchTransition:
         """Sample a random batch of transitions and collate them into batched tensors."""
         if not self.initialized:
@@ -0,0 +1,235 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Real-time building blocks of the control loops: deadline pacing, pipelined stages and latency statistics."""
+
+import queue
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import numpy as np
+
+OVERRUN_POLICIES = ["skip", "catch_up"]
+
+# Sleeping is only accurate to a fraction of a millisecond, the end of a wait is spent spinning
+SPIN_S = 0.0005
+
+# Upper edges of the latency histogram bins, in milliseconds
+HISTOGRAM_BIN_EDGES_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+def sleep_until(deadline: float, spin_s: float = SPIN_S) -> None:
+    """Sleep until `deadline`, on the `time.perf_counter()` clock.
+
+    Unlike sleeping for a duration, waiting for an absolute deadline does not accumulate the time spent
+    computing before the call, nor the oversleep of previous waits.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > spin_s:
+        time.sleep(remaining - spin_s)
+    while time.perf_counter() < deadline:
+        pass
+
+
+class LatencyHistogram:
+    """Latency samples of a stage of the control loop, summarized as percentiles and histogram bins."""
+
+    def __init__(self):
+        self.samples_s: list[float] = []
+
+    def record(self, duration_s: float) -> None:
+        self.samples_s.append(duration_s)
+
+    def summary(self) -> dict[str, Any]:
+        if not self.samples_s:
+            return {"count": 0}
+
+        samples_ms = 1000 * np.array(self.samples_s)
+        counts = np.bincount(
+            np.searchsorted(HISTOGRAM_BIN_EDGES_MS, samples_ms), minlength=len(HISTOGRAM_BIN_EDGES_MS) + 1
+        )
+        bin_names = [f"<{edge}ms" for edge in HISTOGRAM_BIN_EDGES_MS] + [f">={HISTOGRAM_BIN_EDGES_MS[-1]}ms"]
+        return {
+            "count": len(samples_ms),
+            "mean_ms": float(samples_ms.mean()),
+            "p50_ms": float(np.percentile(samples_ms, 50)),
+            "p90_ms": float(np.percentile(samples_ms, 90)),
+            "p99_ms": float(np.percentile(samples_ms, 99)),
+            "max_ms": float(samples_ms.max()),
+            "histogram": dict(zip(bin_names, counts.tolist(), strict=True)),
+        }
+
+
+class ControlLoopStats:
+    """Per-stage latency histograms and deadline statistics of one run of a control loop.
+
+    Example:
+        ```python
+        stats = ControlLoopStats()
+        with stats.measure("observation"):
+            observation = robot.get_observation()
+        logging.info(stats.format())
+        ```
+    """
+
+    def __init__(self):
+        self.stages: dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.ticks = 0
+        self.overruns = 0
+        self.dropped_ticks = 0
+        # Metrics reported by other components of the loop, e.g. the image writer of the dataset
+        self.metrics: dict[str, Any] = {}
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        yield
+        self.stages[stage].record(time.perf_counter() - start)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "dropped_ticks": self.dropped_ticks,
+            "stages": {stage: histogram.summary() for stage, histogram in self.stages.items()},
+            **self.metrics,
+        }
+
+    def format(self) -> str:
+        lines = [f"ticks: {self.ticks} | overruns: {self.overruns} | dropped ticks: {self.dropped_ticks}"]
+        for stage, histogram in self.stages.items():
+            summary = histogram.summary()
+            if summary["count"] == 0:
+                continue
+            lines.append(
+                f"{stage}: mean {summary['mean_ms']:.2f}ms | p50 {summary['p50_ms']:.2f}ms | "
+                f"p99 {summary['p99_ms']:.2f}ms | max {summary['max_ms']:.2f}ms"
+            )
+        return "\n".join(lines)
+
+
+class DeadlineScheduler:
+    """Paces a control loop on absolute deadlines, `start + tick / fps`.
+
+    A slow iteration only delays the ticks it overlaps: the next ticks are still due at their original
+    deadlines, so the loop does not drift. When an iteration overruns, the next one starts right away, and the
+    `overrun_policy` decides what happens to the ticks whose deadlines were missed entirely:
+    - `skip`: they are dropped, and the loop resumes on the next deadline.
+    - `catch_up`: they run back to back until the loop is back on schedule, which keeps the number of ticks
+      proportional to the elapsed time.
+
+    Example:
+        ```python
+        scheduler = DeadlineScheduler(fps=30)
+        scheduler.start()
+        while scheduler.elapsed_s() < duration_s:
+            step()
+            scheduler.wait_for_next_tick()
+        ```
+    """
+
+    def __init__(self, fps: float, overrun_policy: str = "skip", stats: ControlLoopStats | None = None):
+        if overrun_policy not in OVERRUN_POLICIES:
+            raise ValueError(f"Unknown overrun policy '{overrun_policy}'. Available: {OVERRUN_POLICIES}")
+
+        self.period_s = 1 / fps
+        self.overrun_policy = overrun_policy
+        self.stats = stats if stats is not None else ControlLoopStats()
+        self.start_t: float | None = None
+        self.tick = 0
+
+    def start(self) -> None:
+        self.start_t = time.perf_counter()
+        self.tick = 0
+
+    def elapsed_s(self) -> float:
+        return time.perf_counter() - self.start_t
+
+    def wait_for_next_tick(self) -> None:
+        """Wait for the deadline of the next tick, called at the end of each iteration."""
+        self.tick += 1
+        self.stats.ticks += 1
+        deadline = self.start_t + self.tick * self.period_s
+
+        now = time.perf_counter()
+        if now <= deadline:
+            sleep_until(deadline)
+            self.stats.stages["lateness"].record(time.perf_counter() - deadline)
+            return
+
+        self.stats.overruns += 1
+        self.stats.stages["lateness"].record(now - deadline)
+        if self.overrun_policy == "skip":
+            missed = int((now - deadline) // self.period_s)
+            self.tick += missed
+            self.stats.dropped_ticks += missed
+
+
+class PipelinedStage:
+    """Runs `fn` in a background thread on the items submitted by the control thread, in order.
+
+    The queue between both threads is bounded: once `maxsize` items are pending, `submit` blocks, which applies
+    back-pressure instead of growing memory. An exception raised by `fn` is re-raised in the control thread by
+    the next call to `submit` or `close`.
+    """
+
+    def __init__(
+        self, fn: Callable[..., None], maxsize: int, name: str, stats: ControlLoopStats | None = None
+    ):
+        self.fn = fn
+        self.name = name
+        self.stats = stats
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.error: BaseException | None = None
+
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        while (args := self.queue.get()) is not None:
+            # Skip the pending items once an item failed
+            if self.error is not None:
+                continue
+            try:
+                if self.stats is not None:
+                    with self.stats.measure(self.name):
+                        self.fn(*args)
+                else:
+                    self.fn(*args)
+            except BaseException as e:
+                self.error = e
+
+    def _raise_error(self) -> None:
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise RuntimeError(f"{self.name} stage failed") from error
+
+    def submit(self, *args) -> None:
+        self._raise_error()
+        if self.stats is not None:
+            with self.stats.measure(f"{self.name}_backpressure"):
+                self.queue.put(args)
+        else:
+            self.queue.put(args)
+
+    def close(self) -> None:
+        """Wait for the pending items to be processed, and stop the thread."""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        self._raise_error()
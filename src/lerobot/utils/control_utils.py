@@ -20,7 +20,6 @@
 import logging
 import traceback
 from contextlib import nullcontext
-from copy import copy
 from functools import cache
 
 import numpy as np
@@ -32,6 +31,7 @@ from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.datasets.utils import DEFAULT_FEATURES
 from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.robots import Robot
+from lerobot.utils.observation_preprocessing import ObservationPreprocessor
 
 
 def log_control_info(robot: Robot, dt_s, episode_index=None, frame_index=None, fps=None):
@@ -104,20 +104,21 @@ def predict_action(
     use_amp: bool,
     task: str | None = None,
     robot_type: str | None = None,
+    preprocessor: ObservationPreprocessor | None = None,
 ):
-    observation = copy(observation)
+    """Compute the next action of the policy for an observation frame, as built by `build_dataset_frame`.
+
+    Pass a `preprocessor` built once before the control loop to reuse its staging buffers across steps.
+    """
+    if preprocessor is None:
+        preprocessor = ObservationPreprocessor(device, [name for name in observation if "image" in name])
+
     with (
         torch.inference_mode(),
         torch.autocast(device_type=device.type) if device.type == "cuda" and use_amp else nullcontext(),
     ):
         # Convert to pytorch format: channel first and float32 in [0,1] with batch dimension
-        for name in observation:
-            observation[name] = torch.from_numpy(observation[name])
-            if "image" in name:
-                observation[name] = observation[name].type(torch.float32) / 255
-                observation[name] = observation[name].permute(2, 0, 1).contiguous()
-            observation[name] = observation[name].unsqueeze(0)
-            observation[name] = observation[name].to(device)
+        observation = preprocessor(observation)
 
         observation["task"] = task if task else ""
         observation["robot_type"] = robot_type if robot_type else ""
@@ -0,0 +1,112 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Distributed data-parallel training, with one process per device launched by `torchrun`:
+
+```bash
+torchrun --nproc_per_node=4 src/lerobot/scripts/train.py --policy.type=smolvla ...
+```
+
+`torchrun` sets the `RANK`, `LOCAL_RANK` and `WORLD_SIZE` environment variables of each process. Without them,
+training runs in a single process as usual.
+"""
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import torch
+import torch.distributed as dist
+from torch import nn
+from torch.nn.parallel import DistributedDataParallel
+
+
+@dataclass
+class DistributedState:
+    rank: int = 0
+    local_rank: int = 0
+    world_size: int = 1
+
+    @property
+    def is_distributed(self) -> bool:
+        return self.world_size > 1
+
+    @property
+    def is_main_process(self) -> bool:
+        return self.rank == 0
+
+
+def get_distributed_state() -> DistributedState:
+    """Read the rank and world size of the current process from the environment set by `torchrun`."""
+    return DistributedState(
+        rank=int(os.environ.get("RANK", 0)),
+        local_rank=int(os.environ.get("LOCAL_RANK", 0)),
+        world_size=int(os.environ.get("WORLD_SIZE", 1)),
+    )
+
+
+def init_distributed(device_type: str, backend: str | None = None) -> DistributedState:
+    """Join the process group when launched with several processes.
+
+    Args:
+        device_type: Type of the training device, which selects the default backend: `nccl` for cuda, `gloo`
+            otherwise.
+        backend: Backend overriding the default one.
+    """
+    state = get_distributed_state()
+    if state.is_distributed and not dist.is_initialized():
+        if backend is None:
+            backend = "nccl" if device_type == "cuda" else "gloo"
+        dist.init_process_group(backend=backend)
+    return state
+
+
+def cleanup_distributed() -> None:
+    if dist.is_initialized():
+        dist.destroy_process_group()
+
+
+def barrier() -> None:
+    if dist.is_initialized():
+        dist.barrier()
+
+
+@contextmanager
+def main_process_first(state: DistributedState) -> Iterator[None]:
+    """Run the body in the main process before the others, e.g. for the main process to download a dataset
+    that the others then find in the cache."""
+    if not state.is_main_process:
+        barrier()
+    yield
+    if state.is_main_process:
+        barrier()
+
+
+def wrap_policy(
+    policy: nn.Module, state: DistributedState, device: torch.device, find_unused_parameters: bool = False
+) -> nn.Module:
+    """Wrap the policy with `DistributedDataParallel` in distributed training, which averages the gradients
+    across processes during the backward pass. Returns the policy itself otherwise."""
+    if not state.is_distributed:
+        return policy
+    device_ids = [device.index] if device.type == "cuda" else None
+    return DistributedDataParallel(
+        policy, device_ids=device_ids, find_unused_parameters=find_unused_parameters
+    )
+
+
+def unwrap_policy(policy: nn.Module) -> nn.Module:
+    return policy.module if isinstance(policy, DistributedDataParallel) else policy
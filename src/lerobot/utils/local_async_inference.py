@@ -0,0 +1,199 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-process counterpart of the `RobotClient`/`PolicyServer` asynchronous inference: action chunks are predicted
+by a background thread ahead of time, while the control thread only pops actions.
+"""
+
+import threading
+from contextlib import nullcontext
+from typing import Any
+
+import torch
+from torch import Tensor
+
+from lerobot.policies.pretrained import PreTrainedPolicy
+from lerobot.scripts.server.configs import get_aggregate_function
+from lerobot.utils.control_loop import ControlLoopStats
+from lerobot.utils.observation_preprocessing import ObservationPreprocessor
+
+
+class LocalAsyncInference:
+    """
+    Predicts the action chunks of a local policy in a background thread, ahead of their execution.
+
+    The control thread pops one action per tick from a queue of timestamped actions. When the queue runs
+    low (its size over the chunk size drops to `chunk_size_threshold`), the control thread submits its latest
+    observation, and the inference thread predicts the next chunk while the current one is still being
+    executed. As in `RobotClient`, the actions of the new chunk that are already past are dropped, and the
+    ones overlapping the queued actions are blended with `aggregate_fn_name`. The ticks that refill the queue
+    thus no longer take the inference time.
+
+    Only the policy's `predict_action_chunk` is called, so the policy must predict action chunks (e.g. ACT,
+    SmolVLA, pi0).
+
+    Example:
+        ```python
+        inference = LocalAsyncInference(policy, preprocessor, task="Pick the cube")
+        while recording:
+            observation_frame = build_dataset_frame(dataset.features, robot.get_observation(), "observation")
+            if inference.ready_for_observation():
+                inference.submit_observation(observation_frame)
+            action = inference.pop_action()
+        inference.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        policy: PreTrainedPolicy,
+        preprocessor: ObservationPreprocessor,
+        chunk_size_threshold: float = 0.5,
+        aggregate_fn_name: str = "weighted_average",
+        task: str | None = None,
+        robot_type: str | None = None,
+        stats: ControlLoopStats | None = None,
+    ):
+        """
+        Args:
+            policy: Policy predicting action chunks.
+            preprocessor: Conversion of the observation frames into policy inputs.
+            chunk_size_threshold: Fraction of a chunk left in the queue under which a new chunk is requested.
+            aggregate_fn_name: Name of the function blending overlapping actions, see `AGGREGATE_FUNCTIONS`.
+            task: Task passed to the policy.
+            robot_type: Robot type passed to the policy.
+            stats: Optional statistics, where the inference latency is recorded.
+        """
+        if not 0 <= chunk_size_threshold <= 1:
+            raise ValueError(f"chunk_size_threshold must be in [0, 1], got {chunk_size_threshold}")
+
+        self.policy = policy
+        self.preprocessor = preprocessor
+        self.chunk_size_threshold = chunk_size_threshold
+        self.aggregate_fn = get_aggregate_function(aggregate_fn_name)
+        self.task = task
+        self.robot_type = robot_type
+        self.stats = stats
+        # Only the first `n_action_steps` actions of a chunk are meant to be executed
+        self.actions_per_chunk = getattr(policy.config, "n_action_steps", None)
+        self.use_amp = preprocessor.device.type == "cuda" and policy.config.use_amp
+
+        self.condition = threading.Condition()
+        self.action_queue: dict[int, Tensor] = {}
+        self.latest_action = -1
+        self.action_chunk_size = 1
+        self.pending_observation: tuple[int, dict[str, Any]] | None = None
+        self.inference_running = False
+        self.error: BaseException | None = None
+        self.running = True
+
+        self.thread = threading.Thread(target=self._inference_loop, name="local_async_inference", daemon=True)
+        self.thread.start()
+
+    def ready_for_observation(self) -> bool:
+        """Whether the queue runs low and no chunk is being predicted."""
+        with self.condition:
+            if self.inference_running or self.pending_observation is not None:
+                return False
+            return len(self.action_queue) / self.action_chunk_size <= self.chunk_size_threshold
+
+    def submit_observation(self, observation_frame: dict[str, Any]) -> None:
+        """Request the prediction of a chunk from an observation, taken before the next action is popped."""
+        with self.condition:
+            self.pending_observation = (self.latest_action + 1, observation_frame)
+            self.condition.notify_all()
+
+    def pop_action(self, timeout: float | None = None) -> Tensor:
+        """Pop the next action, waiting for a chunk to be predicted if the queue is empty.
+
+        Raises:
+            TimeoutError: If no action is available within `timeout` seconds.
+            RuntimeError: If the prediction of a chunk failed.
+        """
+        with self.condition:
+            available = self.condition.wait_for(
+                lambda: self.action_queue or self.error is not None, timeout=timeout
+            )
+            if self.error is not None:
+                raise RuntimeError("Action chunk prediction failed") from self.error
+            if not available:
+                raise TimeoutError(f"No action predicted within {timeout}s")
+
+            timestep = min(self.action_queue)
+            self.latest_action = timestep
+            return self.action_queue.pop(timestep)
+
+    def _aggregate_action_queue(self, first_timestep: int, chunk: Tensor) -> None:
+        """Replace the queue with the future actions of `chunk`, blended with the queued actions of the same
+        timesteps, as `RobotClient._aggregate_action_queues` does."""
+        self.action_chunk_size = max(self.action_chunk_size, len(chunk))
+        future_action_queue = {}
+        for i, action in enumerate(chunk):
+            timestep = first_timestep + i
+            if timestep <= self.latest_action:
+                continue
+            if timestep in self.action_queue:
+                action = self.aggregate_fn(self.action_queue[timestep], action)
+            future_action_queue[timestep] = action
+        self.action_queue = future_action_queue
+
+    def _predict_action_chunk(self, observation_frame: dict[str, Any]) -> Tensor:
+        with (
+            torch.inference_mode(),
+            torch.autocast(device_type="cuda") if self.use_amp else nullcontext(),
+        ):
+            batch = self.preprocessor(observation_frame)
+            batch["task"] = self.task if self.task else ""
+            batch["robot_type"] = self.robot_type if self.robot_type else ""
+            chunk = self.policy.predict_action_chunk(batch).squeeze(0)
+
+        if self.actions_per_chunk is not None:
+            chunk = chunk[: self.actions_per_chunk]
+        return chunk.to("cpu")
+
+    def _inference_loop(self) -> None:
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending_observation is not None or not self.running)
+                if not self.running:
+                    return
+                timestep, observation_frame = self.pending_observation
+                self.pending_observation = None
+                self.inference_running = True
+
+            try:
+                if self.stats is not None:
+                    with self.stats.measure("inference"):
+                        chunk = self._predict_action_chunk(observation_frame)
+                else:
+                    chunk = self._predict_action_chunk(observation_frame)
+            except BaseException as e:
+                with self.condition:
+                    self.error = e
+                    self.inference_running = False
+                    self.condition.notify_all()
+                return
+
+            with self.condition:
+                self._aggregate_action_queue(timestep, chunk)
+                self.inference_running = False
+                self.condition.notify_all()
+
+    def close(self) -> None:
+        """Stop the inference thread, after the chunk being predicted if any."""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        self.thread.join()
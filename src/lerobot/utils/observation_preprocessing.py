@@ -0,0 +1,148 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Conversion of numpy observations into policy inputs on the policy's device, shared by the control loops."""
+
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+import torch
+import torch.nn.functional as F  # noqa: N812
+from torch import Tensor
+
+from lerobot.configs.types import PolicyFeature
+
+
+class ObservationPreprocessor:
+    """
+    Converts observations of numpy arrays into batched tensors on the policy's device.
+
+    The preprocessor is built once, before the control loop, and reused at every step:
+    - Each array is copied to the device once, as is. On CUDA, the copy goes through a pinned staging buffer
+      kept for each key, so it is asynchronous.
+    - Images stay uint8 (4x smaller than float32) until they are on the device, where the channel-first
+      layout change, the conversion to float32 and the scaling to [0, 1] happen in a single kernel. They are
+      then resized to the resolution expected by the policy, if it differs from the camera's.
+    - A batch dimension is added to unbatched observations (images of 3 dimensions, other arrays of 1).
+
+    Feature normalization is left to the policy, which applies its dataset statistics itself.
+
+    Example:
+        ```python
+        preprocessor = ObservationPreprocessor.from_dataset_features(
+            dataset.features, device, policy.config.input_features
+        )
+        batch = preprocessor(observation_frame)
+        ```
+    """
+
+    def __init__(
+        self,
+        device: torch.device | str,
+        image_keys: Iterable[str],
+        image_sizes: dict[str, tuple[int, int]] | None = None,
+    ):
+        """
+        Args:
+            device: Device of the policy.
+            image_keys: Keys of the uint8 channel-last images of the observations.
+            image_sizes: Optional (height, width) expected by the policy for some images, which are resized
+                to it when the camera resolution differs.
+        """
+        self.device = torch.device(device)
+        self.image_keys = set(image_keys)
+        self.image_sizes = image_sizes or {}
+
+        self.use_pinned_memory = self.device.type == "cuda"
+        self._staging_buffers: dict[str, Tensor] = {}
+        self._copy_events: dict[str, torch.cuda.Event] = {}
+
+    @classmethod
+    def from_dataset_features(
+        cls,
+        features: dict[str, dict],
+        device: torch.device | str,
+        policy_features: dict[str, PolicyFeature] | None = None,
+    ) -> "ObservationPreprocessor":
+        """Build the preprocessor of the observation frames of a dataset, such as those returned by
+        `build_dataset_frame`, resizing images to the shapes of `policy_features`."""
+        image_keys = [
+            key
+            for key, ft in features.items()
+            if key.startswith("observation.") and ft["dtype"] in ["image", "video"]
+        ]
+        policy_features = policy_features or {}
+        image_sizes = {
+            key: tuple(policy_features[key].shape[-2:]) for key in image_keys if key in policy_features
+        }
+        return cls(device, image_keys, image_sizes)
+
+    def _to_device(self, key: str, array: np.ndarray) -> Tensor:
+        tensor = torch.from_numpy(array)
+        if not self.use_pinned_memory:
+            return tensor.to(self.device)
+
+        staging = self._staging_buffers.get(key)
+        if staging is None or staging.shape != tensor.shape or staging.dtype != tensor.dtype:
+            staging = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+            self._staging_buffers[key] = staging
+            self._copy_events[key] = torch.cuda.Event()
+        else:
+            # The previous copy from the staging buffer must be done before it is overwritten
+            self._copy_events[key].synchronize()
+
+        staging.copy_(tensor)
+        device_tensor = staging.to(self.device, non_blocking=True)
+        self._copy_events[key].record()
+        return device_tensor
+
+    def _process_image(self, key: str, image: Tensor) -> Tensor:
+        if image.dtype != torch.uint8:
+            raise ValueError(f"Expected uint8 images for '{key}', but got {image.dtype}")
+        if image.ndim == 3:
+            image = image.unsqueeze(0)
+
+        # Layout change, conversion to float and scaling in a single kernel, writing a contiguous output
+        b, h, w, c = image.shape
+        processed = torch.empty((b, c, h, w), dtype=torch.float32, device=image.device)
+        torch.div(image.permute(0, 3, 1, 2), 255, out=processed)
+
+        size = self.image_sizes.get(key)
+        if size is not None and size != (h, w):
+            processed = F.interpolate(
+                processed, size=size, mode="bilinear", align_corners=False, antialias=True
+            )
+        return processed
+
+    def __call__(self, observation: dict[str, Any]) -> dict[str, Any]:
+        """Convert the numpy arrays of `observation` into batched tensors on the device. Other values are
+        passed through unchanged."""
+        batch = {}
+        for key, value in observation.items():
+            if not isinstance(value, np.ndarray):
+                batch[key] = value
+                continue
+
+            tensor = self._to_device(key, value)
+            if key in self.image_keys:
+                tensor = self._process_image(key, tensor)
+            else:
+                if tensor.is_floating_point():
+                    tensor = tensor.float()
+                if tensor.ndim == 1:
+                    tensor = tensor.unsqueeze(0)
+            batch[key] = tensor
+
+        return batch
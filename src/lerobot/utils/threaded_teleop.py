@@ -0,0 +1,197 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Teleoperation with the leader read and the follower written on separate threads, for followers with slow motor
+buses (e.g. the Hiwonder bus of Brewie).
+"""
+
+import threading
+import time
+from typing import Any
+
+from lerobot.robots import Robot
+from lerobot.teleoperators import Teleoperator
+from lerobot.utils.control_loop import ControlLoopStats, DeadlineScheduler
+
+
+class LeaderTrajectory:
+    """
+    Latest timestamped actions of the leader, linearly extrapolated to a later time.
+
+    The velocity of each numeric value is estimated from the last two samples. The extrapolation horizon is
+    capped at `max_extrapolation_s`, so a stalled leader thread does not send the follower flying.
+    """
+
+    def __init__(self, max_extrapolation_s: float = 0.1):
+        self.max_extrapolation_s = max_extrapolation_s
+        self.lock = threading.Lock()
+        self.previous: tuple[float, dict[str, Any]] | None = None
+        self.latest: tuple[float, dict[str, Any]] | None = None
+
+    def update(self, timestamp: float, action: dict[str, Any]) -> None:
+        with self.lock:
+            self.previous, self.latest = self.latest, (timestamp, action)
+
+    def extrapolate(self, timestamp: float) -> tuple[float, float, dict[str, Any]]:
+        """Return the timestamp of the latest sample, the horizon it is extrapolated over and the predicted
+        action at `timestamp`."""
+        with self.lock:
+            previous, latest = self.previous, self.latest
+        if latest is None:
+            raise RuntimeError("No action was read from the leader yet.")
+
+        latest_t, latest_action = latest
+        horizon = min(max(timestamp - latest_t, 0.0), self.max_extrapolation_s)
+        if previous is None or horizon == 0 or latest_t <= previous[0]:
+            return latest_t, 0.0, latest_action
+
+        previous_t, previous_action = previous
+        scale = horizon / (latest_t - previous_t)
+        predicted = {}
+        for key, value in latest_action.items():
+            if isinstance(value, float) and isinstance(previous_action.get(key), float):
+                predicted[key] = value + (value - previous_action[key]) * scale
+            else:
+                predicted[key] = value
+        return latest_t, horizon, predicted
+
+
+class ThreadedTeleoperation:
+    """
+    Reads the leader in a background thread while the control thread writes the follower.
+
+    In the sequential `teleop_loop`, each tick waits for the leader read and then for the follower write, so a
+    slow follower bus also delays the leader reads. Here, the leader thread samples the leader at `leader_fps`
+    into a `LeaderTrajectory`, and each call to `step` sends the follower the latest leader action. With
+    `predict`, the action is extrapolated over the measured follower latency (an exponential moving average of
+    the `send_action` durations), so that it matches the leader's position when the command lands.
+
+    The statistics record the stages:
+    - `leader_read`: duration of `teleop.get_action`.
+    - `follower_write`: duration of `robot.send_action`.
+    - `leader_to_follower`: time from the leader read to the end of the follower write.
+    - `prediction_horizon`: time over which the sent action was extrapolated.
+
+    Example:
+        ```python
+        teleoperation = ThreadedTeleoperation(teleop, robot, leader_fps=200)
+        teleoperation.start()
+        scheduler = DeadlineScheduler(fps=100)
+        scheduler.start()
+        while scheduler.elapsed_s() < duration_s:
+            teleoperation.step()
+            scheduler.wait_for_next_tick()
+        teleoperation.close()
+        logging.info(teleoperation.stats.format())
+        ```
+    """
+
+    def __init__(
+        self,
+        teleop: Teleoperator,
+        robot: Robot,
+        leader_fps: float,
+        predict: bool = True,
+        max_prediction_s: float = 0.1,
+        latency_smoothing: float = 0.1,
+        stats: ControlLoopStats | None = None,
+    ):
+        """
+        Args:
+            teleop: Leader, read in the background thread.
+            robot: Follower, written by the calls to `step`.
+            leader_fps: Rate at which the leader is read.
+            predict: Whether to extrapolate the leader's action over the follower latency.
+            max_prediction_s: Maximum extrapolation horizon, in seconds.
+            latency_smoothing: Weight of the latest `send_action` duration in the follower latency estimate.
+            stats: Optional statistics, where the latencies are recorded.
+        """
+        if not 0 < latency_smoothing <= 1:
+            raise ValueError(f"latency_smoothing must be in (0, 1], got {latency_smoothing}")
+
+        self.teleop = teleop
+        self.robot = robot
+        self.leader_fps = leader_fps
+        self.predict = predict
+        self.latency_smoothing = latency_smoothing
+        self.stats = stats if stats is not None else ControlLoopStats()
+        self.trajectory = LeaderTrajectory(max_extrapolation_s=max_prediction_s if predict else 0.0)
+        self.follower_latency_s: float | None = None
+
+        self.first_read = threading.Event()
+        self.running = False
+        self.error: BaseException | None = None
+        self.thread: threading.Thread | None = None
+
+    def start(self, timeout: float | None = 5.0) -> None:
+        """Start the leader thread and wait for its first read."""
+        self.running = True
+        self.thread = threading.Thread(target=self._leader_loop, name="teleop_leader", daemon=True)
+        self.thread.start()
+        if not self.first_read.wait(timeout):
+            self._raise_error()
+            raise TimeoutError(f"No action was read from the leader within {timeout}s")
+
+    def _leader_loop(self) -> None:
+        # The leader thread is paced separately, its lateness is not mixed with the control loop's
+        scheduler = DeadlineScheduler(self.leader_fps)
+        scheduler.start()
+        while self.running:
+            try:
+                start = time.perf_counter()
+                action = self.teleop.get_action()
+                end = time.perf_counter()
+            except BaseException as e:
+                self.error = e
+                self.first_read.set()
+                return
+
+            self.trajectory.update((start + end) / 2, action)
+            self.stats.stages["leader_read"].record(end - start)
+            self.first_read.set()
+            scheduler.wait_for_next_tick()
+
+    def _raise_error(self) -> None:
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise RuntimeError("Reading the leader failed") from error
+
+    def step(self) -> dict[str, Any]:
+        """Send the latest leader action to the follower, and return the action actually sent."""
+        self._raise_error()
+
+        start = time.perf_counter()
+        latency_s = self.follower_latency_s if self.follower_latency_s is not None else 0.0
+        leader_t, horizon, action = self.trajectory.extrapolate(start + latency_s)
+        sent_action = self.robot.send_action(action)
+        end = time.perf_counter()
+
+        write_s = end - start
+        if self.follower_latency_s is None:
+            self.follower_latency_s = write_s
+        else:
+            self.follower_latency_s += self.latency_smoothing * (write_s - self.follower_latency_s)
+
+        self.stats.stages["follower_write"].record(write_s)
+        self.stats.stages["leader_to_follower"].record(end - leader_t)
+        self.stats.stages["prediction_horizon"].record(horizon)
+        return sent_action
+
+    def close(self) -> None:
+        """Stop the leader thread."""
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
@@ -12,12 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import os
+import threading
+import time
 from typing import Any
 
+import cv2
 import numpy as np
 import rerun as rr
 
+# Tolerance on the time at which a decimated stream is due, for floating point errors
+DUE_TOLERANCE_S = 1e-6
+
 
 def _init_rerun(session_name: str = "lerobot_control_loop") -> None:
     """Initializes the Rerun SDK for visualizing the control loop."""
@@ -44,3 +51,150 @@ def log_rerun_data(observation: dict[str | Any], action: dict[str | Any]):
         elif isinstance(val, np.ndarray):
             for i, v in enumerate(val):
                 rr.log(f"action.{act}_{i}", rr.Scalar(float(v)))
+
+
+def _is_image(value: Any) -> bool:
+    return isinstance(value, np.ndarray) and value.ndim > 1
+
+
+def _downscale_image(image: np.ndarray, scale: float) -> np.ndarray:
+    height, width = image.shape[:2]
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+class RerunSink:
+    """
+    Logs the observations and actions of a control loop to Rerun from a background thread.
+
+    Logging every observation key and full-resolution image at every tick takes several milliseconds, which
+    would be spent in the control loop with `log_rerun_data`. Instead, `log` only hands the latest observation
+    and action to the logging thread, through a mailbox of size one: when the thread falls behind, the pending
+    item is replaced by the newer one, so the control loop never waits and memory stays bounded.
+
+    Each stream (a key of the observation or the action) is logged at most at its own rate: `image_fps` for
+    camera images, `scalar_fps` for the other values, and `stream_fps` to override the rate of given keys. A
+    rate of None logs the stream every time. Images are also downscaled by `image_scale` before logging.
+
+    Example:
+        ```python
+        _init_rerun(session_name="recording")
+        sink = RerunSink(image_fps=5, image_scale=0.5)
+        while recording:
+            sink.log(robot.get_observation(), action)
+        sink.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        image_fps: float | None = 5.0,
+        scalar_fps: float | None = None,
+        image_scale: float = 1.0,
+        stream_fps: dict[str, float | None] | None = None,
+    ):
+        """
+        Args:
+            image_fps: Rate at which camera images are logged, every time if None.
+            scalar_fps: Rate at which the other values are logged, every time if None.
+            image_scale: Factor by which images are resized before being logged.
+            stream_fps: Rates of given observation or action keys, overriding `image_fps` and `scalar_fps`.
+        """
+        if not 0 < image_scale <= 1:
+            raise ValueError(f"image_scale must be in (0, 1], got {image_scale}")
+
+        self.image_fps = image_fps
+        self.scalar_fps = scalar_fps
+        self.image_scale = image_scale
+        self.stream_fps = stream_fps or {}
+
+        self.condition = threading.Condition()
+        self.mailbox: tuple[dict[str, Any], dict[str, Any], float] | None = None
+        self.busy = False
+        self.running = True
+        # Number of items replaced in the mailbox before being logged
+        self.dropped = 0
+        # First error raised while logging, re-raised by `close`
+        self.error: Exception | None = None
+        self.next_due: dict[str, float] = {}
+
+        self.thread = threading.Thread(target=self._logging_loop, name="rerun_sink", daemon=True)
+        self.thread.start()
+
+    def log(
+        self, observation: dict[str, Any], action: dict[str, Any], timestamp: float | None = None
+    ) -> None:
+        """Hand an observation and an action to the logging thread, without waiting.
+
+        The values must not be modified afterwards, as they are logged asynchronously.
+        """
+        timestamp = time.perf_counter() if timestamp is None else timestamp
+        with self.condition:
+            if self.mailbox is not None:
+                self.dropped += 1
+            self.mailbox = (observation, action, timestamp)
+            self.condition.notify_all()
+
+    def _get_fps(self, key: str, value: Any) -> float | None:
+        if key in self.stream_fps:
+            return self.stream_fps[key]
+        return self.image_fps if _is_image(value) else self.scalar_fps
+
+    def _due_values(self, prefix: str, values: dict[str, Any], timestamp: float) -> dict[str, Any]:
+        """Values of the streams due at `timestamp`, images being downscaled."""
+        due = {}
+        for key, value in values.items():
+            fps = self._get_fps(key, value)
+            if fps is not None:
+                # Streams are due on a fixed schedule, so their rate does not drift with the loop's jitter
+                stream = f"{prefix}.{key}"
+                next_due = self.next_due.get(stream, timestamp)
+                if timestamp < next_due - DUE_TOLERANCE_S:
+                    continue
+                next_due += 1 / fps
+                # After a gap in the data, the schedule restarts from now
+                self.next_due[stream] = next_due if next_due > timestamp else timestamp + 1 / fps
+
+            if _is_image(value) and self.image_scale < 1:
+                value = _downscale_image(value, self.image_scale)
+            due[key] = value
+        return due
+
+    def _logging_loop(self) -> None:
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.mailbox is not None or not self.running)
+                if self.mailbox is None:
+                    return
+                observation, action, timestamp = self.mailbox
+                self.mailbox = None
+                self.busy = True
+
+            try:
+                log_rerun_data(
+                    self._due_values("observation", observation, timestamp),
+                    self._due_values("action", action, timestamp),
+                )
+            except Exception as e:
+                # The control loop goes on, and the next items are still logged
+                logging.exception("Error logging to Rerun")
+                if self.error is None:
+                    self.error = e
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for the pending item to be logged. Returns False on timeout."""
+        with self.condition:
+            return self.condition.wait_for(lambda: self.mailbox is None and not self.busy, timeout=timeout)
+
+    def close(self) -> None:
+        """Log the pending item, and stop the logging thread. Raises the first error raised while logging."""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
@@ -24,6 +24,8 @@ from lerobot.scripts.server.helpers import (
     FPSTracker,
     TimedAction,
     TimedObservation,
+    compute_observation_signature,
+    image_to_luma_thumbnail,
     observations_similar,
     prepare_image,
     prepare_raw_observation,
@@ -202,6 +204,73 @@ def test_observations_similar_true():
     assert not observations_similar(obs1, obs3, lerobot_features, atol=2.0)
 
 
+def _make_obs_with_image(image: np.ndarray) -> TimedObservation:
+    obs = _make_obs(torch.zeros(4))
+    obs.observation["laptop"] = image
+    return obs
+
+
+def test_observations_similar_images():
+    """Same joint state but a different scene → observations not similar when images are compared."""
+    lerobot_features = _create_mock_lerobot_features()
+    lerobot_features.pop("observation.images.phone")
+
+    static = np.full((480, 640, 3), 100, dtype=np.uint8)
+    noisy = static.copy()
+    noisy[::50, ::50] = 110  # sparse, tiny change
+    moved = static.copy()
+    moved[:240] = 255  # half of the scene changed
+
+    obs1 = _make_obs_with_image(static)
+    assert observations_similar(obs1, _make_obs_with_image(noisy), lerobot_features, image_atol=0.02)
+    assert not observations_similar(obs1, _make_obs_with_image(moved), lerobot_features, image_atol=0.02)
+    # Joint-space only check ignores the camera views
+    assert observations_similar(obs1, _make_obs_with_image(moved), lerobot_features)
+
+
+def test_observation_signature_is_cached():
+    """The signature of an observation is computed once and reused across comparisons."""
+    lerobot_features = _create_mock_lerobot_features()
+    lerobot_features.pop("observation.images.phone")
+
+    obs1 = _make_obs_with_image(np.zeros((480, 640, 3), dtype=np.uint8))
+    obs2 = _make_obs_with_image(np.zeros((480, 640, 3), dtype=np.uint8))
+    assert obs1.signature is None
+
+    observations_similar(obs1, obs2, lerobot_features, image_atol=0.02)
+    signature = obs1.signature
+    assert signature is not None
+    assert signature.images["observation.images.laptop"].shape == (16, 16)
+
+    observations_similar(obs1, obs2, lerobot_features, image_atol=0.02)
+    assert obs1.signature is signature
+
+
+def test_compute_observation_signature():
+    lerobot_features = _create_mock_lerobot_features()
+    signature = compute_observation_signature(_create_mock_robot_observation(), lerobot_features)
+
+    torch.testing.assert_close(signature.state, torch.tensor([[1.0, 2.0, 3.0, 0.5]]))
+    assert set(signature.images) == {"observation.images.laptop", "observation.images.phone"}
+
+    signature = compute_observation_signature(
+        _create_mock_robot_observation(), lerobot_features, with_images=False
+    )
+    assert signature.images is None
+
+
+def test_image_to_luma_thumbnail():
+    image = np.zeros((512, 512, 3), dtype=np.uint8)
+    image[:, :256] = 255
+
+    thumbnail = image_to_luma_thumbnail(image, size=8)
+
+    assert thumbnail.shape == (8, 8)
+    assert thumbnail.min() >= 0.0 and thumbnail.max() <= 1.0
+    torch.testing.assert_close(thumbnail[:, :4], torch.ones(8, 4), atol=1e-3, rtol=0)
+    torch.testing.assert_close(thumbnail[:, 4:], torch.zeros(8, 4), atol=1e-3, rtol=0)
+
+
 # ---------------------------------------------------------------------
 # raw_observation_to_observation and helpers
 # ---------------------------------------------------------------------
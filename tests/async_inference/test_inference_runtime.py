@@ -0,0 +1,110 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.scripts.server.inference_runtime import (
+    build_inference_runtime,
+    build_predict_fn,
+    make_dummy_raw_observation,
+)
+
+LEROBOT_FEATURES = {
+    "observation.state": {
+        "dtype": "float32",
+        "shape": [4],
+        "names": ["shoulder", "elbow", "wrist", "gripper"],
+    },
+    "observation.images.laptop": {
+        "dtype": "image",
+        "shape": [48, 64, 3],
+        "names": ["height", "width", "channels"],
+    },
+}
+
+POLICY_IMAGE_FEATURES = {
+    "observation.images.laptop": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 32, 32)),
+}
+
+
+class MockPolicy(torch.nn.Module):
+    """Tiny stand-in for a chunking policy, with a few Linear layers to optimize."""
+
+    def __init__(self, chunk_size: int = 10, action_dim: int = 6):
+        super().__init__()
+        self.chunk_size = chunk_size
+        self.action_dim = action_dim
+        self.state_proj = torch.nn.Linear(4, 32)
+        self.image_proj = torch.nn.Linear(3 * 32 * 32, 32)
+        self.head = torch.nn.Linear(64, chunk_size * action_dim)
+        self.n_resets = 0
+
+    def reset(self):
+        self.n_resets += 1
+
+    @torch.no_grad()
+    def predict_action_chunk(self, batch: dict[str, torch.Tensor]) -> torch.Tensor:
+        state = self.state_proj(batch["observation.state"] + 1)
+        image = self.image_proj(batch["observation.images.laptop"].flatten(1) + 1)
+        actions = self.head(torch.cat([state, image], dim=-1))
+        return actions.view(-1, self.chunk_size, self.action_dim)
+
+
+def test_make_dummy_raw_observation():
+    raw_observation = make_dummy_raw_observation(LEROBOT_FEATURES)
+
+    assert {"shoulder", "elbow", "wrist", "gripper", "laptop", "task"} == set(raw_observation)
+    assert raw_observation["laptop"].shape == (48, 64, 3)
+    assert raw_observation["shoulder"] == 0.0
+
+
+def test_build_predict_fn_unknown_runtime():
+    with pytest.raises(ValueError):
+        build_predict_fn(MockPolicy(), "tensorrt", "cpu")
+
+
+@pytest.mark.parametrize("runtime", ["eager", "bf16", "int8"])
+def test_build_inference_runtime(runtime):
+    policy = MockPolicy()
+
+    optimized_policy, predict_fn, report = build_inference_runtime(
+        policy, runtime, LEROBOT_FEATURES, POLICY_IMAGE_FEATURES, "cpu", warmup_steps=2, atol=1.0
+    )
+
+    assert report.runtime == runtime
+    assert not report.fallback_to_eager
+    assert report.cold_start_s > 0
+    assert report.latency_ms > 0
+    assert report.max_abs_diff <= 1.0
+
+    batch = {
+        "observation.state": torch.zeros(1, 4),
+        "observation.images.laptop": torch.zeros(1, 3, 32, 32),
+    }
+    assert predict_fn(batch).shape == (1, 10, 6)
+    assert optimized_policy.n_resets == 1
+
+
+def test_build_inference_runtime_falls_back_to_eager():
+    policy = MockPolicy()
+
+    optimized_policy, predict_fn, report = build_inference_runtime(
+        policy, "bf16", LEROBOT_FEATURES, POLICY_IMAGE_FEATURES, "cpu", warmup_steps=1, atol=0.0
+    )
+
+    assert report.fallback_to_eager
+    assert optimized_policy is policy
+    assert predict_fn == policy.predict_action_chunk
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cv2
+import numpy as np
+import pytest
+
+from lerobot.cameras import make_cameras_from_configs
+from lerobot.cameras.capture_process import ProcessCamera
+from lerobot.cameras.opencv import OpenCVCameraConfig
+from lerobot.errors import DeviceNotConnectedError
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / "image_160x120.png"
+    image = np.random.default_rng(0).integers(0, 256, size=(120, 160, 3), dtype=np.uint8)
+    cv2.imwrite(str(path), image)
+    return path
+
+
+def test_make_cameras_from_configs(image_path):
+    config = OpenCVCameraConfig(index_or_path=image_path, capture_process=True)
+
+    cameras = make_cameras_from_configs({"front": config})
+
+    assert isinstance(cameras["front"], ProcessCamera)
+
+
+@pytest.mark.parametrize("zero_copy", [False, True], ids=["copy", "zero_copy"])
+def test_read_from_capture_process(image_path, zero_copy):
+    camera = ProcessCamera(OpenCVCameraConfig(index_or_path=image_path), zero_copy=zero_copy)
+    camera.connect(warmup=False)
+
+    try:
+        expected = cv2.cvtColor(cv2.imread(str(image_path)), cv2.COLOR_BGR2RGB)
+        frame = camera.async_read(timeout_ms=2000)
+        latest = camera.read_latest()
+        nearest = camera.read_nearest(latest.timestamp)
+
+        assert (camera.height, camera.width) == (120, 160)
+        assert np.array_equal(frame, expected)
+        assert frame.flags.writeable != zero_copy
+        assert nearest.seq == latest.seq
+        assert camera.read_since(-1)[-1].seq >= latest.seq
+        del frame, latest, nearest
+    finally:
+        camera.disconnect()
+
+    assert not camera.is_connected
+
+
+def test_connect_invalid_camera_path():
+    camera = ProcessCamera(OpenCVCameraConfig(index_or_path="nonexistent/camera.png"))
+
+    with pytest.raises(ConnectionError):
+        camera.connect(warmup=False)
+
+
+def test_read_before_connect():
+    camera = ProcessCamera(OpenCVCameraConfig(index_or_path=0))
+
+    with pytest.raises(DeviceNotConnectedError):
+        _ = camera.async_read()
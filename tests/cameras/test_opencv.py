@@ -155,6 +155,28 @@ def test_async_read_before_connect():
         _ = camera.async_read()
 
 
+@pytest.mark.parametrize("index_or_path", TEST_IMAGE_PATHS, ids=TEST_IMAGE_SIZES)
+def test_read_timestamped_frames(index_or_path):
+    config = OpenCVCameraConfig(index_or_path=index_or_path)
+    camera = OpenCVCamera(config)
+    camera.connect(warmup=False)
+
+    try:
+        latest = camera.read_latest()
+        nearest = camera.read_nearest(latest.timestamp)
+        frames = camera.read_since(-1)
+
+        assert latest.frame.shape == (camera.height, camera.width, 3)
+        assert latest.seq >= 0
+        assert nearest.seq == latest.seq
+        assert np.array_equal(nearest.frame, latest.frame)
+        assert [f.seq for f in frames][-1] >= latest.seq
+        assert camera.read_since(frames[-1].seq) == []
+    finally:
+        if camera.is_connected:
+            camera.disconnect()
+
+
 @pytest.mark.parametrize("index_or_path", TEST_IMAGE_PATHS, ids=TEST_IMAGE_SIZES)
 @pytest.mark.parametrize(
     "rotation",
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from lerobot.cameras.ring_buffer import FrameRingBuffer
+
+SHAPE = (4, 6, 3)
+
+
+def make_frame(value: int) -> np.ndarray:
+    return np.full(SHAPE, value, dtype=np.uint8)
+
+
+@pytest.mark.parametrize("num_slots", [0, 1])
+def test_invalid_num_slots(num_slots):
+    # A single slot would be overwritten in place while readers return it as the latest frame
+    with pytest.raises(ValueError):
+        FrameRingBuffer(num_slots, SHAPE)
+
+
+def test_latest_frame_is_not_the_slot_being_written():
+    ring = FrameRingBuffer(2, SHAPE)
+    ring.write(make_frame(7), timestamp=0.0)
+
+    slot = ring.begin_write()
+    slot[0] = 99
+
+    latest = ring.read_latest()
+    assert latest.seq == 0
+    assert np.array_equal(latest.frame, make_frame(7))
+    assert ring.wait_for_frame(timeout=0).seq == 0
+
+
+def test_empty_ring():
+    ring = FrameRingBuffer(3, SHAPE)
+
+    assert ring.read_latest() is None
+    assert ring.read_nearest(0.0) is None
+    assert ring.read_since(-1) == []
+    assert ring.wait_for_frame(timeout=0) is None
+
+
+def test_write_reuses_preallocated_slots():
+    ring = FrameRingBuffer(3, SHAPE)
+    slots = [ring.frames[i].__array_interface__["data"][0] for i in range(3)]
+
+    for i in range(5):
+        slot = ring.begin_write()
+        slot[:] = i
+        assert ring.commit_write(timestamp=float(i)) == i
+
+    assert [ring.frames[i].__array_interface__["data"][0] for i in range(3)] == slots
+    latest = ring.read_latest()
+    assert latest.seq == 4
+    assert latest.timestamp == 4.0
+    assert np.array_equal(latest.frame, make_frame(4))
+
+
+def test_read_since_skips_overwritten_frames():
+    ring = FrameRingBuffer(3, SHAPE)
+    for i in range(5):
+        ring.write(make_frame(i), timestamp=float(i))
+
+    assert [f.seq for f in ring.read_since(-1)] == [2, 3, 4]
+    assert [f.seq for f in ring.read_since(3)] == [4]
+    assert ring.read_since(4) == []
+
+
+def test_read_nearest():
+    ring = FrameRingBuffer(4, SHAPE)
+    for i in range(6):
+        ring.write(make_frame(i), timestamp=10.0 + i * 0.1)
+
+    assert ring.read_nearest(10.42).seq == 4
+    assert ring.read_nearest(10.58).seq == 5
+    # Frames that left the ring can't be returned
+    assert ring.read_nearest(0.0).seq == 2
+
+
+def test_read_returns_copies():
+    ring = FrameRingBuffer(2, SHAPE)
+    ring.write(make_frame(1), timestamp=0.0)
+
+    frame = ring.read_latest().frame
+    # The slot of the frame read is overwritten once the writer wraps around the ring
+    ring.write(make_frame(2), timestamp=1.0)
+    ring.write(make_frame(3), timestamp=2.0)
+
+    assert np.array_equal(frame, make_frame(1))
+
+
+def test_wait_for_frame():
+    ring = FrameRingBuffer(2, SHAPE)
+    ring.write(make_frame(0), timestamp=0.0)
+
+    writer = threading.Timer(0.05, lambda: ring.write(make_frame(1), timestamp=1.0))
+    writer.start()
+    frame = ring.wait_for_frame(after_seq=0, timeout=1.0)
+    writer.join()
+
+    assert frame.seq == 1
+    assert np.array_equal(frame.frame, make_frame(1))
+
+
+def test_read_views():
+    ring = FrameRingBuffer(2, SHAPE)
+    ring.write(make_frame(1), timestamp=0.0)
+
+    view = ring.read_latest(copy=False).frame
+    assert not view.flags.writeable
+
+    # Views are overwritten once the writer wraps around the ring
+    ring.write(make_frame(2), timestamp=1.0)
+    ring.write(make_frame(3), timestamp=2.0)
+    assert np.array_equal(view, make_frame(3))
+
+
+def test_shared_memory_ring():
+    nbytes = FrameRingBuffer.nbytes(3, SHAPE)
+    shared_memory = SharedMemory(create=True, size=nbytes)
+    try:
+        writer = FrameRingBuffer(3, SHAPE, buffer=shared_memory.buf)
+        writer.write(make_frame(7), timestamp=1.0)
+
+        reader = FrameRingBuffer(3, SHAPE, buffer=shared_memory.buf, initialize=False)
+        latest = reader.read_latest()
+        assert latest.seq == 0
+        assert latest.timestamp == 1.0
+        assert np.array_equal(latest.frame, make_frame(7))
+
+        writer.write(make_frame(8), timestamp=2.0)
+        assert [f.seq for f in reader.read_since(0)] == [1]
+
+        del writer, reader, latest
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
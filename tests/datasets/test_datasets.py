@@ -15,6 +15,7 @@
 # limitations under the License.
 import json
 import logging
+import pickle
 import re
 from copy import deepcopy
 from itertools import chain
@@ -30,6 +31,7 @@ from safetensors.torch import load_file
 import lerobot
 from lerobot.configs.default import DatasetConfig
 from lerobot.configs.train import TrainPipelineConfig
+from lerobot.datasets.compute_stats import aggregate_stats
 from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.image_writer import image_array_to_pil_image
 from lerobot.datasets.lerobot_dataset import (
@@ -39,11 +41,12 @@ from lerobot.datasets.lerobot_dataset import (
 from lerobot.datasets.utils import (
     create_branch,
     flatten_dict,
+    load_episodes_stats,
     unflatten_dict,
 )
 from lerobot.envs.factory import make_env_config
 from lerobot.policies.factory import make_policy_config
-from tests.fixtures.constants import DUMMY_CHW, DUMMY_HWC, DUMMY_REPO_ID
+from tests.fixtures.constants import DEFAULT_FPS, DUMMY_CHW, DUMMY_HWC, DUMMY_REPO_ID
 from tests.utils import require_x86_64_kernel
 
 
@@ -427,6 +430,110 @@ def test_multidataset_frames():
             assert torch.equal(sub_dataset_item[k], dataset_item[k])
 
 
+def make_local_datasets(root: Path, empty_lerobot_dataset_factory, episode_lengths: dict[str, list[int]]):
+    """Datasets whose frames have the state (dataset, episode, frame)."""
+    features = {"state": {"dtype": "float32", "shape": (3,), "names": None}}
+    for dataset_idx, (repo_id, lengths) in enumerate(episode_lengths.items()):
+        dataset = empty_lerobot_dataset_factory(repo_id=repo_id, root=root / repo_id, features=features)
+        for ep_idx, length in enumerate(lengths):
+            for frame_idx in range(length):
+                dataset.add_frame(
+                    {"state": torch.tensor([dataset_idx, ep_idx, frame_idx], dtype=torch.float32)},
+                    task="Dummy task",
+                )
+            dataset.save_episode()
+
+
+def test_episode_subset_with_delta_timestamps(tmp_path, empty_lerobot_dataset_factory):
+    make_local_datasets(tmp_path, empty_lerobot_dataset_factory, {DUMMY_REPO_ID: [3, 4, 5]})
+    dataset = LeRobotDataset(
+        DUMMY_REPO_ID,
+        root=tmp_path / DUMMY_REPO_ID,
+        episodes=[2],
+        delta_timestamps={"state": [-1 / DEFAULT_FPS, 0.0]},
+    )
+    item = dataset[0]
+    assert item["state"].tolist() == [[0, 2, 0], [0, 2, 0]]
+    assert item["state_is_pad"].tolist() == [True, False]
+
+
+def test_episode_subset_parses_selected_metadata(tmp_path, empty_lerobot_dataset_factory):
+    make_local_datasets(tmp_path, empty_lerobot_dataset_factory, {DUMMY_REPO_ID: [2] * 10})
+    dataset = LeRobotDataset(DUMMY_REPO_ID, root=tmp_path / DUMMY_REPO_ID, episodes=[3, 7])
+    assert len(dataset) == 4
+    assert set(dataset.meta.episodes._records) == {3, 7}
+    assert set(dataset.meta.episodes_stats._records) == {3, 7}
+    assert dataset.episode_data_index["to"].tolist() == [2, 4]
+
+    # The stats of the whole dataset are aggregated on access
+    assert dataset.meta.stats["state"]["count"].item() == 20
+    assert len(dataset.meta.episodes_stats._records) == 10
+
+
+def test_resumed_dataset_stats_match_saved_episodes(tmp_path, empty_lerobot_dataset_factory):
+    make_local_datasets(tmp_path, empty_lerobot_dataset_factory, {DUMMY_REPO_ID: [5, 5]})
+    dataset = LeRobotDataset(DUMMY_REPO_ID, root=tmp_path / DUMMY_REPO_ID)
+    for frame_idx in range(5):
+        dataset.add_frame({"state": torch.tensor([0, 2, frame_idx], dtype=torch.float32)}, task="Dummy task")
+    dataset.save_episode()
+
+    expected = aggregate_stats(list(load_episodes_stats(tmp_path / DUMMY_REPO_ID).values()))
+    assert dataset.meta.stats["state"]["count"].item() == 15
+    for stat in ["mean", "std", "min", "max", "count"]:
+        np.testing.assert_allclose(dataset.meta.stats["state"][stat], expected["state"][stat])
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_multidataset_local_frames(tmp_path, empty_lerobot_dataset_factory, streaming):
+    lengths = {"dummy/a": [2, 3], "dummy/b": [4], "dummy/c": [1, 2, 3]}
+    make_local_datasets(tmp_path, empty_lerobot_dataset_factory, lengths)
+    dataset = MultiLeRobotDataset(
+        list(lengths), root=tmp_path, streaming=streaming, max_open_episodes=2, video_backend="pyav"
+    )
+    assert dataset.dataset_sizes == [5, 4, 6]
+    assert len(dataset) == dataset.num_frames == 15
+    assert dataset.num_episodes == 6
+
+    expected = [
+        [dataset_idx, ep_idx, frame_idx]
+        for dataset_idx, episode_lengths in enumerate(lengths.values())
+        for ep_idx, length in enumerate(episode_lengths)
+        for frame_idx in range(length)
+    ]
+    items = [dataset[i] for i in range(len(dataset))]
+    assert [item["state"].tolist() for item in items] == expected
+    assert [item["dataset_index"].item() for item in items] == [state[0] for state in expected]
+    with pytest.raises(IndexError):
+        dataset[len(dataset)]
+
+    if streaming:
+        assert len(dataset._open_episodes) == 2
+    # Opened again by each dataloader worker
+    assert pickle.loads(pickle.dumps(dataset))._datasets == [None] * 3
+
+
+def test_multidataset_lazy_opening(tmp_path, empty_lerobot_dataset_factory):
+    lengths = {"dummy/a": [2], "dummy/b": [3]}
+    make_local_datasets(tmp_path, empty_lerobot_dataset_factory, lengths)
+    dataset = MultiLeRobotDataset(
+        list(lengths), root=tmp_path, episodes={"dummy/b": [0]}, video_backend="pyav"
+    )
+    assert dataset._datasets == [None, None]
+    assert dataset[3]["state"].tolist() == [1, 0, 1]
+    assert dataset._datasets[0] is None
+    assert dataset._datasets[1].episodes == [0]
+
+
+def test_multidataset_weights(tmp_path, empty_lerobot_dataset_factory):
+    lengths = {"dummy/a": [2], "dummy/b": [6]}
+    make_local_datasets(tmp_path, empty_lerobot_dataset_factory, lengths)
+    assert MultiLeRobotDataset(list(lengths), root=tmp_path).weights == [0.25, 0.75]
+    dataset = MultiLeRobotDataset(list(lengths), root=tmp_path, weights={"dummy/a": 3, "dummy/b": 1})
+    assert dataset.weights == [0.75, 0.25]
+    with pytest.raises(ValueError):
+        MultiLeRobotDataset(list(lengths), root=tmp_path, weights={"dummy/a": 1})
+
+
 # TODO(aliberts): Move to more appropriate location
 def test_flatten_unflatten_dict():
     d = {
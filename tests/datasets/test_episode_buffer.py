@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datasets
+import numpy as np
+import pytest
+import torch
+
+from lerobot.datasets.episode_buffer import FeatureColumn, episode_to_arrow_table
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.datasets.utils import DEFAULT_FEATURES, get_hf_features_from_features
+
+FEATURES = {
+    "observation.state": {"dtype": "float32", "shape": (6,), "names": None},
+    "action": {"dtype": "float32", "shape": (6,), "names": None},
+    "next.done": {"dtype": "bool", "shape": (1,), "names": None},
+}
+
+
+def test_feature_column_grows():
+    column = FeatureColumn("float32", shape=(2,), capacity=2)
+    for i in range(5):
+        column.append(np.full(2, i, dtype=np.float32))
+
+    assert len(column) == 5
+    assert column.capacity == 8
+    np.testing.assert_array_equal(column.data[:, 0], np.arange(5))
+    np.testing.assert_array_equal(column[-1], [4, 4])
+
+
+def test_feature_column_accepts():
+    column = FeatureColumn("float32", shape=(2,))
+    assert column.accepts(np.zeros(2, dtype=np.float32))
+    assert not column.accepts(np.zeros(2, dtype=np.float64))
+    assert not column.accepts(np.zeros(3, dtype=np.float32))
+    assert not column.accepts([0.0, 0.0])
+
+
+def test_episode_to_arrow_table():
+    features = {**FEATURES, **DEFAULT_FEATURES}
+    hf_features = get_hf_features_from_features(features)
+    num_frames = 10
+    episode_dict = {
+        "observation.state": np.random.rand(num_frames, 6).astype(np.float32),
+        "action": np.random.rand(num_frames, 6).astype(np.float32),
+        "next.done": np.zeros((num_frames, 1), dtype=bool),
+        "timestamp": np.arange(num_frames) / 30,
+        "frame_index": np.arange(num_frames),
+        "episode_index": np.zeros(num_frames, dtype=np.int64),
+        "index": np.arange(num_frames),
+        "task_index": np.zeros(num_frames, dtype=np.int64),
+    }
+
+    table = episode_to_arrow_table(episode_dict, hf_features)
+
+    expected = datasets.Dataset.from_dict(episode_dict, features=hf_features).data.table
+    assert table.equals(expected)
+
+
+def test_episode_to_arrow_table_unsupported_feature():
+    hf_features = datasets.Features({"language": datasets.Value("string")})
+    assert episode_to_arrow_table({"language": ["a", "b"]}, hf_features) is None
+
+
+def test_add_frame_to_columns(tmp_path):
+    dataset = LeRobotDataset.create(repo_id="dummy/columns", fps=30, features=FEATURES, root=tmp_path / "ds")
+    dataset.episode_buffer = dataset.create_episode_buffer()
+    for key in ["observation.state", "action", "next.done", "timestamp", "frame_index"]:
+        dataset.episode_buffer[key] = FeatureColumn(
+            dataset.episode_buffer[key].dtype, dataset.episode_buffer[key].shape, capacity=4
+        )
+
+    num_frames = 10
+    states = np.random.rand(num_frames, 6).astype(np.float32)
+    for state in states:
+        dataset.add_frame(
+            {"observation.state": state, "action": torch.from_numpy(state), "next.done": np.array([False])},
+            task="Dummy task",
+        )
+    assert isinstance(dataset.episode_buffer["action"], FeatureColumn)
+    assert dataset.episode_buffer["size"] == num_frames
+    dataset.save_episode()
+
+    assert len(dataset) == num_frames
+    torch.testing.assert_close(dataset[3]["observation.state"], torch.from_numpy(states[3]))
+    torch.testing.assert_close(dataset[3]["timestamp"], torch.tensor(3 / 30))
+    np.testing.assert_allclose(
+        dataset.meta.episodes_stats[0]["action"]["mean"], states.mean(axis=0), rtol=1e-6
+    )
+
+
+def test_add_frame_invalid_leaves_buffer_unchanged(tmp_path):
+    dataset = LeRobotDataset.create(repo_id="dummy/columns", fps=30, features=FEATURES, root=tmp_path / "ds")
+    frame = {
+        "observation.state": np.zeros(6, dtype=np.float32),
+        "action": np.zeros(6, dtype=np.float64),
+        "next.done": np.array([False]),
+    }
+    with pytest.raises(ValueError, match="The feature 'action' of dtype 'float64'"):
+        dataset.add_frame(frame, task="Dummy task")
+
+    assert dataset.episode_buffer["size"] == 0
+    assert len(dataset.episode_buffer["observation.state"]) == 0
@@ -0,0 +1,182 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+import torch
+from torch import nn
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.datasets.feature_cache import (
+    ImageFeatureCache,
+    compute_image_features,
+    hash_state_dict,
+    image_features_key,
+)
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.policies.act.configuration_act import ACTConfig
+from lerobot.policies.act.modeling_act import ACTPolicy
+from tests.fixtures.constants import DEFAULT_FPS, DUMMY_REPO_ID
+
+CAMERA_KEY = "observation.images.cam"
+FEATURES_KEY = image_features_key(CAMERA_KEY)
+
+
+@pytest.fixture
+def dataset(tmp_path, empty_lerobot_dataset_factory):
+    features = {
+        CAMERA_KEY: {"dtype": "image", "shape": (8, 8, 3), "names": ["height", "width", "channels"]},
+        "observation.state": {"dtype": "float32", "shape": (2,), "names": None},
+    }
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "dataset", features=features)
+    for episode in range(3):
+        for frame in range(4):
+            value = 10 * episode + frame
+            dataset.add_frame(
+                {
+                    CAMERA_KEY: np.full((8, 8, 3), value, dtype=np.uint8),
+                    "observation.state": torch.full((2,), float(value)),
+                },
+                task="Dummy task",
+            )
+        dataset.save_episode()
+    return LeRobotDataset(DUMMY_REPO_ID, root=tmp_path / "dataset")
+
+
+class CountingEncoder:
+    """Encodes an image into the mean of its channels, 255 times."""
+
+    def __init__(self):
+        self.num_frames = 0
+
+    def __call__(self, batch: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        self.num_frames += len(batch[CAMERA_KEY])
+        return {FEATURES_KEY: 255 * batch[CAMERA_KEY].mean(dim=(2, 3))}
+
+
+def test_cached_features_are_served(dataset):
+    encoder = CountingEncoder()
+    cache = compute_image_features(dataset, encoder, "hash", torch.device("cpu"), batch_size=5)
+    assert encoder.num_frames == 12
+    assert cache.camera_keys == [CAMERA_KEY]
+
+    dataset.image_feature_cache = cache
+    item = dataset[5]
+    assert CAMERA_KEY not in item
+    torch.testing.assert_close(item[FEATURES_KEY], torch.full((3,), 11.0))
+    torch.testing.assert_close(item["observation.state"], torch.full((2,), 11.0))
+
+    # Computed again only if the encoder changes
+    compute_image_features(dataset, encoder, "hash", torch.device("cpu"))
+    assert encoder.num_frames == 12
+
+
+def test_cached_features_with_delta_timestamps(dataset, tmp_path):
+    cache = compute_image_features(dataset, CountingEncoder(), "hash", torch.device("cpu"))
+    dataset = LeRobotDataset(
+        DUMMY_REPO_ID,
+        root=tmp_path / "dataset",
+        delta_timestamps={CAMERA_KEY: [-1 / DEFAULT_FPS, 0.0]},
+        image_feature_cache=cache,
+    )
+
+    item = dataset[8]
+    torch.testing.assert_close(item[FEATURES_KEY][:, 0], torch.tensor([20.0, 20.0]))
+    assert item[f"{CAMERA_KEY}_is_pad"].tolist() == [True, False]
+    item = dataset[6]
+    torch.testing.assert_close(item[FEATURES_KEY][:, 0], torch.tensor([11.0, 12.0]))
+
+
+def test_cached_features_of_episode_subset(dataset, tmp_path):
+    cache = compute_image_features(dataset, CountingEncoder(), "hash", torch.device("cpu"))
+    subset = LeRobotDataset(DUMMY_REPO_ID, root=tmp_path / "dataset", episodes=[2], image_feature_cache=cache)
+    torch.testing.assert_close(subset[1][FEATURES_KEY], torch.full((3,), 21.0))
+
+
+def test_cache_of_episode_subset_is_completed(dataset, tmp_path):
+    encoder = CountingEncoder()
+    subset = LeRobotDataset(DUMMY_REPO_ID, root=tmp_path / "dataset", episodes=[1])
+    compute_image_features(subset, encoder, "hash", torch.device("cpu"))
+    assert encoder.num_frames == 4
+    assert (
+        ImageFeatureCache(tmp_path / "dataset", "hash").cached_frames().tolist()
+        == [False] * 4 + [True] * 4 + [False] * 4
+    )
+
+    cache = compute_image_features(dataset, encoder, "hash", torch.device("cpu"))
+    assert encoder.num_frames == 12
+    assert cache.cached_frames().all()
+    torch.testing.assert_close(cache.get(CAMERA_KEY, [0, 4, 8])[:, 0], torch.tensor([0.0, 10.0, 20.0]))
+
+
+def test_cache_of_grown_dataset_is_completed(tmp_path, empty_lerobot_dataset_factory):
+    features = {CAMERA_KEY: {"dtype": "image", "shape": (8, 8, 3), "names": ["height", "width", "channels"]}}
+    recorded = empty_lerobot_dataset_factory(root=tmp_path / "dataset", features=features)
+
+    def record_episode(value):
+        for _ in range(3):
+            recorded.add_frame({CAMERA_KEY: np.full((8, 8, 3), value, dtype=np.uint8)}, task="Dummy task")
+        recorded.save_episode()
+
+    encoder = CountingEncoder()
+    record_episode(10)
+    compute_image_features(
+        LeRobotDataset(DUMMY_REPO_ID, root=tmp_path / "dataset"), encoder, "hash", torch.device("cpu")
+    )
+    record_episode(20)
+    cache = compute_image_features(
+        LeRobotDataset(DUMMY_REPO_ID, root=tmp_path / "dataset"), encoder, "hash", torch.device("cpu")
+    )
+
+    assert encoder.num_frames == 6
+    assert cache.cached_frames().tolist() == [True] * 6
+    torch.testing.assert_close(cache.get(CAMERA_KEY, [0, 3, 5])[:, 0], torch.tensor([10.0, 20.0, 20.0]))
+    assert list(cache.dir.glob("*.tmp.npy")) == []
+
+
+def test_hash_state_dict():
+    module = nn.Linear(2, 2)
+    assert hash_state_dict(module.state_dict()) == hash_state_dict(module.state_dict())
+    with torch.no_grad():
+        module.weight[0, 0] += 1
+    other = nn.Linear(2, 2)
+    assert hash_state_dict(module.state_dict()) != hash_state_dict(other.state_dict())
+
+
+def test_act_with_cached_features_matches_images():
+    config = ACTConfig(
+        input_features={
+            CAMERA_KEY: PolicyFeature(FeatureType.VISUAL, (3, 64, 64)),
+            "observation.state": PolicyFeature(FeatureType.STATE, (2,)),
+        },
+        output_features={"action": PolicyFeature(FeatureType.ACTION, (2,))},
+        pretrained_backbone_weights=None,
+        freeze_vision_encoder=True,
+        dim_model=32,
+        dim_feedforward=64,
+        n_encoder_layers=1,
+        chunk_size=5,
+        n_action_steps=5,
+    )
+    stats = {
+        CAMERA_KEY: {"mean": torch.full((3, 1, 1), 0.5), "std": torch.full((3, 1, 1), 0.2)},
+        "observation.state": {"mean": torch.zeros(2), "std": torch.ones(2)},
+        "action": {"mean": torch.zeros(2), "std": torch.ones(2)},
+    }
+    policy = ACTPolicy(config, dataset_stats=stats)
+    assert not any(p.requires_grad for p in policy.model.backbone.parameters())
+
+    batch = {CAMERA_KEY: torch.rand(2, 3, 64, 64), "observation.state": torch.randn(2, 2)}
+    features = policy.encode_images(batch)
+    cached_batch = {"observation.state": batch["observation.state"], **features}
+    torch.testing.assert_close(policy.predict_action_chunk(cached_batch), policy.predict_action_chunk(batch))
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import av
+import numpy as np
+import pytest
+
+from lerobot.datasets.frame_spool import SPOOL_FILENAME, FrameSpoolReader, FrameSpoolWriter
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.datasets.video_utils import encode_video_frames
+from tests.fixtures.constants import DUMMY_HWC
+
+
+def make_frames(num_frames: int) -> list[np.ndarray]:
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 256, size=DUMMY_HWC, dtype=np.uint8) for _ in range(num_frames)]
+
+
+def write_spool(path, frames, compression="raw"):
+    writer = FrameSpoolWriter(path, compression)
+    for frame in frames:
+        writer.append(frame)
+    writer.close()
+
+
+@pytest.mark.parametrize("compression", ["raw", "lz4"])
+def test_roundtrip(tmp_path, compression):
+    if compression == "lz4":
+        pytest.importorskip("lz4")
+    frames = make_frames(5)
+    write_spool(tmp_path / SPOOL_FILENAME, frames, compression)
+
+    spool = FrameSpoolReader(tmp_path / SPOOL_FILENAME)
+    assert len(spool) == 5
+    assert spool.compression == compression
+    assert (spool.height, spool.width) == DUMMY_HWC[:2]
+    for expected, frame in zip(frames, spool, strict=True):
+        np.testing.assert_array_equal(frame, expected)
+    np.testing.assert_array_equal(spool[-1], frames[-1])
+    with pytest.raises(IndexError):
+        spool[5]
+
+
+def test_raw_frames_are_read_only_views(tmp_path):
+    write_spool(tmp_path / SPOOL_FILENAME, make_frames(2))
+
+    frame = FrameSpoolReader(tmp_path / SPOOL_FILENAME)[1]
+    assert not frame.flags.writeable
+    assert frame.base is not None
+
+
+def test_channel_first_float_frames(tmp_path):
+    frame = np.random.rand(*DUMMY_HWC).astype(np.float32)
+    write_spool(tmp_path / SPOOL_FILENAME, [frame.transpose(2, 0, 1)])
+
+    expected = (frame * 255).astype(np.uint8)
+    np.testing.assert_array_equal(FrameSpoolReader(tmp_path / SPOOL_FILENAME)[0], expected)
+
+
+def test_shape_mismatch(tmp_path):
+    writer = FrameSpoolWriter(tmp_path / SPOOL_FILENAME)
+    writer.append(np.zeros(DUMMY_HWC, dtype=np.uint8))
+    with pytest.raises(ValueError, match="shape"):
+        writer.append(np.zeros((8, 8, 3), dtype=np.uint8))
+    writer.close()
+
+
+def test_unknown_compression(tmp_path):
+    with pytest.raises(ValueError, match="Unknown spool compression"):
+        FrameSpoolWriter(tmp_path / SPOOL_FILENAME, compression="zip")
+
+
+def test_encode_video_frames_from_spool(tmp_path):
+    write_spool(tmp_path / "imgs" / SPOOL_FILENAME, make_frames(10))
+
+    video_path = tmp_path / "video.mp4"
+    encode_video_frames(tmp_path / "imgs", video_path, fps=30, overwrite=True)
+
+    with av.open(str(video_path)) as container:
+        stream = container.streams.video[0]
+        assert (stream.height, stream.width) == DUMMY_HWC[:2]
+        assert sum(1 for _ in container.decode(stream)) == 10
+
+
+def test_dataset_frame_spooling(tmp_path):
+    features = {
+        "observation.images.cam": {
+            "dtype": "video",
+            "shape": DUMMY_HWC,
+            "names": ["height", "width", "channels"],
+        },
+        "action": {"dtype": "float32", "shape": (2,), "names": None},
+    }
+    dataset = LeRobotDataset.create(
+        repo_id="dummy/spool", fps=30, features=features, root=tmp_path / "spool", frame_spooling="raw"
+    )
+    frames = make_frames(4)
+    for frame in frames:
+        dataset.add_frame(
+            {"observation.images.cam": frame, "action": np.zeros(2, dtype=np.float32)}, task="Dummy task"
+        )
+
+    img_dir = tmp_path / "spool" / "images" / "observation.images.cam" / "episode_000000"
+    assert (img_dir / SPOOL_FILENAME).is_file()
+    assert not list(img_dir.glob("*.png"))
+
+    dataset.save_episode()
+
+    assert (tmp_path / "spool" / dataset.meta.get_video_file_path(0, "observation.images.cam")).is_file()
+    assert not img_dir.exists()
+    expected_mean = np.stack(frames).mean(axis=(0, 1, 2)) / 255
+    np.testing.assert_allclose(
+        dataset.meta.episodes_stats[0]["observation.images.cam"]["mean"].squeeze(), expected_mean, rtol=1e-6
+    )
+
+
+def test_clear_episode_buffer_removes_spool(tmp_path):
+    features = {"observation.images.cam": {"dtype": "video", "shape": DUMMY_HWC, "names": None}}
+    dataset = LeRobotDataset.create(
+        repo_id="dummy/spool", fps=30, features=features, root=tmp_path / "spool", frame_spooling="raw"
+    )
+    dataset.add_frame({"observation.images.cam": make_frames(1)[0]}, task="Dummy task")
+    dataset.clear_episode_buffer()
+
+    assert not (tmp_path / "spool" / "images" / "observation.images.cam" / "episode_000000").exists()
+    assert dataset.spool_writers == {}
@@ -22,11 +22,19 @@ from torchvision.transforms import v2
 from torchvision.transforms.v2 import functional as F  # noqa: N812
 
 from lerobot.datasets.transforms import (
+    BatchColorJitter,
+    BatchImageTransforms,
+    BatchRandomSubsetApply,
     ImageTransformConfig,
     ImageTransforms,
     ImageTransformsConfig,
     RandomSubsetApply,
     SharpnessJitter,
+    adjust_brightness,
+    adjust_contrast,
+    adjust_hue,
+    adjust_saturation,
+    adjust_sharpness,
     make_transform_from_config,
 )
 from lerobot.scripts.visualize_image_transforms import (
@@ -380,3 +388,89 @@ def test_save_each_transform(img_tensor_factory, tmp_path):
             assert (transform_dir / file_name).exists(), (
                 f"{file_name} was not found in {transform} directory."
             )
+
+
+@pytest.mark.parametrize(
+    "batch_fn, fn, min_max",
+    [
+        (adjust_brightness, F.adjust_brightness, (0.5, 1.5)),
+        (adjust_contrast, F.adjust_contrast, (0.5, 1.5)),
+        (adjust_saturation, F.adjust_saturation, (0.0, 2.0)),
+        (adjust_hue, F.adjust_hue, (-0.5, 0.5)),
+        (adjust_sharpness, F.adjust_sharpness, (0.0, 2.0)),
+    ],
+)
+def test_batch_adjustments_match_per_image(batch_fn, fn, min_max):
+    images = torch.rand(4, 2, 3, 12, 10)
+    # Gray, black and saturated pixels, the edge cases of the hue
+    images[0, :, :, :3, :3] = 0.5
+    images[1, :, :, :3, :3] = 0.0
+    images[2, :, :, :3, :3] = torch.tensor([1.0, 0.0, 0.0])[:, None, None]
+    factors = torch.empty(4).uniform_(*min_max)
+    expected = torch.stack([fn(image, factor.item()) for image, factor in zip(images, factors, strict=True)])
+    torch.testing.assert_close(batch_fn(images, factors), expected)
+
+
+def test_batch_image_transforms_match_image_transforms(img_tensor_factory):
+    images = torch.stack([img_tensor_factory(height=32, width=32) for _ in range(3)])
+    tf_cfg = ImageTransformsConfig(
+        enable=True,
+        max_num_transforms=5,
+        tfs={
+            "brightness": ImageTransformConfig(type="ColorJitter", kwargs={"brightness": (0.5, 0.5)}),
+            "contrast": ImageTransformConfig(type="ColorJitter", kwargs={"contrast": (0.5, 0.5)}),
+            "saturation": ImageTransformConfig(type="ColorJitter", kwargs={"saturation": (0.5, 0.5)}),
+            "hue": ImageTransformConfig(type="ColorJitter", kwargs={"hue": (0.5, 0.5)}),
+            "sharpness": ImageTransformConfig(type="SharpnessJitter", kwargs={"sharpness": (0.5, 0.5)}),
+        },
+    )
+    expected = torch.stack([ImageTransforms(tf_cfg)(image) for image in images])
+    torch.testing.assert_close(BatchImageTransforms(tf_cfg)(images), expected)
+
+
+def test_batch_image_transforms_disabled(img_tensor_factory):
+    images = torch.stack([img_tensor_factory() for _ in range(2)])
+    tf = BatchImageTransforms(ImageTransformsConfig(enable=False))
+    torch.testing.assert_close(tf(images), images)
+    with pytest.raises(TypeError):
+        tf(torch.zeros(2, 3, 4, 4, dtype=torch.uint8))
+
+
+def test_batch_image_transforms_share_parameters_across_steps(img_tensor_factory):
+    image = img_tensor_factory(height=16, width=16)
+    images = image.expand(64, 2, *image.shape)
+    actual = BatchImageTransforms(ImageTransformsConfig(enable=True))(images)
+    torch.testing.assert_close(actual[:, 0], actual[:, 1])
+    # But not across images
+    assert len(actual[:, 0].flatten(1).unique(dim=0)) > 1
+
+
+def test_batch_random_subset_apply_matches_distribution():
+    # Transform `i` sets the bit `i` of the image, so that the output identifies the applied subset
+    transforms = [lambda x, bit=2**i: x + bit for i in range(4)]
+    p = [1.0, 2.0, 3.0, 4.0]
+    num_samples = 4000
+
+    with seeded_context(0):
+        per_image = RandomSubsetApply(transforms, p=p, n_subset=2)
+        expected = torch.stack([per_image(torch.zeros(1)) for _ in range(num_samples)]).flatten()
+        actual = BatchRandomSubsetApply(transforms, p=p, n_subset=2)(torch.zeros(num_samples, 1)).flatten()
+
+    # Frequencies of the 6 possible pairs of transforms
+    subsets = torch.tensor([2**i + 2**j for i in range(4) for j in range(i + 1, 4)], dtype=torch.float32)
+    expected_freq = (expected[:, None] == subsets).float().mean(dim=0)
+    actual_freq = (actual[:, None] == subsets).float().mean(dim=0)
+    torch.testing.assert_close(actual_freq.sum(), torch.tensor(1.0))
+    torch.testing.assert_close(actual_freq, expected_freq, atol=0.03, rtol=0)
+
+
+def test_batch_color_jitter_random_order(img_tensor_factory):
+    images = torch.stack([img_tensor_factory(height=8, width=8) for _ in range(64)])
+    actual = BatchColorJitter(brightness=(1.5, 1.5), contrast=(0.5, 0.5))(images)
+
+    brightness_first = F.adjust_contrast(F.adjust_brightness(images, 1.5), 0.5)
+    contrast_first = torch.stack([F.adjust_brightness(F.adjust_contrast(i, 0.5), 1.5) for i in images])
+    is_brightness_first = torch.isclose(actual, brightness_first).flatten(1).all(dim=1)
+    is_contrast_first = torch.isclose(actual, contrast_first).flatten(1).all(dim=1)
+    assert (is_brightness_first | is_contrast_first).all()
+    assert is_brightness_first.any() and is_contrast_first.any()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import queue
+import threading
 import time
 from multiprocessing import queues
 from unittest.mock import MagicMock, patch
@@ -20,6 +21,7 @@ import numpy as np
 import pytest
 from PIL import Image
 
+from lerobot.datasets import image_writer as image_writer_module
 from lerobot.datasets.image_writer import (
     AsyncImageWriter,
     image_array_to_pil_image,
@@ -384,3 +386,141 @@ def test_main_process_time(tmp_path, img_tensor_factory):
         assert fpath.exists()
     finally:
         writer.stop()
+
+
+@pytest.fixture
+def blocked_writes():
+    """Make the image writer workers wait for the returned event before writing."""
+    release = threading.Event()
+    save_image = image_writer_module._save_image
+
+    def blocked_save_image(image, fpath):
+        release.wait()
+        save_image(image, fpath)
+
+    with patch.object(image_writer_module, "_save_image", blocked_save_image):
+        yield release
+    release.set()
+
+
+def make_frame_paths(tmp_path, num_frames, camera="cam"):
+    episode_dir = tmp_path / "images" / camera / "episode_000000"
+    episode_dir.mkdir(parents=True, exist_ok=True)
+    return [episode_dir / f"frame_{i:06d}.png" for i in range(num_frames)]
+
+
+def wait_for_empty_queue(writer):
+    while not writer.queue.empty():
+        time.sleep(0.001)
+
+
+def test_invalid_overflow_policy():
+    with pytest.raises(ValueError):
+        AsyncImageWriter(overflow_policy="overwrite")
+
+
+def test_metrics(tmp_path, img_array_factory, blocked_writes):
+    writer = AsyncImageWriter()
+    try:
+        for fpath in make_frame_paths(tmp_path, 3):
+            writer.save_image(img_array_factory(), fpath)
+        metrics = writer.metrics()["cam"]
+        assert metrics["queue_depth"] == 3
+        assert metrics["max_queue_depth"] == 3
+
+        blocked_writes.set()
+        writer.wait_until_done()
+        metrics = writer.metrics(reset=True)["cam"]
+        assert metrics["queue_depth"] == 0
+        assert metrics["written"] == 3
+        assert metrics["latency"]["count"] == 3
+
+        metrics = writer.metrics()["cam"]
+        assert metrics["written"] == 0
+        assert metrics["max_queue_depth"] == 0
+    finally:
+        writer.stop()
+
+
+def test_metrics_multiprocessing(tmp_path, img_array_factory):
+    writer = AsyncImageWriter(num_processes=2, num_threads=2)
+    try:
+        for fpath in make_frame_paths(tmp_path, 10):
+            writer.save_image(img_array_factory(), fpath)
+        writer.wait_until_done()
+        metrics = writer.metrics()["cam"]
+        assert metrics["written"] == 10
+        assert metrics["queue_depth"] == 0
+    finally:
+        writer.stop()
+
+
+def test_write_errors_are_counted(tmp_path):
+    writer = AsyncImageWriter()
+    try:
+        with patch("builtins.print"):
+            writer.save_image("invalid data", make_frame_paths(tmp_path, 1)[0])
+            writer.wait_until_done()
+        assert writer.metrics()["cam"]["errors"] == 1
+    finally:
+        writer.stop()
+
+
+def test_drop_policy(tmp_path, img_array_factory, blocked_writes):
+    writer = AsyncImageWriter(max_queue_size=1, overflow_policy="drop")
+    try:
+        fpaths = make_frame_paths(tmp_path, 4)
+        images = [img_array_factory() for _ in fpaths]
+        writer.save_image(images[0], fpaths[0])
+        # The first image is being written, the second one fills the queue and the others are dropped
+        wait_for_empty_queue(writer)
+        for image, fpath in zip(images[1:], fpaths[1:], strict=True):
+            writer.save_image(image, fpath)
+        assert writer.metrics()["cam"]["dropped"] == 2
+
+        blocked_writes.set()
+        writer.wait_until_done()
+        assert writer.metrics()["cam"]["written"] == 2
+        # Dropped frames repeat the previous image of the camera
+        for fpath in fpaths[2:]:
+            assert np.array_equal(np.array(Image.open(fpath)), images[1])
+    finally:
+        writer.stop()
+
+
+def test_block_policy(tmp_path, img_array_factory, blocked_writes):
+    writer = AsyncImageWriter(max_queue_size=1, overflow_policy="block")
+    try:
+        fpaths = make_frame_paths(tmp_path, 3)
+        writer.save_image(img_array_factory(), fpaths[0])
+        wait_for_empty_queue(writer)
+        writer.save_image(img_array_factory(), fpaths[1])
+
+        blocked_save = threading.Thread(target=writer.save_image, args=(img_array_factory(), fpaths[2]))
+        blocked_save.start()
+        blocked_save.join(timeout=0.1)
+        assert blocked_save.is_alive()
+
+        blocked_writes.set()
+        blocked_save.join()
+        writer.wait_until_done()
+        assert all(fpath.exists() for fpath in fpaths)
+        assert writer.metrics()["cam"]["dropped"] == 0
+    finally:
+        writer.stop()
+
+
+def test_autoscaling(tmp_path, img_array_factory, blocked_writes):
+    writer = AsyncImageWriter(num_threads=1, max_workers=3)
+    try:
+        with patch.object(image_writer_module, "AUTOSCALE_INTERVAL_S", 0):
+            for fpath in make_frame_paths(tmp_path, 20):
+                writer.save_image(img_array_factory(), fpath)
+        assert writer.num_threads == 3
+        assert len(writer.threads) == 3
+
+        blocked_writes.set()
+        writer.wait_until_done()
+        assert writer.metrics()["cam"]["written"] == 20
+    finally:
+        writer.stop()
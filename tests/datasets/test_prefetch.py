@@ -0,0 +1,120 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import time
+
+import pytest
+import torch
+
+from lerobot.datasets.prefetch import DevicePrefetcher
+from tests.utils import require_cuda
+
+
+def make_batches(num_batches: int = 5) -> list[dict]:
+    return [
+        {
+            "observation.image": torch.full((2, 3, 4, 4), 255 * i // num_batches, dtype=torch.uint8),
+            "observation.state": torch.full((2, 6), float(i)),
+            "index": torch.tensor([i, i], dtype=torch.uint8),
+            "task": ["pick", "place"],
+        }
+        for i in range(num_batches)
+    ]
+
+
+class CountingIterable:
+    def __init__(self, batches):
+        self.batches = batches
+        self.num_loaded = 0
+
+    def __iter__(self):
+        for batch in self.batches:
+            self.num_loaded += 1
+            yield batch
+
+
+class FailingIterable:
+    def __iter__(self):
+        yield make_batches(1)[0]
+        raise OSError("Video decoding failed")
+
+
+@pytest.mark.parametrize("num_prefetch", [0, 2])
+def test_prefetched_batches(num_prefetch):
+    expected = make_batches()
+    prefetcher = DevicePrefetcher(
+        make_batches(), torch.device("cpu"), num_prefetch=num_prefetch, image_keys=["observation.image"]
+    )
+    batches = list(prefetcher)
+    prefetcher.close()
+
+    assert len(batches) == len(expected)
+    for batch, expected_batch in zip(batches, expected, strict=True):
+        assert batch["observation.image"].dtype == torch.float32
+        torch.testing.assert_close(batch["observation.image"], expected_batch["observation.image"] / 255)
+        torch.testing.assert_close(batch["observation.state"], expected_batch["observation.state"])
+        # Only the images are converted
+        assert batch["index"].dtype == torch.uint8
+        assert batch["task"] == ["pick", "place"]
+
+
+def test_images_are_transformed():
+    prefetcher = DevicePrefetcher(
+        make_batches(),
+        torch.device("cpu"),
+        image_keys=["observation.image"],
+        image_transform=lambda images: 1 - images,
+    )
+    batch = next(prefetcher)
+    prefetcher.close()
+    # Transformed after the conversion to float
+    torch.testing.assert_close(batch["observation.image"], torch.ones(2, 3, 4, 4))
+    torch.testing.assert_close(batch["observation.state"], torch.zeros(2, 6))
+
+
+def test_batches_are_loaded_ahead():
+    iterable = CountingIterable(make_batches())
+    prefetcher = DevicePrefetcher(iterable, torch.device("cpu"), num_prefetch=2)
+    next(prefetcher)
+    time.sleep(0.1)
+    # One batch was taken, two are ready and one more is waiting for room in the queue
+    assert iterable.num_loaded == 4
+    prefetcher.close()
+
+
+def test_end_of_iteration():
+    prefetcher = DevicePrefetcher(make_batches(1), torch.device("cpu"))
+    next(prefetcher)
+    for _ in range(2):
+        with pytest.raises(StopIteration):
+            next(prefetcher)
+    prefetcher.close()
+
+
+def test_loading_error_is_raised():
+    prefetcher = DevicePrefetcher(FailingIterable(), torch.device("cpu"))
+    next(prefetcher)
+    with pytest.raises(RuntimeError, match="Loading the batch failed"):
+        next(prefetcher)
+    prefetcher.close()
+
+
+@require_cuda
+def test_prefetch_to_cuda():
+    prefetcher = DevicePrefetcher(
+        make_batches(), torch.device("cuda"), num_prefetch=2, image_keys=["observation.image"]
+    )
+    for i, batch in enumerate(prefetcher):
+        assert batch["observation.image"].device.type == "cuda"
+        assert batch["observation.state"].sum().item() == 12 * i
+    prefetcher.close()
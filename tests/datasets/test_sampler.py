@@ -13,10 +13,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import pytest
+import torch
 from datasets import Dataset
 
 from lerobot.datasets.push_dataset_to_hub.utils import calculate_episode_data_index
-from lerobot.datasets.sampler import EpisodeAwareSampler
+from lerobot.datasets.sampler import EpisodeAwareSampler, WeightedDatasetSampler
 from lerobot.datasets.utils import (
     hf_transform_to_torch,
 )
@@ -88,3 +90,80 @@ def test_shuffle():
     assert sampler.indices == [0, 1, 2, 3, 4, 5]
     assert len(sampler) == 6
     assert set(sampler) == {0, 1, 2, 3, 4, 5}
+
+
+def test_shards():
+    dataset = Dataset.from_dict(
+        {
+            "timestamp": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7],
+            "index": [0, 1, 2, 3, 4, 5, 6],
+            "episode_index": [0, 0, 1, 2, 2, 2, 2],
+        },
+    )
+    dataset.set_transform(hf_transform_to_torch)
+    episode_data_index = calculate_episode_data_index(dataset)
+    shards = [
+        list(EpisodeAwareSampler(episode_data_index, num_replicas=2, rank=rank, seed=0, shuffle=True))
+        for rank in range(2)
+    ]
+    # The 7 indices are padded to 8, for both shards to have the same length
+    assert [len(shard) for shard in shards] == [4, 4]
+    assert set(shards[0]) | set(shards[1]) == set(range(7))
+
+    sampler = EpisodeAwareSampler(episode_data_index, num_replicas=2, rank=0, shuffle=False)
+    assert list(sampler) == [0, 2, 4, 6]
+
+
+def test_seeded_shuffle_changes_with_epoch():
+    dataset = Dataset.from_dict(
+        {
+            "timestamp": [0.1 * i for i in range(20)],
+            "index": list(range(20)),
+            "episode_index": [0] * 20,
+        },
+    )
+    dataset.set_transform(hf_transform_to_torch)
+    episode_data_index = calculate_episode_data_index(dataset)
+    sampler = EpisodeAwareSampler(episode_data_index, shuffle=True, seed=0)
+    first_epoch = list(sampler)
+    assert list(sampler) == first_epoch
+    sampler.set_epoch(1)
+    assert list(sampler) != first_epoch
+    assert sorted(sampler) == list(range(20))
+
+
+def test_shuffle_across_replicas_requires_seed():
+    episode_data_index = {"from": torch.tensor([0]), "to": torch.tensor([4])}
+    with pytest.raises(ValueError, match="seed"):
+        EpisodeAwareSampler(episode_data_index, num_replicas=2, rank=0, shuffle=True)
+    with pytest.raises(ValueError, match="rank"):
+        EpisodeAwareSampler(episode_data_index, num_replicas=2, rank=2)
+
+
+def test_weighted_dataset_sampler_weights():
+    sampler = WeightedDatasetSampler([10, 1000, 5], weights=[1, 3, 0], num_samples=8000, seed=0)
+    indices = torch.tensor(list(sampler))
+    assert len(indices) == len(sampler) == 8000
+    assert ((indices >= 0) & (indices < 1010)).all()
+    # The second dataset is sampled 3 times more often than the first, despite being 100 times larger
+    fraction_first = (indices < 10).float().mean().item()
+    assert fraction_first == pytest.approx(0.25, abs=0.02)
+    # Frames are uniform within a dataset
+    assert len(indices[indices < 10].unique()) == 10
+
+
+def test_weighted_dataset_sampler_seed():
+    sampler = WeightedDatasetSampler([3, 4], weights=[0.5, 0.5], seed=0)
+    first_epoch = list(sampler)
+    assert list(sampler) == first_epoch
+    sampler.set_epoch(1)
+    assert list(sampler) != first_epoch
+
+
+def test_weighted_dataset_sampler_invalid_weights():
+    with pytest.raises(ValueError):
+        WeightedDatasetSampler([3, 4], weights=[1.0])
+    with pytest.raises(ValueError):
+        WeightedDatasetSampler([3, 4], weights=[-1.0, 2.0])
+    with pytest.raises(ValueError):
+        WeightedDatasetSampler([3, 0], weights=[1.0, 1.0])
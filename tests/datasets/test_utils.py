@@ -13,13 +13,23 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import pickle
 
+import pytest
 import torch
 from datasets import Dataset
 from huggingface_hub import DatasetCard
 
 from lerobot.datasets.push_dataset_to_hub.utils import calculate_episode_data_index
-from lerobot.datasets.utils import create_lerobot_dataset_card, hf_transform_to_torch
+from lerobot.datasets.utils import (
+    EPISODES_PATH,
+    LazyJsonlDict,
+    create_lerobot_dataset_card,
+    hf_transform_to_torch,
+    load_episodes,
+    write_episode,
+    write_jsonlines,
+)
 
 
 def test_default_parameters():
@@ -53,3 +63,66 @@ def test_calculate_episode_data_index():
     episode_data_index = calculate_episode_data_index(dataset)
     assert torch.equal(episode_data_index["from"], torch.tensor([0, 2, 3]))
     assert torch.equal(episode_data_index["to"], torch.tensor([2, 3, 6]))
+
+
+def test_lazy_jsonl_dict_matches_load_episodes(tmp_path):
+    for ep_idx in [2, 0, 1, 0]:
+        write_episode({"episode_index": ep_idx, "tasks": [f"task {ep_idx}"], "length": 10 + ep_idx}, tmp_path)
+    episodes = LazyJsonlDict(tmp_path / EPISODES_PATH, key="episode_index")
+    assert list(episodes) == [0, 1, 2]
+    assert dict(episodes) == load_episodes(tmp_path)
+    assert episodes.index_path.is_file()
+    assert 2 in episodes and 3 not in episodes
+    with pytest.raises(KeyError):
+        episodes[4]
+
+    episodes[4] = {"episode_index": 4, "tasks": [], "length": 1}
+    assert list(episodes) == [0, 1, 2, 4]
+    assert len(episodes) == 4
+    assert pickle.loads(pickle.dumps(episodes))[1] == episodes[1]
+
+
+def test_lazy_jsonl_dict_parses_accessed_records_only(tmp_path):
+    for ep_idx in range(5):
+        write_episode({"episode_index": ep_idx, "length": ep_idx}, tmp_path)
+    parsed = []
+    episodes = LazyJsonlDict(tmp_path / EPISODES_PATH, key="episode_index", parse=parsed.append)
+    assert len(episodes) == 5
+    assert parsed == []
+    episodes[3]
+    episodes[3]
+    assert parsed == [{"episode_index": 3, "length": 3}]
+
+
+def test_lazy_jsonl_dict_index_is_reused_and_completed(tmp_path, monkeypatch):
+    fpath = tmp_path / EPISODES_PATH
+    for ep_idx in range(3):
+        write_episode({"episode_index": ep_idx, "length": ep_idx}, tmp_path)
+    LazyJsonlDict(fpath, key="episode_index")
+
+    indexed_from = []
+    index_lines = LazyJsonlDict._index_lines
+    monkeypatch.setattr(
+        LazyJsonlDict,
+        "_index_lines",
+        lambda self, start: indexed_from.append(start) or index_lines(self, start),
+    )
+    assert list(LazyJsonlDict(fpath, key="episode_index")) == [0, 1, 2]
+    assert indexed_from == []
+
+    # Appended lines are indexed alone
+    write_episode({"episode_index": 3, "length": 3}, tmp_path)
+    episodes = LazyJsonlDict(fpath, key="episode_index")
+    assert indexed_from == [fpath.stat().st_size - len(fpath.read_bytes().splitlines()[-1]) - 1]
+    assert [episodes[ep_idx]["length"] for ep_idx in episodes] == [0, 1, 2, 3]
+
+    # A rewritten file is indexed again
+    write_jsonlines([{"length": 7, "episode_index": 5}], fpath)
+    episodes = LazyJsonlDict(fpath, key="episode_index")
+    assert indexed_from[-1] == 0
+    assert dict(episodes) == {5: {"length": 7, "episode_index": 5}}
+
+
+def test_lazy_jsonl_dict_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        LazyJsonlDict(tmp_path / EPISODES_PATH, key="episode_index")
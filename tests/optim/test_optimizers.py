@@ -51,6 +51,22 @@ def test_optimizer_build(config_cls, expected_class, model_params):
         assert optimizer.defaults["lr"] == config.lr
 
 
+@pytest.mark.parametrize("config_cls", [AdamConfig, AdamWConfig, SGDConfig])
+def test_fused_optimizer_matches_default(config_cls):
+    params = [torch.nn.Parameter(torch.randn(10, 10, generator=torch.Generator().manual_seed(0)))]
+    fused_params = [torch.nn.Parameter(param.detach().clone()) for param in params]
+    optimizer = config_cls(weight_decay=0.01).build(params)
+    fused_optimizer = config_cls(weight_decay=0.01, fused=True).build(fused_params)
+    assert fused_optimizer.defaults["fused"]
+
+    for _ in range(3):
+        for opt, opt_params in [(optimizer, params), (fused_optimizer, fused_params)]:
+            opt.zero_grad()
+            sum((param**2).sum() for param in opt_params).backward()
+            opt.step()
+    torch.testing.assert_close(fused_params, params)
+
+
 def test_save_optimizer_state(optimizer, tmp_path):
     save_optimizer_state(optimizer, tmp_path)
     assert (tmp_path / OPTIMIZER_STATE).is_file()
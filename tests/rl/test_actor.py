@@ -102,8 +102,8 @@ def test_establish_learner_connection_failure():
 @require_package("grpc")
 def test_push_transitions_to_transport_queue():
     from lerobot.scripts.rl.actor import push_transitions_to_transport_queue
-    from lerobot.transport.utils import bytes_to_transitions
-    from tests.transport.test_transport_utils import assert_transitions_equal
+    from lerobot.transport.utils import bytes_to_transition_batch
+    from tests.transport.test_transport_utils import assert_transition_batch_equal
 
     """Test pushing transitions to transport queue."""
     # Create mock transitions
@@ -128,10 +128,10 @@ def test_push_transitions_to_transport_queue():
     # Verify the data can be retrieved
     serialized_data = transitions_queue.get()
     assert isinstance(serialized_data, bytes)
-    deserialized_transitions = bytes_to_transitions(serialized_data)
-    assert len(deserialized_transitions) == len(transitions)
-    for i, deserialized_transition in enumerate(deserialized_transitions):
-        assert_transitions_equal(deserialized_transition, transitions[i])
+    batch = bytes_to_transition_batch(serialized_data)
+    assert len(batch["action"]) == len(transitions)
+    assert_transition_batch_equal(batch, transitions)
+    assert torch.equal(batch["complementary_info"]["step"], torch.arange(3))
 
 
 @require_package("grpc")
@@ -97,8 +97,8 @@ def test_end_to_end_transitions_flow(cfg):
         send_transitions,
     )
     from lerobot.scripts.rl.learner import start_learner
-    from lerobot.transport.utils import bytes_to_transitions
-    from tests.transport.test_transport_utils import assert_transitions_equal
+    from lerobot.transport.utils import bytes_to_transition_batch
+    from tests.transport.test_transport_utils import assert_transition_batch_equal
 
     """Test complete transitions flow from actor to learner."""
     transitions_actor_queue = Queue()
@@ -140,13 +140,13 @@ def test_end_to_end_transitions_flow(cfg):
     send_transitions_thread.join()
     channel.close()
 
-    received_transitions = []
+    received_batches = []
     while not transitions_learner_queue.empty():
-        received_transitions.extend(bytes_to_transitions(transitions_learner_queue.get()))
+        received_batches.append(bytes_to_transition_batch(transitions_learner_queue.get()))
 
-    assert len(received_transitions) == len(input_transitions)
-    for i, transition in enumerate(received_transitions):
-        assert_transitions_equal(transition, input_transitions[i])
+    assert len(received_batches) == 1
+    assert len(received_batches[0]["action"]) == len(input_transitions)
+    assert_transition_batch_equal(received_batches[0], input_transitions)
 
 
 @require_package("grpc")
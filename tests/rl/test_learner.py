@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+
+import torch
+from torch.multiprocessing import Event
+
+from lerobot.utils.buffer import ReplayBuffer
+from lerobot.utils.transition import Transition
+from tests.utils import require_package
+
+
+def create_transitions_message(count: int, actor_id: str, policy_version: int | None, reward: float) -> bytes:
+    from lerobot.transport.utils import transitions_to_batch_bytes
+
+    transitions = [
+        Transition(
+            state={"observation.state": torch.randn(1, 4)},
+            action=torch.randn(1, 2),
+            reward=reward,
+            done=False,
+            truncated=False,
+            next_state={"observation.state": torch.randn(1, 4)},
+            complementary_info={},
+        )
+        for _ in range(count)
+    ]
+    return transitions_to_batch_bytes(transitions, actor_id=actor_id, policy_version=policy_version)
+
+
+@require_package("grpc")
+def test_process_transitions_round_robin_across_shards():
+    from lerobot.scripts.rl.learner import process_transitions
+
+    # Plain queues keep `empty()` exact right after `put()`, unlike multiprocessing ones
+    fast_actor_queue, slow_actor_queue = queue.Queue(), queue.Queue()
+    for _ in range(3):
+        fast_actor_queue.put(create_transitions_message(2, "fast", policy_version=4, reward=0.0))
+    slow_actor_queue.put(create_transitions_message(2, "slow", policy_version=1, reward=1.0))
+
+    replay_buffer = ReplayBuffer(capacity=100, device="cpu", state_keys=["observation.state"])
+    actor_stats = {}
+
+    n_added = process_transitions(
+        transition_queue=[fast_actor_queue, slow_actor_queue],
+        replay_buffer=replay_buffer,
+        offline_replay_buffer=None,
+        dataset_repo_id=None,
+        shutdown_event=Event(),
+        actor_stats=actor_stats,
+    )
+
+    assert n_added == 8
+    assert len(replay_buffer) == 8
+    # The slow actor's batch is ingested right after the first batch of the fast actor
+    assert torch.equal(replay_buffer.rewards[:8], torch.tensor([0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0]))
+    assert actor_stats == {
+        "fast": {"transitions": 6, "policy_version": 4},
+        "slow": {"transitions": 2, "policy_version": 1},
+    }
+
+
+@require_package("grpc")
+def test_process_transitions_releases_disconnected_actors():
+    from lerobot.scripts.rl.learner import process_transitions
+    from lerobot.transport.utils import actor_disconnected_to_bytes
+
+    transition_queue = queue.Queue()
+    transition_queue.put(create_transitions_message(2, "restarted", policy_version=1, reward=0.0))
+    transition_queue.put(actor_disconnected_to_bytes("restarted"))
+    transition_queue.put(create_transitions_message(1, "other", policy_version=1, reward=0.0))
+
+    replay_buffer = ReplayBuffer(capacity=100, device="cpu", state_keys=["observation.state"])
+    actor_stats = {}
+
+    n_added = process_transitions(
+        transition_queue=transition_queue,
+        replay_buffer=replay_buffer,
+        offline_replay_buffer=None,
+        dataset_repo_id=None,
+        shutdown_event=Event(),
+        actor_stats=actor_stats,
+    )
+
+    assert n_added == 3
+    assert len(replay_buffer) == 3
+    assert actor_stats == {"other": {"transitions": 1, "policy_version": 1}}
+
+
+@require_package("grpc")
+def test_get_actor_metrics():
+    from lerobot.scripts.rl.learner import get_actor_metrics
+
+    actor_stats = {
+        "fast": {"transitions": 60, "policy_version": 4},
+        "new": {"transitions": 10, "policy_version": None},
+    }
+
+    metrics = get_actor_metrics(actor_stats, parameters_version=5, elapsed_s=2.0)
+
+    assert metrics == {
+        "actor/fast/transitions_per_s": 30.0,
+        "actor/fast/policy_staleness": 1,
+        "actor/new/transitions_per_s": 5.0,
+    }
+    assert actor_stats["fast"]["transitions"] == 0
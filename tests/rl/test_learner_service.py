@@ -16,9 +16,12 @@
 import threading
 import time
 from concurrent import futures
+from contextlib import ExitStack
 from multiprocessing import Event, Queue
+from queue import Empty
 
 import pytest
+import torch
 
 from tests.utils import require_package  # our gRPC servicer class
 
@@ -139,6 +142,7 @@ def test_send_interactions():
 @pytest.mark.timeout(3)  # force cross-platform watchdog
 def test_send_transitions():
     from lerobot.transport import services_pb2
+    from lerobot.transport.utils import read_transitions_header
 
     """Test the SendTransitions method with various transition data."""
     shutdown_event = Event()
@@ -177,14 +181,16 @@ def test_send_transitions():
     while not transitions_queue.empty():
         transitions.append(transitions_queue.get())
 
-    # Should have assembled the chunked data
-    assert transitions == [b"transition_1transition_2transition_3", b"batch_1batch_2"]
+    # Should have assembled the chunked data, followed by the disconnection of the actor
+    assert transitions[:-1] == [b"transition_1transition_2transition_3", b"batch_1batch_2"]
+    assert read_transitions_header(transitions[-1])["disconnected"]
 
 
 @require_package("grpc")
 @pytest.mark.timeout(3)  # force cross-platform watchdog
 def test_send_transitions_empty_stream():
     from lerobot.transport import services_pb2
+    from lerobot.transport.utils import read_transitions_header
 
     """Test SendTransitions with empty stream."""
     shutdown_event = Event()
@@ -205,10 +211,104 @@ def test_send_transitions_empty_stream():
 
     close_learner_service_stub(channel, server)
 
-    # Queue should remain empty
+    # Only the disconnection of the actor should be queued
+    assert read_transitions_header(transitions_queue.get(timeout=1))["disconnected"]
     assert transitions_queue.empty()
 
 
+@require_package("grpc")
+@pytest.mark.timeout(3)  # force cross-platform watchdog
+def test_send_transitions_multiple_actors_are_sharded():
+    from lerobot.scripts.rl.learner_service import ACTOR_ID_METADATA_KEY
+    from lerobot.transport import services_pb2
+    from lerobot.transport.utils import read_transitions_header
+
+    """Test that transitions from actors connected at once go to their own shard."""
+    shutdown_event = Event()
+    parameters_queue = Queue()
+    transitions_queues = [Queue(), Queue()]
+    interactions_queue = Queue()
+    release_streams = threading.Event()
+
+    client, channel, server = create_learner_service_stub(
+        shutdown_event, parameters_queue, transitions_queues, interactions_queue, 1
+    )
+
+    def stream(actor_id):
+        yield services_pb2.Transition(
+            transfer_state=services_pb2.TransferState.TRANSFER_END, data=actor_id.encode()
+        )
+        release_streams.wait()
+
+    def get_message():
+        while True:
+            for shard, transitions_queue in enumerate(transitions_queues):
+                try:
+                    return shard, transitions_queue.get(timeout=0.01)
+                except Empty:
+                    pass
+
+    calls = []
+    received = []
+    for actor_id in ["actor_a", "actor_b", "actor_c"]:
+        calls.append(
+            client.SendTransitions.future(stream(actor_id), metadata=((ACTOR_ID_METADATA_KEY, actor_id),))
+        )
+        # The actor is connected once its message is queued, which keeps the assignment order deterministic
+        received.append(get_message())
+
+    release_streams.set()
+    for call in calls:
+        call.result()
+
+    close_learner_service_stub(channel, server)
+
+    assert received == [(0, b"actor_a"), (1, b"actor_b"), (0, b"actor_c")]
+    # Each actor is released on its shard when its stream closes
+    disconnected = sorted(
+        (shard, read_transitions_header(message)["actor_id"])
+        for shard, message in [get_message() for _ in calls]
+    )
+    assert disconnected == [(0, "actor_a"), (0, "actor_c"), (1, "actor_b")]
+
+
+@require_package("grpc")
+def test_transitions_stream_assigns_least_loaded_shard():
+    from lerobot.scripts.rl.learner_service import LearnerService
+    from lerobot.transport.utils import read_transitions_header
+
+    transitions_queues = [Queue(), Queue()]
+    service = LearnerService(
+        shutdown_event=Event(),
+        parameters_queue=Queue(),
+        seconds_between_pushes=1,
+        transition_queue=transitions_queues,
+        interaction_message_queue=Queue(),
+    )
+
+    with ExitStack() as streams_a, ExitStack() as streams_c:
+        assert streams_a.enter_context(service.transitions_stream("actor_a")) is transitions_queues[0]
+        with service.transitions_stream("actor_b") as queue_b:
+            assert queue_b is transitions_queues[1]
+            assert streams_c.enter_context(service.transitions_stream("actor_c")) is transitions_queues[0]
+            # A second stream of a connected actor keeps its shard, and doesn't release it when closed
+            with service.transitions_stream("actor_a") as queue_a:
+                assert queue_a is transitions_queues[0]
+            assert transitions_queues[0].empty()
+
+            streams_a.close()
+            streams_c.close()
+            # E.g. actor_a restarted under a new id, which goes to the shard left empty
+            with service.transitions_stream("actor_d") as queue_d:
+                assert queue_d is transitions_queues[0]
+
+    assert service._actor_shards == {}
+    assert service._actor_streams == {}
+    released = [read_transitions_header(transitions_queues[0].get(timeout=1))["actor_id"] for _ in range(3)]
+    assert released == ["actor_a", "actor_c", "actor_d"]
+    assert read_transitions_header(transitions_queues[1].get(timeout=1))["actor_id"] == "actor_b"
+
+
 @require_package("grpc")
 @pytest.mark.timeout(10)  # force cross-platform watchdog
 def test_stream_parameters():
@@ -267,6 +367,93 @@ def test_stream_parameters():
     assert time_diff == pytest.approx(seconds_between_pushes, abs=0.1)
 
 
+@require_package("grpc")
+@pytest.mark.timeout(3)  # force cross-platform watchdog
+def test_stream_parameters_multiple_actors():
+    from lerobot.transport import services_pb2
+    from lerobot.transport.utils import parameters_to_bytes
+
+    """Test that every actor receives the parameters, and that a late actor receives a keyframe first."""
+    shutdown_event = Event()
+    parameters_queue = Queue()
+    transitions_queue = Queue()
+    interactions_queue = Queue()
+
+    client, channel, server = create_learner_service_stub(
+        shutdown_event, parameters_queue, transitions_queue, interactions_queue, 0.05
+    )
+
+    state_dicts = {"policy": {"weight": torch.zeros(2)}}
+    keyframe = parameters_to_bytes(state_dicts, version=0, is_keyframe=True)
+    update = parameters_to_bytes(state_dicts, version=1, is_keyframe=False)
+
+    parameters_queue.put(keyframe)
+    first_stream = client.StreamParameters(services_pb2.Empty())
+    assert next(first_stream).data == keyframe
+
+    parameters_queue.put(update)
+    assert next(first_stream).data == update
+
+    # The queue was drained by the first actor's stream, the second one is served from the cache
+    second_stream = client.StreamParameters(services_pb2.Empty())
+    assert [next(second_stream).data, next(second_stream).data] == [keyframe, update]
+
+    shutdown_event.set()
+    close_learner_service_stub(channel, server)
+
+
+@require_package("grpc")
+@pytest.mark.timeout(10)  # force cross-platform watchdog
+def test_stream_parameters_reach_waiting_actors_at_once():
+    from lerobot.transport import services_pb2
+    from lerobot.transport.utils import parameters_to_bytes
+
+    """Test that actors waiting for new parameters all get them as soon as they are published, instead of
+    each one waiting for the queue timeout of the previous one."""
+    shutdown_event = Event()
+    parameters_queue = Queue()
+    queue_get_timeout = 2.0
+
+    client, channel, server = create_learner_service_stub(
+        shutdown_event, parameters_queue, Queue(), Queue(), 0.01, queue_get_timeout=queue_get_timeout
+    )
+
+    state_dicts = {"policy": {"weight": torch.zeros(2)}}
+    keyframe = parameters_to_bytes(state_dicts, version=0, is_keyframe=True)
+    update = parameters_to_bytes(state_dicts, version=1, is_keyframe=False)
+
+    parameters_queue.put(keyframe)
+    streams = [client.StreamParameters(services_pb2.Empty()) for _ in range(3)]
+    assert [next(stream).data for stream in streams] == [keyframe] * 3
+
+    received = {}
+
+    def receive(i):
+        received[i] = (next(streams[i]).data, time.monotonic())
+
+    threads = [threading.Thread(target=receive, args=(i,)) for i in range(len(streams))]
+    for thread in threads:
+        thread.start()
+    # Let all the streams wait for new parameters
+    time.sleep(0.3)
+    published = time.monotonic()
+    parameters_queue.put(update)
+    for thread in threads:
+        thread.join()
+
+    assert [data for data, _ in received.values()] == [update] * 3
+    assert max(t for _, t in received.values()) - published < queue_get_timeout / 2
+
+    # An actor connecting now is served from the cache right away
+    start = time.monotonic()
+    late_stream = client.StreamParameters(services_pb2.Empty())
+    assert [next(late_stream).data, next(late_stream).data] == [keyframe, update]
+    assert time.monotonic() - start < queue_get_timeout / 2
+
+    shutdown_event.set()
+    close_learner_service_stub(channel, server)
+
+
 @require_package("grpc")
 @pytest.mark.timeout(3)  # force cross-platform watchdog
 def test_stream_parameters_with_shutdown():
@@ -14,8 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
+
 from lerobot.calibrate import CalibrateConfig, calibrate
-from lerobot.record import DatasetRecordConfig, RecordConfig, record
+from lerobot.record import DatasetRecordConfig, RecordConfig, _close_all, record
 from lerobot.replay import DatasetReplayConfig, ReplayConfig, replay
 from lerobot.teleoperate import TeleoperateConfig, teleoperate
 from tests.fixtures.constants import DUMMY_REPO_ID
@@ -40,6 +42,19 @@ def test_teleoperate():
     teleoperate(cfg)
 
 
+def test_teleoperate_threaded():
+    robot_cfg = MockRobotConfig()
+    teleop_cfg = MockTeleopConfig()
+    cfg = TeleoperateConfig(
+        robot=robot_cfg,
+        teleop=teleop_cfg,
+        teleop_time_s=0.1,
+        threaded=True,
+        leader_fps=120,
+    )
+    teleoperate(cfg)
+
+
 def test_record_and_resume(tmp_path):
     robot_cfg = MockRobotConfig()
     teleop_cfg = MockTeleopConfig()
@@ -74,6 +89,26 @@ def test_record_and_resume(tmp_path):
     assert dataset.meta.total_tasks == 1
 
 
+def test_close_all_closes_every_resource_and_raises_the_first_error():
+    closed = []
+
+    def failing_close(name):
+        def close():
+            closed.append(name)
+            raise RuntimeError(name)
+
+        return close
+
+    with pytest.raises(RuntimeError, match="first"):
+        _close_all([failing_close("first"), failing_close("second"), lambda: closed.append("third")])
+    assert closed == ["first", "second", "third"]
+
+    # The error of the loop is the one being raised, so the errors of the closers are only logged
+    closed.clear()
+    _close_all([failing_close("first"), lambda: closed.append("second")], error=KeyboardInterrupt())
+    assert closed == ["first", "second"]
+
+
 def test_record_and_replay(tmp_path):
     robot_cfg = MockRobotConfig()
     teleop_cfg = MockTeleopConfig()
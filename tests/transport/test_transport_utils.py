@@ -258,6 +258,37 @@ def test_receive_bytes_in_chunks_shutdown_during_receive():
     assert queue.empty()
 
 
+@require_package("grpc")
+@pytest.mark.timeout(3)
+def test_receive_bytes_in_chunks_bounded_queue_back_pressure():
+    import threading
+
+    from lerobot.transport.utils import receive_bytes_in_chunks, services_pb2
+
+    """Test that a full queue blocks the receiver until it is drained, and releases it on shutdown."""
+    queue = Queue(maxsize=1)
+    shutdown_event = Event()
+
+    chunks = [
+        services_pb2.InteractionMessage(data=data, transfer_state=services_pb2.TransferState.TRANSFER_END)
+        for data in [b"first", b"second", b"third"]
+    ]
+
+    receiver = threading.Thread(target=receive_bytes_in_chunks, args=(iter(chunks), queue, shutdown_event))
+    receiver.start()
+
+    assert queue.get(timeout=1) == b"first"
+    # The second message fills the queue again, the receiver is blocked on the third one until shutdown
+    receiver.join(timeout=0.3)
+    assert receiver.is_alive()
+
+    shutdown_event.set()
+    receiver.join(timeout=1)
+    assert not receiver.is_alive()
+    assert queue.get(timeout=1) == b"second"
+    assert queue.empty()
+
+
 @require_package("grpc")
 def test_receive_bytes_in_chunks_only_begin_chunk():
     from lerobot.transport.utils import receive_bytes_in_chunks, services_pb2
@@ -406,6 +437,86 @@ def test_state_to_bytes_various_dtypes_cuda():
             assert torch.allclose(state_dict[key], reconstructed[key])
 
 
+def _make_sync_module() -> torch.nn.Module:
+    module = torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.BatchNorm1d(8), torch.nn.Linear(8, 2))
+    # Freeze the first layer, like a frozen vision encoder
+    for param in module[0].parameters():
+        param.requires_grad = False
+    return module
+
+
+@require_package("grpc")
+def test_parameters_to_bytes_round_trip():
+    from lerobot.transport.utils import load_parameters_from_bytes, parameters_to_bytes
+
+    source = _make_sync_module()
+    source[1].num_batches_tracked += 3
+    target = _make_sync_module()
+
+    data = parameters_to_bytes({"policy": source.state_dict()}, version=5)
+    header = load_parameters_from_bytes({"policy": target}, data)
+
+    assert header["version"] == 5
+    assert header["is_keyframe"]
+    for (name, expected), actual in zip(
+        source.state_dict().items(), target.state_dict().values(), strict=True
+    ):
+        assert actual.dtype == expected.dtype, name
+        assert torch.equal(actual, expected), name
+
+
+@pytest.mark.parametrize("dtype", [torch.float16, torch.bfloat16])
+@require_package("grpc")
+def test_parameters_to_bytes_quantized(dtype):
+    from lerobot.transport.utils import load_parameters_from_bytes, parameters_to_bytes
+
+    source = _make_sync_module()
+    target = _make_sync_module()
+
+    full = parameters_to_bytes({"policy": source.state_dict()}, version=0)
+    quantized = parameters_to_bytes({"policy": source.state_dict()}, version=0, dtype=dtype)
+    assert len(quantized) < len(full)
+
+    load_parameters_from_bytes({"policy": target}, quantized)
+
+    for name, expected in source.state_dict().items():
+        actual = target.state_dict()[name]
+        # Parameters keep their dtype on the receiving side, only the transmission is quantized
+        assert actual.dtype == expected.dtype
+        assert torch.allclose(actual.float(), expected.float(), atol=1e-2, rtol=1e-2), name
+
+
+@require_package("grpc")
+def test_parameters_to_bytes_skips_frozen_parameters():
+    from lerobot.transport.utils import load_parameters_from_bytes, parameters_to_bytes
+
+    source = _make_sync_module()
+    target = _make_sync_module()
+    frozen = {"policy": {n for n, p in source.named_parameters() if not p.requires_grad}}
+    assert frozen["policy"] == {"0.weight", "0.bias"}
+
+    keyframe = parameters_to_bytes({"policy": source.state_dict()}, version=0, skip=frozen)
+    delta = parameters_to_bytes({"policy": source.state_dict()}, version=1, is_keyframe=False, skip=frozen)
+    assert len(delta) < len(keyframe)
+
+    header = load_parameters_from_bytes({"policy": target}, delta)
+    assert not header["is_keyframe"]
+    assert {t["name"] for t in header["tensors"]}.isdisjoint(frozen["policy"])
+    assert torch.equal(target[2].weight, source[2].weight)
+    assert not torch.equal(target[0].weight, source[0].weight)
+
+    load_parameters_from_bytes({"policy": target}, keyframe)
+    assert torch.equal(target[0].weight, source[0].weight)
+
+
+@require_package("grpc")
+def test_read_parameters_header_invalid_data():
+    from lerobot.transport.utils import read_parameters_header
+
+    with pytest.raises(ValueError):
+        read_parameters_header(b"")
+
+
 @require_package("grpc")
 def test_python_object_to_bytes_none():
     from lerobot.transport.utils import bytes_to_python_object, python_object_to_bytes
@@ -550,6 +661,121 @@ def test_transitions_to_bytes_multiple_transitions():
         assert_transitions_equal(original, reconstructed_item)
 
 
+def assert_transition_batch_equal(batch: dict, transitions: list[Transition], atol: float = 1e-6):
+    """Helper to assert a columnar batch holds the given transitions, row by row."""
+    for field in ["state", "next_state"]:
+        assert set(batch[field].keys()) == set(transitions[0][field].keys())
+        for key in batch[field]:
+            expected = torch.stack([t[field][key].squeeze(0) for t in transitions])
+            assert torch.allclose(batch[field][key].float(), expected.float(), atol=atol)
+
+    for field in ["action", "reward", "done"]:
+        expected = torch.stack([torch.as_tensor(t[field]).squeeze(0) for t in transitions])
+        assert torch.allclose(batch[field].float(), expected.float(), atol=atol)
+
+
+def _make_episode_transitions(count: int, image: bool = False) -> list[Transition]:
+    """Consecutive transitions, where each next state is the following state."""
+    states = []
+    for _ in range(count + 1):
+        state = {"observation.state": torch.randn(1, 6)}
+        if image:
+            state["observation.image"] = torch.rand(1, 3, 16, 16)
+        states.append(state)
+
+    return [
+        Transition(
+            state=states[i],
+            action=torch.randn(1, 2),
+            reward=float(i),
+            done=i == count - 1,
+            truncated=False,
+            next_state=states[i + 1],
+            complementary_info={"is_intervention": torch.tensor(i % 2 == 0)},
+        )
+        for i in range(count)
+    ]
+
+
+@require_package("grpc")
+def test_transitions_to_batch_bytes_round_trip():
+    from lerobot.transport.utils import bytes_to_transition_batch, transitions_to_batch_bytes
+
+    transitions = _make_episode_transitions(5)
+
+    batch = bytes_to_transition_batch(transitions_to_batch_bytes(transitions))
+
+    assert batch["action"].shape == (5, 2)
+    assert batch["done"].dtype == torch.bool
+    assert_transition_batch_equal(batch, transitions)
+    assert torch.equal(
+        batch["complementary_info"]["is_intervention"],
+        torch.tensor([True, False, True, False, True]),
+    )
+
+
+@require_package("grpc")
+def test_transitions_to_batch_bytes_deduplicates_next_states():
+    from lerobot.transport.utils import bytes_to_transition_batch, transitions_to_batch_bytes
+
+    consecutive = _make_episode_transitions(8)
+    shuffled = [consecutive[i] for i in [0, 2, 4, 6, 1, 3, 5, 7]]
+
+    consecutive_data = transitions_to_batch_bytes(consecutive)
+    shuffled_data = transitions_to_batch_bytes(shuffled)
+
+    assert len(consecutive_data) < len(shuffled_data)
+    assert_transition_batch_equal(bytes_to_transition_batch(consecutive_data), consecutive)
+    assert_transition_batch_equal(bytes_to_transition_batch(shuffled_data), shuffled)
+
+
+@require_package("grpc")
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_transitions_to_batch_bytes_images_to_uint8(compression):
+    from lerobot.transport.utils import bytes_to_transition_batch, transitions_to_batch_bytes
+
+    transitions = _make_episode_transitions(4, image=True)
+
+    quantized = transitions_to_batch_bytes(transitions, compression=compression, images_to_uint8=True)
+    full = transitions_to_batch_bytes(transitions, compression=compression)
+    batch = bytes_to_transition_batch(quantized)
+
+    assert len(quantized) < len(full)
+    assert batch["state"]["observation.image"].dtype == torch.float32
+    assert_transition_batch_equal(batch, transitions, atol=1 / 255)
+    assert_transition_batch_equal(bytes_to_transition_batch(full), transitions)
+
+
+@require_package("grpc")
+def test_read_transitions_header():
+    from lerobot.transport.utils import read_transitions_header, transitions_to_batch_bytes
+
+    data = transitions_to_batch_bytes(
+        _make_episode_transitions(3), compression="zlib", actor_id="brewie_1", policy_version=7
+    )
+
+    header = read_transitions_header(data)
+
+    assert header["n"] == 3
+    assert header["actor_id"] == "brewie_1"
+    assert header["policy_version"] == 7
+
+
+@require_package("grpc")
+def test_transitions_to_batch_bytes_empty_list():
+    from lerobot.transport.utils import bytes_to_transition_batch, transitions_to_batch_bytes
+
+    assert bytes_to_transition_batch(transitions_to_batch_bytes([])) is None
+
+
+@require_package("grpc")
+def test_transitions_to_batch_bytes_unknown_compression():
+    from lerobot.transport.utils import transitions_to_batch_bytes
+
+    with pytest.raises(ValueError):
+        transitions_to_batch_bytes(_make_episode_transitions(2), compression="brotli")
+
+
 @require_package("grpc")
 def test_receive_bytes_in_chunks_unknown_state():
     from lerobot.transport.utils import receive_bytes_in_chunks
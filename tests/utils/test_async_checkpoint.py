@@ -0,0 +1,159 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+from unittest.mock import Mock
+
+import pytest
+import torch
+from safetensors.torch import load_file, load_model, save_model
+from torch import nn
+
+from lerobot.constants import (
+    CHECKPOINTS_DIR,
+    LAST_CHECKPOINT_LINK,
+    PRETRAINED_MODEL_DIR,
+    RNG_STATE,
+    TRAINING_STATE_DIR,
+)
+from lerobot.optim.optimizers import load_optimizer_state
+from lerobot.utils.async_checkpoint import AsyncCheckpointer
+from lerobot.utils.train_utils import load_training_state, save_training_state
+
+
+class TiedPolicy(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.config = Mock()
+        self.encoder = nn.Linear(4, 4)
+        self.decoder = nn.Linear(4, 4)
+        self.decoder.weight = self.encoder.weight
+
+
+def test_checkpoint_matches_save_training_state(tmp_path, model_params, optimizer, scheduler):
+    policy = TiedPolicy()
+    cfg = Mock()
+    checkpoint_dir = tmp_path / CHECKPOINTS_DIR / "000010"
+    checkpointer = AsyncCheckpointer()
+    checkpointer.save(checkpoint_dir, 10, cfg, policy, optimizer, scheduler)
+    checkpointer.close()
+
+    policy.config._save_pretrained.assert_called_once()
+    cfg.save_pretrained.assert_called_once()
+    # The tied weights are saved once, as by `save_model`
+    save_model(policy, tmp_path / "model.safetensors")
+    state_dict = load_file(checkpoint_dir / PRETRAINED_MODEL_DIR / "model.safetensors")
+    assert state_dict.keys() == load_file(tmp_path / "model.safetensors").keys()
+    loaded_policy = TiedPolicy()
+    load_model(loaded_policy, checkpoint_dir / PRETRAINED_MODEL_DIR / "model.safetensors")
+    torch.testing.assert_close(loaded_policy.encoder.weight, policy.encoder.weight)
+
+    reference_dir = tmp_path / "reference"
+    save_training_state(reference_dir, 10, optimizer, scheduler)
+    for reference_file in (reference_dir / TRAINING_STATE_DIR).iterdir():
+        # The random generators advanced since the checkpoint
+        if reference_file.name == RNG_STATE:
+            continue
+        file = checkpoint_dir / TRAINING_STATE_DIR / reference_file.name
+        if reference_file.suffix == ".safetensors":
+            for key, value in load_file(reference_file).items():
+                torch.testing.assert_close(load_file(file)[key], value)
+        else:
+            assert file.read_text() == reference_file.read_text()
+
+    step, _, _ = load_training_state(checkpoint_dir, optimizer, scheduler)
+    assert step == 10
+    assert (tmp_path / CHECKPOINTS_DIR / LAST_CHECKPOINT_LINK).resolve() == checkpoint_dir
+    assert not list((tmp_path / CHECKPOINTS_DIR).glob(".*"))
+
+
+def test_checkpoint_of_several_optimizers(tmp_path, model_params, optimizer):
+    optimizers = {"actor": optimizer, "critic": torch.optim.SGD(model_params, lr=0.1)}
+    checkpoint_dir = tmp_path / "000001"
+    checkpointer = AsyncCheckpointer()
+    checkpointer.save(
+        checkpoint_dir,
+        1,
+        Mock(),
+        TiedPolicy(),
+        optimizers,
+        write_extra=lambda tmp_dir: torch.save({"interaction_step": 5}, tmp_dir / "extra.pt"),
+    )
+    checkpointer.close()
+
+    load_optimizer_state(optimizers, checkpoint_dir / TRAINING_STATE_DIR)
+    assert torch.load(checkpoint_dir / "extra.pt") == {"interaction_step": 5}
+
+
+def test_training_continues_while_writing(tmp_path):
+    policy = TiedPolicy()
+    expected = policy.encoder.bias.detach().clone()
+    writing = threading.Event()
+    resume_writing = threading.Event()
+
+    def write_extra(tmp_dir):
+        writing.set()
+        resume_writing.wait()
+
+    checkpointer = AsyncCheckpointer()
+    checkpointer.save(tmp_path / "000001", 1, Mock(), policy, write_extra=write_extra)
+    assert writing.wait(5)
+    with torch.no_grad():
+        policy.encoder.bias.add_(1.0)
+    assert not (tmp_path / "000001").exists()
+    resume_writing.set()
+    checkpointer.close()
+
+    state_dict = load_file(tmp_path / "000001" / PRETRAINED_MODEL_DIR / "model.safetensors")
+    torch.testing.assert_close(state_dict["encoder.bias"], expected)
+
+
+def test_write_error_is_raised_and_checkpoint_is_absent(tmp_path):
+    def write_extra(tmp_dir):
+        raise OSError("Disk full")
+
+    checkpointer = AsyncCheckpointer()
+    checkpointer.save(tmp_path / "000001", 1, Mock(), TiedPolicy(), write_extra=write_extra)
+    with pytest.raises(RuntimeError, match="Writing the checkpoint failed"):
+        checkpointer.wait()
+    assert not (tmp_path / "000001").exists()
+    assert not (tmp_path / LAST_CHECKPOINT_LINK).exists()
+
+    # The leftover temporary directory is replaced by the next attempt
+    checkpointer.save(tmp_path / "000001", 1, Mock(), TiedPolicy())
+    checkpointer.close()
+    assert (tmp_path / "000001" / PRETRAINED_MODEL_DIR / "model.safetensors").is_file()
+    assert not list(tmp_path.glob(".*"))
+
+
+def test_retention(tmp_path):
+    policy = TiedPolicy()
+    checkpointer = AsyncCheckpointer(keep_last=2, keep_best=1)
+    for step, success in [(1, 10.0), (2, 90.0), (3, 50.0), (4, 20.0), (5, None)]:
+        checkpoint_dir = tmp_path / f"{step:06d}"
+        checkpointer.save(checkpoint_dir, step, Mock(), policy)
+        if success is not None:
+            checkpointer.set_metric(checkpoint_dir, success)
+    checkpointer.close()
+
+    assert sorted(path.name for path in tmp_path.iterdir() if not path.is_symlink()) == [
+        "000002",
+        "000004",
+        "000005",
+    ]
+    assert (tmp_path / LAST_CHECKPOINT_LINK).resolve().name == "000005"
+
+
+def test_invalid_retention():
+    with pytest.raises(ValueError):
+        AsyncCheckpointer(keep_last=0)
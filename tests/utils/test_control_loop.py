@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import pytest
+
+from lerobot.utils.control_loop import (
+    ControlLoopStats,
+    DeadlineScheduler,
+    LatencyHistogram,
+    PipelinedStage,
+    sleep_until,
+)
+
+
+def test_sleep_until():
+    deadline = time.perf_counter() + 0.01
+    sleep_until(deadline)
+    assert time.perf_counter() >= deadline
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.summary() == {"count": 0}
+
+    for duration_ms in [0.5, 0.7, 3, 600]:
+        histogram.record(duration_ms / 1000)
+    summary = histogram.summary()
+
+    assert summary["count"] == 4
+    assert summary["max_ms"] == pytest.approx(600)
+    assert summary["histogram"]["<1ms"] == 2
+    assert summary["histogram"]["<5ms"] == 1
+    assert summary["histogram"][">=500ms"] == 1
+    assert sum(summary["histogram"].values()) == 4
+
+
+def test_invalid_overrun_policy():
+    with pytest.raises(ValueError):
+        DeadlineScheduler(fps=30, overrun_policy="ignore")
+
+
+def test_scheduler_does_not_drift():
+    scheduler = DeadlineScheduler(fps=100)
+    scheduler.start()
+    for _ in range(10):
+        # Work shorter than the period is absorbed by the wait
+        time.sleep(0.005)
+        scheduler.wait_for_next_tick()
+
+    assert scheduler.elapsed_s() == pytest.approx(0.1, abs=0.005)
+    assert scheduler.stats.overruns == 0
+
+
+@pytest.mark.parametrize("overrun_policy, expected_ticks", [("skip", 4), ("catch_up", 3)])
+def test_scheduler_overrun_policies(overrun_policy, expected_ticks):
+    scheduler = DeadlineScheduler(fps=20, overrun_policy=overrun_policy)
+    scheduler.start()
+    # Miss the deadlines of the next two ticks, at 50ms and 100ms
+    time.sleep(0.125)
+    scheduler.wait_for_next_tick()
+    scheduler.wait_for_next_tick()
+    scheduler.wait_for_next_tick()
+
+    assert scheduler.stats.overruns >= 1
+    assert scheduler.tick == expected_ticks
+    assert scheduler.stats.dropped_ticks == expected_ticks - 3
+
+
+def test_pipelined_stage_preserves_order():
+    results = []
+    stats = ControlLoopStats()
+    stage = PipelinedStage(results.append, maxsize=2, name="record", stats=stats)
+
+    for i in range(10):
+        stage.submit(i)
+    stage.close()
+
+    assert results == list(range(10))
+    assert stats.stages["record"].summary()["count"] == 10
+
+
+def test_pipelined_stage_backpressure():
+    release = threading.Event()
+    stage = PipelinedStage(lambda _: release.wait(), maxsize=1, name="record")
+
+    stage.submit(0)
+    stage.submit(1)
+    # The worker is blocked on the first item, and the queue holds the second one
+    assert stage.queue.full()
+
+    release.set()
+    stage.close()
+
+
+def test_pipelined_stage_raises_errors():
+    def fail(_):
+        raise ValueError("disk full")
+
+    stage = PipelinedStage(fail, maxsize=1, name="record")
+    stage.submit(0)
+
+    with pytest.raises(RuntimeError, match="record stage failed"):
+        stage.close()
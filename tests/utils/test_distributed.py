@@ -0,0 +1,170 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import socket
+from types import SimpleNamespace
+
+import pytest
+import torch
+import torch.multiprocessing as mp
+from torch import nn
+from torch.amp import GradScaler
+
+from lerobot.scripts.train import update_policy
+from lerobot.utils.distributed import (
+    cleanup_distributed,
+    get_distributed_state,
+    init_distributed,
+    unwrap_policy,
+    wrap_policy,
+)
+
+WORLD_SIZE = 2
+
+
+class LinearPolicy(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.linear = nn.Linear(4, 1)
+
+    def forward(self, batch):
+        loss = ((self.linear(batch["x"]) - batch["y"]) ** 2).mean()
+        return loss, {}
+
+
+def make_batch(num_samples: int = 8) -> dict[str, torch.Tensor]:
+    generator = torch.Generator().manual_seed(0)
+    return {
+        "x": torch.randn(num_samples, 4, generator=generator),
+        "y": torch.randn(num_samples, 1, generator=generator),
+    }
+
+
+def make_policy() -> LinearPolicy:
+    torch.manual_seed(0)
+    return LinearPolicy()
+
+
+def train_step(policy: nn.Module, batch) -> SimpleNamespace:
+    optimizer = torch.optim.SGD(unwrap_policy(policy).parameters(), lr=0.1)
+    metrics = SimpleNamespace()
+    update_policy(
+        metrics,
+        policy,
+        batch,
+        optimizer,
+        grad_clip_norm=1e6,
+        grad_scaler=GradScaler("cpu", enabled=False),
+    )
+    return metrics
+
+
+def distributed_train_step(rank: int, port: int, output_dir: str) -> None:
+    os.environ.update(
+        {
+            "MASTER_ADDR": "127.0.0.1",
+            "MASTER_PORT": str(port),
+            "RANK": str(rank),
+            "LOCAL_RANK": str(rank),
+            "WORLD_SIZE": str(WORLD_SIZE),
+        }
+    )
+    state = init_distributed("cpu")
+    try:
+        # The processes start from different parameters, DistributedDataParallel overwrites them with the ones of
+        # the main process, which are the ones of `make_policy`
+        torch.manual_seed(rank)
+        policy = wrap_policy(LinearPolicy(), state, torch.device("cpu"))
+
+        # Each process takes its half of the batch, in two micro-batches
+        shard = {key: value[rank * 4 : (rank + 1) * 4] for key, value in make_batch().items()}
+        micro_batches = [
+            {key: value[:2] for key, value in shard.items()},
+            {key: value[2:] for key, value in shard.items()},
+        ]
+        train_step(policy, micro_batches)
+        torch.save(unwrap_policy(policy).state_dict(), os.path.join(output_dir, f"rank_{rank}.pt"))
+    finally:
+        cleanup_distributed()
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_get_distributed_state(monkeypatch):
+    monkeypatch.delenv("WORLD_SIZE", raising=False)
+    monkeypatch.delenv("RANK", raising=False)
+    state = get_distributed_state()
+    assert not state.is_distributed
+    assert state.is_main_process
+
+    monkeypatch.setenv("RANK", "3")
+    monkeypatch.setenv("LOCAL_RANK", "1")
+    monkeypatch.setenv("WORLD_SIZE", "4")
+    state = get_distributed_state()
+    assert (state.rank, state.local_rank, state.world_size) == (3, 1, 4)
+    assert state.is_distributed
+    assert not state.is_main_process
+
+
+def test_wrap_policy_single_process():
+    policy = LinearPolicy()
+    assert wrap_policy(policy, get_distributed_state(), torch.device("cpu")) is policy
+
+
+def test_gradient_accumulation():
+    batch = make_batch()
+    policy = make_policy()
+    train_step(policy, batch)
+
+    accumulated_policy = make_policy()
+    train_step(
+        accumulated_policy,
+        [{key: value[:4] for key, value in batch.items()}, {key: value[4:] for key, value in batch.items()}],
+    )
+
+    for param, accumulated_param in zip(policy.parameters(), accumulated_policy.parameters(), strict=True):
+        torch.testing.assert_close(param, accumulated_param)
+
+
+def test_compiled_policy_matches_eager():
+    batch = make_batch()
+    policy = make_policy()
+    metrics = train_step(policy, batch)
+
+    compiled_policy = make_policy()
+    # The "aot_eager" backend traces the forward and backward passes like the default one, without the time
+    # spent generating kernels
+    compiled_policy.compile(backend="aot_eager")
+    compiled_metrics = train_step(compiled_policy, batch)
+
+    assert compiled_metrics.loss == pytest.approx(metrics.loss)
+    for param, compiled_param in zip(policy.parameters(), compiled_policy.parameters(), strict=True):
+        torch.testing.assert_close(param, compiled_param)
+
+
+def test_distributed_data_parallel_matches_single_process(tmp_path):
+    mp.spawn(distributed_train_step, args=(get_free_port(), str(tmp_path)), nprocs=WORLD_SIZE, join=True)
+
+    # One step on the whole batch in a single process
+    policy = make_policy()
+    train_step(policy, make_batch())
+
+    for rank in range(WORLD_SIZE):
+        state_dict = torch.load(tmp_path / f"rank_{rank}.pt")
+        for key, value in policy.state_dict().items():
+            torch.testing.assert_close(state_dict[key], value)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import torch
+
+from lerobot.utils.local_async_inference import LocalAsyncInference
+from lerobot.utils.observation_preprocessing import ObservationPreprocessor
+
+
+class MockChunkPolicy:
+    """Predicts chunks of actions whose values are the state value plus the index in the chunk."""
+
+    def __init__(self, chunk_size: int = 4, n_action_steps: int | None = None, fail: bool = False):
+        self.config = SimpleNamespace(n_action_steps=n_action_steps, use_amp=False)
+        self.chunk_size = chunk_size
+        self.fail = fail
+        self.n_calls = 0
+
+    def predict_action_chunk(self, batch: dict[str, torch.Tensor]) -> torch.Tensor:
+        self.n_calls += 1
+        if self.fail:
+            raise ValueError("inference failed")
+        steps = torch.arange(self.chunk_size, dtype=torch.float32)
+        return (batch["observation.state"][:, :1] + steps).unsqueeze(-1)
+
+
+def make_frame(value: float) -> dict[str, np.ndarray]:
+    return {"observation.state": np.array([value], dtype=np.float32)}
+
+
+def make_inference(policy, **kwargs) -> LocalAsyncInference:
+    return LocalAsyncInference(policy, ObservationPreprocessor("cpu", []), **kwargs)
+
+
+def test_pops_chunk_in_order():
+    inference = make_inference(MockChunkPolicy(chunk_size=4))
+    try:
+        assert inference.ready_for_observation()
+        inference.submit_observation(make_frame(10))
+
+        actions = [inference.pop_action(timeout=5).item() for _ in range(2)]
+        assert actions == [10, 11]
+        # Half of the chunk is left
+        assert inference.ready_for_observation()
+    finally:
+        inference.close()
+
+
+def test_overlapping_chunks_are_aggregated():
+    policy = MockChunkPolicy(chunk_size=4)
+    inference = make_inference(policy, aggregate_fn_name="average")
+    try:
+        inference.submit_observation(make_frame(0))
+        assert inference.pop_action(timeout=5).item() == 0
+        assert inference.pop_action(timeout=5).item() == 1
+
+        # Predicted before action #2: actions #2 and #3 overlap with the queued ones
+        inference.submit_observation(make_frame(100))
+        with inference.condition:
+            assert inference.condition.wait_for(
+                lambda: inference.pending_observation is None and not inference.inference_running, timeout=5
+            )
+
+        actions = [inference.pop_action(timeout=5).item() for _ in range(4)]
+        assert actions == [(2 + 100) / 2, (3 + 101) / 2, 102, 103]
+    finally:
+        inference.close()
+
+
+def test_actions_per_chunk():
+    inference = make_inference(MockChunkPolicy(chunk_size=10, n_action_steps=2), chunk_size_threshold=0)
+    try:
+        inference.submit_observation(make_frame(0))
+        inference.pop_action(timeout=5)
+        inference.pop_action(timeout=5)
+
+        with pytest.raises(TimeoutError):
+            inference.pop_action(timeout=0.05)
+    finally:
+        inference.close()
+
+
+def test_inference_errors_are_raised():
+    inference = make_inference(MockChunkPolicy(fail=True))
+    inference.submit_observation(make_frame(0))
+
+    with pytest.raises(RuntimeError, match="prediction failed"):
+        inference.pop_action(timeout=5)
+    inference.close()
+
+
+def test_invalid_chunk_size_threshold():
+    with pytest.raises(ValueError):
+        make_inference(MockChunkPolicy(), chunk_size_threshold=1.5)
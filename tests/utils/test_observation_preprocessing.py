@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import torch
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.envs.utils import preprocess_observation, rename_env_observation
+from lerobot.utils.observation_preprocessing import ObservationPreprocessor
+from tests.utils import DEVICE
+
+FEATURES = {
+    "observation.state": {"dtype": "float32", "shape": (6,), "names": None},
+    "observation.images.front": {"dtype": "video", "shape": (48, 64, 3), "names": None},
+    "action": {"dtype": "float32", "shape": (6,), "names": None},
+}
+
+
+def make_observation_frame(seed: int = 0) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return {
+        "observation.state": rng.standard_normal(6).astype(np.float32),
+        "observation.images.front": rng.integers(0, 256, size=(48, 64, 3), dtype=np.uint8),
+    }
+
+
+def test_matches_reference_conversion():
+    preprocessor = ObservationPreprocessor.from_dataset_features(FEATURES, DEVICE)
+    frame = make_observation_frame()
+
+    # Run twice, to reuse the staging buffers
+    preprocessor(make_observation_frame(seed=1))
+    batch = preprocessor({**frame, "task": "pick"})
+
+    image = torch.from_numpy(frame["observation.images.front"]).float() / 255
+    expected_image = image.permute(2, 0, 1).unsqueeze(0)
+    expected_state = torch.from_numpy(frame["observation.state"]).unsqueeze(0)
+
+    assert batch["task"] == "pick"
+    assert batch["observation.images.front"].is_contiguous()
+    torch.testing.assert_close(batch["observation.images.front"].cpu(), expected_image)
+    torch.testing.assert_close(batch["observation.state"].cpu(), expected_state)
+
+
+def test_resize_to_policy_shape():
+    policy_features = {
+        "observation.images.front": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 24, 32)),
+    }
+    preprocessor = ObservationPreprocessor.from_dataset_features(FEATURES, DEVICE, policy_features)
+
+    batch = preprocessor(make_observation_frame())
+
+    assert batch["observation.images.front"].shape == (1, 3, 24, 32)
+
+
+def test_non_uint8_image():
+    preprocessor = ObservationPreprocessor.from_dataset_features(FEATURES, DEVICE)
+    frame = make_observation_frame()
+    frame["observation.images.front"] = frame["observation.images.front"].astype(np.float32)
+
+    with pytest.raises(ValueError):
+        preprocessor(frame)
+
+
+def test_matches_preprocess_observation_on_env_batches():
+    rng = np.random.default_rng(0)
+    observation = {
+        "pixels": {"top": rng.integers(0, 256, size=(2, 48, 64, 3), dtype=np.uint8)},
+        "agent_pos": rng.standard_normal((2, 14)),
+    }
+    preprocessor = ObservationPreprocessor(DEVICE, ["observation.images.top"])
+
+    batch = preprocessor(rename_env_observation(observation))
+    expected = preprocess_observation(observation)
+
+    assert set(batch) == set(expected)
+    for key in expected:
+        torch.testing.assert_close(batch[key].cpu(), expected[key])
@@ -235,6 +235,73 @@ def test_add_over_capacity():
     assert replay_buffer.truncateds[0], "Truncated should be True for the first transition."
 
 
+@pytest.mark.parametrize("optimize_memory", [False, True])
+def test_add_batch_matches_add(optimize_memory):
+    looped_buffer = create_empty_replay_buffer(optimize_memory=optimize_memory)
+    batched_buffer = create_empty_replay_buffer(optimize_memory=optimize_memory)
+
+    # 13 transitions in a buffer of capacity 10, added in two batches, wrap around the ring buffer
+    states = [create_dummy_state() for _ in range(14)]
+    actions = [create_dummy_action() for _ in range(13)]
+    for i in range(13):
+        looped_buffer.add(
+            {k: v.unsqueeze(0) for k, v in states[i].items()},
+            actions[i],
+            float(i),
+            {k: v.unsqueeze(0) for k, v in states[i + 1].items()},
+            i == 12,
+            False,
+            complementary_info={"is_intervention": torch.tensor(i % 3 == 0)},
+        )
+
+    for batch_slice in [slice(0, 4), slice(4, 13)]:
+        indices = range(13)[batch_slice]
+        batched_buffer.add_batch(
+            state={k: torch.stack([states[i][k] for i in indices]) for k in state_dims()},
+            action=torch.stack([actions[i] for i in indices]),
+            reward=torch.tensor([float(i) for i in indices]),
+            next_state={k: torch.stack([states[i + 1][k] for i in indices]) for k in state_dims()},
+            done=torch.tensor([i == 12 for i in indices]),
+            truncated=torch.zeros(len(indices), dtype=torch.bool),
+            complementary_info={"is_intervention": torch.tensor([i % 3 == 0 for i in indices])},
+        )
+
+    assert len(batched_buffer) == len(looped_buffer) == 10
+    assert batched_buffer.position == looped_buffer.position
+    for dim in state_dims():
+        assert torch.equal(batched_buffer.states[dim], looped_buffer.states[dim])
+        if not optimize_memory:
+            assert torch.equal(batched_buffer.next_states[dim], looped_buffer.next_states[dim])
+    assert torch.equal(batched_buffer.actions, looped_buffer.actions)
+    assert torch.equal(batched_buffer.rewards, looped_buffer.rewards)
+    assert torch.equal(batched_buffer.dones, looped_buffer.dones)
+    assert torch.equal(
+        batched_buffer.complementary_info["is_intervention"],
+        looped_buffer.complementary_info["is_intervention"],
+    )
+
+
+def test_add_batch_larger_than_capacity():
+    replay_buffer = create_empty_replay_buffer()
+    states = {k: torch.stack([create_dummy_state()[k] for _ in range(25)]) for k in state_dims()}
+
+    replay_buffer.add_batch(
+        state=states,
+        action=torch.randn(25, 4),
+        reward=torch.arange(25, dtype=torch.float32),
+        next_state=states,
+        done=torch.zeros(25, dtype=torch.bool),
+        truncated=torch.zeros(25, dtype=torch.bool),
+    )
+
+    assert len(replay_buffer) == 10
+    assert replay_buffer.position == 5
+    # Only the last 10 transitions are kept, at the positions they would have reached one by one
+    assert torch.equal(replay_buffer.rewards[5:], torch.arange(15, 20, dtype=torch.float32))
+    assert torch.equal(replay_buffer.rewards[:5], torch.arange(20, 25, dtype=torch.float32))
+    assert torch.equal(replay_buffer.states["observation.state"][:5], states["observation.state"][20:])
+
+
 def test_sample_from_empty_buffer(replay_buffer):
     with pytest.raises(RuntimeError, match="Cannot sample from an empty buffer"):
         replay_buffer.sample(1)
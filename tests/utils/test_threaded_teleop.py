@@ -0,0 +1,121 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import pytest
+
+from lerobot.utils.threaded_teleop import LeaderTrajectory, ThreadedTeleoperation
+
+
+class RampLeader:
+    """Leader moving at 100 units per second."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+
+    def get_action(self):
+        return {"joint.pos": 100 * (time.perf_counter() - self.start), "mode": "arm"}
+
+
+class FailingLeader:
+    def get_action(self):
+        raise OSError("Bus disconnected")
+
+
+class SlowFollower:
+    def __init__(self, latency_s):
+        self.latency_s = latency_s
+        self.thread_names = []
+
+    def send_action(self, action):
+        self.thread_names.append(threading.current_thread().name)
+        time.sleep(self.latency_s)
+        return action
+
+
+def test_extrapolation():
+    trajectory = LeaderTrajectory(max_extrapolation_s=0.1)
+    trajectory.update(1.0, {"joint.pos": 0.0, "mode": "arm"})
+    trajectory.update(1.01, {"joint.pos": 1.0, "mode": "arm"})
+
+    leader_t, horizon, action = trajectory.extrapolate(1.03)
+    assert leader_t == 1.01
+    assert horizon == pytest.approx(0.02)
+    assert action["joint.pos"] == pytest.approx(3.0)
+    assert action["mode"] == "arm"
+
+
+def test_extrapolation_is_capped():
+    trajectory = LeaderTrajectory(max_extrapolation_s=0.05)
+    trajectory.update(1.0, {"joint.pos": 0.0})
+    trajectory.update(1.01, {"joint.pos": 1.0})
+
+    _, horizon, action = trajectory.extrapolate(2.0)
+    assert horizon == 0.05
+    assert action["joint.pos"] == pytest.approx(6.0)
+
+
+def test_single_sample_is_not_extrapolated():
+    trajectory = LeaderTrajectory()
+    with pytest.raises(RuntimeError):
+        trajectory.extrapolate(1.0)
+
+    trajectory.update(1.0, {"joint.pos": 2.0})
+    assert trajectory.extrapolate(1.05) == (1.0, 0.0, {"joint.pos": 2.0})
+
+
+def test_threaded_teleoperation_predicts_over_follower_latency():
+    leader = RampLeader()
+    follower = SlowFollower(latency_s=0.01)
+    teleoperation = ThreadedTeleoperation(leader, follower, leader_fps=500, latency_smoothing=1.0)
+    teleoperation.start()
+    try:
+        for _ in range(10):
+            sent_action = teleoperation.step()
+    finally:
+        teleoperation.close()
+
+    # The action is extrapolated to about the end of the follower write
+    expected = 100 * (time.perf_counter() - leader.start)
+    assert sent_action["joint.pos"] == pytest.approx(expected, abs=1.0)
+    assert teleoperation.follower_latency_s == pytest.approx(0.01, abs=0.005)
+    assert "teleop_leader" not in follower.thread_names
+    summary = teleoperation.stats.summary()["stages"]
+    assert summary["follower_write"]["count"] == 10
+    assert summary["leader_to_follower"]["p50_ms"] >= summary["follower_write"]["p50_ms"]
+    assert summary["leader_read"]["count"] > 0
+
+
+def test_threaded_teleoperation_without_prediction():
+    teleoperation = ThreadedTeleoperation(
+        RampLeader(), SlowFollower(latency_s=0.005), leader_fps=500, predict=False
+    )
+    teleoperation.start()
+    try:
+        for _ in range(3):
+            teleoperation.step()
+    finally:
+        teleoperation.close()
+
+    assert teleoperation.stats.summary()["stages"]["prediction_horizon"]["max_ms"] == 0
+
+
+def test_leader_error_is_raised():
+    teleoperation = ThreadedTeleoperation(FailingLeader(), SlowFollower(latency_s=0), leader_fps=100)
+    with pytest.raises(RuntimeError, match="Reading the leader failed"):
+        teleoperation.start()
+        teleoperation.step()
+    teleoperation.close()
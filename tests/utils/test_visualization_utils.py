@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from lerobot.utils import visualization_utils
+from lerobot.utils.visualization_utils import RerunSink
+
+
+@pytest.fixture
+def logged():
+    """Record the entities logged to rerun, instead of logging them."""
+    entities = []
+    with patch.object(visualization_utils.rr, "log", lambda path, value, **kwargs: entities.append(path)):
+        yield entities
+
+
+def make_observation():
+    return {"shoulder.pos": 1.0, "front": np.zeros((48, 64, 3), dtype=np.uint8)}
+
+
+def test_logs_in_background(logged):
+    sink = RerunSink()
+    try:
+        sink.log(make_observation(), {"shoulder.pos": 2.0})
+        assert sink.flush(timeout=5)
+        assert sorted(logged) == ["action.shoulder.pos", "observation.front", "observation.shoulder.pos"]
+        assert sink.thread.name == "rerun_sink"
+        assert sink.thread is not threading.current_thread()
+    finally:
+        sink.close()
+
+
+def test_decimation(logged):
+    sink = RerunSink(image_fps=5, scalar_fps=None, stream_fps={"gripper.pos": 1})
+    try:
+        # One second at 20 fps
+        for i in range(20):
+            sink.log(make_observation(), {"gripper.pos": 0.0}, timestamp=i / 20)
+            assert sink.flush(timeout=5)
+    finally:
+        sink.close()
+
+    assert logged.count("observation.shoulder.pos") == 20
+    assert logged.count("observation.front") == 5
+    assert logged.count("action.gripper.pos") == 1
+
+
+def test_latest_only_mailbox(logged):
+    sink = RerunSink()
+    release = threading.Event()
+    log_rerun_data = visualization_utils.log_rerun_data
+
+    def blocked_log_rerun_data(observation, action):
+        release.wait()
+        log_rerun_data(observation, action)
+
+    try:
+        with patch.object(visualization_utils, "log_rerun_data", blocked_log_rerun_data):
+            sink.log({"step": 0.0}, {})
+            # Wait for the logging thread to take the first item
+            while sink.mailbox is not None:
+                pass
+            for step in range(1, 5):
+                sink.log({"step": float(step)}, {})
+            # Only the latest item is kept while the logging thread is busy
+            assert sink.mailbox[0] == {"step": 4.0}
+            assert sink.dropped == 3
+
+            release.set()
+            assert sink.flush(timeout=5)
+    finally:
+        release.set()
+        sink.close()
+
+    assert logged == ["observation.step", "observation.step"]
+
+
+def test_logging_errors_are_raised_on_close(logged):
+    calls = []
+
+    def failing_log_rerun_data(observation, action):
+        calls.append(observation)
+        if len(calls) == 1:
+            raise RuntimeError("viewer is gone")
+
+    sink = RerunSink()
+    with patch.object(visualization_utils, "log_rerun_data", failing_log_rerun_data):
+        sink.log(make_observation(), {}, timestamp=0.0)
+        assert sink.flush(timeout=5)
+        # The thread is still running after the error
+        sink.log(make_observation(), {}, timestamp=1.0)
+        assert sink.flush(timeout=5)
+        assert len(calls) == 2
+        with pytest.raises(RuntimeError, match="viewer is gone"):
+            sink.close()
+
+
+def test_downscaling():
+    sink = RerunSink(image_scale=0.5)
+    try:
+        values = sink._due_values("observation", make_observation(), timestamp=0.0)
+    finally:
+        sink.close()
+
+    assert values["front"].shape == (24, 32, 3)
+    assert values["shoulder.pos"] == 1.0
+
+
+def test_invalid_image_scale():
+    with pytest.raises(ValueError):
+        RerunSink(image_scale=2)